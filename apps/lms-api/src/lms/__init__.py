@@ -1,8 +1,16 @@
 from __future__ import annotations
 
+import time
+import datetime
+
+from flask import current_app
+
 import click
 
 from lms.app import create_app
+from lms.app.services.circulations import SWEEP_CHUNK_SIZE, HoldService, LoanService
+from lms.infrastructure.database.outbox import OutboxRelay
+from lms.infrastructure.database.seeding import SeedOptions, seed
 
 app = create_app()
 
@@ -14,3 +22,116 @@ def db_init_command() -> None:
 
         init_db(app)
     click.echo('Database initialized.')
+
+
+@app.cli.command('seed')
+@click.option('--branches', type=click.IntRange(min=1), default=SeedOptions.branches, show_default=True)
+@click.option('--items', type=click.IntRange(min=1), default=SeedOptions.items, show_default=True)
+@click.option('--copies-per-item', type=click.IntRange(min=1), default=SeedOptions.copies_per_item, show_default=True)
+@click.option('--patrons', type=click.IntRange(min=1), default=SeedOptions.patrons, show_default=True)
+@click.option(
+    '--loan-history-years', type=click.IntRange(min=1), default=SeedOptions.loan_history_years, show_default=True
+)
+@click.option(
+    '--loans-per-patron-year',
+    type=click.FloatRange(min=0),
+    default=SeedOptions.loans_per_patron_year,
+    show_default=True,
+    help='Checkouts of an average patron per year of history.',
+)
+@click.option(
+    '--overdue-rate',
+    type=click.FloatRange(min=0, max=1),
+    default=SeedOptions.overdue_rate,
+    show_default=True,
+    help='Share of loans kept past their due date.',
+)
+@click.option(
+    '--zipf-exponent',
+    type=click.FloatRange(min=0),
+    default=SeedOptions.zipf_exponent,
+    show_default=True,
+    help='Skew of item popularity across loans and holds.',
+)
+@click.option('--seed', 'seed_value', type=int, default=SeedOptions.seed, show_default=True, help='Random seed.')
+@click.option(
+    '--as-of', type=click.DateTime(formats=['%Y-%m-%d']), default=None, help='Date the history ends at; today if unset.'
+)
+def seed_command(
+    branches: int,
+    items: int,
+    copies_per_item: int,
+    patrons: int,
+    loan_history_years: int,
+    loans_per_patron_year: float,
+    overdue_rate: float,
+    zipf_exponent: float,
+    seed_value: int,
+    as_of: datetime.datetime | None,
+) -> None:
+    from lms.app.extensions import db
+    from lms.infrastructure.database.db import init_db
+    from lms.infrastructure.database.models.organizations import BranchModel
+
+    init_db(current_app._get_current_object())  # type: ignore[attr-defined]
+    if db.session.query(BranchModel.id).first() is not None:
+        raise click.ClickException('The database already holds data; point DATABASE_URL at an empty one.')
+    options = SeedOptions(
+        branches=branches,
+        items=items,
+        copies_per_item=copies_per_item,
+        patrons=patrons,
+        loan_history_years=loan_history_years,
+        loans_per_patron_year=loans_per_patron_year,
+        overdue_rate=overdue_rate,
+        zipf_exponent=zipf_exponent,
+        seed=seed_value,
+        as_of=as_of.date() if as_of else datetime.date.today(),
+    )
+    started = time.perf_counter()
+    counts = seed(db.session, options)
+    for table, count in counts.items():
+        click.echo(f'{table}: {count}')
+    click.echo(f'Seeded {sum(counts.values())} rows in {time.perf_counter() - started:.1f}s.')
+
+
+@app.cli.command('sweep-overdue-loans')
+@click.option(
+    '--chunk-size',
+    type=click.IntRange(min=1),
+    default=SWEEP_CHUNK_SIZE,
+    show_default=True,
+    help='Loans per transaction.',
+)
+def sweep_overdue_loans_command(chunk_size: int) -> None:
+    loan_service: LoanService = current_app.container.loan_service  # type: ignore
+    swept = loan_service.sweep_overdue_loans(chunk_size=chunk_size)
+    click.echo(f'Swept {swept} overdue loans.')
+
+
+@app.cli.command('sweep-expired-holds')
+@click.option(
+    '--batch-size', type=click.IntRange(min=1), default=SWEEP_CHUNK_SIZE, show_default=True, help='Holds per statement.'
+)
+def sweep_expired_holds_command(batch_size: int) -> None:
+    hold_service: HoldService = current_app.container.hold_service  # type: ignore
+    expired = hold_service.sweep_expired_holds(batch_size=batch_size)
+    click.echo(f'Expired {expired} holds.')
+
+
+@app.cli.command('relay-outbox')
+@click.option('--batch-size', type=click.IntRange(min=1), default=None, help='Events per transaction.')
+@click.option('--interval', type=click.FloatRange(min=0), default=1.0, show_default=True, help='Seconds between polls.')
+@click.option('--once', is_flag=True, help='Exit once the outbox is drained.')
+def relay_outbox_command(batch_size: int | None, interval: float, once: bool) -> None:
+    outbox_relay: OutboxRelay = current_app.container.outbox_relay  # type: ignore
+    batch_size = batch_size or current_app.config['OUTBOX_BATCH_SIZE']
+    relayed = 0
+    while True:
+        count = outbox_relay.relay(batch_size=batch_size)
+        relayed += count
+        if count < batch_size:
+            if once:
+                break
+            time.sleep(interval)
+    click.echo(f'Relayed {relayed} outbox events.')
@@ -11,23 +11,43 @@ def create_app(config_class: type[Config] = Config) -> Flask:
     app.config.from_object(config_class)
     app.json = MsgSpecJSONProvider(app)
 
+    from lms.infrastructure.logging import configure as configure_logging
+
+    configure_logging(
+        levels=app.config['LOG_LEVELS'],
+        sample_rates=app.config['LOG_SAMPLE_RATES'],
+        queue_size=app.config['LOG_QUEUE_SIZE'],
+        json=app.config['LOG_JSON'],
+    )
+
     from lms.app.extensions import db, cors, alembic, jsonrpc
+    from lms.infrastructure.database.instrumentation import instrument
 
     db.init_app(app)
+    with app.app_context():
+        instrument(db.engine)
     alembic.init_app(app)
     jsonrpc.init_app(app)
     cors.init_app(app, resources={r'/api/*': {'origins': '*'}})
 
     from lms.app import rpc, errors, routes, handlers, services
+    from lms.infrastructure.event_bus import event_bus
 
     services.register(app)
     handlers.register(app)
     routes.register(app)
     rpc.register(app, jsonrpc)
     errors.register(app, jsonrpc)
+    if app.config['REFERENCE_CACHE_PRELOAD']:
+        services.preload_reference_cache_on_first_request(app)
 
     @app.teardown_appcontext
     def shutdown_session(exception: BaseException | None = None) -> None:
         db.session.remove()
 
+    @app.teardown_appcontext
+    def discard_pending_events(exception: BaseException | None = None) -> None:
+        # Worker threads are reused across requests; never let unpublished events outlive the request.
+        event_bus.discard_events()
+
     return app
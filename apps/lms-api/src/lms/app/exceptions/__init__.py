@@ -14,3 +14,17 @@ class ServiceFailed(ApplicationError):
 class ObjectNotFoundFailed(ServiceFailed):
     def __init__(self, message: str) -> None:
         super().__init__(message=message, code=404)
+
+
+class InvalidCursorError(ApplicationError):
+    def __init__(self, cursor: str) -> None:
+        super().__init__(message=f'Invalid pagination cursor {cursor!r}')
+        self.cursor = cursor
+
+
+class QueryBudgetExceeded(ApplicationError):
+    def __init__(self, method: str, count: int, budget: int) -> None:
+        super().__init__(message=f'{method} ran {count} queries, over its budget of {budget}', code=500)
+        self.method = method
+        self.count = count
+        self.budget = budget
@@ -1,7 +1,11 @@
 from __future__ import annotations
 
+import atexit
+
 from flask import Flask
 
+from lms.infrastructure.event_bus import BackgroundDispatcher, event_bus
+
 
 def register(app: Flask) -> None:
     from . import patrons, catalogs, organizations
@@ -9,3 +13,16 @@ def register(app: Flask) -> None:
     organizations.register_handler(app)
     patrons.register_handler(app)
     catalogs.register_handler(app)
+
+    dispatcher = None
+    if app.config['EVENT_BUS_WORKERS'] > 0:
+        dispatcher = BackgroundDispatcher(
+            max_workers=app.config['EVENT_BUS_WORKERS'],
+            max_pending=app.config['EVENT_BUS_MAX_PENDING'],
+            submit_timeout=app.config['EVENT_BUS_SUBMIT_TIMEOUT'],
+            context=app.app_context,
+        )
+        atexit.register(dispatcher.shutdown)
+    app.extensions['event_bus_dispatcher'] = dispatcher
+    event_bus.use_dispatcher(dispatcher)
+    event_bus.metrics.slow_threshold = app.config['EVENT_BUS_SLOW_HANDLER_SECONDS']
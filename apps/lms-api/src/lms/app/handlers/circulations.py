@@ -2,11 +2,13 @@ from __future__ import annotations
 
 from flask import Flask, current_app
 
-from lms.infrastructure.logging import logger
+from lms.infrastructure.logging import get_logger
 from lms.infrastructure.event_bus import event_bus
 from lms.app.services.circulations import HoldService
 from lms.domain.circulations.events import LoanReturnedEvent
 
+logger = get_logger(__name__)
+
 
 def handle_loan_returned(event: LoanReturnedEvent) -> None:
     logger.info('Loan returned: ID=%s', event.loan_id)
@@ -2,11 +2,13 @@ from __future__ import annotations
 
 from flask import Flask, current_app
 
-from lms.infrastructure.logging import logger
+from lms.infrastructure.logging import get_logger
 from lms.infrastructure.event_bus import event_bus
 from lms.app.services.organizations import StaffService
 from lms.domain.organizations.events import BranchClosedEvent, BranchOpenedEvent, ManagerAssignedToBranchEvent
 
+logger = get_logger(__name__)
+
 
 def handle_branch_opened(event: BranchOpenedEvent) -> None:
     logger.info('Branch opened: ID=%s, Name=%s', event.branch_id, event.branch_name)
@@ -24,6 +26,6 @@ def handle_manager_assigned_to_branch(event: ManagerAssignedToBranchEvent) -> No
 
 
 def register_handler(app: Flask) -> None:
-    event_bus.subscribe(BranchOpenedEvent, handle_branch_opened)
-    event_bus.subscribe(BranchClosedEvent, handle_branch_closed)
-    event_bus.subscribe(ManagerAssignedToBranchEvent, handle_manager_assigned_to_branch)
+    event_bus.subscribe(BranchOpenedEvent, handle_branch_opened, background=True)
+    event_bus.subscribe(BranchClosedEvent, handle_branch_closed, background=True)
+    event_bus.subscribe(ManagerAssignedToBranchEvent, handle_manager_assigned_to_branch, background=True)
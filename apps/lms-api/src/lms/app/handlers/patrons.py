@@ -3,10 +3,12 @@ from __future__ import annotations
 from flask import Flask, current_app
 
 from lms.app.services.patrons import FineService
-from lms.infrastructure.logging import logger
+from lms.infrastructure.logging import get_logger
 from lms.infrastructure.event_bus import event_bus
 from lms.domain.circulations.events import LoanDamagedEvent, LoanOverdueEvent, LoanMarkedLostEvent
 
+logger = get_logger(__name__)
+
 
 def handle_loan_overdue(event: LoanOverdueEvent) -> None:
     logger.info('Loan overdue: Loan ID=%s, Patron ID=%s, Days Late=%s', event.loan_id, event.patron_id, event.days_late)
@@ -14,8 +16,13 @@ def handle_loan_overdue(event: LoanOverdueEvent) -> None:
     fine = fine_service.process_overdue_loan(
         loan_id=event.loan_id, patron_id=event.patron_id, days_late=event.days_late
     )
+    # The fine may have been created, accrued or left as it was because it is already settled.
     logger.info(
-        'Created overdue fine of amount %s for loan ID %s (patron ID %s)', fine.amount, event.loan_id, event.patron_id
+        'Overdue fine for loan ID %s (patron ID %s) stands at %s (%s)',
+        event.loan_id,
+        event.patron_id,
+        fine.amount,
+        fine.status,
     )
 
 
@@ -41,5 +48,5 @@ def handle_loan_marked_lost(event: LoanMarkedLostEvent) -> None:
 
 def register_handler(app: Flask) -> None:
     event_bus.subscribe(LoanOverdueEvent, handle_loan_overdue)
-    event_bus.subscribe(LoanMarkedLostEvent, handle_loan_marked_lost)
-    event_bus.subscribe(LoanDamagedEvent, handle_loan_marked_damaged)
+    event_bus.subscribe(LoanMarkedLostEvent, handle_loan_marked_lost, background=True)
+    event_bus.subscribe(LoanDamagedEvent, handle_loan_marked_damaged, background=True)
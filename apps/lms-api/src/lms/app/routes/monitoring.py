@@ -1,6 +1,12 @@
 from __future__ import annotations
 
-from flask import Blueprint
+import typing as t
+
+from flask import Response, Blueprint, current_app, send_from_directory
+
+from lms.infrastructure.logging import dropped_records
+from lms.infrastructure.metrics import rpc_metrics, render_prometheus
+from lms.infrastructure.event_bus import event_bus
 
 bp = Blueprint('monitoring', __name__)
 
@@ -8,3 +14,43 @@ bp = Blueprint('monitoring', __name__)
 @bp.route('/health', methods=['GET'])
 def health_check() -> dict[str, str]:
     return {'status': 'OK'}
+
+
+@bp.route('/event-bus', methods=['GET'])
+def event_bus_metrics() -> dict[str, t.Any]:
+    return {'handlers': event_bus.metrics.snapshot()}
+
+
+@bp.route('/logging', methods=['GET'])
+def logging_stats() -> dict[str, t.Any]:
+    return {'dropped': dropped_records()}
+
+
+@bp.route('/reference-cache', methods=['GET'])
+def reference_cache() -> tuple[dict[str, t.Any], int]:
+    cache = current_app.container.reference_cache  # type: ignore
+    if cache is None:
+        return {'error': 'The reference cache is disabled'}, 404
+    return {'max_size': cache.max_size, 'size': len(cache), 'kinds': cache.snapshot()}, 200
+
+
+@bp.route('/metrics', methods=['GET'])
+def metrics() -> Response:
+    return Response(render_prometheus(rpc_metrics.collect()), mimetype='text/plain; version=0.0.4')
+
+
+@bp.route('/profiles', methods=['GET'])
+def profiles() -> tuple[dict[str, t.Any], int]:
+    profiler = current_app.extensions['profiler']
+    if profiler is None:
+        return {'error': 'Profiling is disabled'}, 404
+    return {'profiles': profiler.profiles()}, 200
+
+
+@bp.route('/profiles/<name>', methods=['GET'])
+def profile(name: str) -> Response | tuple[dict[str, t.Any], int]:
+    profiler = current_app.extensions['profiler']
+    # Unknown names are answered here because the app-wide error handler turns NotFound into a 500.
+    if profiler is None or not name.endswith('.prof') or not (profiler.directory / name).is_file():
+        return {'error': 'Profile not found'}, 404
+    return send_from_directory(profiler.directory, name, mimetype='application/octet-stream')
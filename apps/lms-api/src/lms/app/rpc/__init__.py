@@ -1,13 +1,172 @@
 from __future__ import annotations
 
-from flask import Flask
+import time
+import atexit
+import random
+import typing as t
+import secrets
+from concurrent import futures
+import contextvars
+from dataclasses import dataclass
+
+from flask import Flask, Response, g, request, current_app
+from flask.ctx import RequestContext
+from flask.globals import request_ctx
 
 from flask_jsonrpc import JSONRPC
+from flask_jsonrpc.site import JSONRPC_DEFAULT_HTTP_STATUS_CODE, JSONRPCSite
+from werkzeug.datastructures import Headers
+import flask_jsonrpc.types.methods as tm
+
+from lms.app.exceptions import QueryBudgetExceeded
+from lms.infrastructure.logging import logger
+from lms.infrastructure.metrics import rpc_metrics
+from lms.infrastructure.profiling import Profiler
+from lms.infrastructure.database.identity_map import identity_scope
+from lms.infrastructure.database.instrumentation import QueryStats, track_queries
+
+
+@dataclass(frozen=True, slots=True)
+class ReadOnly(tm.BaseMethodAnnotatedMetadata):
+    """Marks a method that never writes, so its calls in a batch may run alongside each other."""
+
+    read_only: bool = True
+
+
+class MeteredJSONRPCSite(JSONRPCSite):
+    def dispatch(self, req_json: dict[str, t.Any]) -> t.Any:  # noqa: ANN401
+        method = req_json['method']
+        # Unknown method names are left out so a client cannot grow the label set at will.
+        if method not in self.view_funcs:
+            return super().dispatch(req_json)
+        rpc_metrics.started(method)
+        started = time.perf_counter()
+        error = None
+        with track_queries() as queries, identity_scope():
+            try:
+                response = self._profiled_dispatch(method, req_json)
+                check_query_budget(method, queries)
+                return response
+            except Exception as e:
+                error = type(e).__name__
+                raise
+            finally:
+                rpc_metrics.finished(
+                    method,
+                    time.perf_counter() - started,
+                    error=error,
+                    queries=queries.count,
+                    query_seconds=queries.seconds,
+                    repeated_queries=queries.repeated,
+                )
+                if current_app.config['QUERY_DEBUG_HEADERS']:
+                    g.setdefault('query_stats', QueryStats()).merge(queries)
+
+    def _profiled_dispatch(self, method: str, req_json: dict[str, t.Any]) -> t.Any:  # noqa: ANN401
+        profiler: Profiler | None = current_app.extensions['profiler']
+        if profiler is None or not wants_profile():
+            return super().dispatch(req_json)
+        with profiler.profile(method, req_json.get('id')):
+            return super().dispatch(req_json)
+
+    def batch_dispatch(self, reqs_json: list[dict[str, t.Any]]) -> t.Any:  # noqa: ANN401
+        executor: futures.Executor | None = current_app.extensions['rpc_batch_executor']
+        if executor is None or sum(map(self.is_read_only, reqs_json)) < 2:
+            return super().batch_dispatch(reqs_json)
+        app = t.cast(Flask, current_app._get_current_object())  # type: ignore[attr-defined]
+        responses: list[t.Any] = []
+        reading: list[futures.Future[t.Any]] = []
+        for req_json in reqs_json:
+            if self.is_read_only(req_json):
+                ctx = request_ctx.copy()
+                reading.append(executor.submit(contextvars.Context().run, self._dispatch_apart, app, ctx, req_json))
+                responses.append(reading[-1])
+                continue
+            # A write waits for the reads sent before it and runs before the reads sent after it, as in a serial batch.
+            futures.wait(reading)
+            reading = []
+            responses.append(self.handle_dispatch_except(req_json))
+
+        resp_views = []
+        headers = Headers()
+        for response in responses:
+            rv, _, hdrs = self._merge_apart(response.result()) if isinstance(response, futures.Future) else response
+            headers.update([hdrs] if isinstance(hdrs, tuple) else hdrs)
+            if rv is not None:
+                resp_views.append(rv)
+        return resp_views, JSONRPC_DEFAULT_HTTP_STATUS_CODE if resp_views else 204, headers
+
+    def is_read_only(self, req_json: t.Any) -> bool:  # noqa: ANN401
+        method = req_json.get('method') if isinstance(req_json, dict) else None
+        view_func = self.view_funcs.get(method) if isinstance(method, str) else None
+        annotations = getattr(view_func, 'jsonrpc_method_annotations', None)
+        return any(isinstance(metadata, ReadOnly) for metadata in getattr(annotations, '__metadata__', ()))
+
+    def _dispatch_apart(self, app: Flask, ctx: RequestContext, req_json: dict[str, t.Any]) -> t.Any:  # noqa: ANN401
+        # A fresh application context gives the call its own g and its own scoped SQLAlchemy session.
+        with app.app_context(), ctx:
+            return self.handle_dispatch_except(req_json), g.pop('query_stats', None)
+
+    def _merge_apart(self, result: tuple[t.Any, QueryStats | None]) -> t.Any:  # noqa: ANN401
+        response, queries = result
+        if queries is not None:
+            g.setdefault('query_stats', QueryStats()).merge(queries)
+        return response
+
+
+def wants_profile() -> bool:
+    secret = current_app.config['PROFILE_SECRET']
+    header = request.headers.get('X-Profile')
+    if header is not None and (secret is None or secrets.compare_digest(header, secret)):
+        return True
+    return random.random() < float(current_app.config['PROFILE_SAMPLE_RATE'])
+
+
+def check_query_budget(method: str, queries: QueryStats) -> None:
+    budget = current_app.config['QUERY_BUDGETS'].get(method, current_app.config['QUERY_BUDGET'])
+    if budget is None or queries.count <= budget:
+        return
+    if current_app.config['QUERY_BUDGET_ACTION'] == 'raise':
+        raise QueryBudgetExceeded(method, queries.count, budget)
+    logger.warning(
+        '%s ran %d queries, over its budget of %d; most repeated: %r',
+        method,
+        queries.count,
+        budget,
+        queries.most_repeated(),
+    )
+
+
+def add_query_headers(response: Response) -> Response:
+    queries: QueryStats | None = g.pop('query_stats', None)
+    if queries is not None:
+        response.headers['X-Query-Count'] = str(queries.count)
+        response.headers['X-Query-Time-Ms'] = f'{queries.seconds * 1000:.3f}'
+        response.headers['X-Query-Repeated'] = str(queries.repeated)
+    return response
 
 
 def register(app: Flask, jsonrpc: JSONRPC) -> None:
     from . import patrons, serials, catalogs, acquisitions, circulations, organizations
 
+    rpc_metrics.configure(directory=app.config['METRICS_DIR'], flush_interval=app.config['METRICS_FLUSH_INTERVAL'])
+    if rpc_metrics.directory is not None:
+        atexit.register(rpc_metrics.flush)
+    if app.config['QUERY_DEBUG_HEADERS']:
+        app.after_request(add_query_headers)
+    app.extensions['rpc_batch_executor'] = None
+    if app.config['RPC_BATCH_WORKERS'] > 0:
+        executor = futures.ThreadPoolExecutor(
+            max_workers=app.config['RPC_BATCH_WORKERS'], thread_name_prefix='rpc-batch'
+        )
+        atexit.register(executor.shutdown)
+        app.extensions['rpc_batch_executor'] = executor
+    app.extensions['profiler'] = None
+    if app.config['PROFILE_DIR']:
+        app.extensions['profiler'] = Profiler(
+            app.config['PROFILE_DIR'], keep=app.config['PROFILE_KEEP'], interval=app.config['PROFILE_INTERVAL']
+        )
+
     jsonrpc.register_blueprint(app, patrons.jsonrpc_bp, url_prefix='/patrons', enable_web_browsable_api=True)
     jsonrpc.register_blueprint(
         app, organizations.jsonrpc_bp, url_prefix='/organizations', enable_web_browsable_api=True
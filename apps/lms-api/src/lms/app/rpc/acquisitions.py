@@ -8,7 +8,8 @@ from flask_jsonrpc import JSONRPCBlueprint
 import flask_jsonrpc.types.params as tp
 import flask_jsonrpc.types.methods as tm
 
-from lms.app.schemas import Page
+from lms.app.rpc import ReadOnly, MeteredJSONRPCSite
+from lms.app.schemas import MAX_PAGE_SIZE, DEFAULT_PAGE_SIZE, Page
 from lms.app.schemas.acquisitions import OrderCreate, OrderLineAdd, VendorUpdate, VendorRegister
 from lms.app.services.acquisitions import VendorService, AcquisitionOrderService
 from lms.app.exceptions.acquisitions import (
@@ -18,7 +19,7 @@ from lms.app.exceptions.acquisitions import (
 )
 from lms.domain.acquisitions.entities import Vendor, AcquisitionOrder
 
-jsonrpc_bp = JSONRPCBlueprint('acquisitions', __name__)
+jsonrpc_bp = JSONRPCBlueprint('acquisitions', __name__, jsonrpc_site=MeteredJSONRPCSite)
 
 
 @jsonrpc_bp.errorhandler(AcquisitionOrderNotFoundError)
@@ -42,12 +43,17 @@ def handle_vendor_not_found(ex: VendorNotFoundError) -> dict[str, t.Any]:
         tm.Summary('List acquisition orders'),
         tm.Description('Get a list of all acquisition orders'),
         tm.Tag(name='acquisitions', summary='Acquisitions Management', description='Library acquisition operations'),
+        ReadOnly(),
     ],
 )
-def list_orders() -> t.Annotated[Page[AcquisitionOrder], tp.Summary('List of orders')]:
+def list_orders(
+    limit: t.Annotated[
+        int, tp.Summary('Maximum number of results per page'), tp.Minimum(1), tp.Maximum(MAX_PAGE_SIZE)
+    ] = DEFAULT_PAGE_SIZE,
+    after: t.Annotated[str | None, tp.Summary('Cursor returned as next_cursor by the previous page')] = None,
+) -> t.Annotated[Page[AcquisitionOrder], tp.Summary('List of orders')]:
     acquisition_order_service: AcquisitionOrderService = current_app.container.acquisition_order_service  # type: ignore
-    orders = acquisition_order_service.find_all_orders()
-    return Page[AcquisitionOrder](results=orders, count=len(orders))
+    return Page[AcquisitionOrder].paginate(acquisition_order_service.find_all_orders, limit=limit, after=after)
 
 
 @jsonrpc_bp.method(
@@ -56,6 +62,7 @@ def list_orders() -> t.Annotated[Page[AcquisitionOrder], tp.Summary('List of ord
         tm.Summary('Get acquisition order by ID'),
         tm.Description('Retrieve messages of a specific acquisition order'),
         tm.Tag(name='acquisitions'),
+        ReadOnly(),
     ],
 )
 def get_order(
@@ -204,12 +211,17 @@ def cancel_order(
         tm.Tag(name='acquisitions'),
         tm.Error(code=-32002, message='No vendors found', data={'reason': 'no vendors available'}),
         tm.Example(name='all_vendors_example', params=[]),
+        ReadOnly(),
     ],
 )
-def list_vendors() -> t.Annotated[Page[Vendor], tp.Summary('Vendor search result')]:
+def list_vendors(
+    limit: t.Annotated[
+        int, tp.Summary('Maximum number of results per page'), tp.Minimum(1), tp.Maximum(MAX_PAGE_SIZE)
+    ] = DEFAULT_PAGE_SIZE,
+    after: t.Annotated[str | None, tp.Summary('Cursor returned as next_cursor by the previous page')] = None,
+) -> t.Annotated[Page[Vendor], tp.Summary('Vendor search result')]:
     vendor_service: VendorService = current_app.container.vendor_service  # type: ignore
-    vendors = vendor_service.find_all_vendors()
-    return Page[Vendor](results=vendors, count=len(vendors))
+    return Page[Vendor].paginate(vendor_service.find_all_vendors, limit=limit, after=after)
 
 
 @jsonrpc_bp.method(
@@ -220,6 +232,7 @@ def list_vendors() -> t.Annotated[Page[Vendor], tp.Summary('Vendor search result
         tm.Tag(name='acquisitions'),
         tm.Error(code=-32002, message='Vendor not found', data={'reason': 'invalid vendor ID'}),
         tm.Example(name='get_vendor_example', params=[tm.ExampleField(name='vendor_id', value=1, summary='Vendor ID')]),
+        ReadOnly(),
     ],
 )
 def get_vendor(
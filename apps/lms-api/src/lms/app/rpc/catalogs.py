@@ -8,7 +8,8 @@ from flask_jsonrpc import JSONRPCBlueprint
 import flask_jsonrpc.types.params as tp
 import flask_jsonrpc.types.methods as tm
 
-from lms.app.schemas import Page
+from lms.app.rpc import ReadOnly, MeteredJSONRPCSite
+from lms.app.schemas import MAX_PAGE_SIZE, MAX_LOOKUP_SIZE, DEFAULT_PAGE_SIZE, Page, Lookup
 from lms.app.schemas.catalogs import ItemCreate, ItemUpdate
 from lms.app.services.catalogs import CopyService, ItemService
 from lms.app.exceptions.catalogs import (
@@ -20,7 +21,7 @@ from lms.app.exceptions.catalogs import (
 )
 from lms.domain.catalogs.entities import Copy, Item
 
-jsonrpc_bp = JSONRPCBlueprint('catalogs', __name__)
+jsonrpc_bp = JSONRPCBlueprint('catalogs', __name__, jsonrpc_site=MeteredJSONRPCSite)
 
 
 @jsonrpc_bp.errorhandler(CopyNotFoundError)
@@ -56,12 +57,17 @@ def handle_publisher_not_found_error(ex: PublisherNotFoundError) -> dict[str, t.
         tm.Tag(name='catalogs'),
         tm.Error(code=-32002, message='No copies found', data={'reason': 'no catalog copies available'}),
         tm.Example(name='all_catalog_copies_example', params=[]),
+        ReadOnly(),
     ],
 )
-def list_copies() -> t.Annotated[Page[Copy], tp.Summary('Catalog copies search result')]:
+def list_copies(
+    limit: t.Annotated[
+        int, tp.Summary('Maximum number of results per page'), tp.Minimum(1), tp.Maximum(MAX_PAGE_SIZE)
+    ] = DEFAULT_PAGE_SIZE,
+    after: t.Annotated[str | None, tp.Summary('Cursor returned as next_cursor by the previous page')] = None,
+) -> t.Annotated[Page[Copy], tp.Summary('Catalog copies search result')]:
     copy_service: CopyService = current_app.container.copy_service  # type: ignore
-    items = copy_service.get_all_copies()
-    return Page[Copy](results=items, count=len(items))
+    return Page[Copy].paginate(copy_service.get_all_copies, limit=limit, after=after)
 
 
 @jsonrpc_bp.method(
@@ -72,6 +78,7 @@ def list_copies() -> t.Annotated[Page[Copy], tp.Summary('Catalog copies search r
         tm.Tag(name='catalogs'),
         tm.Error(code=-32002, message='Copy not found', data={'reason': 'invalid copy ID'}),
         tm.Example(name='get_copy_example', params=[tm.ExampleField(name='copy_id', value=1, summary='Copy ID')]),
+        ReadOnly(),
     ],
 )
 def get_copy(
@@ -81,6 +88,29 @@ def get_copy(
     return copy_service.get_copy(copy_id)
 
 
+@jsonrpc_bp.method(
+    'Copies.get_many',
+    tm.MethodAnnotated[
+        tm.Summary('Get copies by ID'),
+        tm.Description('Retrieve several copies in one query; results follow the order of the given IDs'),
+        tm.Tag(name='catalogs'),
+        tm.Example(
+            name='get_many_copies_example', params=[tm.ExampleField(name='copy_ids', value=[1, 2], summary='Copy IDs')]
+        ),
+        ReadOnly(),
+    ],
+)
+def get_many_copies(
+    copy_ids: t.Annotated[list[str], tp.Summary('Copy IDs'), tp.Required(), tp.MaxLength(MAX_LOOKUP_SIZE)],
+) -> t.Annotated[list[Lookup[Copy]], tp.Summary('One lookup per requested ID')]:
+    copy_service: CopyService = current_app.container.copy_service  # type: ignore
+    return Lookup[Copy].many(
+        copy_service.get_copies_by_ids,
+        copy_ids,
+        not_found=lambda copy_id: CopyNotFoundError(f'Copy with id {copy_id} not found'),
+    )
+
+
 @jsonrpc_bp.method(
     'Items.list',
     tm.MethodAnnotated[
@@ -89,12 +119,17 @@ def get_copy(
         tm.Tag(name='catalogs'),
         tm.Error(code=-32002, message='No items found', data={'reason': 'no catalog items available'}),
         tm.Example(name='all_catalog_items_example', params=[]),
+        ReadOnly(),
     ],
 )
-def list_items() -> t.Annotated[Page[Item], tp.Summary('Catalog items search result')]:
+def list_items(
+    limit: t.Annotated[
+        int, tp.Summary('Maximum number of results per page'), tp.Minimum(1), tp.Maximum(MAX_PAGE_SIZE)
+    ] = DEFAULT_PAGE_SIZE,
+    after: t.Annotated[str | None, tp.Summary('Cursor returned as next_cursor by the previous page')] = None,
+) -> t.Annotated[Page[Item], tp.Summary('Catalog items search result')]:
     item_service: ItemService = current_app.container.item_service  # type: ignore
-    items = item_service.get_all_items()
-    return Page[Item](results=items, count=len(items))
+    return Page[Item].paginate(item_service.get_all_items, limit=limit, after=after)
 
 
 @jsonrpc_bp.method(
@@ -148,6 +183,7 @@ def create_item(
         tm.Example(
             name='get_catalog_item_example', params=[tm.ExampleField(name='item_id', value=1, summary='Item ID')]
         ),
+        ReadOnly(),
     ],
 )
 def get_item(
@@ -157,6 +193,29 @@ def get_item(
     return item_service.get_item(item_id)
 
 
+@jsonrpc_bp.method(
+    'Items.get_many',
+    tm.MethodAnnotated[
+        tm.Summary('Get items by ID'),
+        tm.Description('Retrieve several items in one query; results follow the order of the given IDs'),
+        tm.Tag(name='catalogs'),
+        tm.Example(
+            name='get_many_items_example', params=[tm.ExampleField(name='item_ids', value=[1, 2], summary='Item IDs')]
+        ),
+        ReadOnly(),
+    ],
+)
+def get_many_items(
+    item_ids: t.Annotated[list[str], tp.Summary('Item IDs'), tp.Required(), tp.MaxLength(MAX_LOOKUP_SIZE)],
+) -> t.Annotated[list[Lookup[Item]], tp.Summary('One lookup per requested ID')]:
+    item_service: ItemService = current_app.container.item_service  # type: ignore
+    return Lookup[Item].many(
+        item_service.get_items_by_ids,
+        item_ids,
+        not_found=lambda item_id: ItemNotFoundError(f'Item with id {item_id} not found'),
+    )
+
+
 @jsonrpc_bp.method(
     'Items.update',
     tm.MethodAnnotated[
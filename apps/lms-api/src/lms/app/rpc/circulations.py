@@ -8,12 +8,14 @@ from flask_jsonrpc import JSONRPCBlueprint
 import flask_jsonrpc.types.params as tp
 import flask_jsonrpc.types.methods as tm
 
-from lms.app.schemas import Page
+from lms.app.rpc import ReadOnly, MeteredJSONRPCSite
+from lms.app.schemas import MAX_PAGE_SIZE, MAX_LOOKUP_SIZE, DEFAULT_PAGE_SIZE, Page, Lookup
+from lms.app.schemas.circulations import HoldPosition
 from lms.app.services.circulations import HoldService, LoanService
 from lms.app.exceptions.circulations import HoldNotFoundError, LoanNotFoundError
 from lms.domain.circulations.entities import Hold, Loan
 
-jsonrpc_bp = JSONRPCBlueprint('circulations', __name__)
+jsonrpc_bp = JSONRPCBlueprint('circulations', __name__, jsonrpc_site=MeteredJSONRPCSite)
 
 
 @jsonrpc_bp.errorhandler(LoanNotFoundError)
@@ -34,12 +36,17 @@ def handle_hold_not_found_error(ex: HoldNotFoundError) -> dict[str, t.Any]:
         tm.Tag(name='circulations'),
         tm.Error(code=-32002, message='No loans found', data={'reason': 'no loans available'}),
         tm.Example(name='all_loans_example', params=[]),
+        ReadOnly(),
     ],
 )
-def list_loans() -> t.Annotated[Page[Loan], tp.Summary('Loan search result')]:
+def list_loans(
+    limit: t.Annotated[
+        int, tp.Summary('Maximum number of results per page'), tp.Minimum(1), tp.Maximum(MAX_PAGE_SIZE)
+    ] = DEFAULT_PAGE_SIZE,
+    after: t.Annotated[str | None, tp.Summary('Cursor returned as next_cursor by the previous page')] = None,
+) -> t.Annotated[Page[Loan], tp.Summary('Loan search result')]:
     loan_service: LoanService = current_app.container.loan_service  # type: ignore
-    loans = loan_service.find_all_loans()
-    return Page[Loan](results=loans, count=len(loans))
+    return Page[Loan].paginate(loan_service.find_all_loans, limit=limit, after=after)
 
 
 @jsonrpc_bp.method(
@@ -151,6 +158,7 @@ def lost_copy(
         tm.Tag(name='circulations'),
         tm.Error(code=-32002, message='Loan not found', data={'reason': 'invalid loan ID'}),
         tm.Example(name='get_loan_example', params=[tm.ExampleField(name='loan_id', value=1, summary='Loan ID')]),
+        ReadOnly(),
     ],
 )
 def get_loan(
@@ -160,6 +168,29 @@ def get_loan(
     return loan_service.get_loan(loan_id)
 
 
+@jsonrpc_bp.method(
+    'Loans.get_many',
+    tm.MethodAnnotated[
+        tm.Summary('Get loans by ID'),
+        tm.Description('Retrieve several loans in one query; results follow the order of the given IDs'),
+        tm.Tag(name='circulations'),
+        tm.Example(
+            name='get_many_loans_example', params=[tm.ExampleField(name='loan_ids', value=[1, 2], summary='Loan IDs')]
+        ),
+        ReadOnly(),
+    ],
+)
+def get_many_loans(
+    loan_ids: t.Annotated[list[str], tp.Summary('Loan IDs'), tp.Required(), tp.MaxLength(MAX_LOOKUP_SIZE)],
+) -> t.Annotated[list[Lookup[Loan]], tp.Summary('One lookup per requested ID')]:
+    loan_service: LoanService = current_app.container.loan_service  # type: ignore
+    return Lookup[Loan].many(
+        loan_service.get_loans_by_ids,
+        loan_ids,
+        not_found=lambda loan_id: LoanNotFoundError(f'Loan with id {loan_id} not found'),
+    )
+
+
 @jsonrpc_bp.method(
     'Loans.renew',
     tm.MethodAnnotated[
@@ -191,12 +222,17 @@ def renew_loan(
         tm.Tag(name='circulations'),
         tm.Error(code=-32002, message='No holds found', data={'reason': 'no holds available'}),
         tm.Example(name='all_holds_example', params=[]),
+        ReadOnly(),
     ],
 )
-def list_holds() -> t.Annotated[Page[Hold], tp.Summary('Hold list')]:
+def list_holds(
+    limit: t.Annotated[
+        int, tp.Summary('Maximum number of results per page'), tp.Minimum(1), tp.Maximum(MAX_PAGE_SIZE)
+    ] = DEFAULT_PAGE_SIZE,
+    after: t.Annotated[str | None, tp.Summary('Cursor returned as next_cursor by the previous page')] = None,
+) -> t.Annotated[Page[Hold], tp.Summary('Hold list')]:
     hold_service: HoldService = current_app.container.hold_service  # type: ignore
-    holds = hold_service.find_all_holds()
-    return Page[Hold](results=holds, count=len(holds))
+    return Page[Hold].paginate(hold_service.find_all_holds, limit=limit, after=after)
 
 
 @jsonrpc_bp.method(
@@ -207,6 +243,7 @@ def list_holds() -> t.Annotated[Page[Hold], tp.Summary('Hold list')]:
         tm.Tag(name='circulations'),
         tm.Error(code=-32002, message='Hold not found', data={'reason': 'invalid hold ID'}),
         tm.Example(name='get_hold_example', params=[tm.ExampleField(name='hold_id', value=1, summary='Hold ID')]),
+        ReadOnly(),
     ],
 )
 def get_hold(
@@ -216,6 +253,53 @@ def get_hold(
     return hold_service.get_hold(hold_id)
 
 
+@jsonrpc_bp.method(
+    'Holds.get_many',
+    tm.MethodAnnotated[
+        tm.Summary('Get holds by ID'),
+        tm.Description('Retrieve several holds in one query; results follow the order of the given IDs'),
+        tm.Tag(name='circulations'),
+        tm.Example(
+            name='get_many_holds_example', params=[tm.ExampleField(name='hold_ids', value=[1, 2], summary='Hold IDs')]
+        ),
+        ReadOnly(),
+    ],
+)
+def get_many_holds(
+    hold_ids: t.Annotated[list[str], tp.Summary('Hold IDs'), tp.Required(), tp.MaxLength(MAX_LOOKUP_SIZE)],
+) -> t.Annotated[list[Lookup[Hold]], tp.Summary('One lookup per requested ID')]:
+    hold_service: HoldService = current_app.container.hold_service  # type: ignore
+    return Lookup[Hold].many(
+        hold_service.get_holds_by_ids,
+        hold_ids,
+        not_found=lambda hold_id: HoldNotFoundError(f'Hold with id {hold_id} not found'),
+    )
+
+
+@jsonrpc_bp.method(
+    'Holds.position',
+    tm.MethodAnnotated[
+        tm.Summary('Get hold queue position'),
+        tm.Description('Retrieve the place of a pending hold in the queue of its item'),
+        tm.Tag(name='circulations'),
+        tm.Error(code=-32002, message='Hold not found', data={'reason': 'invalid hold ID'}),
+        tm.Example(name='hold_position_example', params=[tm.ExampleField(name='hold_id', value=1, summary='Hold ID')]),
+        ReadOnly(),
+    ],
+)
+def get_hold_position(
+    hold_id: t.Annotated[str, tp.Summary('Hold ID'), tp.Required()],
+) -> t.Annotated[HoldPosition, tp.Summary('Hold queue position')]:
+    hold_service: HoldService = current_app.container.hold_service  # type: ignore
+    hold = hold_service.get_hold(hold_id)
+    return HoldPosition(
+        hold_id=hold_id,
+        item_id=hold.item_id,
+        patron_id=hold.patron_id,
+        position=hold_service.get_hold_position(hold_id),
+    )
+
+
 @jsonrpc_bp.method(
     'Holds.place',
     tm.MethodAnnotated[
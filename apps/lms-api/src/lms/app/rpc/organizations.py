@@ -8,13 +8,14 @@ from flask_jsonrpc import JSONRPCBlueprint
 import flask_jsonrpc.types.params as tp
 import flask_jsonrpc.types.methods as tm
 
-from lms.app.schemas import Page
+from lms.app.rpc import ReadOnly, MeteredJSONRPCSite
+from lms.app.schemas import MAX_PAGE_SIZE, MAX_LOOKUP_SIZE, DEFAULT_PAGE_SIZE, Page, Lookup
 from lms.app.schemas.organizations import StaffCreate, StaffUpdate, BranchCreate, BranchUpdate
 from lms.app.services.organizations import StaffService, BranchService
 from lms.app.exceptions.organizations import StaffNotFoundError, BranchNotFoundError
 from lms.domain.organizations.entities import Staff, Branch
 
-jsonrpc_bp = JSONRPCBlueprint('organizations', __name__)
+jsonrpc_bp = JSONRPCBlueprint('organizations', __name__, jsonrpc_site=MeteredJSONRPCSite)
 
 
 @jsonrpc_bp.errorhandler(BranchNotFoundError)
@@ -35,12 +36,17 @@ def handle_staff_not_found_error(ex: StaffNotFoundError) -> dict[str, t.Any]:
         tm.Tag(name='organizations'),
         tm.Error(code=-32002, message='No branches found', data={'reason': 'no branches available'}),
         tm.Example(name='all_branches_example', params=[]),
+        ReadOnly(),
     ],
 )
-def list_branches() -> t.Annotated[Page[Branch], tp.Summary('Branch information')]:
+def list_branches(
+    limit: t.Annotated[
+        int, tp.Summary('Maximum number of results per page'), tp.Minimum(1), tp.Maximum(MAX_PAGE_SIZE)
+    ] = DEFAULT_PAGE_SIZE,
+    after: t.Annotated[str | None, tp.Summary('Cursor returned as next_cursor by the previous page')] = None,
+) -> t.Annotated[Page[Branch], tp.Summary('Branch information')]:
     branch_service: BranchService = current_app.container.branch_service  # type: ignore
-    branches = branch_service.find_all_branches()
-    return Page[Branch](results=branches, count=len(branches))
+    return Page[Branch].paginate(branch_service.find_all_branches, limit=limit, after=after)
 
 
 @jsonrpc_bp.method(
@@ -51,6 +57,7 @@ def list_branches() -> t.Annotated[Page[Branch], tp.Summary('Branch information'
         tm.Tag(name='organizations'),
         tm.Error(code=-32002, message='Branch not found', data={'reason': 'invalid branch ID'}),
         tm.Example(name='get_branch_example', params=[tm.ExampleField(name='branch_id', value=1, summary='Branch ID')]),
+        ReadOnly(),
     ],
 )
 def get_branch(
@@ -60,6 +67,30 @@ def get_branch(
     return branch_service.get_branch(branch_id)
 
 
+@jsonrpc_bp.method(
+    'Branches.get_many',
+    tm.MethodAnnotated[
+        tm.Summary('Get branches by ID'),
+        tm.Description('Retrieve several branches in one query; results follow the order of the given IDs'),
+        tm.Tag(name='organizations'),
+        tm.Example(
+            name='get_many_branches_example',
+            params=[tm.ExampleField(name='branch_ids', value=[1, 2], summary='Branch IDs')],
+        ),
+        ReadOnly(),
+    ],
+)
+def get_many_branches(
+    branch_ids: t.Annotated[list[str], tp.Summary('Branch IDs'), tp.Required(), tp.MaxLength(MAX_LOOKUP_SIZE)],
+) -> t.Annotated[list[Lookup[Branch]], tp.Summary('One lookup per requested ID')]:
+    branch_service: BranchService = current_app.container.branch_service  # type: ignore
+    return Lookup[Branch].many(
+        branch_service.get_branches_by_ids,
+        branch_ids,
+        not_found=lambda branch_id: BranchNotFoundError(f'Branch with id {branch_id} not found'),
+    )
+
+
 @jsonrpc_bp.method(
     'Branches.create',
     tm.MethodAnnotated[
@@ -179,12 +210,17 @@ def close_branch(branch_id: t.Annotated[str, tp.Summary('Branch ID'), tp.Require
         tm.Tag(name='organizations'),
         tm.Error(code=-32002, message='No staff found', data={'reason': 'no staff available'}),
         tm.Example(name='all_staff_example', params=[]),
+        ReadOnly(),
     ],
 )
-def list_staff() -> t.Annotated[Page[Staff], tp.Summary('List of all staff')]:
+def list_staff(
+    limit: t.Annotated[
+        int, tp.Summary('Maximum number of results per page'), tp.Minimum(1), tp.Maximum(MAX_PAGE_SIZE)
+    ] = DEFAULT_PAGE_SIZE,
+    after: t.Annotated[str | None, tp.Summary('Cursor returned as next_cursor by the previous page')] = None,
+) -> t.Annotated[Page[Staff], tp.Summary('List of all staff')]:
     staff_service: StaffService = current_app.container.staff_service  # type: ignore
-    staffs = staff_service.find_all_staff()
-    return Page[Staff](results=staffs, count=len(staffs))
+    return Page[Staff].paginate(staff_service.find_all_staff, limit=limit, after=after)
 
 
 @jsonrpc_bp.method(
@@ -195,6 +231,7 @@ def list_staff() -> t.Annotated[Page[Staff], tp.Summary('List of all staff')]:
         tm.Tag(name='organizations'),
         tm.Error(code=-32002, message='Staff not found', data={'reason': 'invalid staff ID'}),
         tm.Example(name='get_staff_example', params=[tm.ExampleField(name='staff_id', value=1, summary='Staff ID')]),
+        ReadOnly(),
     ],
 )
 def get_staff(
@@ -204,6 +241,29 @@ def get_staff(
     return staff_service.get_staff(staff_id)
 
 
+@jsonrpc_bp.method(
+    'Staff.get_many',
+    tm.MethodAnnotated[
+        tm.Summary('Get staff by ID'),
+        tm.Description('Retrieve several staff in one query; results follow the order of the given IDs'),
+        tm.Tag(name='organizations'),
+        tm.Example(
+            name='get_many_staff_example', params=[tm.ExampleField(name='staff_ids', value=[1, 2], summary='Staff IDs')]
+        ),
+        ReadOnly(),
+    ],
+)
+def get_many_staff(
+    staff_ids: t.Annotated[list[str], tp.Summary('Staff IDs'), tp.Required(), tp.MaxLength(MAX_LOOKUP_SIZE)],
+) -> t.Annotated[list[Lookup[Staff]], tp.Summary('One lookup per requested ID')]:
+    staff_service: StaffService = current_app.container.staff_service  # type: ignore
+    return Lookup[Staff].many(
+        staff_service.get_staff_by_ids,
+        staff_ids,
+        not_found=lambda staff_id: StaffNotFoundError(f'Staff with id {staff_id} not found'),
+    )
+
+
 @jsonrpc_bp.method(
     'Staff.create',
     tm.MethodAnnotated[
@@ -8,13 +8,14 @@ from flask_jsonrpc import JSONRPCBlueprint
 import flask_jsonrpc.types.params as tp
 import flask_jsonrpc.types.methods as tm
 
-from lms.app.schemas import Page
+from lms.app.rpc import ReadOnly, MeteredJSONRPCSite
+from lms.app.schemas import MAX_PAGE_SIZE, MAX_LOOKUP_SIZE, DEFAULT_PAGE_SIZE, Page, Lookup
 from lms.app.schemas.patrons import PatronCreate, PatronUpdate
 from lms.app.services.patrons import FineService, PatronService
 from lms.app.exceptions.patrons import FineNotFoundError, PatronNotFoundError
 from lms.domain.patrons.entities import Fine, Patron
 
-jsonrpc_bp = JSONRPCBlueprint('patrons', __name__)
+jsonrpc_bp = JSONRPCBlueprint('patrons', __name__, jsonrpc_site=MeteredJSONRPCSite)
 
 
 @jsonrpc_bp.errorhandler(PatronNotFoundError)
@@ -34,12 +35,17 @@ def handle_fine_not_found_error(ex: FineNotFoundError) -> dict[str, t.Any]:
         tm.Description('Retrieve all patrons'),
         tm.Tag(name='patrons'),
         tm.Example(name='list_patrons_example', params=[]),
+        ReadOnly(),
     ],
 )
-def list_patrons() -> t.Annotated[Page[Patron], tp.Summary('Patron list')]:
+def list_patrons(
+    limit: t.Annotated[
+        int, tp.Summary('Maximum number of results per page'), tp.Minimum(1), tp.Maximum(MAX_PAGE_SIZE)
+    ] = DEFAULT_PAGE_SIZE,
+    after: t.Annotated[str | None, tp.Summary('Cursor returned as next_cursor by the previous page')] = None,
+) -> t.Annotated[Page[Patron], tp.Summary('Patron list')]:
     patron_service: PatronService = current_app.container.patron_service  # type: ignore
-    patrons = patron_service.find_all_patrons()
-    return Page[Patron](results=patrons, count=len(patrons))
+    return Page[Patron].paginate(patron_service.find_all_patrons, limit=limit, after=after)
 
 
 @jsonrpc_bp.method(
@@ -50,6 +56,7 @@ def list_patrons() -> t.Annotated[Page[Patron], tp.Summary('Patron list')]:
         tm.Tag(name='patrons'),
         tm.Error(code=-32002, message='Patron not found', data={'reason': 'invalid patron ID'}),
         tm.Example(name='get_patron_example', params=[tm.ExampleField(name='patron_id', value=1, summary='Patron ID')]),
+        ReadOnly(),
     ],
 )
 def get_patron(
@@ -59,6 +66,30 @@ def get_patron(
     return patron_service.get_patron(patron_id)
 
 
+@jsonrpc_bp.method(
+    'Patrons.get_many',
+    tm.MethodAnnotated[
+        tm.Summary('Get patrons by ID'),
+        tm.Description('Retrieve several patrons in one query; results follow the order of the given IDs'),
+        tm.Tag(name='patrons'),
+        tm.Example(
+            name='get_many_patrons_example',
+            params=[tm.ExampleField(name='patron_ids', value=[1, 2], summary='Patron IDs')],
+        ),
+        ReadOnly(),
+    ],
+)
+def get_many_patrons(
+    patron_ids: t.Annotated[list[str], tp.Summary('Patron IDs'), tp.Required(), tp.MaxLength(MAX_LOOKUP_SIZE)],
+) -> t.Annotated[list[Lookup[Patron]], tp.Summary('One lookup per requested ID')]:
+    patron_service: PatronService = current_app.container.patron_service  # type: ignore
+    return Lookup[Patron].many(
+        patron_service.get_patrons_by_ids,
+        patron_ids,
+        not_found=lambda patron_id: PatronNotFoundError(f'Patron with id {patron_id} not found'),
+    )
+
+
 @jsonrpc_bp.method(
     'Patrons.create',
     tm.MethodAnnotated[
@@ -176,12 +207,17 @@ def archive_patron(
         tm.Description('Retrieve all fines'),
         tm.Tag(name='fine'),
         tm.Example(name='list_fines_example', params=[]),
+        ReadOnly(),
     ],
 )
-def list_fines() -> t.Annotated[Page[Fine], tp.Summary('Fine list')]:
+def list_fines(
+    limit: t.Annotated[
+        int, tp.Summary('Maximum number of results per page'), tp.Minimum(1), tp.Maximum(MAX_PAGE_SIZE)
+    ] = DEFAULT_PAGE_SIZE,
+    after: t.Annotated[str | None, tp.Summary('Cursor returned as next_cursor by the previous page')] = None,
+) -> t.Annotated[Page[Fine], tp.Summary('Fine list')]:
     fine_service: FineService = current_app.container.fine_service  # type: ignore
-    fines = fine_service.find_all_fines()
-    return Page[Fine](results=fines, count=len(fines))
+    return Page[Fine].paginate(fine_service.find_all_fines, limit=limit, after=after)
 
 
 @jsonrpc_bp.method(
@@ -192,6 +228,7 @@ def list_fines() -> t.Annotated[Page[Fine], tp.Summary('Fine list')]:
         tm.Tag(name='patrons'),
         tm.Error(code=-32002, message='Patron not found', data={'reason': 'invalid patron ID'}),
         tm.Example(name='get_patron_example', params=[tm.ExampleField(name='patron_id', value=1, summary='Patron ID')]),
+        ReadOnly(),
     ],
 )
 def get_fine(
@@ -201,6 +238,29 @@ def get_fine(
     return fine_service.get_fine(fine_id)
 
 
+@jsonrpc_bp.method(
+    'Fines.get_many',
+    tm.MethodAnnotated[
+        tm.Summary('Get fines by ID'),
+        tm.Description('Retrieve several fines in one query; results follow the order of the given IDs'),
+        tm.Tag(name='patrons'),
+        tm.Example(
+            name='get_many_fines_example', params=[tm.ExampleField(name='fine_ids', value=[1, 2], summary='Fine IDs')]
+        ),
+        ReadOnly(),
+    ],
+)
+def get_many_fines(
+    fine_ids: t.Annotated[list[str], tp.Summary('Fine IDs'), tp.Required(), tp.MaxLength(MAX_LOOKUP_SIZE)],
+) -> t.Annotated[list[Lookup[Fine]], tp.Summary('One lookup per requested ID')]:
+    fine_service: FineService = current_app.container.fine_service  # type: ignore
+    return Lookup[Fine].many(
+        fine_service.get_fines_by_ids,
+        fine_ids,
+        not_found=lambda fine_id: FineNotFoundError(f'Fine with id {fine_id} not found'),
+    )
+
+
 @jsonrpc_bp.method(
     'Fines.pay',
     tm.MethodAnnotated[
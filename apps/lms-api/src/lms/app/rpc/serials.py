@@ -8,13 +8,14 @@ from flask_jsonrpc import JSONRPCBlueprint
 import flask_jsonrpc.types.params as tp
 import flask_jsonrpc.types.methods as tm
 
-from lms.app.schemas import Page
+from lms.app.rpc import ReadOnly, MeteredJSONRPCSite
+from lms.app.schemas import MAX_PAGE_SIZE, DEFAULT_PAGE_SIZE, Page
 from lms.app.schemas.serials import SerialCreate
 from lms.app.services.serials import SerialService
 from lms.app.exceptions.serials import SerialNotFoundError, SerialIssueNotFoundError
 from lms.domain.serials.entities import Serial
 
-jsonrpc_bp = JSONRPCBlueprint('serials', __name__)
+jsonrpc_bp = JSONRPCBlueprint('serials', __name__, jsonrpc_site=MeteredJSONRPCSite)
 
 
 @jsonrpc_bp.errorhandler(SerialNotFoundError)
@@ -33,18 +34,26 @@ def handle_serial_issue_not_found_error(ex: SerialIssueNotFoundError) -> dict[st
         tm.Summary('List serials'),
         tm.Description('Get a list of all serials/periodicals'),
         tm.Tag(name='serials', summary='Serials Management', description='Library serials and periodicals operations'),
+        ReadOnly(),
     ],
 )
-def list_serials() -> t.Annotated[Page[Serial], tp.Summary('List of serials')]:
+def list_serials(
+    limit: t.Annotated[
+        int, tp.Summary('Maximum number of results per page'), tp.Minimum(1), tp.Maximum(MAX_PAGE_SIZE)
+    ] = DEFAULT_PAGE_SIZE,
+    after: t.Annotated[str | None, tp.Summary('Cursor returned as next_cursor by the previous page')] = None,
+) -> t.Annotated[Page[Serial], tp.Summary('List of serials')]:
     serial_service: SerialService = current_app.container.serial_service  # type: ignore
-    serials = serial_service.find_all_serials()
-    return Page[Serial](results=serials, count=len(serials))
+    return Page[Serial].paginate(serial_service.find_all_serials, limit=limit, after=after)
 
 
 @jsonrpc_bp.method(
     'Serials.get',
     tm.MethodAnnotated[
-        tm.Summary('Get serial by ID'), tm.Description('Retrieve details of a specific serial'), tm.Tag(name='serials')
+        tm.Summary('Get serial by ID'),
+        tm.Description('Retrieve details of a specific serial'),
+        tm.Tag(name='serials'),
+        ReadOnly(),
     ],
 )
 def get_serial(
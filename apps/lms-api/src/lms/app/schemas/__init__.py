@@ -1,11 +1,34 @@
 from __future__ import annotations
 
+import uuid
+import base64
 import typing as t
 from datetime import datetime
 
 from pydantic import Field, BaseModel, ConfigDict
 
+from lms.domain import DomainEntity
+from lms.app.exceptions import ApplicationError, InvalidCursorError
+
 T_Page_Results = t.TypeVar('T_Page_Results')
+T_Lookup_Result = t.TypeVar('T_Lookup_Result')
+
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+MAX_LOOKUP_SIZE = 500
+
+
+def encode_cursor(entity_id: str) -> str:
+    return base64.urlsafe_b64encode(uuid.UUID(entity_id).bytes).rstrip(b'=').decode('ascii')
+
+
+def decode_cursor(cursor: str | None) -> str | None:
+    if cursor is None:
+        return None
+    try:
+        return str(uuid.UUID(bytes=base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))))
+    except ValueError as e:
+        raise InvalidCursorError(cursor) from e
 
 
 class BaseSchema(BaseModel):
@@ -20,7 +43,51 @@ class BaseSchema(BaseModel):
 
 class Page[T_Page_Results](BaseSchema):
     results: list[T_Page_Results] = Field(..., description='List of items on the current page')
-    count: int = Field(..., description='Total number of items across all pages')
+    count: int = Field(..., description='Number of items on the current page')
+    next_cursor: str | None = Field(None, description='Opaque cursor of the next page, null on the last page')
+
+    @classmethod
+    def paginate(
+        cls, find_all: t.Callable[..., list[T_Page_Results]], /, *, limit: int, after: str | None = None
+    ) -> t.Self:
+        # One extra row tells whether a next page exists without counting the table.
+        window = find_all(limit=limit + 1, after=decode_cursor(after))
+        results = window[:limit]
+        next_cursor = None
+        if len(window) > limit:
+            next_cursor = encode_cursor(t.cast(str, t.cast(DomainEntity, results[-1]).id))
+        return cls(results=results, count=len(results), next_cursor=next_cursor)
+
+
+class LookupFailure(BaseSchema):
+    code: str = Field(..., description='Name of the error, as reported by the single-record method')
+    message: str = Field(..., description='Human readable description of the error')
+
+
+class Lookup[T_Lookup_Result](BaseSchema):
+    id: str = Field(..., description='Requested ID')
+    result: T_Lookup_Result | None = Field(None, description='Record with the requested ID, null if not found')
+    error: LookupFailure | None = Field(None, description='Why the record was not returned, null if found')
+
+    @classmethod
+    def many(
+        cls,
+        get_by_ids: t.Callable[[list[str]], t.Mapping[str, T_Lookup_Result]],
+        ids: list[str],
+        /,
+        *,
+        not_found: t.Callable[[str], ApplicationError],
+    ) -> list[t.Self]:
+        # One query for all of the IDs; a missing record fails its own element, not the call.
+        found = get_by_ids(ids)
+        lookups = []
+        for entity_id in ids:
+            if entity_id in found:
+                lookups.append(cls(id=entity_id, result=found[entity_id]))
+            else:
+                error = not_found(entity_id)
+                lookups.append(cls(id=entity_id, error=LookupFailure(code=type(error).__name__, message=error.message)))
+        return lookups
 
 
 class TimestampMixin(BaseModel):
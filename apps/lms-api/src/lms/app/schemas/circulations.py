@@ -1 +1,12 @@
 from __future__ import annotations
+
+from pydantic import Field
+
+from . import BaseSchema
+
+
+class HoldPosition(BaseSchema):
+    hold_id: str = Field(description='Hold ID')
+    item_id: str = Field(description='Item ID')
+    patron_id: str = Field(description='Patron ID')
+    position: int = Field(ge=1, description='Place in the item hold queue, 1 being the next to be served')
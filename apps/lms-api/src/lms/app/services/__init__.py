@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import typing as t
+import threading
 
 from flask import Flask
 
@@ -53,14 +54,19 @@ def register(app: Flask) -> None:
         BranchAssignmentService,
         BranchUniquenessService,
     )
+    from lms.infrastructure.database.cache import ReferenceCache
+    from lms.infrastructure.database.outbox import OutboxRelay, SQLAlchemyOutbox
+    from lms.infrastructure.database.unit_of_work import SQLAlchemyUnitOfWork
     from lms.infrastructure.database.repositories.patrons import SQLAlchemyFineRepository, SQLAlchemyPatronRepository
     from lms.infrastructure.database.repositories.serials import (
         SQLAlchemySerialRepository,
         SQLAlchemySerialIssueRepository,
     )
     from lms.infrastructure.database.repositories.catalogs import (
+        CachedCategoryRepository,
         SQLAlchemyCopyRepository,
         SQLAlchemyItemRepository,
+        CachedPublisherRepository,
         SQLAlchemyAuthorRepository,
         SQLAlchemyCategoryRepository,
         SQLAlchemyPublisherRepository,
@@ -70,14 +76,50 @@ def register(app: Flask) -> None:
         SQLAlchemyAcquisitionOrderRepository,
         SQLAlchemyAcquisitionOrderLineRepository,
     )
-    from lms.infrastructure.database.repositories.circulations import SQLAlchemyHoldRepository, SQLAlchemyLoanRepository
+    from lms.infrastructure.database.repositories.circulations import (
+        SQLAlchemyHoldRepository,
+        SQLAlchemyLoanRepository,
+        SQLAlchemySweepCheckpointRepository,
+    )
     from lms.infrastructure.database.repositories.organizations import (
+        CachedStaffRepository,
+        CachedBranchRepository,
         SQLAlchemyStaffRepository,
         SQLAlchemyBranchRepository,
     )
 
     container = Container()
-    container.register_singleton('db_session', db_session)
+    container.register_singleton('db_session', lambda: db_session)
+    container.register_singleton(
+        'reference_cache',
+        lambda: ReferenceCache(max_size=app.config['REFERENCE_CACHE_SIZE'], ttl=app.config['REFERENCE_CACHE_TTL'])
+        if app.config['REFERENCE_CACHE_SIZE'] > 0
+        else None,
+    )
+
+    def reference_repository(plain: type[t.Any], cached: type[t.Any]) -> t.Callable[[], t.Any]:
+        def factory() -> t.Any:  # noqa: ANN401
+            cache = container.resolve('reference_cache')
+            session = container.resolve('db_session')
+            return cached(session, cache) if cache is not None else plain(session)
+
+        return factory
+
+    container.register_singleton(
+        'outbox', lambda: SQLAlchemyOutbox(container.resolve('db_session')) if app.config['OUTBOX_ENABLED'] else None
+    )
+    container.register_singleton(
+        'unit_of_work',
+        lambda: SQLAlchemyUnitOfWork(container.resolve('db_session'), outbox=container.resolve('outbox')),
+    )
+    container.register_singleton(
+        'outbox_relay',
+        lambda: OutboxRelay(
+            container.resolve('db_session'),
+            container.resolve('unit_of_work'),
+            max_attempts=app.config['OUTBOX_MAX_ATTEMPTS'],
+        ),
+    )
 
     # Acquisition Repositories
     container.register_singleton(
@@ -98,20 +140,25 @@ def register(app: Flask) -> None:
         'author_repository', lambda: SQLAlchemyAuthorRepository(container.resolve('db_session'))
     )
     container.register_singleton(
-        'category_repository', lambda: SQLAlchemyCategoryRepository(container.resolve('db_session'))
+        'category_repository', reference_repository(SQLAlchemyCategoryRepository, CachedCategoryRepository)
     )
     container.register_singleton(
-        'publisher_repository', lambda: SQLAlchemyPublisherRepository(container.resolve('db_session'))
+        'publisher_repository', reference_repository(SQLAlchemyPublisherRepository, CachedPublisherRepository)
     )
 
     # Circulations Repositories
     container.register_singleton('loan_repository', lambda: SQLAlchemyLoanRepository(container.resolve('db_session')))
     container.register_singleton('hold_repository', lambda: SQLAlchemyHoldRepository(container.resolve('db_session')))
+    container.register_singleton(
+        'sweep_checkpoint_repository', lambda: SQLAlchemySweepCheckpointRepository(container.resolve('db_session'))
+    )
 
     # Organization Repositories
-    container.register_singleton('staff_repository', lambda: SQLAlchemyStaffRepository(container.resolve('db_session')))
     container.register_singleton(
-        'branch_repository', lambda: SQLAlchemyBranchRepository(container.resolve('db_session'))
+        'staff_repository', reference_repository(SQLAlchemyStaffRepository, CachedStaffRepository)
+    )
+    container.register_singleton(
+        'branch_repository', reference_repository(SQLAlchemyBranchRepository, CachedBranchRepository)
     )
 
     # Patrons Repositories
@@ -132,28 +179,44 @@ def register(app: Flask) -> None:
     container.register_singleton(
         'item_service',
         lambda: ItemService(
-            item_repository=container.resolve('item_repository'), copy_repository=container.resolve('copy_repository')
+            item_repository=container.resolve('item_repository'),
+            copy_repository=container.resolve('copy_repository'),
+            unit_of_work=container.resolve('unit_of_work'),
         ),
     )
     container.register_singleton(
-        'author_service', lambda: AuthorService(author_repository=container.resolve('author_repository'))
+        'author_service',
+        lambda: AuthorService(
+            author_repository=container.resolve('author_repository'), unit_of_work=container.resolve('unit_of_work')
+        ),
     )
     container.register_singleton(
-        'category_service', lambda: CategoryService(category_repository=container.resolve('category_repository'))
+        'category_service',
+        lambda: CategoryService(
+            category_repository=container.resolve('category_repository'), unit_of_work=container.resolve('unit_of_work')
+        ),
     )
     container.register_singleton(
-        'publisher_service', lambda: PublisherService(publisher_repository=container.resolve('publisher_repository'))
+        'publisher_service',
+        lambda: PublisherService(
+            publisher_repository=container.resolve('publisher_repository'),
+            unit_of_work=container.resolve('unit_of_work'),
+        ),
     )
 
     # Acquisition Services
     container.register_singleton(
-        'vendor_service', lambda: VendorService(vendor_repository=container.resolve('vendor_repository'))
+        'vendor_service',
+        lambda: VendorService(
+            vendor_repository=container.resolve('vendor_repository'), unit_of_work=container.resolve('unit_of_work')
+        ),
     )
     container.register_singleton(
         'acquisition_order_service',
         lambda: AcquisitionOrderService(
             acquisition_order_repository=container.resolve('acquisition_order_repository'),
             acquisition_order_line_repository=container.resolve('acquisition_order_line_repository'),
+            unit_of_work=container.resolve('unit_of_work'),
         ),
     )
 
@@ -164,10 +227,7 @@ def register(app: Flask) -> None:
     )
     container.register_singleton(
         'patron_reinstatement_service',
-        lambda: PatronReinstatementService(
-            patron_repository=container.resolve('patron_repository'),
-            loan_repository=container.resolve('loan_repository'),
-        ),
+        lambda: PatronReinstatementService(patron_repository=container.resolve('patron_repository')),
     )
     container.register_singleton(
         'fine_policy_service',
@@ -182,19 +242,18 @@ def register(app: Flask) -> None:
         'hold_policy_service', lambda: HoldPolicyService(hold_repository=container.resolve('hold_repository'))
     )
     container.register_singleton(
-        'patron_holding_service', lambda: PatronHoldingService(hold_repository=container.resolve('hold_repository'))
+        'patron_holding_service', lambda: PatronHoldingService(patron_repository=container.resolve('patron_repository'))
     )
     container.register_singleton(
-        'patron_barring_service',
-        lambda: PatronBarringService(
-            patron_repository=container.resolve('patron_repository'),
-            loan_repository=container.resolve('loan_repository'),
-        ),
+        'patron_barring_service', lambda: PatronBarringService(patron_repository=container.resolve('patron_repository'))
     )
 
     # Catalog Services
     container.register_singleton(
-        'copy_service', lambda: CopyService(copy_repository=container.resolve('copy_repository'))
+        'copy_service',
+        lambda: CopyService(
+            copy_repository=container.resolve('copy_repository'), unit_of_work=container.resolve('unit_of_work')
+        ),
     )
 
     container.register_singleton(
@@ -205,8 +264,10 @@ def register(app: Flask) -> None:
             branch_repository=container.resolve('branch_repository'),
             staff_repository=container.resolve('staff_repository'),
             copy_repository=container.resolve('copy_repository'),
+            sweep_checkpoint_repository=container.resolve('sweep_checkpoint_repository'),
             loan_policy_service=container.resolve('loan_policy_service'),
             patron_barring_service=container.resolve('patron_barring_service'),
+            unit_of_work=container.resolve('unit_of_work'),
         ),
     )
     container.register_singleton(
@@ -223,6 +284,7 @@ def register(app: Flask) -> None:
             staff_repository=container.resolve('staff_repository'),
             loan_repository=container.resolve('loan_repository'),
             copy_repository=container.resolve('copy_repository'),
+            unit_of_work=container.resolve('unit_of_work'),
         ),
     )
 
@@ -232,6 +294,7 @@ def register(app: Flask) -> None:
             serial_repository=container.resolve('serial_repository'),
             serial_issue_repository=container.resolve('serial_issue_repository'),
             item_repository=container.resolve('item_repository'),
+            unit_of_work=container.resolve('unit_of_work'),
         ),
     )
     container.register_singleton(
@@ -239,6 +302,7 @@ def register(app: Flask) -> None:
         lambda: FineService(
             fine_repository=container.resolve('fine_repository'),
             fine_policy_service=container.resolve('fine_policy_service'),
+            unit_of_work=container.resolve('unit_of_work'),
         ),
     )
     container.register_singleton(
@@ -247,6 +311,7 @@ def register(app: Flask) -> None:
             patron_repository=container.resolve('patron_repository'),
             patron_uniqueness_service=container.resolve('patron_uniqueness_service'),
             patron_reinstatement_service=container.resolve('patron_reinstatement_service'),
+            unit_of_work=container.resolve('unit_of_work'),
         ),
     )
 
@@ -267,6 +332,7 @@ def register(app: Flask) -> None:
             branch_repository=container.resolve('branch_repository'),
             branch_uniqueness_service=container.resolve('branch_uniqueness_service'),
             branch_assignment_service=container.resolve('branch_assignment_service'),
+            unit_of_work=container.resolve('unit_of_work'),
         ),
     )
 
@@ -279,6 +345,52 @@ def register(app: Flask) -> None:
         lambda: StaffService(
             staff_repository=container.resolve('staff_repository'),
             staff_uniqueness_service=container.resolve('staff_uniqueness_service'),
+            unit_of_work=container.resolve('unit_of_work'),
         ),
     )
     app.container = container  # type: ignore
+
+
+REFERENCE_REPOSITORIES = ('branch_repository', 'staff_repository', 'category_repository', 'publisher_repository')
+
+
+def preload_reference_cache(app: Flask) -> None:
+    """Fills the reference cache up to its size so the first calls after a deploy do not all miss."""
+    from lms.infrastructure.logging import logger
+    from lms.infrastructure.database import RepositoryError
+
+    container: Container = app.container  # type: ignore
+    cache = container.resolve('reference_cache')
+    if cache is None:
+        return
+    loaded = 0
+    with app.app_context():
+        for name in REFERENCE_REPOSITORIES:
+            if (limit := cache.max_size - len(cache)) <= 0:
+                break
+            try:
+                loaded += container.resolve(name).preload(limit)
+            except RepositoryError:
+                # The schema may not exist yet, e.g. when the app is created to run the migrations.
+                logger.warning('Could not preload the reference cache from %s', name, exc_info=True)
+                return
+    logger.info('Preloaded %d reference rows', loaded)
+
+
+def preload_reference_cache_on_first_request(app: Flask) -> None:
+    """Preloads the reference cache when the process serves its first request.
+
+    Not done in ``create_app``: every CLI command creates the app, migrations included, and a connection opened before
+    gunicorn forks its workers with ``--preload`` would be shared by all of them.
+    """
+    lock = threading.Lock()
+    done = threading.Event()
+
+    @app.before_request
+    def preload() -> None:
+        if done.is_set():
+            return
+        with lock:
+            if not done.is_set():
+                preload_reference_cache(app)
+                done.set()
@@ -2,9 +2,8 @@ from __future__ import annotations
 
 from decimal import Decimal
 
-from lms.domain import DomainError
+from lms.domain import UnitOfWork, DomainError
 from lms.app.exceptions import ServiceFailed
-from lms.infrastructure.event_bus import event_bus
 from lms.app.exceptions.acquisitions import VendorNotFoundError, AcquisitionOrderNotFoundError
 from lms.domain.acquisitions.entities import Vendor, AcquisitionOrder
 from lms.domain.acquisitions.repositories import (
@@ -21,9 +20,11 @@ class AcquisitionOrderService:
         *,
         acquisition_order_repository: AcquisitionOrderRepository,
         acquisition_order_line_repository: AcquisitionOrderLineRepository,
+        unit_of_work: UnitOfWork,
     ) -> None:
         self.acquisition_order_repository = acquisition_order_repository
         self.acquisition_order_line_repository = acquisition_order_line_repository
+        self.unit_of_work = unit_of_work
 
     def _get_order(self, order_id: str) -> AcquisitionOrder:
         order = self.acquisition_order_repository.get_by_id(order_id)
@@ -31,77 +32,78 @@ class AcquisitionOrderService:
             raise AcquisitionOrderNotFoundError(f'Acquisition order with id {order_id} not found')
         return order
 
-    def find_all_orders(self) -> list[AcquisitionOrder]:
-        return self.acquisition_order_repository.find_all()
+    def find_all_orders(self, *, limit: int | None = None, after: str | None = None) -> list[AcquisitionOrder]:
+        return self.acquisition_order_repository.find_all(limit=limit, after=after)
 
     def get_order(self, order_id: str) -> AcquisitionOrder:
         return self._get_order(order_id)
 
     def create_order(self, vendor_id: str, staff_id: str) -> AcquisitionOrder:
-        try:
-            order = AcquisitionOrder.create(vendor_id=vendor_id, staff_id=staff_id)
-        except DomainError as e:
-            raise ServiceFailed('The acquisition order cannot be created', cause=e) from e
-        created_order = self.acquisition_order_repository.save(order)
-        event_bus.publish_events()
-        return created_order
+        with self.unit_of_work:
+            try:
+                order = AcquisitionOrder.create(vendor_id=vendor_id, staff_id=staff_id)
+            except DomainError as e:
+                raise ServiceFailed('The acquisition order cannot be created', cause=e) from e
+            created_order = self.acquisition_order_repository.save(order)
+            return created_order
 
     def add_line_to_order(self, order_id: str, item_id: str, quantity: int, unit_price: Decimal) -> AcquisitionOrder:
-        order = self._get_order(order_id)
-        try:
-            order.add_line(item_id=item_id, unit_price=unit_price, quantity=quantity)
-        except DomainError as e:
-            raise ServiceFailed('The line cannot be added to the acquisition order', cause=e) from e
-        updated_order = self.acquisition_order_repository.save(order)
-        event_bus.publish_events()
-        return updated_order
+        with self.unit_of_work:
+            order = self._get_order(order_id)
+            try:
+                order.add_line(item_id=item_id, unit_price=unit_price, quantity=quantity)
+            except DomainError as e:
+                raise ServiceFailed('The line cannot be added to the acquisition order', cause=e) from e
+            updated_order = self.acquisition_order_repository.save(order)
+            return updated_order
 
     def remove_line_from_order(self, order_id: str, order_line_id: str) -> AcquisitionOrder:
-        order = self._get_order(order_id)
-        try:
-            order.remove_line(order_line_id=order_line_id)
-        except DomainError as e:
-            raise ServiceFailed('The line cannot be removed from the acquisition order', cause=e) from e
-        updated_order = self.acquisition_order_repository.save(order)
-        event_bus.publish_events()
-        return updated_order
+        with self.unit_of_work:
+            order = self._get_order(order_id)
+            try:
+                order.remove_line(order_line_id=order_line_id)
+            except DomainError as e:
+                raise ServiceFailed('The line cannot be removed from the acquisition order', cause=e) from e
+            updated_order = self.acquisition_order_repository.save(order)
+            return updated_order
 
     def receive_line_from_order(
         self, order_id: str, order_line_id: str, received_quantity: int | None = None
     ) -> AcquisitionOrder:
-        order = self._get_order(order_id)
-        try:
-            order.receive_line(order_line_id=order_line_id, received_quantity=received_quantity)
-        except DomainError as e:
-            raise ServiceFailed('The line cannot be marked as received in the acquisition order', cause=e) from e
-        updated_order = self.acquisition_order_repository.save(order)
-        event_bus.publish_events()
-        return updated_order
+        with self.unit_of_work:
+            order = self._get_order(order_id)
+            try:
+                order.receive_line(order_line_id=order_line_id, received_quantity=received_quantity)
+            except DomainError as e:
+                raise ServiceFailed('The line cannot be marked as received in the acquisition order', cause=e) from e
+            updated_order = self.acquisition_order_repository.save(order)
+            return updated_order
 
     def submit_order(self, order_id: str) -> AcquisitionOrder:
-        order = self._get_order(order_id)
-        try:
-            order.submit()
-        except DomainError as e:
-            raise ServiceFailed('The acquisition order cannot be submitted', cause=e) from e
-        updated_order = self.acquisition_order_repository.save(order)
-        event_bus.publish_events()
-        return updated_order
+        with self.unit_of_work:
+            order = self._get_order(order_id)
+            try:
+                order.submit()
+            except DomainError as e:
+                raise ServiceFailed('The acquisition order cannot be submitted', cause=e) from e
+            updated_order = self.acquisition_order_repository.save(order)
+            return updated_order
 
     def cancel_order(self, order_id: str) -> AcquisitionOrder:
-        order = self._get_order(order_id)
-        try:
-            order.mark_as_cancelled()
-        except DomainError as e:
-            raise ServiceFailed('The acquisition order cannot be cancelled', cause=e) from e
-        updated_order = self.acquisition_order_repository.save(order)
-        event_bus.publish_events()
-        return updated_order
+        with self.unit_of_work:
+            order = self._get_order(order_id)
+            try:
+                order.mark_as_cancelled()
+            except DomainError as e:
+                raise ServiceFailed('The acquisition order cannot be cancelled', cause=e) from e
+            updated_order = self.acquisition_order_repository.save(order)
+            return updated_order
 
 
 class VendorService:
-    def __init__(self, /, *, vendor_repository: VendorRepository) -> None:
+    def __init__(self, /, *, vendor_repository: VendorRepository, unit_of_work: UnitOfWork) -> None:
         self.vendor_repository = vendor_repository
+        self.unit_of_work = unit_of_work
 
     def _get(self, vendor_id: str) -> Vendor:
         model = self.vendor_repository.get_by_id(vendor_id)
@@ -109,8 +111,8 @@ class VendorService:
             raise VendorNotFoundError(f'Vendor with id {vendor_id} not found')
         return model
 
-    def find_all_vendors(self) -> list[Vendor]:
-        return self.vendor_repository.find_all()
+    def find_all_vendors(self, *, limit: int | None = None, after: str | None = None) -> list[Vendor]:
+        return self.vendor_repository.find_all(limit=limit, after=after)
 
     def get_vendor(self, vendor_id: str) -> Vendor:
         return self._get(vendor_id)
@@ -118,13 +120,13 @@ class VendorService:
     def register_vendor(
         self, name: str, staff_id: str, address: str | None = None, email: str | None = None, phone: str | None = None
     ) -> Vendor:
-        try:
-            vendor = Vendor.create(name=name, staff_id=staff_id, address=address, email=email, phone=phone)
-        except DomainError as e:
-            raise ServiceFailed('The vendor cannot be created', cause=e) from e
-        created_vendor = self.vendor_repository.save(vendor)
-        event_bus.publish_events()
-        return created_vendor
+        with self.unit_of_work:
+            try:
+                vendor = Vendor.create(name=name, staff_id=staff_id, address=address, email=email, phone=phone)
+            except DomainError as e:
+                raise ServiceFailed('The vendor cannot be created', cause=e) from e
+            created_vendor = self.vendor_repository.save(vendor)
+            return created_vendor
 
     def update_vendor(
         self,
@@ -135,11 +137,11 @@ class VendorService:
         email: str | None = None,
         phone: str | None = None,
     ) -> Vendor:
-        vendor = self._get(vendor_id)
-        vendor.name = name if name is not None else vendor.name
-        vendor.address = address if address is not None else vendor.address
-        vendor.email = email if email is not None else vendor.email
-        vendor.phone = phone if phone is not None else vendor.phone
-        updated_vendor = self.vendor_repository.save(vendor)
-        event_bus.publish_events()
-        return updated_vendor
+        with self.unit_of_work:
+            vendor = self._get(vendor_id)
+            vendor.name = name if name is not None else vendor.name
+            vendor.address = address if address is not None else vendor.address
+            vendor.email = email if email is not None else vendor.email
+            vendor.phone = phone if phone is not None else vendor.phone
+            updated_vendor = self.vendor_repository.save(vendor)
+            return updated_vendor
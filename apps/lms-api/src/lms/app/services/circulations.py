@@ -3,10 +3,10 @@ from __future__ import annotations
 import typing as t
 import datetime
 
-from lms.domain import DomainError
+from lms.domain import UnitOfWork, DomainError
 from lms.app.exceptions import ServiceFailed
 from lms.app.exceptions.patrons import PatronNotFoundError
-from lms.infrastructure.logging import logger
+from lms.infrastructure.logging import get_logger
 from lms.app.exceptions.catalogs import CopyNotFoundError, ItemNotFoundError
 from lms.domain.patrons.entities import Patron
 from lms.domain.patrons.services import PatronBarringService, PatronHoldingService
@@ -16,12 +16,17 @@ from lms.app.exceptions.circulations import HoldNotFoundError, LoanNotFoundError
 from lms.domain.patrons.repositories import PatronRepository
 from lms.app.exceptions.organizations import StaffNotFoundError, BranchNotFoundError
 from lms.domain.catalogs.repositories import CopyRepository, ItemRepository
-from lms.domain.circulations.entities import Hold, Loan
+from lms.domain.circulations.entities import Hold, Loan, SweepCheckpoint
 from lms.domain.circulations.services import HoldPolicyService, LoanPolicyService
 from lms.domain.organizations.entities import Staff, Branch
-from lms.domain.circulations.repositories import HoldRepository, LoanRepository
+from lms.domain.circulations.repositories import HoldRepository, LoanRepository, SweepCheckpointRepository
 from lms.domain.organizations.repositories import StaffRepository, BranchRepository
 
+logger = get_logger(__name__)
+
+OVERDUE_LOANS_SWEEP = 'overdue_loans'
+SWEEP_CHUNK_SIZE = 500
+
 
 class LoanService:
     def __init__(
@@ -33,16 +38,20 @@ class LoanService:
         branch_repository: BranchRepository,
         staff_repository: StaffRepository,
         copy_repository: CopyRepository,
+        sweep_checkpoint_repository: SweepCheckpointRepository,
         loan_policy_service: LoanPolicyService,
         patron_barring_service: PatronBarringService,
+        unit_of_work: UnitOfWork,
     ) -> None:
         self.loan_repository = loan_repository
         self.patron_repository = patron_repository
         self.branch_repository = branch_repository
         self.staff_repository = staff_repository
         self.copy_repository = copy_repository
+        self.sweep_checkpoint_repository = sweep_checkpoint_repository
         self.loan_policy_service = loan_policy_service
         self.patron_barring_service = patron_barring_service
+        self.unit_of_work = unit_of_work
 
     def _get_copy(self, copy_id: str) -> Copy:
         copy = self.copy_repository.get_by_id(copy_id)
@@ -74,81 +83,108 @@ class LoanService:
             raise LoanNotFoundError(f'Loan with id {loan_id} not found')
         return loan
 
-    def find_all_loans(self) -> list[Loan]:
-        return self.loan_repository.find_all()
+    def find_all_loans(self, *, limit: int | None = None, after: str | None = None) -> list[Loan]:
+        return self.loan_repository.find_all(limit=limit, after=after)
 
     def get_loan(self, loan_id: str) -> Loan:
         return self._get_loan(loan_id)
 
+    def get_loans_by_ids(self, loan_ids: list[str]) -> dict[str, Loan]:
+        return self.loan_repository.get_by_ids(loan_ids)
+
     def checkout_copy(self, copy_id: str, patron_id: str, staff_out_id: str) -> Loan:
-        patron = self._get_patron(patron_id)
-        staff = self._get_staff(staff_out_id)
-        branch = self._get_branch(patron.branch_id)
-        copy = self._get_copy(copy_id)
-        try:
-            loan = Loan.create(
-                copy=copy,
-                patron=patron,
-                staff=staff,
-                branch=branch,
-                patron_barring_service=self.patron_barring_service,
-                loan_policy_service=self.loan_policy_service,
-            )
-        except DomainError as e:
-            raise ServiceFailed('The copy cannot be checked out', cause=e) from e
-        created_loan = self.loan_repository.save(loan, copy)
-        event_bus.publish_events()
-        return created_loan
+        with self.unit_of_work:
+            patron = self._get_patron(patron_id)
+            staff = self._get_staff(staff_out_id)
+            branch = self._get_branch(patron.branch_id)
+            copy = self._get_copy(copy_id)
+            try:
+                loan = Loan.create(
+                    copy=copy,
+                    patron=patron,
+                    staff=staff,
+                    branch=branch,
+                    patron_barring_service=self.patron_barring_service,
+                    loan_policy_service=self.loan_policy_service,
+                )
+            except DomainError as e:
+                raise ServiceFailed('The copy cannot be checked out', cause=e) from e
+            created_loan = self.loan_repository.save(loan, copy)
+            return created_loan
 
     def checkin_copy(self, loan_id: str, staff_in_id: str) -> Loan:
-        loan = self._get_loan(loan_id)
-        copy = self._get_copy(loan.copy_id)
-        try:
-            loan.mark_as_returned(copy=copy, return_date=datetime.date.today(), staff_in_id=staff_in_id)
-        except DomainError as e:
-            raise ServiceFailed('The copy cannot be checked in', cause=e) from e
-        updated_loan = self.loan_repository.save(loan, copy)
-        event_bus.publish_events()
-        return updated_loan
+        with self.unit_of_work:
+            loan = self._get_loan(loan_id)
+            copy = self._get_copy(loan.copy_id)
+            try:
+                loan.mark_as_returned(copy=copy, return_date=datetime.date.today(), staff_in_id=staff_in_id)
+            except DomainError as e:
+                raise ServiceFailed('The copy cannot be checked in', cause=e) from e
+            updated_loan = self.loan_repository.save(loan, copy)
+            return updated_loan
 
     def damaged_copy(self, loan_id: str) -> Loan:
-        loan = self._get_loan(loan_id)
-        copy = self._get_copy(loan.copy_id)
-        try:
-            loan.mark_damaged(copy=copy)
-        except DomainError as e:
-            raise ServiceFailed('The copy cannot be marked as damaged', cause=e) from e
-        updated_loan = self.loan_repository.save(loan, copy)
-        event_bus.publish_events()
-        return updated_loan
+        with self.unit_of_work:
+            loan = self._get_loan(loan_id)
+            copy = self._get_copy(loan.copy_id)
+            try:
+                loan.mark_damaged(copy=copy)
+            except DomainError as e:
+                raise ServiceFailed('The copy cannot be marked as damaged', cause=e) from e
+            updated_loan = self.loan_repository.save(loan, copy)
+            return updated_loan
 
     def lost_copy(self, loan_id: str) -> Loan:
-        loan = self._get_loan(loan_id)
-        copy = self._get_copy(loan.copy_id)
-        try:
-            loan.mark_lost(copy=copy)
-        except DomainError as e:
-            raise ServiceFailed('The copy cannot be marked as lost', cause=e) from e
-        updated_loan = self.loan_repository.save(loan, copy)
-        event_bus.publish_events()
-        return updated_loan
+        with self.unit_of_work:
+            loan = self._get_loan(loan_id)
+            copy = self._get_copy(loan.copy_id)
+            try:
+                loan.mark_lost(copy=copy)
+            except DomainError as e:
+                raise ServiceFailed('The copy cannot be marked as lost', cause=e) from e
+            updated_loan = self.loan_repository.save(loan, copy)
+            return updated_loan
 
     def renew_loan(self, loan_id: str) -> Loan:
-        loan = self._get_loan(loan_id)
-        patron = self._get_patron(loan.patron_id)
-        copy = self._get_copy(loan.copy_id)
-        try:
-            loan.renew(
-                patron=patron,
-                copy=copy,
-                patron_barring_service=self.patron_barring_service,
-                loan_policy_service=self.loan_policy_service,
-            )
-        except DomainError as e:
-            raise ServiceFailed('The loan cannot be renewed', cause=e) from e
-        updated_loan = self.loan_repository.save(loan, copy)
-        event_bus.publish_events()
-        return updated_loan
+        with self.unit_of_work:
+            loan = self._get_loan(loan_id)
+            patron = self._get_patron(loan.patron_id)
+            copy = self._get_copy(loan.copy_id)
+            try:
+                loan.renew(
+                    patron=patron,
+                    copy=copy,
+                    patron_barring_service=self.patron_barring_service,
+                    loan_policy_service=self.loan_policy_service,
+                )
+            except DomainError as e:
+                raise ServiceFailed('The loan cannot be renewed', cause=e) from e
+            updated_loan = self.loan_repository.save(loan, copy)
+            return updated_loan
+
+    def sweep_overdue_loans(self, today: datetime.date | None = None, *, chunk_size: int = SWEEP_CHUNK_SIZE) -> int:
+        today = today or datetime.date.today()
+        checkpoint = self.sweep_checkpoint_repository.get_by_name(OVERDUE_LOANS_SWEEP) or SweepCheckpoint(
+            name=OVERDUE_LOANS_SWEEP, run_date=today
+        )
+        checkpoint.start(today)
+        swept = 0
+        while True:
+            with self.unit_of_work:
+                loans = self.loan_repository.find_overdue(today, limit=chunk_size, after=checkpoint.position)
+                if not loans:
+                    break
+                for loan in loans:
+                    loan.mark_overdue(today)
+                # Dispatching inside the chunk transaction lets the fines raised by the handlers commit together
+                # with the checkpoint, so a restarted sweep neither skips nor repeats a chunk. Background handlers
+                # wait for the unit of work, which writes them to the outbox or dispatches them after the commit.
+                event_bus.publish_events(background=False)
+                checkpoint.advance(loans[-1])
+                self.sweep_checkpoint_repository.save(checkpoint)
+            swept += len(loans)
+            logger.info('Swept %s overdue loans up to due date %s', swept, checkpoint.last_due_date)
+        return swept
 
 
 class HoldService:
@@ -167,6 +203,7 @@ class HoldService:
         hold_policy_service: HoldPolicyService,
         patron_barring_service: PatronBarringService,
         loan_policy_service: LoanPolicyService,
+        unit_of_work: UnitOfWork,
     ) -> None:
         self.hold_repository = hold_repository
         self.patron_repository = patron_repository
@@ -179,6 +216,7 @@ class HoldService:
         self.hold_policy_service = hold_policy_service
         self.patron_barring_service = patron_barring_service
         self.loan_policy_service = loan_policy_service
+        self.unit_of_work = unit_of_work
 
     def _get_copy(self, copy_id: str) -> Copy:
         copy = self.copy_repository.get_by_id(copy_id)
@@ -216,91 +254,131 @@ class HoldService:
             raise HoldNotFoundError(f'Hold with id {hold_id} not found')
         return hold
 
-    def find_all_holds(self) -> list[Hold]:
-        return self.hold_repository.find_all()
+    def find_all_holds(self, *, limit: int | None = None, after: str | None = None) -> list[Hold]:
+        return self.hold_repository.find_all(limit=limit, after=after)
 
     def get_hold(self, hold_id: str) -> Hold:
         return self._get_hold(hold_id)
 
-    def place_hold(self, patron_id: str, item_id: str, copy_id: str | None = None) -> Hold:
-        patron = self._get_patron(patron_id)
-        item = self._get_item(item_id)
-        copy = self._get_copy(copy_id) if copy_id else None
-        try:
-            hold = Hold.create(
-                patron=patron,
-                item=item,
-                copy=copy,
-                patron_holding_service=self.patron_holding_service,
-                hold_policy_service=self.hold_policy_service,
-            )
-        except DomainError as e:
-            raise ServiceFailed('The hold cannot be placed', cause=e) from e
-        created_hold = self.hold_repository.save(hold)
-        event_bus.publish_events()
-        return created_hold
+    def get_holds_by_ids(self, hold_ids: list[str]) -> dict[str, Hold]:
+        return self.hold_repository.get_by_ids(hold_ids)
 
-    def ready_hold_for_pickup(self, hold_id: str, copy_id: str) -> Hold:
-        copy = self._get_copy(copy_id)
+    def get_hold_position(self, hold_id: str) -> int:
         hold = self._get_hold(hold_id)
         try:
-            hold.ready_for_pickup(copy=copy)
+            return hold.queue_position(self.hold_repository.count_holds_ahead(hold))
         except DomainError as e:
-            raise ServiceFailed('The hold cannot be marked as ready for pickup', cause=e) from e
-        updated_hold = self.hold_repository.save(hold)
-        event_bus.publish_events()
-        return updated_hold
+            raise ServiceFailed('The hold is not waiting in the queue', cause=e) from e
+
+    def place_hold(self, patron_id: str, item_id: str, copy_id: str | None = None) -> Hold:
+        with self.unit_of_work:
+            patron = self._get_patron(patron_id)
+            item = self._get_item(item_id)
+            copy = self._get_copy(copy_id) if copy_id else None
+            try:
+                hold = Hold.create(
+                    patron=patron,
+                    item=item,
+                    copy=copy,
+                    patron_holding_service=self.patron_holding_service,
+                    hold_policy_service=self.hold_policy_service,
+                )
+            except DomainError as e:
+                raise ServiceFailed('The hold cannot be placed', cause=e) from e
+            created_hold = self.hold_repository.save(hold)
+            return created_hold
+
+    def ready_hold_for_pickup(self, hold_id: str, copy_id: str) -> Hold:
+        with self.unit_of_work:
+            copy = self._get_copy(copy_id)
+            hold = self._get_hold(hold_id)
+            try:
+                hold.ready_for_pickup(copy=copy)
+            except DomainError as e:
+                raise ServiceFailed('The hold cannot be marked as ready for pickup', cause=e) from e
+            updated_hold = self.hold_repository.save(hold)
+            return updated_hold
 
     def pickup_hold(self, hold_id: str, staff_out_id: str, copy_id: str) -> Loan:
-        copy = self._get_copy(copy_id)
-        hold = self._get_hold(hold_id)
-        patron = self._get_patron(hold.patron_id)
-        staff = self._get_staff(staff_out_id)
-        branch = self._get_branch(patron.branch_id)
-        try:
-            loan = Loan.create(
-                copy=copy,
-                patron=patron,
-                staff=staff,
-                branch=branch,
-                patron_barring_service=self.patron_barring_service,
-                loan_policy_service=self.loan_policy_service,
-            )
-        except DomainError as e:
-            raise ServiceFailed('The hold cannot be picked up', cause=e) from e
-        created_loan = self.loan_repository.save(loan, copy)
-        try:
-            hold.fulfill(copy=copy, loan=created_loan)
-        except DomainError as e:
-            raise ServiceFailed('The hold cannot be fulfilled', cause=e) from e
-        self.hold_repository.save(hold)
-        event_bus.publish_events()
-        return created_loan
+        with self.unit_of_work:
+            copy = self._get_copy(copy_id)
+            hold = self._get_hold(hold_id)
+            patron = self._get_patron(hold.patron_id)
+            staff = self._get_staff(staff_out_id)
+            branch = self._get_branch(patron.branch_id)
+            try:
+                loan = Loan.create(
+                    copy=copy,
+                    patron=patron,
+                    staff=staff,
+                    branch=branch,
+                    patron_barring_service=self.patron_barring_service,
+                    loan_policy_service=self.loan_policy_service,
+                )
+            except DomainError as e:
+                raise ServiceFailed('The hold cannot be picked up', cause=e) from e
+            created_loan = self.loan_repository.save(loan, copy)
+            try:
+                hold.fulfill(copy=copy, loan=created_loan)
+            except DomainError as e:
+                raise ServiceFailed('The hold cannot be fulfilled', cause=e) from e
+            self.hold_repository.save(hold)
+            return created_loan
 
     def expire_hold(self, hold_id: str) -> Hold:
-        hold = self._get_hold(hold_id)
-        try:
-            hold.expire()
-        except DomainError as e:
-            raise ServiceFailed('The hold cannot be expired', cause=e) from e
-        updated_hold = self.hold_repository.save(hold)
-        event_bus.publish_events()
-        return updated_hold
+        with self.unit_of_work:
+            hold = self._get_hold(hold_id)
+            try:
+                hold.expire()
+            except DomainError as e:
+                raise ServiceFailed('The hold cannot be expired', cause=e) from e
+            updated_hold = self.hold_repository.save(hold)
+            return updated_hold
 
     def cancel_hold(self, hold_id: str) -> Hold:
-        hold = self._get_hold(hold_id)
-        try:
-            hold.cancel()
-        except DomainError as e:
-            raise ServiceFailed('The hold cannot be canceled', cause=e) from e
-        updated_hold = self.hold_repository.save(hold)
-        event_bus.publish_events()
-        return updated_hold
+        with self.unit_of_work:
+            hold = self._get_hold(hold_id)
+            try:
+                hold.cancel()
+            except DomainError as e:
+                raise ServiceFailed('The hold cannot be canceled', cause=e) from e
+            updated_hold = self.hold_repository.save(hold)
+            return updated_hold
+
+    def sweep_expired_holds(self, today: datetime.date | None = None, *, batch_size: int = SWEEP_CHUNK_SIZE) -> int:
+        today = today or datetime.date.today()
+        expired = 0
+        while True:
+            with self.unit_of_work:
+                holds = self.hold_repository.expire_pending_holds(today, limit=batch_size)
+                for hold in holds:
+                    hold.record_expiry()
+                self._ready_holds_for_expired_copies(holds)
+            if not holds:
+                break
+            expired += len(holds)
+            logger.info('Expired %s holds past their expiry date', expired)
+        return expired
+
+    def _ready_holds_for_expired_copies(self, holds: list[Hold]) -> None:
+        # A pending hold's copy is only the one it asked for; that copy is often still out on loan.
+        copy_ids = list(dict.fromkeys(hold.copy_id for hold in holds if hold.copy_id))
+        if not copy_ids:
+            return
+        copies = self.copy_repository.get_by_ids(copy_ids)
+        for copy_id in copy_ids:
+            copy = copies.get(copy_id)
+            if copy is None:
+                logger.warning('Copy ID %s of an expired hold was not found', copy_id)
+            elif copy.is_available():
+                self._ready_next_hold(copy)
 
     def process_holds_for_returned_copy(self, copy_id: str) -> None:
-        copy = self._get_copy(copy_id)
-        holds = self.hold_repository.find_active_holds_by_item(item_id=copy.item_id)
-        next_hold = holds[0] if holds else None
+        self._ready_next_hold(self._get_copy(copy_id))
+
+    def _ready_next_hold(self, copy: Copy) -> None:
+        copy_id = t.cast(str, copy.id)
+        next_hold = self.hold_repository.find_next_hold_for_item(item_id=copy.item_id)
         if next_hold:
             self.ready_hold_for_pickup(hold_id=t.cast(str, next_hold.id), copy_id=copy_id)
             logger.info(
@@ -1,8 +1,7 @@
 from __future__ import annotations
 
-from lms.domain import DomainError
+from lms.domain import UnitOfWork, DomainError
 from lms.app.exceptions import ServiceFailed
-from lms.infrastructure.event_bus import event_bus
 from lms.app.exceptions.organizations import StaffNotFoundError, BranchNotFoundError
 from lms.domain.organizations.entities import Staff, Branch
 from lms.domain.organizations.services import StaffUniquenessService, BranchAssignmentService, BranchUniquenessService
@@ -18,10 +17,12 @@ class BranchService:
         branch_repository: BranchRepository,
         branch_uniqueness_service: BranchUniquenessService,
         branch_assignment_service: BranchAssignmentService,
+        unit_of_work: UnitOfWork,
     ) -> None:
         self.branch_repository = branch_repository
         self.branch_uniqueness_service = branch_uniqueness_service
         self.branch_assignment_service = branch_assignment_service
+        self.unit_of_work = unit_of_work
 
     def _get_branch(self, branch_id: str) -> Branch:
         branch = self.branch_repository.get_by_id(branch_id)
@@ -29,12 +30,15 @@ class BranchService:
             raise BranchNotFoundError(f'Branch with id {branch_id} not found')
         return branch
 
-    def find_all_branches(self) -> list[Branch]:
-        return self.branch_repository.find_all()
+    def find_all_branches(self, *, limit: int | None = None, after: str | None = None) -> list[Branch]:
+        return self.branch_repository.find_all(limit=limit, after=after)
 
     def get_branch(self, branch_id: str) -> Branch:
         return self._get_branch(branch_id)
 
+    def get_branches_by_ids(self, branch_ids: list[str]) -> dict[str, Branch]:
+        return self.branch_repository.get_by_ids(branch_ids)
+
     def create_branch(
         self,
         name: str,
@@ -43,23 +47,23 @@ class BranchService:
         email: str | None = None,
         manager_id: str | None = None,
     ) -> Branch:
-        try:
-            branch = Branch.create(
-                name=name,
-                email=email,
-                address=address,
-                phone=phone,
-                branch_uniqueness_service=self.branch_uniqueness_service,
-            )
-            if manager_id is not None:
-                branch.assign_manager(manager_id, self.branch_assignment_service)
-        except StaffNotManager as e:
-            raise ServiceFailed('The branch cannot be created with the specified manager', cause=e) from e
-        except DomainError as e:
-            raise ServiceFailed('The branch cannot be created', cause=e) from e
-        created_branch = self.branch_repository.save(branch)
-        event_bus.publish_events()
-        return created_branch
+        with self.unit_of_work:
+            try:
+                branch = Branch.create(
+                    name=name,
+                    email=email,
+                    address=address,
+                    phone=phone,
+                    branch_uniqueness_service=self.branch_uniqueness_service,
+                )
+                if manager_id is not None:
+                    branch.assign_manager(manager_id, self.branch_assignment_service)
+            except StaffNotManager as e:
+                raise ServiceFailed('The branch cannot be created with the specified manager', cause=e) from e
+            except DomainError as e:
+                raise ServiceFailed('The branch cannot be created', cause=e) from e
+            created_branch = self.branch_repository.save(branch)
+            return created_branch
 
     def update_branch(
         self,
@@ -69,45 +73,51 @@ class BranchService:
         phone: str | None = None,
         email: str | None = None,
     ) -> Branch:
-        branch = self._get_branch(branch_id)
-        try:
-            branch.change_name(name or branch.name, self.branch_uniqueness_service)
-        except DomainError as e:
-            raise ServiceFailed('The branch name cannot be updated', cause=e) from e
-        branch.address = address if address is not None else branch.address
-        branch.phone = phone if phone is not None else branch.phone
-        branch.email = email if email is not None else branch.email
-        updated_branch = self.branch_repository.save(branch)
-        event_bus.publish_events()
-        return updated_branch
+        with self.unit_of_work:
+            branch = self._get_branch(branch_id)
+            try:
+                branch.change_name(name or branch.name, self.branch_uniqueness_service)
+            except DomainError as e:
+                raise ServiceFailed('The branch name cannot be updated', cause=e) from e
+            branch.address = address if address is not None else branch.address
+            branch.phone = phone if phone is not None else branch.phone
+            branch.email = email if email is not None else branch.email
+            updated_branch = self.branch_repository.save(branch)
+            return updated_branch
 
     def assign_branch_manager(self, branch_id: str, manager_id: str) -> Branch:
-        branch = self._get_branch(branch_id)
-        try:
-            branch.assign_manager(manager_id, self.branch_assignment_service)
-        except DomainError as e:
-            raise ServiceFailed('The branch manager cannot be assigned', cause=e) from e
-        updated_branch = self.branch_repository.save(branch)
-        event_bus.publish_events()
-        return updated_branch
+        with self.unit_of_work:
+            branch = self._get_branch(branch_id)
+            try:
+                branch.assign_manager(manager_id, self.branch_assignment_service)
+            except DomainError as e:
+                raise ServiceFailed('The branch manager cannot be assigned', cause=e) from e
+            updated_branch = self.branch_repository.save(branch)
+            return updated_branch
 
     def close_branch(self, branch_id: str) -> Branch:
-        branch = self._get_branch(branch_id)
-        try:
-            branch.close()
-        except DomainError as e:
-            raise ServiceFailed('The branch cannot be closed', cause=e) from e
-        updated_branch = self.branch_repository.save(branch)
-        event_bus.publish_events()
-        return updated_branch
+        with self.unit_of_work:
+            branch = self._get_branch(branch_id)
+            try:
+                branch.close()
+            except DomainError as e:
+                raise ServiceFailed('The branch cannot be closed', cause=e) from e
+            updated_branch = self.branch_repository.save(branch)
+            return updated_branch
 
 
 class StaffService:
     def __init__(
-        self, /, *, staff_repository: StaffRepository, staff_uniqueness_service: StaffUniquenessService
+        self,
+        /,
+        *,
+        staff_repository: StaffRepository,
+        staff_uniqueness_service: StaffUniquenessService,
+        unit_of_work: UnitOfWork,
     ) -> None:
         self.staff_repository = staff_repository
         self.staff_uniqueness_service = staff_uniqueness_service
+        self.unit_of_work = unit_of_work
 
     def _get_staff(self, staff_id: str) -> Staff:
         staff = self.staff_repository.get_by_id(staff_id)
@@ -115,63 +125,66 @@ class StaffService:
             raise StaffNotFoundError(f'Staff with id {staff_id} not found')
         return staff
 
-    def find_all_staff(self) -> list[Staff]:
-        return self.staff_repository.find_all()
+    def find_all_staff(self, *, limit: int | None = None, after: str | None = None) -> list[Staff]:
+        return self.staff_repository.find_all(limit=limit, after=after)
 
     def get_staff(self, staff_id: str) -> Staff:
         return self._get_staff(staff_id)
 
+    def get_staff_by_ids(self, staff_ids: list[str]) -> dict[str, Staff]:
+        return self.staff_repository.get_by_ids(staff_ids)
+
     def create_staff(self, name: str, email: str, role: str) -> Staff:
-        try:
-            staff = Staff.create(
-                name=name, email=email, role=role, staff_uniqueness_service=self.staff_uniqueness_service
-            )
-        except DomainError as e:
-            raise ServiceFailed('The staff cannot be created', cause=e) from e
-        created_staff = self.staff_repository.save(staff)
-        event_bus.publish_events()
-        return created_staff
+        with self.unit_of_work:
+            try:
+                staff = Staff.create(
+                    name=name, email=email, role=role, staff_uniqueness_service=self.staff_uniqueness_service
+                )
+            except DomainError as e:
+                raise ServiceFailed('The staff cannot be created', cause=e) from e
+            created_staff = self.staff_repository.save(staff)
+            return created_staff
 
     def update_staff(self, staff_id: str, name: str | None = None) -> Staff:
-        staff = self._get_staff(staff_id)
-        staff.name = name if name is not None else staff.name
-        updated_staff = self.staff_repository.save(staff)
-        event_bus.publish_events()
-        return updated_staff
+        with self.unit_of_work:
+            staff = self._get_staff(staff_id)
+            staff.name = name if name is not None else staff.name
+            updated_staff = self.staff_repository.save(staff)
+            return updated_staff
 
     def update_staff_email(self, staff_id: str, email: str) -> Staff:
-        staff = self._get_staff(staff_id)
-        try:
-            staff.change_email(email, self.staff_uniqueness_service)
-        except DomainError as e:
-            raise ServiceFailed('The staff email cannot be updated', cause=e) from e
-        updated_staff = self.staff_repository.save(staff)
-        event_bus.publish_events()
-        return updated_staff
+        with self.unit_of_work:
+            staff = self._get_staff(staff_id)
+            try:
+                staff.change_email(email, self.staff_uniqueness_service)
+            except DomainError as e:
+                raise ServiceFailed('The staff email cannot be updated', cause=e) from e
+            updated_staff = self.staff_repository.save(staff)
+            return updated_staff
 
     def assign_staff_to_branch(self, staff_id: str, branch_id: str) -> Staff:
-        staff = self._get_staff(staff_id)
-        staff.branch_id = branch_id
-        updated_staff = self.staff_repository.save(staff)
-        event_bus.publish_events()
-        return updated_staff
+        with self.unit_of_work:
+            staff = self._get_staff(staff_id)
+            staff.branch_id = branch_id
+            updated_staff = self.staff_repository.save(staff)
+            return updated_staff
 
     def assign_staff_role(self, staff_id: str, role: str) -> Staff:
-        staff = self._get_staff(staff_id)
-        try:
-            staff.change_role(role)
-        except DomainError as e:
-            raise ServiceFailed('The staff role cannot be updated', cause=e) from e
-        updated_staff = self.staff_repository.save(staff)
-        event_bus.publish_events()
-        return updated_staff
+        with self.unit_of_work:
+            staff = self._get_staff(staff_id)
+            try:
+                staff.change_role(role)
+            except DomainError as e:
+                raise ServiceFailed('The staff role cannot be updated', cause=e) from e
+            updated_staff = self.staff_repository.save(staff)
+            return updated_staff
 
     def inactivate_staff(self, staff_id: str) -> Staff:
-        staff = self._get_staff(staff_id)
-        try:
-            staff.mark_as_inactive()
-        except DomainError as e:
-            raise ServiceFailed('The staff cannot be inactivated', cause=e) from e
-        updated_staff = self.staff_repository.save(staff)
-        event_bus.publish_events()
-        return updated_staff
+        with self.unit_of_work:
+            staff = self._get_staff(staff_id)
+            try:
+                staff.mark_as_inactive()
+            except DomainError as e:
+                raise ServiceFailed('The staff cannot be inactivated', cause=e) from e
+            updated_staff = self.staff_repository.save(staff)
+            return updated_staff
@@ -1,11 +1,10 @@
 from __future__ import annotations
 
-from lms.domain import DomainError
+from lms.domain import UnitOfWork, DomainError
 from lms.app.exceptions import ServiceFailed
 from lms.app.exceptions.patrons import FineNotFoundError, PatronNotFoundError
 from lms.domain.patrons.entities import Fine, Patron
 from lms.domain.patrons.services import FinePolicyService, PatronUniquenessService, PatronReinstatementService
-from lms.infrastructure.event_bus import event_bus
 from lms.domain.patrons.exceptions import PatronAlreadyActive
 from lms.domain.patrons.repositories import FineRepository, PatronRepository
 
@@ -18,10 +17,12 @@ class PatronService:
         patron_repository: PatronRepository,
         patron_uniqueness_service: PatronUniquenessService,
         patron_reinstatement_service: PatronReinstatementService,
+        unit_of_work: UnitOfWork,
     ) -> None:
         self.patron_repository = patron_repository
         self.patron_uniqueness_service = patron_uniqueness_service
         self.patron_reinstatement_service = patron_reinstatement_service
+        self.unit_of_work = unit_of_work
 
     def _get_patron(self, patron_id: str) -> Patron:
         patron = self.patron_repository.get_by_id(patron_id)
@@ -29,88 +30,97 @@ class PatronService:
             raise PatronNotFoundError(f'Patron with id {patron_id} not found')
         return patron
 
-    def find_all_patrons(self) -> list[Patron]:
-        return self.patron_repository.find_all()
+    def find_all_patrons(self, *, limit: int | None = None, after: str | None = None) -> list[Patron]:
+        return self.patron_repository.find_all(limit=limit, after=after)
 
     def get_patron(self, patron_id: str) -> Patron:
         return self._get_patron(patron_id)
 
+    def get_patrons_by_ids(self, patron_ids: list[str]) -> dict[str, Patron]:
+        return self.patron_repository.get_by_ids(patron_ids)
+
     def create_patron(self, branch_id: str, name: str, email: str) -> Patron:
-        try:
-            patron = Patron.create(
-                branch_id=branch_id, name=name, email=email, patron_uniqueness_service=self.patron_uniqueness_service
-            )
-            patron.activate()
-        except PatronAlreadyActive as e:
-            raise ServiceFailed('The patron cannot be created as active', cause=e) from e
-        except DomainError as e:
-            raise ServiceFailed('The patron cannot be created', cause=e) from e
-        created_patron = self.patron_repository.save(patron)
-        event_bus.publish_events()
-        return created_patron
+        with self.unit_of_work:
+            try:
+                patron = Patron.create(
+                    branch_id=branch_id,
+                    name=name,
+                    email=email,
+                    patron_uniqueness_service=self.patron_uniqueness_service,
+                )
+                patron.activate()
+            except PatronAlreadyActive as e:
+                raise ServiceFailed('The patron cannot be created as active', cause=e) from e
+            except DomainError as e:
+                raise ServiceFailed('The patron cannot be created', cause=e) from e
+            created_patron = self.patron_repository.save(patron)
+            return created_patron
 
     def update_patron(self, patron_id: str, name: str | None) -> Patron:
-        patron = self._get_patron(patron_id)
-        patron.name = name if name is not None else patron.name
-        updated_patron = self.patron_repository.save(patron)
-        event_bus.publish_events()
-        return updated_patron
+        with self.unit_of_work:
+            patron = self._get_patron(patron_id)
+            patron.name = name if name is not None else patron.name
+            updated_patron = self.patron_repository.save(patron)
+            return updated_patron
 
     def update_patron_email(self, patron_id: str, email: str) -> Patron:
-        patron = self._get_patron(patron_id)
-        try:
-            patron.change_email(email, self.patron_uniqueness_service)
-        except DomainError as e:
-            raise ServiceFailed('The patron email cannot be updated', cause=e) from e
-        updated_patron = self.patron_repository.save(patron)
-        event_bus.publish_events()
-        return updated_patron
+        with self.unit_of_work:
+            patron = self._get_patron(patron_id)
+            try:
+                patron.change_email(email, self.patron_uniqueness_service)
+            except DomainError as e:
+                raise ServiceFailed('The patron email cannot be updated', cause=e) from e
+            updated_patron = self.patron_repository.save(patron)
+            return updated_patron
 
     def activate_patron(self, patron_id: str) -> Patron:
-        patron = self._get_patron(patron_id)
-        try:
-            patron.activate()
-        except DomainError as e:
-            raise ServiceFailed('The patron cannot be activated', cause=e) from e
-        updated_patron = self.patron_repository.save(patron)
-        event_bus.publish_events()
-        return updated_patron
+        with self.unit_of_work:
+            patron = self._get_patron(patron_id)
+            try:
+                patron.activate()
+            except DomainError as e:
+                raise ServiceFailed('The patron cannot be activated', cause=e) from e
+            updated_patron = self.patron_repository.save(patron)
+            return updated_patron
 
     def reinstate_patron(self, patron_id: str) -> Patron:
-        patron = self._get_patron(patron_id)
-        try:
-            patron.reinstate(self.patron_reinstatement_service)
-        except DomainError as e:
-            raise ServiceFailed('The patron cannot be reinstated', cause=e) from e
-        updated_patron = self.patron_repository.save(patron)
-        event_bus.publish_events()
-        return updated_patron
+        with self.unit_of_work:
+            patron = self._get_patron(patron_id)
+            try:
+                patron.reinstate(self.patron_reinstatement_service)
+            except DomainError as e:
+                raise ServiceFailed('The patron cannot be reinstated', cause=e) from e
+            updated_patron = self.patron_repository.save(patron)
+            return updated_patron
 
     def archive_patron(self, patron_id: str) -> Patron:
-        patron = self._get_patron(patron_id)
-        try:
-            patron.archive()
-        except DomainError as e:
-            raise ServiceFailed('The patron cannot be archived', cause=e) from e
-        updated_patron = self.patron_repository.save(patron)
-        event_bus.publish_events()
-        return updated_patron
+        with self.unit_of_work:
+            patron = self._get_patron(patron_id)
+            try:
+                patron.archive()
+            except DomainError as e:
+                raise ServiceFailed('The patron cannot be archived', cause=e) from e
+            updated_patron = self.patron_repository.save(patron)
+            return updated_patron
 
     def unarchive_patron(self, patron_id: str) -> Patron:
-        patron = self._get_patron(patron_id)
-        try:
-            patron.unarchive()
-        except DomainError as e:
-            raise ServiceFailed('The patron cannot be unarchived', cause=e) from e
-        updated_patron = self.patron_repository.save(patron)
-        event_bus.publish_events()
-        return updated_patron
+        with self.unit_of_work:
+            patron = self._get_patron(patron_id)
+            try:
+                patron.unarchive()
+            except DomainError as e:
+                raise ServiceFailed('The patron cannot be unarchived', cause=e) from e
+            updated_patron = self.patron_repository.save(patron)
+            return updated_patron
 
 
 class FineService:
-    def __init__(self, /, *, fine_repository: FineRepository, fine_policy_service: FinePolicyService) -> None:
+    def __init__(
+        self, /, *, fine_repository: FineRepository, fine_policy_service: FinePolicyService, unit_of_work: UnitOfWork
+    ) -> None:
         self.fine_repository = fine_repository
         self.fine_policy_service = fine_policy_service
+        self.unit_of_work = unit_of_work
 
     def _get_fine(self, fine_id: str) -> Fine:
         fine = self.fine_repository.get_by_id(fine_id)
@@ -118,39 +128,56 @@ class FineService:
             raise FineNotFoundError(f'Fine with id {fine_id} not found')
         return fine
 
-    def find_all_fines(self) -> list[Fine]:
-        return self.fine_repository.find_all()
+    def find_all_fines(self, *, limit: int | None = None, after: str | None = None) -> list[Fine]:
+        return self.fine_repository.find_all(limit=limit, after=after)
 
     def get_fine(self, fine_id: str) -> Fine:
         return self._get_fine(fine_id)
 
+    def get_fines_by_ids(self, fine_ids: list[str]) -> dict[str, Fine]:
+        return self.fine_repository.get_by_ids(fine_ids)
+
     def pay_fine(self, fine_id: str) -> Fine:
-        fine = self._get_fine(fine_id)
-        try:
-            fine.pay()
-        except DomainError as e:
-            raise ServiceFailed('The fine cannot be paid', cause=e) from e
-        updated_fine = self.fine_repository.save(fine)
-        event_bus.publish_events()
-        return updated_fine
+        with self.unit_of_work:
+            fine = self._get_fine(fine_id)
+            try:
+                fine.pay()
+            except DomainError as e:
+                raise ServiceFailed('The fine cannot be paid', cause=e) from e
+            updated_fine = self.fine_repository.save(fine)
+            return updated_fine
 
     def waive_fine(self, fine_id: str) -> Fine:
-        fine = self._get_fine(fine_id)
-        try:
-            fine.waive()
-        except DomainError as e:
-            raise ServiceFailed('The fine cannot be waived', cause=e) from e
-        updated_fine = self.fine_repository.save(fine)
-        event_bus.publish_events()
-        return updated_fine
+        with self.unit_of_work:
+            fine = self._get_fine(fine_id)
+            try:
+                fine.waive()
+            except DomainError as e:
+                raise ServiceFailed('The fine cannot be waived', cause=e) from e
+            updated_fine = self.fine_repository.save(fine)
+            return updated_fine
 
     def process_overdue_loan(self, loan_id: str, patron_id: str, days_late: int) -> Fine:
-        try:
-            fine = Fine.create_for_overdue(
-                loan_id=loan_id, patron_id=patron_id, days_late=days_late, fine_policy_service=self.fine_policy_service
-            )
-        except DomainError as e:
-            raise ServiceFailed('The overdue loan cannot be processed for fine', cause=e) from e
-        created_fine = self.fine_repository.save(fine)
-        event_bus.publish_events()
-        return created_fine
+        with self.unit_of_work:
+            # A loan is reported overdue by every sweep and again at check-in; keep one fine that tracks the latest,
+            # and once that fine is paid or waived leave it settled rather than charging the same days again.
+            existing_fine = self.fine_repository.find_by_loan_id(loan_id)
+            if existing_fine is not None:
+                if existing_fine.settled:
+                    return existing_fine
+                try:
+                    existing_fine.accrue_overdue(days_late=days_late, fine_policy_service=self.fine_policy_service)
+                except DomainError as e:
+                    raise ServiceFailed('The overdue loan cannot be processed for fine', cause=e) from e
+                return self.fine_repository.save(existing_fine)
+            try:
+                fine = Fine.create_for_overdue(
+                    loan_id=loan_id,
+                    patron_id=patron_id,
+                    days_late=days_late,
+                    fine_policy_service=self.fine_policy_service,
+                )
+            except DomainError as e:
+                raise ServiceFailed('The overdue loan cannot be processed for fine', cause=e) from e
+            created_fine = self.fine_repository.save(fine)
+            return created_fine
@@ -1,12 +1,11 @@
 from __future__ import annotations
 
-from lms.domain import DomainError
+from lms.domain import UnitOfWork, DomainError
 from lms.app.exceptions import ServiceFailed
 from lms.app.exceptions.serials import SerialNotFoundError
 from lms.app.exceptions.catalogs import ItemNotFoundError
 from lms.domain.serials.entities import Serial
 from lms.domain.catalogs.entities import Item
-from lms.infrastructure.event_bus import event_bus
 from lms.domain.serials.repositories import SerialRepository, SerialIssueRepository
 from lms.domain.catalogs.repositories import ItemRepository
 
@@ -19,10 +18,12 @@ class SerialService:
         serial_repository: SerialRepository,
         serial_issue_repository: SerialIssueRepository,
         item_repository: ItemRepository,
+        unit_of_work: UnitOfWork,
     ) -> None:
         self.serial_repository = serial_repository
         self.serial_issue_repository = serial_issue_repository
         self.item_repository = item_repository
+        self.unit_of_work = unit_of_work
 
     def _get_item(self, item_id: str) -> Item:
         item = self.item_repository.get_by_id(item_id)
@@ -36,8 +37,8 @@ class SerialService:
             raise SerialNotFoundError(f'Serial with id {serial_id} not found')
         return serial
 
-    def find_all_serials(self) -> list[Serial]:
-        return self.serial_repository.find_all()
+    def find_all_serials(self, *, limit: int | None = None, after: str | None = None) -> list[Serial]:
+        return self.serial_repository.find_all(limit=limit, after=after)
 
     def get_serial(self, serial_id: str) -> Serial:
         return self._get_serial(serial_id)
@@ -45,31 +46,31 @@ class SerialService:
     def subscribe_serial(
         self, title: str, issn: str, item_id: str, frequency: str | None = None, description: str | None = None
     ) -> Serial:
-        item = self._get_item(item_id)
-        try:
-            serial = Serial.create(item=item, title=title, issn=issn, frequency=frequency, description=description)
-        except DomainError as e:
-            raise ServiceFailed('The serial subscription cannot be created', cause=e) from e
-        created_serial = self.serial_repository.save(serial)
-        event_bus.publish_events()
-        return created_serial
+        with self.unit_of_work:
+            item = self._get_item(item_id)
+            try:
+                serial = Serial.create(item=item, title=title, issn=issn, frequency=frequency, description=description)
+            except DomainError as e:
+                raise ServiceFailed('The serial subscription cannot be created', cause=e) from e
+            created_serial = self.serial_repository.save(serial)
+            return created_serial
 
     def renew_serial_subscription(self, serial_id: str) -> Serial:
-        serial = self._get_serial(serial_id)
-        try:
-            serial.activate()
-        except DomainError as e:
-            raise ServiceFailed('The serial subscription cannot be renewed', cause=e) from e
-        updated_serial = self.serial_repository.save(serial)
-        event_bus.publish_events()
-        return updated_serial
+        with self.unit_of_work:
+            serial = self._get_serial(serial_id)
+            try:
+                serial.activate()
+            except DomainError as e:
+                raise ServiceFailed('The serial subscription cannot be renewed', cause=e) from e
+            updated_serial = self.serial_repository.save(serial)
+            return updated_serial
 
     def unsubscribe_serial(self, serial_id: str) -> Serial:
-        serial = self._get_serial(serial_id)
-        try:
-            serial.deactivate()
-        except DomainError as e:
-            raise ServiceFailed('The serial subscription cannot be unsubscribed', cause=e) from e
-        updated_serial = self.serial_repository.save(serial)
-        event_bus.publish_events()
-        return updated_serial
+        with self.unit_of_work:
+            serial = self._get_serial(serial_id)
+            try:
+                serial.deactivate()
+            except DomainError as e:
+                raise ServiceFailed('The serial subscription cannot be unsubscribed', cause=e) from e
+            updated_serial = self.serial_repository.save(serial)
+            return updated_serial
@@ -1,10 +1,63 @@
 from __future__ import annotations
 
 import os
+import typing as t
+
+
+def _mapping[T](value: str, cast: t.Callable[[str], T]) -> dict[str, T]:
+    # Parses 'lms=INFO,lms.app.handlers=WARNING' style settings.
+    pairs = (item.split('=', 1) for item in value.split(',') if item.strip())
+    return {name.strip(): cast(setting.strip()) for name, setting in pairs}
 
 
 class Config:
     SECRET_KEY = os.getenv('SECRET_KEY', 'devkey')
     SQLALCHEMY_DATABASE_URI = os.getenv('DATABASE_URL', 'sqlite:///lms.db')
     SQLALCHEMY_TRACK_MODIFICATIONS = False
+    # Threads running handlers subscribed with background=True; 0 runs every handler inline.
+    EVENT_BUS_WORKERS = int(os.getenv('EVENT_BUS_WORKERS', '0'))
+    EVENT_BUS_MAX_PENDING = int(os.getenv('EVENT_BUS_MAX_PENDING', '100'))
+    EVENT_BUS_SUBMIT_TIMEOUT = float(os.getenv('EVENT_BUS_SUBMIT_TIMEOUT', '1.0'))
+    # Handlers slower than this many seconds are logged with their event; unset leaves the slow-handler log off.
+    EVENT_BUS_SLOW_HANDLER_SECONDS = (
+        float(os.environ['EVENT_BUS_SLOW_HANDLER_SECONDS']) if os.getenv('EVENT_BUS_SLOW_HANDLER_SECONDS') else None
+    )
+    # Write events that have background handlers to the outbox table and leave them to `flask relay-outbox`.
+    OUTBOX_ENABLED = os.getenv('OUTBOX_ENABLED', 'false').lower() in ('1', 'true', 'yes')
+    OUTBOX_BATCH_SIZE = int(os.getenv('OUTBOX_BATCH_SIZE', '100'))
+    OUTBOX_MAX_ATTEMPTS = int(os.getenv('OUTBOX_MAX_ATTEMPTS', '5'))
+    # Directory shared by the worker processes to aggregate /monitoring/metrics; unset keeps metrics per process.
+    METRICS_DIR = os.getenv('METRICS_DIR') or None
+    METRICS_FLUSH_INTERVAL = float(os.getenv('METRICS_FLUSH_INTERVAL', '1.0'))
+    # Threads running the read-only calls of a JSON-RPC batch side by side, each in its own session; 0 runs every
+    # batch call in order on the request thread.
+    RPC_BATCH_WORKERS = int(os.getenv('RPC_BATCH_WORKERS', '0'))
+    # Queries allowed per JSON-RPC call, by method with QUERY_BUDGET as the fallback; None disables the check.
+    # Over-budget calls are logged, or fail with QUERY_BUDGET_ACTION = 'raise' (meant for tests and CI).
+    QUERY_BUDGET = int(os.environ['QUERY_BUDGET']) if os.getenv('QUERY_BUDGET') else None
+    QUERY_BUDGETS: dict[str, int] = {}
+    QUERY_BUDGET_ACTION = os.getenv('QUERY_BUDGET_ACTION', 'log')
+    # Adds X-Query-Count, X-Query-Time-Ms and X-Query-Repeated to JSON-RPC responses.
+    QUERY_DEBUG_HEADERS = os.getenv('QUERY_DEBUG_HEADERS', 'false').lower() in ('1', 'true', 'yes')
+    # Directory receiving pstats dumps of JSON-RPC calls; unset turns profiling off. A call is profiled when it
+    # carries an X-Profile header (equal to PROFILE_SECRET when one is set) or is picked by PROFILE_SAMPLE_RATE, by
+    # sampling the stack of the thread dispatching it every PROFILE_INTERVAL seconds.
+    PROFILE_DIR = os.getenv('PROFILE_DIR') or None
+    PROFILE_SECRET = os.getenv('PROFILE_SECRET') or None
+    PROFILE_SAMPLE_RATE = float(os.getenv('PROFILE_SAMPLE_RATE', '0.0'))
+    PROFILE_KEEP = int(os.getenv('PROFILE_KEEP', '100'))
+    PROFILE_INTERVAL = float(os.getenv('PROFILE_INTERVAL', '0.001'))
+    # In-process cache of branches, staff, categories and publishers read by id, filled by the first request of each
+    # process when REFERENCE_CACHE_PRELOAD is set; 0 turns it off. Entries are evicted once a transaction writing
+    # their rows commits in the process that made it, and reloaded everywhere else once older than REFERENCE_CACHE_TTL
+    # seconds.
+    REFERENCE_CACHE_SIZE = int(os.getenv('REFERENCE_CACHE_SIZE', '10000'))
+    REFERENCE_CACHE_TTL = float(os.getenv('REFERENCE_CACHE_TTL', '60.0'))
+    REFERENCE_CACHE_PRELOAD = os.getenv('REFERENCE_CACHE_PRELOAD', 'true').lower() in ('1', 'true', 'yes')
+    # Levels per logger, e.g. 'lms=INFO,lms.app.handlers=WARNING', and the fraction of INFO and DEBUG records kept
+    # per logger, e.g. 'lms.app.handlers.catalogs=0.1'. Records are written by a background thread.
+    LOG_LEVELS = _mapping(os.getenv('LOG_LEVELS', 'lms=DEBUG'), str)
+    LOG_SAMPLE_RATES = _mapping(os.getenv('LOG_SAMPLE_RATES', ''), float)
+    LOG_QUEUE_SIZE = int(os.getenv('LOG_QUEUE_SIZE', '10000'))
+    LOG_JSON = os.getenv('LOG_JSON', 'true').lower() in ('1', 'true', 'yes')
     ALEMBIC = {'script_location': '../infrastructure/database/migrations', 'prepend_sys_path': '.'}
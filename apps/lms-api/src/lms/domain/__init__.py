@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import uuid
+import types
+import typing as t
 import datetime
 from dataclasses import field, dataclass
 
@@ -33,5 +35,15 @@ class DomainEvent:
     occurred_on: datetime.datetime = field(init=False)
 
     def __post_init__(self) -> None:
-        self.event_id = str(uuid.uuid7())
-        self.occurred_on = datetime.datetime.now(datetime.UTC)
+        # A decoded event (e.g. read back from the outbox) already carries both fields; keep them.
+        if not hasattr(self, 'event_id'):
+            self.event_id = str(uuid.uuid7())
+            self.occurred_on = datetime.datetime.now(datetime.UTC)
+
+
+@t.runtime_checkable
+class UnitOfWork(t.Protocol):
+    def __enter__(self) -> t.Self: ...
+    def __exit__(
+        self, exc_type: type[BaseException] | None, exc: BaseException | None, traceback: types.TracebackType | None
+    ) -> None: ...
@@ -12,8 +12,9 @@ if t.TYPE_CHECKING:
 @t.runtime_checkable
 class AcquisitionOrderRepository(t.Protocol):
     def __init__(self, session: sa_orm.scoped_session[Session]) -> None: ...
-    def find_all(self) -> list[AcquisitionOrder]: ...
+    def find_all(self, *, limit: int | None = None, after: str | None = None) -> list[AcquisitionOrder]: ...
     def get_by_id(self, order_id: str) -> AcquisitionOrder | None: ...
+    def get_by_ids(self, order_ids: t.Sequence[str]) -> dict[str, AcquisitionOrder]: ...
     def save(self, order: AcquisitionOrder) -> AcquisitionOrder: ...
 
 
@@ -22,11 +23,13 @@ class AcquisitionOrderLineRepository(t.Protocol):
     def __init__(self, session: sa_orm.scoped_session[Session]) -> None: ...
     def find_by_order(self, order_id: str) -> list[AcquisitionOrderLine]: ...
     def get_by_id(self, order_line_id: str) -> AcquisitionOrderLine | None: ...
+    def get_by_ids(self, order_line_ids: t.Sequence[str]) -> dict[str, AcquisitionOrderLine]: ...
 
 
 @t.runtime_checkable
 class VendorRepository(t.Protocol):
     def __init__(self, session: sa_orm.scoped_session[Session]) -> None: ...
-    def find_all(self) -> list[Vendor]: ...
+    def find_all(self, *, limit: int | None = None, after: str | None = None) -> list[Vendor]: ...
     def get_by_id(self, vendor_id: str) -> Vendor | None: ...
+    def get_by_ids(self, vendor_ids: t.Sequence[str]) -> dict[str, Vendor]: ...
     def save(self, vendor: Vendor) -> Vendor: ...
@@ -51,6 +51,9 @@ class Copy(DomainEntity):
     def is_older_version(self) -> bool:
         return self.acquisition_date <= datetime.date.today() - datetime.timedelta(days=365 * 2)
 
+    def is_available(self) -> bool:
+        return self.status == CopyStatus.AVAILABLE.value
+
     def mark_as_checked_out(self) -> None:
         if self.status != CopyStatus.AVAILABLE.value:
             raise CopyNotAvailable(t.cast(str, self.id))
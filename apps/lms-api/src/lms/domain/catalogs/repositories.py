@@ -12,17 +12,20 @@ if t.TYPE_CHECKING:
 @t.runtime_checkable
 class CopyRepository(t.Protocol):
     def __init__(self, session: sa_orm.scoped_session[Session]) -> None: ...
-    def find_all(self) -> list[Copy]: ...
+    def find_all(self, *, limit: int | None = None, after: str | None = None) -> list[Copy]: ...
     def get_by_id(self, copy_id: str) -> Copy | None: ...
+    def get_by_ids(self, copy_ids: t.Sequence[str]) -> dict[str, Copy]: ...
     def save(self, copy: Copy) -> Copy: ...
+    def bulk_add(self, copies: list[Copy]) -> list[Copy]: ...
     def delete_by_id(self, copy_id: str) -> None: ...
 
 
 @t.runtime_checkable
 class ItemRepository(t.Protocol):
     def __init__(self, session: sa_orm.scoped_session[Session]) -> None: ...
-    def find_all(self) -> list[Item]: ...
+    def find_all(self, *, limit: int | None = None, after: str | None = None) -> list[Item]: ...
     def get_by_id(self, item_id: str) -> Item | None: ...
+    def get_by_ids(self, item_ids: t.Sequence[str]) -> dict[str, Item]: ...
     def exists_by_title(self, title: str) -> bool: ...
     def save(self, item: Item) -> Item: ...
     def delete_by_id(self, item_id: str) -> None: ...
@@ -30,23 +33,26 @@ class ItemRepository(t.Protocol):
 
 @t.runtime_checkable
 class CategoryRepository(t.Protocol):
-    def find_all(self) -> list[Category]: ...
+    def find_all(self, *, limit: int | None = None, after: str | None = None) -> list[Category]: ...
     def get_by_id(self, category_id: str) -> Category | None: ...
+    def get_by_ids(self, category_ids: t.Sequence[str]) -> dict[str, Category]: ...
     def save(self, category: Category) -> Category: ...
     def delete_by_id(self, category_id: str) -> None: ...
 
 
 @t.runtime_checkable
 class AuthorRepository(t.Protocol):
-    def find_all(self) -> list[Author]: ...
+    def find_all(self, *, limit: int | None = None, after: str | None = None) -> list[Author]: ...
     def get_by_id(self, author_id: str) -> Author | None: ...
+    def get_by_ids(self, author_ids: t.Sequence[str]) -> dict[str, Author]: ...
     def save(self, author: Author) -> Author: ...
     def delete_by_id(self, author_id: str) -> None: ...
 
 
 @t.runtime_checkable
 class PublisherRepository(t.Protocol):
-    def find_all(self) -> list[Publisher]: ...
+    def find_all(self, *, limit: int | None = None, after: str | None = None) -> list[Publisher]: ...
     def get_by_id(self, publisher_id: str) -> Publisher | None: ...
+    def get_by_ids(self, publisher_ids: t.Sequence[str]) -> dict[str, Publisher]: ...
     def save(self, publisher: Publisher) -> Publisher: ...
     def delete_by_id(self, publisher_id: str) -> None: ...
@@ -102,6 +102,15 @@ class Loan(DomainEntity):
                 LoanOverdueEvent(loan_id=t.cast(str, self.id), days_late=days_late, patron_id=self.patron_id)
             )
 
+    def mark_overdue(self, today: datetime.date) -> None:
+        if self.return_date is not None:
+            raise LoanAlreadyReturned(t.cast(str, self.id), self.return_date)
+        event_bus.add_event(
+            LoanOverdueEvent(
+                loan_id=t.cast(str, self.id), days_late=(today - self.due_date).days, patron_id=self.patron_id
+            )
+        )
+
     def mark_damaged(self, copy: Copy) -> None:
         copy.mark_as_damaged()
         if self.return_date is not None:
@@ -181,6 +190,11 @@ class Hold(DomainEntity):
         )
         return hold
 
+    def queue_position(self, holds_ahead: int) -> int:
+        if self.status != HoldStatus.PENDING.value:
+            raise HoldNotPending(t.cast(str, self.id))
+        return holds_ahead + 1
+
     def ready_for_pickup(self, copy: Copy) -> None:
         if self.status != HoldStatus.PENDING.value:
             raise HoldNotPending(t.cast(str, self.id))
@@ -214,6 +228,10 @@ class Hold(DomainEntity):
         if self.status != HoldStatus.PENDING.value:
             raise HoldNotPending(t.cast(str, self.id))
         self.status = HoldStatus.EXPIRED.value
+        self.record_expiry()
+
+    def record_expiry(self) -> None:
+        # Also called for holds moved to EXPIRED by a bulk statement, which bypasses expire().
         event_bus.add_event(
             HoldExpiredEvent(
                 hold_id=t.cast(str, self.id), patron_id=self.patron_id, item_id=self.item_id, copy_id=self.copy_id
@@ -229,3 +247,27 @@ class Hold(DomainEntity):
                 hold_id=t.cast(str, self.id), patron_id=self.patron_id, item_id=self.item_id, copy_id=self.copy_id
             )
         )
+
+
+@dataclass
+class SweepCheckpoint:
+    name: str
+    run_date: datetime.date
+    last_due_date: datetime.date | None = None
+    last_loan_id: str | None = None
+
+    @property
+    def position(self) -> tuple[datetime.date, str] | None:
+        if self.last_due_date is None or self.last_loan_id is None:
+            return None
+        return self.last_due_date, self.last_loan_id
+
+    def start(self, run_date: datetime.date) -> None:
+        if self.run_date != run_date:
+            self.run_date = run_date
+            self.last_due_date = None
+            self.last_loan_id = None
+
+    def advance(self, loan: Loan) -> None:
+        self.last_due_date = loan.due_date
+        self.last_loan_id = loan.id
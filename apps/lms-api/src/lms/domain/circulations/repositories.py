@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import typing as t
+import datetime
 
 import sqlalchemy.orm as sa_orm
 from flask_sqlalchemy.session import Session
@@ -8,15 +9,19 @@ from flask_sqlalchemy.session import Session
 from lms.domain.catalogs.entities import Copy
 
 if t.TYPE_CHECKING:
-    from .entities import Hold, Loan
+    from .entities import Hold, Loan, SweepCheckpoint
 
 
 @t.runtime_checkable
 class LoanRepository(t.Protocol):
     def __init__(self, session: sa_orm.scoped_session[Session]) -> None: ...
-    def find_all(self) -> list[Loan]: ...
+    def find_all(self, *, limit: int | None = None, after: str | None = None) -> list[Loan]: ...
     def find_by_patron_id(self, patron_id: str) -> list[Loan]: ...
+    def find_overdue(
+        self, today: datetime.date, *, limit: int, after: tuple[datetime.date, str] | None = None
+    ) -> list[Loan]: ...
     def get_by_id(self, loan_id: str) -> Loan | None: ...
+    def get_by_ids(self, loan_ids: t.Sequence[str]) -> dict[str, Loan]: ...
     def save(self, loan: Loan, copy: Copy) -> Loan: ...
     def delete_by_id(self, loan_id: str) -> None: ...
 
@@ -24,9 +29,20 @@ class LoanRepository(t.Protocol):
 @t.runtime_checkable
 class HoldRepository(t.Protocol):
     def __init__(self, session: sa_orm.scoped_session[Session]) -> None: ...
-    def find_all(self) -> list[Hold]: ...
+    def find_all(self, *, limit: int | None = None, after: str | None = None) -> list[Hold]: ...
     def find_active_holds_by_patron(self, patron_id: str) -> list[Hold]: ...
     def find_active_holds_by_item(self, item_id: str) -> list[Hold]: ...
+    def find_next_hold_for_item(self, item_id: str) -> Hold | None: ...
+    def count_holds_ahead(self, hold: Hold) -> int: ...
+    def expire_pending_holds(self, today: datetime.date, *, limit: int) -> list[Hold]: ...
     def get_by_id(self, hold_id: str) -> Hold | None: ...
+    def get_by_ids(self, hold_ids: t.Sequence[str]) -> dict[str, Hold]: ...
     def save(self, hold: Hold) -> Hold: ...
     def delete_by_id(self, hold_id: str) -> None: ...
+
+
+@t.runtime_checkable
+class SweepCheckpointRepository(t.Protocol):
+    def __init__(self, session: sa_orm.scoped_session[Session]) -> None: ...
+    def get_by_name(self, name: str) -> SweepCheckpoint | None: ...
+    def save(self, checkpoint: SweepCheckpoint) -> SweepCheckpoint: ...
@@ -12,8 +12,9 @@ if t.TYPE_CHECKING:
 @t.runtime_checkable
 class BranchRepository(t.Protocol):
     def __init__(self, session: sa_orm.scoped_session[Session]) -> None: ...
-    def find_all(self) -> list[Branch]: ...
+    def find_all(self, *, limit: int | None = None, after: str | None = None) -> list[Branch]: ...
     def get_by_id(self, branch_id: str) -> Branch | None: ...
+    def get_by_ids(self, branch_ids: t.Sequence[str]) -> dict[str, Branch]: ...
     def exists_by_name(self, name: str) -> bool: ...
     def save(self, branch: Branch) -> Branch: ...
     def delete_by_id(self, branch_id: str) -> None: ...
@@ -22,8 +23,9 @@ class BranchRepository(t.Protocol):
 @t.runtime_checkable
 class StaffRepository(t.Protocol):
     def __init__(self, session: sa_orm.scoped_session[Session]) -> None: ...
-    def find_all(self) -> list[Staff]: ...
+    def find_all(self, *, limit: int | None = None, after: str | None = None) -> list[Staff]: ...
     def get_by_id(self, staff_id: str) -> Staff | None: ...
+    def get_by_ids(self, staff_ids: t.Sequence[str]) -> dict[str, Staff]: ...
     def exists_by_email(self, email: str) -> bool: ...
     def save(self, staff: Staff) -> Staff: ...
     def delete_by_id(self, staff_id: str) -> None: ...
@@ -31,6 +31,16 @@ from .exceptions import (
 )
 
 
+@dataclass(frozen=True)
+class PatronEligibility:
+    patron_id: str
+    status: str
+    active_loans: int = 0
+    pending_holds: int = 0
+    outstanding_fines: Decimal = Decimal(0)
+    has_copy_on_loan: bool = False
+
+
 @dataclass
 class Patron(DomainEntity):
     name: str
@@ -168,6 +178,15 @@ class Fine(DomainEntity):
         event_bus.add_event(FineCreatedEvent(patron_id=patron_id, loan_id=loan_id, amount=amount))
         return fine
 
+    @property
+    def settled(self) -> bool:
+        return self.status in (FineStatus.PAID.value, FineStatus.WAIVED.value)
+
+    def accrue_overdue(self, days_late: int, fine_policy_service: FinePolicyService) -> None:
+        if self.settled:
+            raise FineAlreadyPaid(self.patron_id, self.loan_id)
+        self.amount = fine_policy_service.calculate_overdue_fine(days_late=days_late)
+
     def pay(self) -> None:
         if self.status == FineStatus.PAID.value:
             raise FineAlreadyPaid(self.patron_id, self.loan_id)
@@ -6,15 +6,17 @@ import sqlalchemy.orm as sa_orm
 from flask_sqlalchemy.session import Session
 
 if t.TYPE_CHECKING:
-    from .entities import Fine, Patron
+    from .entities import Fine, Patron, PatronEligibility
 
 
 @t.runtime_checkable
 class PatronRepository(t.Protocol):
     def __init__(self, session: sa_orm.scoped_session[Session]) -> None: ...
-    def find_all(self) -> list[Patron]: ...
+    def find_all(self, *, limit: int | None = None, after: str | None = None) -> list[Patron]: ...
     def get_by_id(self, patron_id: str) -> Patron | None: ...
+    def get_by_ids(self, patron_ids: t.Sequence[str]) -> dict[str, Patron]: ...
     def exists_by_email(self, email: str) -> bool: ...
+    def get_eligibility(self, patron_id: str, *, copy_id: str | None = None) -> PatronEligibility | None: ...
     def save(self, patron: Patron) -> Patron: ...
     def delete_by_id(self, patron_id: str) -> None: ...
 
@@ -22,7 +24,9 @@ class PatronRepository(t.Protocol):
 @t.runtime_checkable
 class FineRepository(t.Protocol):
     def __init__(self, session: sa_orm.scoped_session[Session]) -> None: ...
-    def find_all(self) -> list[Fine]: ...
+    def find_all(self, *, limit: int | None = None, after: str | None = None) -> list[Fine]: ...
     def get_by_id(self, fine_id: str) -> Fine | None: ...
+    def get_by_ids(self, fine_ids: t.Sequence[str]) -> dict[str, Fine]: ...
+    def find_by_loan_id(self, loan_id: str) -> Fine | None: ...
     def save(self, fine: Fine) -> Fine: ...
     def delete_by_id(self, fine_id: str) -> None: ...
@@ -4,7 +4,6 @@ from decimal import Decimal
 
 from lms.domain import DomainNotFound
 from lms.domain.catalogs.repositories import CopyRepository, ItemRepository
-from lms.domain.circulations.repositories import HoldRepository, LoanRepository
 from lms.infrastructure.database.models.patrons import PatronStatus
 from lms.infrastructure.database.models.catalogs import ItemFormat
 
@@ -20,48 +19,41 @@ class PatronUniquenessService:
 
 
 class PatronBarringService:
-    def __init__(self, /, *, patron_repository: PatronRepository, loan_repository: LoanRepository) -> None:
+    def __init__(self, /, *, patron_repository: PatronRepository) -> None:
         self.patron_repository = patron_repository
-        self.loan_repository = loan_repository
 
     def can_borrow_copies(self, patron_id: str) -> bool:
-        patron = self.patron_repository.get_by_id(patron_id)
-        if patron is None:
+        eligibility = self.patron_repository.get_eligibility(patron_id)
+        if eligibility is None:
             return False
-        loans = self.loan_repository.find_by_patron_id(patron_id)
-        return patron.status == PatronStatus.ACTIVE.value and len(loans) == 0
+        return eligibility.status == PatronStatus.ACTIVE.value and eligibility.active_loans == 0
 
     def can_renew_copy(self, patron_id: str, copy_id: str) -> bool:
-        patron = self.patron_repository.get_by_id(patron_id)
-        if patron is None:
-            return False
-        loans = self.loan_repository.find_by_patron_id(patron_id)
-        loan = next((loan for loan in loans if loan.copy_id == copy_id), None)
-        if loan is None:
+        eligibility = self.patron_repository.get_eligibility(patron_id, copy_id=copy_id)
+        if eligibility is None or not eligibility.has_copy_on_loan:
             return False
-        return patron.status == PatronStatus.ACTIVE.value and len(loans) == 1
+        return eligibility.status == PatronStatus.ACTIVE.value and eligibility.active_loans == 1
 
 
 class PatronHoldingService:
-    def __init__(self, /, *, hold_repository: HoldRepository) -> None:
-        self.hold_repository = hold_repository
+    def __init__(self, /, *, patron_repository: PatronRepository) -> None:
+        self.patron_repository = patron_repository
 
     def can_place_holds(self, patron_id: str) -> bool:
-        pending_holds = self.hold_repository.find_active_holds_by_patron(patron_id=patron_id)
-        return len(pending_holds) <= 1
+        eligibility = self.patron_repository.get_eligibility(patron_id)
+        # An unknown patron has no holds; whether the patron exists is checked by the caller.
+        return eligibility is None or eligibility.pending_holds <= 1
 
 
 class PatronReinstatementService:
-    def __init__(self, /, *, patron_repository: PatronRepository, loan_repository: LoanRepository) -> None:
+    def __init__(self, /, *, patron_repository: PatronRepository) -> None:
         self.patron_repository = patron_repository
-        self.loan_repository = loan_repository
 
     def can_reinstate(self, patron_id: str) -> bool:
-        patron = self.patron_repository.get_by_id(patron_id)
-        if patron is None:
+        eligibility = self.patron_repository.get_eligibility(patron_id)
+        if eligibility is None:
             return False
-        loans = self.loan_repository.find_by_patron_id(patron_id)
-        return patron.status == PatronStatus.SUSPENDED.value and len(loans) == 0
+        return eligibility.status == PatronStatus.SUSPENDED.value and eligibility.active_loans == 0
 
 
 class FinePolicyService:
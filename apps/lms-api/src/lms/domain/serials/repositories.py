@@ -12,8 +12,9 @@ if t.TYPE_CHECKING:
 @t.runtime_checkable
 class SerialRepository(t.Protocol):
     def __init__(self, session: sa_orm.scoped_session[Session]) -> None: ...
-    def find_all(self) -> list[Serial]: ...
+    def find_all(self, *, limit: int | None = None, after: str | None = None) -> list[Serial]: ...
     def get_by_id(self, serial_id: str) -> Serial | None: ...
+    def get_by_ids(self, serial_ids: t.Sequence[str]) -> dict[str, Serial]: ...
     def save(self, serial: Serial) -> Serial: ...
     def delete_by_id(self, serial_id: str) -> None: ...
 
@@ -21,7 +22,8 @@ class SerialRepository(t.Protocol):
 @t.runtime_checkable
 class SerialIssueRepository(t.Protocol):
     def __init__(self, session: sa_orm.scoped_session[Session]) -> None: ...
-    def find_all(self) -> list[SerialIssue]: ...
+    def find_all(self, *, limit: int | None = None, after: str | None = None) -> list[SerialIssue]: ...
     def get_by_id(self, issue_id: str) -> SerialIssue | None: ...
+    def get_by_ids(self, issue_ids: t.Sequence[str]) -> dict[str, SerialIssue]: ...
     def save(self, issue: SerialIssue) -> SerialIssue: ...
     def delete_by_id(self, issue_id: str) -> None: ...
@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import uuid
+import typing as t
+
+import sqlalchemy as sa
+import sqlalchemy.orm as sa_orm
+from flask_sqlalchemy.session import Session
+
+from lms.infrastructure.database import identity_map
+from lms.infrastructure.database.identity_map import canonical_id
+
+# Well below the bound parameter limits of SQLite (999 on old builds) and PostgreSQL (65535).
+IN_CHUNK_SIZE = 500
+
+
+class _HasId(t.Protocol):
+    id: sa_orm.Mapped[uuid.UUID]
+
+
+def load_by_ids[M: _HasId, E](
+    session: sa_orm.scoped_session[Session],
+    model_type: type[M],
+    entity_type: type[E],
+    to_entity: t.Callable[[M], E],
+    ids: t.Iterable[str],
+    /,
+    *,
+    options: t.Sequence[sa_orm.interfaces.ORMOption] = (),
+    chunk_size: int = IN_CHUNK_SIZE,
+) -> dict[str, E]:
+    """Map the rows of ``model_type`` with the given ids, one ``WHERE id IN (...)`` query per ``chunk_size`` ids.
+
+    Entities already in the identity map are not read again. The result is keyed by the ids as the caller spelled
+    them and leaves out ids without a row, including values that are not ids at all.
+    """
+    found: dict[str, E] = {}
+    wanted: dict[str, list[str]] = {}
+    for entity_id in ids:
+        if (key := canonical_id(entity_id)) is None:
+            continue
+        if (entity := identity_map.get(entity_type, key)) is not None:
+            found[entity_id] = entity
+        else:
+            wanted.setdefault(key, []).append(entity_id)
+    keys = list(wanted)
+    for start in range(0, len(keys), chunk_size):
+        chunk = [uuid.UUID(key) for key in keys[start : start + chunk_size]]
+        for model in session.scalars(sa.select(model_type).where(model_type.id.in_(chunk)).options(*options)):
+            key = str(model.id)
+            entity = identity_map.add(entity_type, key, to_entity(model))
+            found.update(dict.fromkeys(wanted[key], entity))
+    return found
@@ -0,0 +1,216 @@
+from __future__ import annotations
+
+import copy
+import time
+import typing as t
+import threading
+import collections
+from dataclasses import dataclass
+
+import sqlalchemy.orm as sa_orm
+from flask_sqlalchemy.session import Session
+
+from lms.domain import DomainEntity
+from lms.infrastructure.database import identity_map
+from lms.infrastructure.database.identity_map import canonical_id
+
+_WRITTEN_KEY = 'reference_cache_written'
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    invalidations: int = 0
+
+
+class ReferenceCache:
+    """Bounded LRU of small, rarely changing rows (branches, staff, categories, publishers) shared by the threads of
+    one process.
+
+    Writes through the cached repositories evict entries once their transaction has committed; other processes only
+    see a change once their entry is older than ``ttl`` seconds. Entries are deep-copied in and out, so callers may
+    mutate what they get back.
+    """
+
+    def __init__(self, *, max_size: int, ttl: float | None = None) -> None:
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: collections.OrderedDict[tuple[str, str], tuple[float, object]] = collections.OrderedDict()
+        self._stats: dict[str, CacheStats] = {}
+        # Bumped by every invalidation; a load that raced with one is not stored, as it may have read the old row.
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get[T](self, kind: str, key: str, load: t.Callable[[str], T | None]) -> T | None:
+        entry_key = _entry_key(kind, key)
+        if entry_key is None:
+            return load(key)
+        with self._lock:
+            stats = self._kind_stats(kind)
+            entry = self._entries.get(entry_key)
+            if entry is not None and self._fresh(entry):
+                self._entries.move_to_end(entry_key)
+                stats.hits += 1
+                return copy.deepcopy(t.cast(T, entry[1]))
+            stats.misses += 1
+            generation = self._generation
+        value = load(key)
+        if value is not None:
+            with self._lock:
+                if generation == self._generation:
+                    self._store(entry_key, value)
+        return value
+
+    def get_many[T](
+        self, kind: str, keys: t.Sequence[str], load: t.Callable[[t.Sequence[str]], t.Mapping[str, T]]
+    ) -> dict[str, T]:
+        """Like :meth:`get` for several keys, loading all of the misses with one call of ``load``."""
+        found: dict[str, T] = {}
+        missing: list[str] = []
+        with self._lock:
+            stats = self._kind_stats(kind)
+            for key in keys:
+                entry_key = _entry_key(kind, key)
+                entry = self._entries.get(entry_key) if entry_key is not None else None
+                if entry_key is None:
+                    missing.append(key)
+                elif entry is not None and self._fresh(entry):
+                    self._entries.move_to_end(entry_key)
+                    stats.hits += 1
+                    found[key] = copy.deepcopy(t.cast(T, entry[1]))
+                else:
+                    stats.misses += 1
+                    missing.append(key)
+            generation = self._generation
+        if not missing:
+            return found
+        loaded = load(missing)
+        with self._lock:
+            if generation == self._generation:
+                for key, value in loaded.items():
+                    if (entry_key := _entry_key(kind, key)) is not None:
+                        self._store(entry_key, value)
+        found.update(loaded)
+        return found
+
+    def put_many(self, kind: str, values: t.Iterable[tuple[str, object]]) -> None:
+        with self._lock:
+            self._kind_stats(kind)
+            for key, value in values:
+                if (entry_key := _entry_key(kind, key)) is not None:
+                    self._store(entry_key, value)
+
+    def invalidate(self, kind: str, key: str) -> None:
+        entry_key = _entry_key(kind, key)
+        with self._lock:
+            self._generation += 1
+            if entry_key is not None and self._entries.pop(entry_key, None) is not None:
+                self._kind_stats(kind).invalidations += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+
+    def snapshot(self) -> dict[str, dict[str, int]]:
+        with self._lock:
+            sizes = collections.Counter(kind for kind, _ in self._entries)
+            return {
+                kind: {
+                    'size': sizes[kind],
+                    'hits': stats.hits,
+                    'misses': stats.misses,
+                    'evictions': stats.evictions,
+                    'invalidations': stats.invalidations,
+                }
+                for kind, stats in sorted(self._stats.items())
+            }
+
+    def _fresh(self, entry: tuple[float, object]) -> bool:
+        return self.ttl is None or time.monotonic() - entry[0] < self.ttl
+
+    def _store(self, entry_key: tuple[str, str], value: object) -> None:
+        self._entries[entry_key] = (time.monotonic(), copy.deepcopy(value))
+        self._entries.move_to_end(entry_key)
+        while len(self._entries) > self.max_size:
+            (kind, _), _ = self._entries.popitem(last=False)
+            self._kind_stats(kind).evictions += 1
+
+    def _kind_stats(self, kind: str) -> CacheStats:
+        stats = self._stats.get(kind)
+        if stats is None:
+            stats = self._stats[kind] = CacheStats()
+        return stats
+
+
+def _entry_key(kind: str, key: str) -> tuple[str, str] | None:
+    entity_id = canonical_id(key)
+    return (kind, entity_id) if entity_id is not None else None
+
+
+class CachedReads:
+    """Serves ``get_by_id`` of a repository from a :class:`ReferenceCache`.
+
+    Rows written in the current session are read from it instead, so an uncommitted change never reaches the cache,
+    and their entries are evicted by :func:`invalidate_written` once the session commits.
+    """
+
+    kind: t.ClassVar[str]
+    session: sa_orm.scoped_session[Session]
+    cache: ReferenceCache
+
+    def _cached[T](self, entity_type: type[T], key: str, load: t.Callable[[str], T | None]) -> T | None:
+        if (entity := identity_map.get(entity_type, key)) is not None:
+            return entity
+        if _entry_key(self.kind, key) in self.session.info.get(_WRITTEN_KEY, ()):
+            return load(key)
+        entity = self.cache.get(self.kind, key, load)
+        return identity_map.add(entity_type, key, entity) if entity is not None else None
+
+    def _cached_many[T](
+        self, entity_type: type[T], keys: t.Sequence[str], load: t.Callable[[t.Sequence[str]], t.Mapping[str, T]]
+    ) -> dict[str, T]:
+        found: dict[str, T] = {}
+        written = self.session.info.get(_WRITTEN_KEY, ())
+        own: list[str] = []
+        shared: list[str] = []
+        for key in keys:
+            if (entity := identity_map.get(entity_type, key)) is not None:
+                found[key] = entity
+            else:
+                (own if _entry_key(self.kind, key) in written else shared).append(key)
+        if own:
+            found.update(load(own))
+        for key, entity in self.cache.get_many(self.kind, shared, load).items():
+            found[key] = identity_map.add(entity_type, key, entity)
+        return found
+
+    def _written(self, key: str | None) -> None:
+        if key is None:
+            return
+        if (entry_key := _entry_key(self.kind, key)) is not None:
+            self.session.info.setdefault(_WRITTEN_KEY, {})[entry_key] = self.cache
+
+    def _preload(self, entities: t.Sequence[DomainEntity]) -> int:
+        self.cache.put_many(self.kind, ((t.cast(str, entity.id), entity) for entity in entities))
+        return len(entities)
+
+
+def invalidate_written(session: sa_orm.scoped_session[Session]) -> None:
+    """Evict the rows written through cached repositories in ``session``; call once their transaction has committed.
+
+    Evicting only then means a concurrent reader cannot put the old row back in the window before the commit.
+    """
+    written: dict[tuple[str, str], ReferenceCache] = session.info.pop(_WRITTEN_KEY, {})
+    for (kind, key), cache in written.items():
+        cache.invalidate(kind, key)
+
+
+def forget_written(session: sa_orm.scoped_session[Session]) -> None:
+    """Drop the rows written in ``session`` after a rollback; the cached entries still match the database."""
+    session.info.pop(_WRITTEN_KEY, None)
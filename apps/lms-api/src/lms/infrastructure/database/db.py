@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from flask import Flask
 
-from lms.app.extensions import db
+from lms.app.extensions import db, alembic
 
 db_session = db.session
 
@@ -13,6 +13,7 @@ class BaseModel(db.Model):  # type: ignore
 
 def init_db(app: Flask) -> None:
     from lms.infrastructure.database.models import (  # noqa: F401
+        outbox,
         patrons,
         serials,
         catalogs,
@@ -23,3 +24,5 @@ def init_db(app: Flask) -> None:
 
     with app.app_context():
         db.create_all()
+        # The schema now matches the latest revision, so later `flask db upgrade` runs start from there.
+        alembic.stamp()
@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import uuid
+import typing as t
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+
+class IdentityMap:
+    """Domain entities mapped during one JSON-RPC call, keyed by type and id.
+
+    Repositories hand out the mapped entity again instead of re-reading and re-mapping its row, drop it when they
+    write the row, and the unit of work empties the map when its transaction ends.
+    """
+
+    def __init__(self) -> None:
+        self._entities: dict[tuple[type[t.Any], str], t.Any] = {}
+
+    def __len__(self) -> int:
+        return len(self._entities)
+
+    def get[E](self, entity_type: type[E], entity_id: str) -> E | None:
+        key = canonical_id(entity_id)
+        return self._entities.get((entity_type, key)) if key is not None else None
+
+    def add[E](self, entity_type: type[E], entity_id: str, entity: E) -> E:
+        if (key := canonical_id(entity_id)) is not None:
+            self._entities[entity_type, key] = entity
+        return entity
+
+    def discard(self, entity_type: type[t.Any], entity_id: str | None) -> None:
+        if (key := canonical_id(entity_id)) is not None:
+            self._entities.pop((entity_type, key), None)
+
+    def clear(self) -> None:
+        self._entities.clear()
+
+
+def canonical_id(value: str | None) -> str | None:
+    """Spells an id one way so lookups by client input match entities keyed by their own id; None if not an id."""
+    try:
+        return str(uuid.UUID(value))
+    except (TypeError, ValueError, AttributeError):
+        return None
+
+
+_current: ContextVar[IdentityMap | None] = ContextVar('identity_map', default=None)
+
+
+@contextmanager
+def identity_scope() -> t.Iterator[IdentityMap]:
+    identity_map = IdentityMap()
+    token = _current.set(identity_map)
+    try:
+        yield identity_map
+    finally:
+        _current.reset(token)
+
+
+# Outside a scope (CLI commands, background handlers, the outbox relay) there is no map and every lookup misses.
+def get[E](entity_type: type[E], entity_id: str) -> E | None:
+    identity_map = _current.get()
+    return identity_map.get(entity_type, entity_id) if identity_map is not None else None
+
+
+def add[E](entity_type: type[E], entity_id: str, entity: E) -> E:
+    identity_map = _current.get()
+    return identity_map.add(entity_type, entity_id, entity) if identity_map is not None else entity
+
+
+def discard(entity_type: type[t.Any], entity_id: str | None) -> None:
+    identity_map = _current.get()
+    if identity_map is not None:
+        identity_map.discard(entity_type, entity_id)
+
+
+def clear() -> None:
+    identity_map = _current.get()
+    if identity_map is not None:
+        identity_map.clear()
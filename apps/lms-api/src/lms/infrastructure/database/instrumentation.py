@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import time
+import typing as t
+from contextlib import contextmanager
+from collections import Counter
+from contextvars import ContextVar
+
+import sqlalchemy as sa
+
+
+class QueryStats:
+    def __init__(self) -> None:
+        self.count = 0
+        self.seconds = 0.0
+        # Statements arrive with bound parameters as placeholders, so equal strings mean the same statement shape.
+        self.statements: Counter[str] = Counter()
+
+    @property
+    def repeated(self) -> int:
+        return sum(count - 1 for count in self.statements.values() if count > 1)
+
+    def most_repeated(self) -> tuple[str, int] | None:
+        top = self.statements.most_common(1)
+        if not top or top[0][1] <= 1:
+            return None
+        return top[0]
+
+    def record(self, statement: str, seconds: float) -> None:
+        self.count += 1
+        self.seconds += seconds
+        self.statements[statement] += 1
+
+    def merge(self, other: QueryStats) -> None:
+        self.count += other.count
+        self.seconds += other.seconds
+        self.statements.update(other.statements)
+
+
+_current: ContextVar[QueryStats | None] = ContextVar('query_stats', default=None)
+
+
+@contextmanager
+def track_queries() -> t.Iterator[QueryStats]:
+    stats = QueryStats()
+    token = _current.set(stats)
+    try:
+        yield stats
+    finally:
+        _current.reset(token)
+
+
+def instrument(engine: sa.Engine) -> None:
+    if not sa.event.contains(engine, 'before_cursor_execute', _before_cursor_execute):
+        sa.event.listen(engine, 'before_cursor_execute', _before_cursor_execute)
+        sa.event.listen(engine, 'after_cursor_execute', _after_cursor_execute)
+        sa.event.listen(engine, 'handle_error', _handle_error)
+
+
+def _before_cursor_execute(conn: sa.Connection, *args: t.Any) -> None:  # noqa: ANN401
+    if _current.get() is not None:
+        conn.info.setdefault('query_started', []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn: sa.Connection, cursor: t.Any, statement: str, *args: t.Any) -> None:  # noqa: ANN401
+    stats = _current.get()
+    if stats is not None and conn.info.get('query_started'):
+        stats.record(statement, time.perf_counter() - conn.info['query_started'].pop())
+
+
+def _handle_error(context: sa.engine.ExceptionContext) -> None:
+    # A statement that raises never reaches after_cursor_execute; drop its start time so the stack kept on a pooled
+    # connection does not grow.
+    conn = context.connection
+    if conn is not None and context.statement is not None and conn.info.get('query_started'):
+        conn.info['query_started'].pop()
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import uuid
+import typing as t
 
 from lms.domain.acquisitions.entities import Vendor, AcquisitionOrder, AcquisitionOrderLine
 from lms.infrastructure.database.models.acquisitions import (
@@ -66,6 +67,18 @@ class AcquisitionOrderLineMapper:
         model.status = OrderLineStatus(entity.status)
         return model
 
+    @staticmethod
+    def to_row(entity: AcquisitionOrderLine) -> dict[str, t.Any]:
+        return {
+            'id': uuid.UUID(t.cast(str, entity.id)),
+            'order_id': uuid.UUID(entity.order_id),
+            'item_id': uuid.UUID(entity.item_id),
+            'unit_price': entity.unit_price,
+            'quantity': entity.quantity,
+            'received_quantity': entity.received_quantity,
+            'status': OrderLineStatus(entity.status),
+        }
+
 
 class VendorMapper:
     @staticmethod
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import uuid
+import typing as t
 
 from lms.domain.catalogs.entities import Copy, Item, Author, Category, Publisher
 from lms.infrastructure.database.models.catalogs import (
@@ -40,6 +41,18 @@ class CopyMapper:
         model.acquisition_date = entity.acquisition_date
         return model
 
+    @staticmethod
+    def to_row(entity: Copy) -> dict[str, t.Any]:
+        return {
+            'id': uuid.UUID(t.cast(str, entity.id)),
+            'item_id': uuid.UUID(entity.item_id),
+            'branch_id': uuid.UUID(entity.branch_id),
+            'barcode': entity.barcode,
+            'status': CopyStatus(entity.status),
+            'location': entity.location,
+            'acquisition_date': entity.acquisition_date,
+        }
+
 
 class ItemMapper:
     @staticmethod
@@ -2,8 +2,8 @@ from __future__ import annotations
 
 import uuid
 
-from lms.domain.circulations.entities import Hold, Loan
-from lms.infrastructure.database.models.circulations import HoldModel, LoanModel, HoldStatus
+from lms.domain.circulations.entities import Hold, Loan, SweepCheckpoint
+from lms.infrastructure.database.models.circulations import HoldModel, LoanModel, HoldStatus, SweepCheckpointModel
 
 
 class LoanMapper:
@@ -64,3 +64,23 @@ class HoldMapper:
         model.expiry_date = entity.expiry_date
         model.status = HoldStatus(entity.status)
         return model
+
+
+class SweepCheckpointMapper:
+    @staticmethod
+    def to_entity(model: SweepCheckpointModel) -> SweepCheckpoint:
+        return SweepCheckpoint(
+            name=model.name,
+            run_date=model.run_date,
+            last_due_date=model.last_due_date,
+            last_loan_id=str(model.last_loan_id) if model.last_loan_id else None,
+        )
+
+    @staticmethod
+    def from_entity(entity: SweepCheckpoint) -> SweepCheckpointModel:
+        model = SweepCheckpointModel()
+        model.name = entity.name
+        model.run_date = entity.run_date
+        model.last_due_date = entity.last_due_date
+        model.last_loan_id = uuid.UUID(entity.last_loan_id) if entity.last_loan_id else None
+        return model
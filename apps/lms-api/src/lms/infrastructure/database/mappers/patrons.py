@@ -37,7 +37,7 @@ class FineMapper:
         return Fine(
             id=str(model.id) if model.id else None,
             patron_id=str(model.patron_id),
-            loan_id='',  # str(model.loan_id),
+            loan_id=str(model.loan_id) if model.loan_id else '',
             amount=model.amount,
             reason=model.reason,
             issued_date=model.issued_date,
@@ -51,7 +51,7 @@ class FineMapper:
         if entity.id:
             model.id = uuid.UUID(entity.id)
         model.patron_id = uuid.UUID(entity.patron_id)
-        # model.loan_id = uuid.UUID(entity.loan_id)
+        model.loan_id = uuid.UUID(entity.loan_id) if entity.loan_id else None
         model.amount = entity.amount
         model.reason = entity.reason
         model.issued_date = entity.issued_date
@@ -0,0 +1,56 @@
+"""Add indexes for hot circulation and catalog queries
+
+Revision ID: 1792202458
+Revises: 1792202431
+Create Date: 2026-10-17 02:00:58.962434
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '1792202458'
+down_revision: str | Sequence[str] | None = '1792202431'
+branch_labels: str | Sequence[str] | None = ()
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_loans_patron_id_return_date', 'loans', ['patron_id', 'return_date'], unique=False)
+    op.create_index(
+        'ix_loans_copy_id_active',
+        'loans',
+        ['copy_id'],
+        unique=False,
+        sqlite_where=sa.text('return_date IS NULL'),
+        postgresql_where=sa.text('return_date IS NULL'),
+    )
+    op.create_index('ix_holds_patron_id_status', 'holds', ['patron_id', 'status'], unique=False)
+    op.create_index(
+        'ix_holds_copy_id_pending',
+        'holds',
+        ['copy_id'],
+        unique=False,
+        sqlite_where=sa.text("status = 'PENDING'"),
+        postgresql_where=sa.text("status = 'PENDING'"),
+    )
+    op.create_index('ix_fines_patron_id_status', 'fines', ['patron_id', 'status'], unique=False)
+    op.create_index(op.f('ix_copies_item_id'), 'copies', ['item_id'], unique=False)
+    op.create_index(op.f('ix_acquisition_order_lines_order_id'), 'acquisition_order_lines', ['order_id'], unique=False)
+    op.create_index(op.f('ix_serial_issues_serial_id'), 'serial_issues', ['serial_id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_serial_issues_serial_id'), table_name='serial_issues')
+    op.drop_index(op.f('ix_acquisition_order_lines_order_id'), table_name='acquisition_order_lines')
+    op.drop_index(op.f('ix_copies_item_id'), table_name='copies')
+    op.drop_index('ix_fines_patron_id_status', table_name='fines')
+    op.drop_index('ix_holds_copy_id_pending', table_name='holds')
+    op.drop_index('ix_holds_patron_id_status', table_name='holds')
+    op.drop_index('ix_loans_copy_id_active', table_name='loans')
+    op.drop_index('ix_loans_patron_id_return_date', table_name='loans')
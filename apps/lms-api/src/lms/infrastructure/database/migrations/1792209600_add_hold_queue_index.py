@@ -0,0 +1,35 @@
+"""Add the pending hold queue index
+
+Revision ID: 1792209600
+Revises: 1792202458
+Create Date: 2026-10-17 04:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '1792209600'
+down_revision: str | Sequence[str] | None = '1792202458'
+branch_labels: str | Sequence[str] | None = ()
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'ix_holds_item_id_queue',
+        'holds',
+        ['item_id', 'request_date', 'id'],
+        unique=False,
+        sqlite_where=sa.text("status = 'PENDING'"),
+        postgresql_where=sa.text("status = 'PENDING'"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_holds_item_id_queue', table_name='holds')
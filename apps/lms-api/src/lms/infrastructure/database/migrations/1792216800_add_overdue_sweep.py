@@ -0,0 +1,54 @@
+"""Link fines to loans and add the overdue sweep checkpoint
+
+Revision ID: 1792216800
+Revises: 1792209600
+Create Date: 2026-10-17 06:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+import sqlalchemy as sa
+
+from lms.app.extensions import GUID
+
+# revision identifiers, used by Alembic.
+revision: str = '1792216800'
+down_revision: str | Sequence[str] | None = '1792209600'
+branch_labels: str | Sequence[str] | None = ()
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'sweep_checkpoints',
+        sa.Column('name', sa.String(length=50), nullable=False),
+        sa.Column('run_date', sa.Date(), nullable=False),
+        sa.Column('last_due_date', sa.Date(), nullable=True),
+        sa.Column('last_loan_id', GUID(), nullable=True),
+        sa.PrimaryKeyConstraint('name'),
+    )
+    with op.batch_alter_table('fines') as batch_op:
+        batch_op.add_column(sa.Column('loan_id', GUID(), nullable=True))
+        batch_op.create_index(batch_op.f('ix_fines_loan_id'), ['loan_id'], unique=False)
+        batch_op.create_foreign_key('fk_fines_loan_id_loans', 'loans', ['loan_id'], ['id'])
+    op.create_index(
+        'ix_loans_due_date_active',
+        'loans',
+        ['due_date', 'id'],
+        unique=False,
+        sqlite_where=sa.text('return_date IS NULL'),
+        postgresql_where=sa.text('return_date IS NULL'),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_loans_due_date_active', table_name='loans')
+    with op.batch_alter_table('fines') as batch_op:
+        batch_op.drop_constraint('fk_fines_loan_id_loans', type_='foreignkey')
+        batch_op.drop_index(batch_op.f('ix_fines_loan_id'))
+        batch_op.drop_column('loan_id')
+    op.drop_table('sweep_checkpoints')
@@ -0,0 +1,35 @@
+"""Add the pending hold expiry index
+
+Revision ID: 1792220400
+Revises: 1792216800
+Create Date: 2026-10-17 07:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '1792220400'
+down_revision: str | Sequence[str] | None = '1792216800'
+branch_labels: str | Sequence[str] | None = ()
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'ix_holds_expiry_date_pending',
+        'holds',
+        ['expiry_date', 'id'],
+        unique=False,
+        sqlite_where=sa.text("status = 'PENDING'"),
+        postgresql_where=sa.text("status = 'PENDING'"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_holds_expiry_date_pending', table_name='holds')
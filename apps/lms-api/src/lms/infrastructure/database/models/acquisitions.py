@@ -70,7 +70,7 @@ class AcquisitionOrderLineModel(BaseModel):
     __tablename__ = 'acquisition_order_lines'
 
     id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid.uuid7)
-    order_id: Mapped[uuid.UUID] = mapped_column(ForeignKey('acquisition_orders.id'))
+    order_id: Mapped[uuid.UUID] = mapped_column(ForeignKey('acquisition_orders.id'), index=True)
     item_id: Mapped[uuid.UUID] = mapped_column(ForeignKey('items.id'))
     quantity: Mapped[int] = mapped_column(default=1)
     unit_price: Mapped[Decimal] = mapped_column(DECIMAL(10, 2))
@@ -103,7 +103,7 @@ class CopyModel(BaseModel):
     __tablename__ = 'copies'
 
     id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid.uuid7)
-    item_id: Mapped[uuid.UUID] = mapped_column(ForeignKey('items.id'))
+    item_id: Mapped[uuid.UUID] = mapped_column(ForeignKey('items.id'), index=True)
     branch_id: Mapped[uuid.UUID] = mapped_column(ForeignKey('branches.id'))
     barcode: Mapped[str] = mapped_column(String(50), unique=True, nullable=False)
     status: Mapped[CopyStatus] = mapped_column(default=CopyStatus.AVAILABLE)
@@ -5,7 +5,7 @@ import uuid
 import typing as t
 import datetime
 
-from sqlalchemy import ForeignKey
+from sqlalchemy import Index, String, ForeignKey, text
 from sqlalchemy.orm import Mapped, relationship, mapped_column
 
 from lms.infrastructure.database.db import BaseModel
@@ -26,6 +26,22 @@ class HoldStatus(enum.Enum):
 
 class LoanModel(BaseModel):
     __tablename__ = 'loans'
+    __table_args__ = (
+        Index('ix_loans_patron_id_return_date', 'patron_id', 'return_date'),
+        Index(
+            'ix_loans_copy_id_active',
+            'copy_id',
+            sqlite_where=text('return_date IS NULL'),
+            postgresql_where=text('return_date IS NULL'),
+        ),
+        Index(
+            'ix_loans_due_date_active',
+            'due_date',
+            'id',
+            sqlite_where=text('return_date IS NULL'),
+            postgresql_where=text('return_date IS NULL'),
+        ),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid.uuid7)
     copy_id: Mapped[uuid.UUID] = mapped_column(ForeignKey('copies.id'))
@@ -51,6 +67,30 @@ class LoanModel(BaseModel):
 
 class HoldModel(BaseModel):
     __tablename__ = 'holds'
+    __table_args__ = (
+        Index('ix_holds_patron_id_status', 'patron_id', 'status'),
+        Index(
+            'ix_holds_item_id_queue',
+            'item_id',
+            'request_date',
+            'id',
+            sqlite_where=text("status = 'PENDING'"),
+            postgresql_where=text("status = 'PENDING'"),
+        ),
+        Index(
+            'ix_holds_copy_id_pending',
+            'copy_id',
+            sqlite_where=text("status = 'PENDING'"),
+            postgresql_where=text("status = 'PENDING'"),
+        ),
+        Index(
+            'ix_holds_expiry_date_pending',
+            'expiry_date',
+            'id',
+            sqlite_where=text("status = 'PENDING'"),
+            postgresql_where=text("status = 'PENDING'"),
+        ),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid.uuid7)
     patron_id: Mapped[uuid.UUID] = mapped_column(ForeignKey('patrons.id'))
@@ -65,3 +105,12 @@ class HoldModel(BaseModel):
     item: Mapped[ItemModel] = relationship('ItemModel', back_populates='holds')
     loan: Mapped[LoanModel] = relationship('LoanModel', back_populates='hold')
     copy: Mapped[CopyModel] = relationship('CopyModel', back_populates='holds')
+
+
+class SweepCheckpointModel(BaseModel):
+    __tablename__ = 'sweep_checkpoints'
+
+    name: Mapped[str] = mapped_column(String(50), primary_key=True)
+    run_date: Mapped[datetime.date]
+    last_due_date: Mapped[datetime.date | None]
+    last_loan_id: Mapped[uuid.UUID | None]
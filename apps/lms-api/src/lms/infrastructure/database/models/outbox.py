@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+import uuid
+import datetime
+
+from sqlalchemy import Index, String, LargeBinary, text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from lms.infrastructure.database.db import BaseModel
+
+
+class OutboxEventModel(BaseModel):
+    __tablename__ = 'outbox_events'
+    __table_args__ = (
+        Index(
+            'ix_outbox_events_pending',
+            'id',
+            sqlite_where=text('delivered_at IS NULL'),
+            postgresql_where=text('delivered_at IS NULL'),
+        ),
+    )
+
+    # The event id is a UUIDv7, so primary key order is the order the events were raised in.
+    id: Mapped[uuid.UUID] = mapped_column(primary_key=True)
+    event_type: Mapped[str] = mapped_column(String(100))
+    payload: Mapped[bytes] = mapped_column(LargeBinary)
+    created_at: Mapped[datetime.datetime]
+    delivered_at: Mapped[datetime.datetime | None]
+    attempts: Mapped[int] = mapped_column(default=0)
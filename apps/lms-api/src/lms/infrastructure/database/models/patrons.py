@@ -6,7 +6,7 @@ import typing as t
 from decimal import Decimal
 import datetime
 
-from sqlalchemy import DECIMAL, String, ForeignKey
+from sqlalchemy import DECIMAL, Index, String, ForeignKey
 from sqlalchemy.orm import Mapped, relationship, mapped_column
 
 from lms.infrastructure.database.db import BaseModel
@@ -48,9 +48,11 @@ class PatronModel(BaseModel):
 
 class FineModel(BaseModel):
     __tablename__ = 'fines'
+    __table_args__ = (Index('ix_fines_patron_id_status', 'patron_id', 'status'),)
 
     id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid.uuid7)
     patron_id: Mapped[uuid.UUID] = mapped_column(ForeignKey('patrons.id'))
+    loan_id: Mapped[uuid.UUID | None] = mapped_column(ForeignKey('loans.id'), index=True)
     amount: Mapped[Decimal] = mapped_column(DECIMAL(10, 2))
     reason: Mapped[str | None]
     issued_date: Mapped[datetime.date] = mapped_column(default=datetime.date.today)
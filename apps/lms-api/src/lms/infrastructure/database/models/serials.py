@@ -51,7 +51,7 @@ class SerialIssueModel(BaseModel):
     __tablename__ = 'serial_issues'
 
     id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid.uuid7)
-    serial_id: Mapped[uuid.UUID] = mapped_column(ForeignKey('serials.id'))
+    serial_id: Mapped[uuid.UUID] = mapped_column(ForeignKey('serials.id'), index=True)
     issue_number: Mapped[str | None] = mapped_column(String(50))
     date_received: Mapped[datetime.date] = mapped_column(default=datetime.date.today)
     status: Mapped[SerialIssueStatus] = mapped_column(default=SerialIssueStatus.RECEIVED)
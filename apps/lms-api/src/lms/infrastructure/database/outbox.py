@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import uuid
+import typing as t
+import datetime
+
+import msgspec
+import sqlalchemy as sa
+import sqlalchemy.exc as sa_exc
+import sqlalchemy.orm as sa_orm
+from flask_sqlalchemy.session import Session
+
+from lms.domain import UnitOfWork, DomainEvent
+from lms.infrastructure.logging import logger
+from lms.infrastructure.database import RepositoryError
+from lms.infrastructure.event_bus import event_bus
+from lms.infrastructure.database.models.outbox import OutboxEventModel
+
+_encoder = msgspec.msgpack.Encoder()
+
+
+_decoders: dict[type[object], msgspec.msgpack.Decoder[t.Any]] = {}
+
+
+def _decoder(event_type: type[object]) -> msgspec.msgpack.Decoder[t.Any]:
+    if (decoder := _decoders.get(event_type)) is None:
+        decoder = _decoders[event_type] = msgspec.msgpack.Decoder(event_type)
+    return decoder
+
+
+class SQLAlchemyOutbox:
+    """Stores events with background handlers in the transaction that raised them."""
+
+    def __init__(self, session: sa_orm.scoped_session[Session]) -> None:
+        self.session = session
+
+    def add_all(self, events: t.Sequence[object]) -> None:
+        now = datetime.datetime.now(datetime.UTC)
+        rows = [
+            {
+                'id': uuid.UUID(event.event_id) if isinstance(event, DomainEvent) else uuid.uuid7(),
+                'event_type': type(event).__name__,
+                'payload': _encoder.encode(event),
+                'created_at': now,
+            }
+            for event in events
+            if event_bus.has_background_handlers(event)
+        ]
+        if not rows:
+            return
+        try:
+            self.session.execute(sa.insert(OutboxEventModel), rows)
+        except sa_exc.SQLAlchemyError as e:
+            raise RepositoryError('Failed to write events to the outbox', cause=e) from e
+
+
+class OutboxRelay:
+    """Delivers undelivered outbox events to their background handlers, one batch per transaction.
+
+    Each handler runs in a savepoint inside the batch transaction, so its writes commit together with the
+    delivered mark and a failing handler only rolls back its own work. Delivery is at least once: a batch
+    that fails to commit is delivered again by the next run.
+    """
+
+    def __init__(
+        self, session: sa_orm.scoped_session[Session], unit_of_work: UnitOfWork, *, max_attempts: int = 5
+    ) -> None:
+        self.session = session
+        self.unit_of_work = unit_of_work
+        self.max_attempts = max_attempts
+
+    def relay(self, *, batch_size: int) -> int:
+        with self.unit_of_work:
+            try:
+                models = self.session.scalars(
+                    sa.select(OutboxEventModel)
+                    .where(OutboxEventModel.delivered_at.is_(None), OutboxEventModel.attempts < self.max_attempts)
+                    .order_by(OutboxEventModel.id)
+                    .limit(batch_size)
+                    .with_for_update(skip_locked=True)
+                ).all()
+            except sa_exc.SQLAlchemyError as e:
+                raise RepositoryError('Failed to read the outbox', cause=e) from e
+            now = datetime.datetime.now(datetime.UTC)
+            for model in models:
+                if self._deliver(model):
+                    model.delivered_at = now
+                else:
+                    model.attempts += 1
+            try:
+                self.session.flush()
+            except sa_exc.SQLAlchemyError as e:
+                raise RepositoryError('Failed to mark outbox events', cause=e) from e
+        return len(models)
+
+    def _deliver(self, model: OutboxEventModel) -> bool:
+        event_type = event_bus.background_event_type(model.event_type)
+        if event_type is None:
+            logger.warning('No background handlers for outbox event %s (%s)', model.event_type, model.id)
+            return True
+        try:
+            with self.session.begin_nested(), event_bus.savepoint():
+                event_bus.deliver(_decoder(event_type).decode(model.payload))
+        except Exception:
+            logger.exception('Failed to deliver outbox event %s (%s)', model.event_type, model.id)
+            return False
+        return True
@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+import uuid
+
+import sqlalchemy.orm as sa_orm
+
+
+def keyset[T](
+    query: sa_orm.Query[T],
+    id_column: sa_orm.InstrumentedAttribute[uuid.UUID],
+    /,
+    *,
+    limit: int | None = None,
+    after: str | None = None,
+) -> sa_orm.Query[T]:
+    """Restrict ``query`` to the page that follows ``after`` in primary key order.
+
+    Primary keys are uuid7 values, so ordering by them is ordering by creation time and
+    the ``id > after`` seek is answered by the primary key index, whatever the page depth.
+    """
+    if after is not None:
+        query = query.filter(id_column > uuid.UUID(after))
+    query = query.order_by(id_column)
+    if limit is not None:
+        query = query.limit(limit)
+    return query
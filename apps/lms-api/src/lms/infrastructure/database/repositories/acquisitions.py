@@ -1,11 +1,16 @@
 from __future__ import annotations
 
+import typing as t
+
+import sqlalchemy as sa
 import sqlalchemy.exc as sa_exc
 import sqlalchemy.orm as sa_orm
 from flask_sqlalchemy.session import Session
 
-from lms.infrastructure.database import RepositoryError
+from lms.infrastructure.database import RepositoryError, identity_map
 from lms.domain.acquisitions.entities import Vendor, AcquisitionOrder, AcquisitionOrderLine
+from lms.infrastructure.database.batching import load_by_ids
+from lms.infrastructure.database.pagination import keyset
 from lms.infrastructure.database.models.acquisitions import (
     OrderStatus,
     VendorModel,
@@ -23,47 +28,89 @@ class SQLAlchemyAcquisitionOrderRepository:
     def __init__(self, session: sa_orm.scoped_session[Session]) -> None:
         self.session = session
 
-    def find_all(self) -> list[AcquisitionOrder]:
+    def find_all(self, *, limit: int | None = None, after: str | None = None) -> list[AcquisitionOrder]:
         try:
-            models = self.session.query(AcquisitionOrderModel).all()
+            models = keyset(
+                self.session.query(AcquisitionOrderModel), AcquisitionOrderModel.id, limit=limit, after=after
+            ).all()
             return [AcquisitionOrderMapper.to_entity(m) for m in models]
         except sa_exc.SQLAlchemyError as e:
             raise RepositoryError('Failed to retrieve acquisition orders', cause=e) from e
 
     def get_by_id(self, order_id: str) -> AcquisitionOrder | None:
+        if (order := identity_map.get(AcquisitionOrder, order_id)) is not None:
+            return order
         try:
             model = self.session.get(AcquisitionOrderModel, order_id)
-            return AcquisitionOrderMapper.to_entity(model) if model else None
+            return (
+                identity_map.add(AcquisitionOrder, order_id, AcquisitionOrderMapper.to_entity(model)) if model else None
+            )
         except sa_exc.SQLAlchemyError as e:
             raise RepositoryError('Failed to retrieve acquisition order', cause=e) from e
 
+    def get_by_ids(self, order_ids: t.Sequence[str]) -> dict[str, AcquisitionOrder]:
+        try:
+            return load_by_ids(
+                self.session,
+                AcquisitionOrderModel,
+                AcquisitionOrder,
+                AcquisitionOrderMapper.to_entity,
+                order_ids,
+                options=(sa_orm.selectinload(AcquisitionOrderModel.order_lines),),
+            )
+        except sa_exc.SQLAlchemyError as e:
+            raise RepositoryError('Failed to retrieve acquisition orders', cause=e) from e
+
     def save(self, order: AcquisitionOrder) -> AcquisitionOrder:
+        identity_map.discard(AcquisitionOrder, order.id)
         model = self.session.get(AcquisitionOrderModel, order.id) if order.id else None
         if not model:
             model = AcquisitionOrderMapper.from_entity(order)
             try:
                 self.session.add(model)
-                self.session.commit()
+                self.session.flush()
             except sa_exc.SQLAlchemyError as e:
-                self.session.rollback()
                 raise RepositoryError('Failed to save acquisition order', cause=e) from e
             order.id = str(model.id)
             return order
         model.received_date = order.received_date
         model.status = OrderStatus(order.status)
-
-        for line_model in model.order_lines:
-            self.session.delete(line_model)
-        model.order_lines = [AcquisitionOrderLineMapper.from_entity(line) for line in order.order_lines]
+        for line in order.order_lines:
+            identity_map.discard(AcquisitionOrderLine, line.id)
         try:
-            self.session.commit()
+            self._sync_order_lines(model, order.order_lines)
+            self.session.flush()
         except sa_exc.SQLAlchemyError as e:
-            self.session.rollback()
             raise RepositoryError('Failed to update acquisition order', cause=e) from e
-        for line, line_model in zip(order.order_lines, model.order_lines, strict=True):
-            line.id = str(line_model.id)
         return order
 
+    def _sync_order_lines(self, model: AcquisitionOrderModel, order_lines: list[AcquisitionOrderLine]) -> None:
+        # Only rows that differ from the loaded lines are written, so line ids stay stable and a
+        # status-only change on the order does not touch its lines at all.
+        loaded = {str(line_model.id): line_model for line_model in model.order_lines}
+        rows = {t.cast(str, line.id): AcquisitionOrderLineMapper.to_row(line) for line in order_lines}
+        inserts = [row for line_id, row in rows.items() if line_id not in loaded]
+        updates = [
+            row
+            for line_id, row in rows.items()
+            if line_id in loaded
+            and row != AcquisitionOrderLineMapper.to_row(AcquisitionOrderLineMapper.to_entity(loaded[line_id]))
+        ]
+        deletes = [line_model.id for line_id, line_model in loaded.items() if line_id not in rows]
+        if deletes:
+            self.session.execute(
+                sa.delete(AcquisitionOrderLineModel).where(AcquisitionOrderLineModel.id.in_(deletes)),
+                execution_options={'synchronize_session': False},
+            )
+        if updates:
+            self.session.execute(sa.update(AcquisitionOrderLineModel), updates)
+        if inserts:
+            self.session.execute(sa.insert(AcquisitionOrderLineModel), inserts)
+        if inserts or updates or deletes:
+            for line_model in loaded.values():
+                self.session.expire(line_model)
+            self.session.expire(model, ['order_lines'])
+
 
 class SQLAlchemyAcquisitionOrderLineRepository:
     def __init__(self, session: sa_orm.scoped_session[Session]) -> None:
@@ -77,40 +124,66 @@ class SQLAlchemyAcquisitionOrderLineRepository:
             raise RepositoryError('Failed to retrieve acquisition order lines', cause=e) from e
 
     def get_by_id(self, order_line_id: str) -> AcquisitionOrderLine | None:
+        if (order_line := identity_map.get(AcquisitionOrderLine, order_line_id)) is not None:
+            return order_line
         try:
             model = self.session.get(AcquisitionOrderLineModel, order_line_id)
-            return AcquisitionOrderLineMapper.to_entity(model) if model else None
+            return (
+                identity_map.add(AcquisitionOrderLine, order_line_id, AcquisitionOrderLineMapper.to_entity(model))
+                if model
+                else None
+            )
         except sa_exc.SQLAlchemyError as e:
             raise RepositoryError('Failed to retrieve acquisition order line', cause=e) from e
 
+    def get_by_ids(self, order_line_ids: t.Sequence[str]) -> dict[str, AcquisitionOrderLine]:
+        try:
+            return load_by_ids(
+                self.session,
+                AcquisitionOrderLineModel,
+                AcquisitionOrderLine,
+                AcquisitionOrderLineMapper.to_entity,
+                order_line_ids,
+            )
+        except sa_exc.SQLAlchemyError as e:
+            raise RepositoryError('Failed to retrieve acquisition order lines', cause=e) from e
+
 
 class SQLAlchemyVendorRepository:
     def __init__(self, session: sa_orm.scoped_session[Session]) -> None:
         self.session = session
 
-    def find_all(self) -> list[Vendor]:
+    def find_all(self, *, limit: int | None = None, after: str | None = None) -> list[Vendor]:
         try:
-            models = self.session.query(VendorModel).all()
+            models = keyset(self.session.query(VendorModel), VendorModel.id, limit=limit, after=after).all()
             return [VendorMapper.to_entity(m) for m in models]
         except sa_exc.SQLAlchemyError as e:
             raise RepositoryError('Failed to retrieve vendors', cause=e) from e
 
     def get_by_id(self, vendor_id: str) -> Vendor | None:
+        if (vendor := identity_map.get(Vendor, vendor_id)) is not None:
+            return vendor
         try:
             model = self.session.get(VendorModel, vendor_id)
-            return VendorMapper.to_entity(model) if model else None
+            return identity_map.add(Vendor, vendor_id, VendorMapper.to_entity(model)) if model else None
         except sa_exc.SQLAlchemyError as e:
             raise RepositoryError('Failed to retrieve vendor', cause=e) from e
 
+    def get_by_ids(self, vendor_ids: t.Sequence[str]) -> dict[str, Vendor]:
+        try:
+            return load_by_ids(self.session, VendorModel, Vendor, VendorMapper.to_entity, vendor_ids)
+        except sa_exc.SQLAlchemyError as e:
+            raise RepositoryError('Failed to retrieve vendors', cause=e) from e
+
     def save(self, vendor: Vendor) -> Vendor:
+        identity_map.discard(Vendor, vendor.id)
         model = self.session.get(VendorModel, vendor.id) if vendor.id else None
         if not model:
             model = VendorMapper.from_entity(vendor)
             try:
                 self.session.add(model)
-                self.session.commit()
+                self.session.flush()
             except sa_exc.SQLAlchemyError as e:
-                self.session.rollback()
                 raise RepositoryError('Failed to save vendor', cause=e) from e
             vendor.id = str(model.id)
             return vendor
@@ -119,8 +192,7 @@ class SQLAlchemyVendorRepository:
         model.email = vendor.email
         model.phone = vendor.phone
         try:
-            self.session.commit()
+            self.session.flush()
         except sa_exc.SQLAlchemyError as e:
-            self.session.rollback()
             raise RepositoryError('Failed to update vendor', cause=e) from e
         return vendor
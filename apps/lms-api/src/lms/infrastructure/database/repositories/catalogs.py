@@ -1,11 +1,17 @@
 from __future__ import annotations
 
+import typing as t
+
+import sqlalchemy as sa
 import sqlalchemy.exc as sa_exc
 import sqlalchemy.orm as sa_orm
 from flask_sqlalchemy.session import Session
 
-from lms.infrastructure.database import RepositoryError
+from lms.infrastructure.database import RepositoryError, identity_map
 from lms.domain.catalogs.entities import Copy, Item, Author, Category, Publisher
+from lms.infrastructure.database.cache import CachedReads, ReferenceCache
+from lms.infrastructure.database.batching import load_by_ids
+from lms.infrastructure.database.pagination import keyset
 from lms.infrastructure.database.models.catalogs import CopyModel, ItemModel, AuthorModel, CategoryModel, PublisherModel
 from lms.infrastructure.database.mappers.catalogs import (
     CopyMapper,
@@ -20,45 +26,60 @@ class SQLAlchemyCopyRepository:
     def __init__(self, session: sa_orm.scoped_session[Session]) -> None:
         self.session = session
 
-    def find_all(self) -> list[Copy]:
+    def find_all(self, *, limit: int | None = None, after: str | None = None) -> list[Copy]:
         try:
-            models = self.session.query(CopyModel).all()
+            models = keyset(self.session.query(CopyModel), CopyModel.id, limit=limit, after=after).all()
             return [CopyMapper.to_entity(m) for m in models]
         except sa_exc.SQLAlchemyError as e:
             raise RepositoryError('Failed to retrieve copies', cause=e) from e
 
     def get_by_id(self, copy_id: str) -> Copy | None:
+        if (copy := identity_map.get(Copy, copy_id)) is not None:
+            return copy
         try:
             model = self.session.get(CopyModel, copy_id)
-            return CopyMapper.to_entity(model) if model else None
+            return identity_map.add(Copy, copy_id, CopyMapper.to_entity(model)) if model else None
         except sa_exc.SQLAlchemyError as e:
             raise RepositoryError('Failed to retrieve copy', cause=e) from e
 
+    def get_by_ids(self, copy_ids: t.Sequence[str]) -> dict[str, Copy]:
+        try:
+            return load_by_ids(self.session, CopyModel, Copy, CopyMapper.to_entity, copy_ids)
+        except sa_exc.SQLAlchemyError as e:
+            raise RepositoryError('Failed to retrieve copies', cause=e) from e
+
     def save(self, copy: Copy) -> Copy:
+        identity_map.discard(Copy, copy.id)
         model = self.session.get(CopyModel, copy.id) if copy.id else None
         if not model:
             model = CopyMapper.from_entity(copy)
             try:
                 self.session.add(model)
-                self.session.commit()
+                self.session.flush()
             except sa_exc.SQLAlchemyError as e:
-                self.session.rollback()
                 raise RepositoryError('Failed to save copy', cause=e) from e
             copy.id = str(model.id)
             return copy
         try:
-            self.session.commit()
+            self.session.flush()
         except sa_exc.SQLAlchemyError as e:
-            self.session.rollback()
             raise RepositoryError('Failed to save copy', cause=e) from e
         return copy
 
+    def bulk_add(self, copies: list[Copy]) -> list[Copy]:
+        if not copies:
+            return copies
+        try:
+            self.session.execute(sa.insert(CopyModel), [CopyMapper.to_row(copy) for copy in copies])
+        except sa_exc.SQLAlchemyError as e:
+            raise RepositoryError('Failed to bulk add copies', cause=e) from e
+        return copies
+
     def delete_by_id(self, copy_id: str) -> None:
+        identity_map.discard(Copy, copy_id)
         try:
             self.session.query(CopyModel).filter_by(id=copy_id).delete()
-            self.session.commit()
         except sa_exc.SQLAlchemyError as e:
-            self.session.rollback()
             raise RepositoryError('Failed to delete copy', cause=e) from e
 
 
@@ -66,20 +87,28 @@ class SQLAlchemyItemRepository:
     def __init__(self, session: sa_orm.scoped_session[Session]) -> None:
         self.session = session
 
-    def find_all(self) -> list[Item]:
+    def find_all(self, *, limit: int | None = None, after: str | None = None) -> list[Item]:
         try:
-            models = self.session.query(ItemModel).all()
+            models = keyset(self.session.query(ItemModel), ItemModel.id, limit=limit, after=after).all()
             return [ItemMapper.to_entity(m) for m in models]
         except sa_exc.SQLAlchemyError as e:
             raise RepositoryError('Failed to retrieve items', cause=e) from e
 
     def get_by_id(self, item_id: str) -> Item | None:
+        if (item := identity_map.get(Item, item_id)) is not None:
+            return item
         try:
             model = self.session.get(ItemModel, item_id)
-            return ItemMapper.to_entity(model) if model else None
+            return identity_map.add(Item, item_id, ItemMapper.to_entity(model)) if model else None
         except sa_exc.SQLAlchemyError as e:
             raise RepositoryError('Failed to retrieve item', cause=e) from e
 
+    def get_by_ids(self, item_ids: t.Sequence[str]) -> dict[str, Item]:
+        try:
+            return load_by_ids(self.session, ItemModel, Item, ItemMapper.to_entity, item_ids)
+        except sa_exc.SQLAlchemyError as e:
+            raise RepositoryError('Failed to retrieve items', cause=e) from e
+
     def exists_by_title(self, title: str) -> bool:
         try:
             q = self.session.query(ItemModel).filter_by(title=title)
@@ -89,14 +118,14 @@ class SQLAlchemyItemRepository:
             raise RepositoryError('Failed to check item existence by title', cause=e) from e
 
     def save(self, item: Item) -> Item:
+        identity_map.discard(Item, item.id)
         model = self.session.get(ItemModel, item.id) if item.id else None
         if not model:
             model = ItemMapper.from_entity(item)
             try:
                 self.session.add(model)
-                self.session.commit()
+                self.session.flush()
             except sa_exc.SQLAlchemyError as e:
-                self.session.rollback()
                 raise RepositoryError('Failed to save item', cause=e) from e
             item.id = str(model.id)
             return item
@@ -106,18 +135,16 @@ class SQLAlchemyItemRepository:
         model.edition = item.edition
         model.description = item.description
         try:
-            self.session.commit()
+            self.session.flush()
         except sa_exc.SQLAlchemyError as e:
-            self.session.rollback()
             raise RepositoryError('Failed to save item', cause=e) from e
         return item
 
     def delete_by_id(self, item_id: str) -> None:
+        identity_map.discard(Item, item_id)
         try:
             self.session.query(ItemModel).filter_by(id=item_id).delete()
-            self.session.commit()
         except sa_exc.SQLAlchemyError as e:
-            self.session.rollback()
             raise RepositoryError('Failed to delete item', cause=e) from e
 
 
@@ -125,47 +152,53 @@ class SQLAlchemyCategoryRepository:
     def __init__(self, session: sa_orm.scoped_session[Session]) -> None:
         self.session = session
 
-    def find_all(self) -> list[Category]:
+    def find_all(self, *, limit: int | None = None, after: str | None = None) -> list[Category]:
         try:
-            models = self.session.query(CategoryModel).all()
+            models = keyset(self.session.query(CategoryModel), CategoryModel.id, limit=limit, after=after).all()
             return [CategoryMapper.to_entity(m) for m in models]
         except sa_exc.SQLAlchemyError as e:
             raise RepositoryError('Failed to retrieve categories', cause=e) from e
 
     def get_by_id(self, category_id: str) -> Category | None:
+        if (category := identity_map.get(Category, category_id)) is not None:
+            return category
         try:
             model = self.session.get(CategoryModel, category_id)
-            return CategoryMapper.to_entity(model) if model else None
+            return identity_map.add(Category, category_id, CategoryMapper.to_entity(model)) if model else None
         except sa_exc.SQLAlchemyError as e:
             raise RepositoryError('Failed to retrieve category', cause=e) from e
 
+    def get_by_ids(self, category_ids: t.Sequence[str]) -> dict[str, Category]:
+        try:
+            return load_by_ids(self.session, CategoryModel, Category, CategoryMapper.to_entity, category_ids)
+        except sa_exc.SQLAlchemyError as e:
+            raise RepositoryError('Failed to retrieve categories', cause=e) from e
+
     def save(self, category: Category) -> Category:
+        identity_map.discard(Category, category.id)
         model = self.session.get(CategoryModel, category.id)
         if not model:
             model = CategoryMapper.from_entity(category)
             try:
                 self.session.add(model)
-                self.session.commit()
+                self.session.flush()
             except sa_exc.SQLAlchemyError as e:
-                self.session.rollback()
                 raise RepositoryError('Failed to save category', cause=e) from e
             category.id = str(model.id)
             return category
         model.name = category.name
         model.description = category.description
         try:
-            self.session.commit()
+            self.session.flush()
         except sa_exc.SQLAlchemyError as e:
-            self.session.rollback()
             raise RepositoryError('Failed to save category', cause=e) from e
         return category
 
     def delete_by_id(self, category_id: str) -> None:
+        identity_map.discard(Category, category_id)
         try:
             self.session.query(CategoryModel).filter_by(id=category_id).delete()
-            self.session.commit()
         except sa_exc.SQLAlchemyError as e:
-            self.session.rollback()
             raise RepositoryError('Failed to delete category', cause=e) from e
 
 
@@ -173,29 +206,37 @@ class SQLAlchemyAuthorRepository:
     def __init__(self, session: sa_orm.scoped_session[Session]) -> None:
         self.session = session
 
-    def find_all(self) -> list[Author]:
+    def find_all(self, *, limit: int | None = None, after: str | None = None) -> list[Author]:
         try:
-            models = self.session.query(AuthorModel).all()
+            models = keyset(self.session.query(AuthorModel), AuthorModel.id, limit=limit, after=after).all()
             return [AuthorMapper.to_entity(m) for m in models]
         except sa_exc.SQLAlchemyError as e:
             raise RepositoryError('Failed to retrieve authors', cause=e) from e
 
     def get_by_id(self, author_id: str) -> Author | None:
+        if (author := identity_map.get(Author, author_id)) is not None:
+            return author
         try:
             model = self.session.get(AuthorModel, author_id)
-            return AuthorMapper.to_entity(model) if model else None
+            return identity_map.add(Author, author_id, AuthorMapper.to_entity(model)) if model else None
         except sa_exc.SQLAlchemyError as e:
             raise RepositoryError('Failed to retrieve author', cause=e) from e
 
+    def get_by_ids(self, author_ids: t.Sequence[str]) -> dict[str, Author]:
+        try:
+            return load_by_ids(self.session, AuthorModel, Author, AuthorMapper.to_entity, author_ids)
+        except sa_exc.SQLAlchemyError as e:
+            raise RepositoryError('Failed to retrieve authors', cause=e) from e
+
     def save(self, author: Author) -> Author:
+        identity_map.discard(Author, author.id)
         model = self.session.get(AuthorModel, author.id) if author.id else None
         if not model:
             model = AuthorMapper.from_entity(author)
             try:
                 self.session.add(model)
-                self.session.commit()
+                self.session.flush()
             except sa_exc.SQLAlchemyError as e:
-                self.session.rollback()
                 raise RepositoryError('Failed to save author', cause=e) from e
             author.id = str(model.id)
             return author
@@ -203,18 +244,16 @@ class SQLAlchemyAuthorRepository:
         model.bio = author.bio
         model.birth_date = author.birth_date
         try:
-            self.session.commit()
+            self.session.flush()
         except sa_exc.SQLAlchemyError as e:
-            self.session.rollback()
             raise RepositoryError('Failed to save author', cause=e) from e
         return author
 
     def delete_by_id(self, author_id: str) -> None:
+        identity_map.discard(Author, author_id)
         try:
             self.session.query(AuthorModel).filter_by(id=author_id).delete()
-            self.session.commit()
         except sa_exc.SQLAlchemyError as e:
-            self.session.rollback()
             raise RepositoryError('Failed to delete author', cause=e) from e
 
 
@@ -222,29 +261,37 @@ class SQLAlchemyPublisherRepository:
     def __init__(self, session: sa_orm.scoped_session[Session]) -> None:
         self.session = session
 
-    def find_all(self) -> list[Publisher]:
+    def find_all(self, *, limit: int | None = None, after: str | None = None) -> list[Publisher]:
         try:
-            models = self.session.query(PublisherModel).all()
+            models = keyset(self.session.query(PublisherModel), PublisherModel.id, limit=limit, after=after).all()
             return [PublisherMapper.to_entity(m) for m in models]
         except sa_exc.SQLAlchemyError as e:
             raise RepositoryError('Failed to retrieve publishers', cause=e) from e
 
     def get_by_id(self, publisher_id: str) -> Publisher | None:
+        if (publisher := identity_map.get(Publisher, publisher_id)) is not None:
+            return publisher
         try:
             model = self.session.get(PublisherModel, publisher_id)
-            return PublisherMapper.to_entity(model) if model else None
+            return identity_map.add(Publisher, publisher_id, PublisherMapper.to_entity(model)) if model else None
         except sa_exc.SQLAlchemyError as e:
             raise RepositoryError('Failed to retrieve publisher', cause=e) from e
 
+    def get_by_ids(self, publisher_ids: t.Sequence[str]) -> dict[str, Publisher]:
+        try:
+            return load_by_ids(self.session, PublisherModel, Publisher, PublisherMapper.to_entity, publisher_ids)
+        except sa_exc.SQLAlchemyError as e:
+            raise RepositoryError('Failed to retrieve publishers', cause=e) from e
+
     def save(self, publisher: Publisher) -> Publisher:
+        identity_map.discard(Publisher, publisher.id)
         model = self.session.get(PublisherModel, publisher.id) if publisher.id else None
         if not model:
             model = PublisherMapper.from_entity(publisher)
             try:
                 self.session.add(model)
-                self.session.commit()
+                self.session.flush()
             except sa_exc.SQLAlchemyError as e:
-                self.session.rollback()
                 raise RepositoryError('Failed to save publisher', cause=e) from e
             publisher.id = str(model.id)
             return publisher
@@ -252,16 +299,64 @@ class SQLAlchemyPublisherRepository:
         model.address = publisher.address
         model.email = publisher.email
         try:
-            self.session.commit()
+            self.session.flush()
         except sa_exc.SQLAlchemyError as e:
-            self.session.rollback()
             raise RepositoryError('Failed to save publisher', cause=e) from e
         return publisher
 
     def delete_by_id(self, publisher_id: str) -> None:
+        identity_map.discard(Publisher, publisher_id)
         try:
             self.session.query(PublisherModel).filter_by(id=publisher_id).delete()
-            self.session.commit()
         except sa_exc.SQLAlchemyError as e:
-            self.session.rollback()
             raise RepositoryError('Failed to delete publisher', cause=e) from e
+
+
+class CachedCategoryRepository(CachedReads, SQLAlchemyCategoryRepository):
+    kind = 'category'
+
+    def __init__(self, session: sa_orm.scoped_session[Session], cache: ReferenceCache) -> None:
+        super().__init__(session)
+        self.cache = cache
+
+    def get_by_id(self, category_id: str) -> Category | None:
+        return self._cached(Category, category_id, super().get_by_id)
+
+    def get_by_ids(self, category_ids: t.Sequence[str]) -> dict[str, Category]:
+        return self._cached_many(Category, category_ids, super().get_by_ids)
+
+    def save(self, category: Category) -> Category:
+        self._written(category.id)
+        return super().save(category)
+
+    def delete_by_id(self, category_id: str) -> None:
+        self._written(category_id)
+        super().delete_by_id(category_id)
+
+    def preload(self, limit: int) -> int:
+        return self._preload(super().find_all(limit=limit))
+
+
+class CachedPublisherRepository(CachedReads, SQLAlchemyPublisherRepository):
+    kind = 'publisher'
+
+    def __init__(self, session: sa_orm.scoped_session[Session], cache: ReferenceCache) -> None:
+        super().__init__(session)
+        self.cache = cache
+
+    def get_by_id(self, publisher_id: str) -> Publisher | None:
+        return self._cached(Publisher, publisher_id, super().get_by_id)
+
+    def get_by_ids(self, publisher_ids: t.Sequence[str]) -> dict[str, Publisher]:
+        return self._cached_many(Publisher, publisher_ids, super().get_by_ids)
+
+    def save(self, publisher: Publisher) -> Publisher:
+        self._written(publisher.id)
+        return super().save(publisher)
+
+    def delete_by_id(self, publisher_id: str) -> None:
+        self._written(publisher_id)
+        super().delete_by_id(publisher_id)
+
+    def preload(self, limit: int) -> int:
+        return self._preload(super().find_all(limit=limit))
@@ -2,26 +2,30 @@ from __future__ import annotations
 
 import uuid
 import typing as t
+import datetime
 
+import sqlalchemy as sa
 import sqlalchemy.exc as sa_exc
 import sqlalchemy.orm as sa_orm
 from flask_sqlalchemy.session import Session
 
-from lms.infrastructure.database import RepositoryError
+from lms.infrastructure.database import RepositoryError, identity_map
 from lms.domain.catalogs.entities import Copy
-from lms.domain.circulations.entities import Hold, Loan
+from lms.domain.circulations.entities import Hold, Loan, SweepCheckpoint
+from lms.infrastructure.database.batching import load_by_ids
+from lms.infrastructure.database.pagination import keyset
 from lms.infrastructure.database.models.catalogs import CopyModel, CopyStatus
-from lms.infrastructure.database.models.circulations import HoldModel, LoanModel, HoldStatus
-from lms.infrastructure.database.mappers.circulations import HoldMapper, LoanMapper
+from lms.infrastructure.database.models.circulations import HoldModel, LoanModel, HoldStatus, SweepCheckpointModel
+from lms.infrastructure.database.mappers.circulations import HoldMapper, LoanMapper, SweepCheckpointMapper
 
 
 class SQLAlchemyLoanRepository:
     def __init__(self, session: sa_orm.scoped_session[Session]) -> None:
         self.session = session
 
-    def find_all(self) -> list[Loan]:
+    def find_all(self, *, limit: int | None = None, after: str | None = None) -> list[Loan]:
         try:
-            models = self.session.query(LoanModel).all()
+            models = keyset(self.session.query(LoanModel), LoanModel.id, limit=limit, after=after).all()
             return [LoanMapper.to_entity(m) for m in models]
         except sa_exc.SQLAlchemyError as e:
             raise RepositoryError('Failed to retrieve loans', cause=e) from e
@@ -33,14 +37,41 @@ class SQLAlchemyLoanRepository:
         except sa_exc.SQLAlchemyError as e:
             raise RepositoryError('Failed to retrieve loans for patron', cause=e) from e
 
+    def find_overdue(
+        self, today: datetime.date, *, limit: int, after: tuple[datetime.date, str] | None = None
+    ) -> list[Loan]:
+        # Walks ix_loans_due_date_active in (due_date, id) order so callers can resume from the last row seen.
+        query = self.session.query(LoanModel).filter(LoanModel.return_date.is_(None), LoanModel.due_date < today)
+        if after is not None:
+            last_due_date, last_loan_id = after
+            query = query.filter(
+                sa.tuple_(LoanModel.due_date, LoanModel.id)
+                > sa.tuple_(sa.literal(last_due_date, sa.Date), sa.literal(last_loan_id, LoanModel.id.type))
+            )
+        try:
+            models = query.order_by(LoanModel.due_date, LoanModel.id).limit(limit).all()
+            return [LoanMapper.to_entity(m) for m in models]
+        except sa_exc.SQLAlchemyError as e:
+            raise RepositoryError('Failed to retrieve overdue loans', cause=e) from e
+
     def get_by_id(self, loan_id: str) -> Loan | None:
+        if (loan := identity_map.get(Loan, loan_id)) is not None:
+            return loan
         try:
             model = self.session.get(LoanModel, loan_id)
-            return LoanMapper.to_entity(model) if model else None
+            return identity_map.add(Loan, loan_id, LoanMapper.to_entity(model)) if model else None
         except sa_exc.SQLAlchemyError as e:
             raise RepositoryError('Failed to retrieve loan', cause=e) from e
 
+    def get_by_ids(self, loan_ids: t.Sequence[str]) -> dict[str, Loan]:
+        try:
+            return load_by_ids(self.session, LoanModel, Loan, LoanMapper.to_entity, loan_ids)
+        except sa_exc.SQLAlchemyError as e:
+            raise RepositoryError('Failed to retrieve loans', cause=e) from e
+
     def save(self, loan: Loan, copy: Copy) -> Loan:
+        identity_map.discard(Loan, loan.id)
+        identity_map.discard(Copy, copy.id)
         try:
             copy_model = t.cast(CopyModel, self.session.get(CopyModel, copy.id))
             copy_model.status = CopyStatus(copy.status)
@@ -52,9 +83,8 @@ class SQLAlchemyLoanRepository:
             model = LoanMapper.from_entity(loan)
             try:
                 self.session.add(model)
-                self.session.commit()
+                self.session.flush()
             except sa_exc.SQLAlchemyError as e:
-                self.session.rollback()
                 raise RepositoryError('Failed to save loan', cause=e) from e
             loan.id = str(model.id)
             return loan
@@ -63,18 +93,16 @@ class SQLAlchemyLoanRepository:
             model.staff_in_id = uuid.UUID(loan.staff_in_id)
         model.return_date = loan.return_date
         try:
-            self.session.commit()
+            self.session.flush()
         except sa_exc.SQLAlchemyError as e:
-            self.session.rollback()
             raise RepositoryError('Failed to update loan', cause=e) from e
         return loan
 
     def delete_by_id(self, loan_id: str) -> None:
+        identity_map.discard(Loan, loan_id)
         try:
             self.session.query(LoanModel).filter_by(id=loan_id).delete()
-            self.session.commit()
         except sa_exc.SQLAlchemyError as e:
-            self.session.rollback()
             raise RepositoryError('Failed to delete loan', cause=e) from e
 
 
@@ -82,9 +110,9 @@ class SQLAlchemyHoldRepository:
     def __init__(self, session: sa_orm.scoped_session[Session]) -> None:
         self.session = session
 
-    def find_all(self) -> list[Hold]:
+    def find_all(self, *, limit: int | None = None, after: str | None = None) -> list[Hold]:
         try:
-            models = self.session.query(HoldModel).all()
+            models = keyset(self.session.query(HoldModel), HoldModel.id, limit=limit, after=after).all()
             return [HoldMapper.to_entity(m) for m in models]
         except sa_exc.SQLAlchemyError as e:
             raise RepositoryError('Failed to retrieve holds', cause=e) from e
@@ -100,50 +128,125 @@ class SQLAlchemyHoldRepository:
         except sa_exc.SQLAlchemyError as e:
             raise RepositoryError('Failed to retrieve active holds for patron', cause=e) from e
 
+    def _queue(self, item_id: str) -> sa_orm.Query[HoldModel]:
+        # Pending holds of an item in FIFO order; ix_holds_item_id_queue serves both the filter and the ordering.
+        return (
+            self.session.query(HoldModel)
+            .filter(HoldModel.item_id == item_id, HoldModel.status == HoldStatus.PENDING)
+            .order_by(HoldModel.request_date, HoldModel.id)
+        )
+
     def find_active_holds_by_item(self, item_id: str) -> list[Hold]:
         try:
-            models = (
-                self.session.query(HoldModel)
-                .join(CopyModel, HoldModel.copy_id == CopyModel.id)
-                .filter(CopyModel.item_id == item_id, HoldModel.status == HoldStatus.PENDING)
-                .all()
-            )
+            models = self._queue(item_id).all()
             return [HoldMapper.to_entity(m) for m in models]
         except sa_exc.SQLAlchemyError as e:
             raise RepositoryError('Failed to retrieve active holds for item', cause=e) from e
 
+    def find_next_hold_for_item(self, item_id: str) -> Hold | None:
+        try:
+            model = self._queue(item_id).first()
+            return HoldMapper.to_entity(model) if model else None
+        except sa_exc.SQLAlchemyError as e:
+            raise RepositoryError('Failed to retrieve next hold for item', cause=e) from e
+
+    def count_holds_ahead(self, hold: Hold) -> int:
+        try:
+            return self.session.execute(
+                sa.select(sa.func.count()).where(
+                    HoldModel.item_id == hold.item_id,
+                    HoldModel.status == HoldStatus.PENDING,
+                    sa.tuple_(HoldModel.request_date, HoldModel.id)
+                    < sa.tuple_(sa.literal(hold.request_date, sa.Date), sa.literal(hold.id, HoldModel.id.type)),
+                )
+            ).scalar_one()
+        except sa_exc.SQLAlchemyError as e:
+            raise RepositoryError('Failed to count holds ahead in queue', cause=e) from e
+
+    def expire_pending_holds(self, today: datetime.date, *, limit: int) -> list[Hold]:
+        # One UPDATE ... RETURNING per batch; the bounded subquery walks ix_holds_expiry_date_pending and the outer
+        # predicate is re-checked so a hold picked up concurrently is left alone.
+        batch = (
+            sa.select(HoldModel.id)
+            .where(HoldModel.status == HoldStatus.PENDING, HoldModel.expiry_date < today)
+            .order_by(HoldModel.expiry_date, HoldModel.id)
+            .limit(limit)
+        )
+        try:
+            models = self.session.scalars(
+                sa.update(HoldModel)
+                .where(
+                    HoldModel.id.in_(batch.scalar_subquery()),
+                    HoldModel.status == HoldStatus.PENDING,
+                    HoldModel.expiry_date < today,
+                )
+                .values(status=HoldStatus.EXPIRED)
+                .returning(HoldModel)
+            ).all()
+            for model in models:
+                identity_map.discard(Hold, str(model.id))
+            return [HoldMapper.to_entity(m) for m in models]
+        except sa_exc.SQLAlchemyError as e:
+            raise RepositoryError('Failed to expire pending holds', cause=e) from e
+
     def get_by_id(self, hold_id: str) -> Hold | None:
+        if (hold := identity_map.get(Hold, hold_id)) is not None:
+            return hold
         try:
             model = self.session.get(HoldModel, hold_id)
-            return HoldMapper.to_entity(model) if model else None
+            return identity_map.add(Hold, hold_id, HoldMapper.to_entity(model)) if model else None
         except sa_exc.SQLAlchemyError as e:
             raise RepositoryError('Failed to retrieve hold', cause=e) from e
 
+    def get_by_ids(self, hold_ids: t.Sequence[str]) -> dict[str, Hold]:
+        try:
+            return load_by_ids(self.session, HoldModel, Hold, HoldMapper.to_entity, hold_ids)
+        except sa_exc.SQLAlchemyError as e:
+            raise RepositoryError('Failed to retrieve holds', cause=e) from e
+
     def save(self, hold: Hold) -> Hold:
+        identity_map.discard(Hold, hold.id)
         model = self.session.get(HoldModel, hold.id)
         if not model:
             model = HoldMapper.from_entity(hold)
             try:
                 self.session.add(model)
-                self.session.commit()
+                self.session.flush()
             except sa_exc.SQLAlchemyError as e:
-                self.session.rollback()
                 raise RepositoryError('Failed to save hold', cause=e) from e
             hold.id = str(model.id)
             return hold
         model.status = HoldStatus(hold.status)
         model.expiry_date = hold.expiry_date
         try:
-            self.session.commit()
+            self.session.flush()
         except sa_exc.SQLAlchemyError as e:
-            self.session.rollback()
             raise RepositoryError('Failed to update hold', cause=e) from e
         return hold
 
     def delete_by_id(self, hold_id: str) -> None:
+        identity_map.discard(Hold, hold_id)
         try:
             self.session.query(HoldModel).filter_by(id=hold_id).delete()
-            self.session.commit()
         except sa_exc.SQLAlchemyError as e:
-            self.session.rollback()
             raise RepositoryError('Failed to delete hold', cause=e) from e
+
+
+class SQLAlchemySweepCheckpointRepository:
+    def __init__(self, session: sa_orm.scoped_session[Session]) -> None:
+        self.session = session
+
+    def get_by_name(self, name: str) -> SweepCheckpoint | None:
+        try:
+            model = self.session.get(SweepCheckpointModel, name)
+            return SweepCheckpointMapper.to_entity(model) if model else None
+        except sa_exc.SQLAlchemyError as e:
+            raise RepositoryError('Failed to retrieve sweep checkpoint', cause=e) from e
+
+    def save(self, checkpoint: SweepCheckpoint) -> SweepCheckpoint:
+        try:
+            self.session.merge(SweepCheckpointMapper.from_entity(checkpoint))
+            self.session.flush()
+        except sa_exc.SQLAlchemyError as e:
+            raise RepositoryError('Failed to save sweep checkpoint', cause=e) from e
+        return checkpoint
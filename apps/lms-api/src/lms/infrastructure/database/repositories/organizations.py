@@ -1,13 +1,17 @@
 from __future__ import annotations
 
 import uuid
+import typing as t
 
 import sqlalchemy.exc as sa_exc
 import sqlalchemy.orm as sa_orm
 from flask_sqlalchemy.session import Session
 
-from lms.infrastructure.database import RepositoryError
+from lms.infrastructure.database import RepositoryError, identity_map
 from lms.domain.organizations.entities import Staff, Branch
+from lms.infrastructure.database.cache import CachedReads, ReferenceCache
+from lms.infrastructure.database.batching import load_by_ids
+from lms.infrastructure.database.pagination import keyset
 from lms.infrastructure.database.models.organizations import StaffRole, StaffModel, BranchModel, BranchStatus
 from lms.infrastructure.database.mappers.organizations import StaffMapper, BranchMapper
 
@@ -16,20 +20,28 @@ class SQLAlchemyBranchRepository:
     def __init__(self, session: sa_orm.scoped_session[Session]) -> None:
         self.session = session
 
-    def find_all(self) -> list[Branch]:
+    def find_all(self, *, limit: int | None = None, after: str | None = None) -> list[Branch]:
         try:
-            models = self.session.query(BranchModel).all()
+            models = keyset(self.session.query(BranchModel), BranchModel.id, limit=limit, after=after).all()
             return [BranchMapper.to_entity(m) for m in models]
         except sa_exc.SQLAlchemyError as e:
             raise RepositoryError('Failed to retrieve branches', cause=e) from e
 
     def get_by_id(self, branch_id: str) -> Branch | None:
+        if (branch := identity_map.get(Branch, branch_id)) is not None:
+            return branch
         try:
             model = self.session.get(BranchModel, branch_id)
-            return BranchMapper.to_entity(model) if model else None
+            return identity_map.add(Branch, branch_id, BranchMapper.to_entity(model)) if model else None
         except sa_exc.SQLAlchemyError as e:
             raise RepositoryError('Failed to retrieve branch', cause=e) from e
 
+    def get_by_ids(self, branch_ids: t.Sequence[str]) -> dict[str, Branch]:
+        try:
+            return load_by_ids(self.session, BranchModel, Branch, BranchMapper.to_entity, branch_ids)
+        except sa_exc.SQLAlchemyError as e:
+            raise RepositoryError('Failed to retrieve branches', cause=e) from e
+
     def exists_by_name(self, name: str) -> bool:
         try:
             q = self.session.query(BranchModel).filter_by(name=name)
@@ -39,14 +51,14 @@ class SQLAlchemyBranchRepository:
             raise RepositoryError('Failed to check branch existence by name', cause=e) from e
 
     def save(self, branch: Branch) -> Branch:
+        identity_map.discard(Branch, branch.id)
         model = self.session.get(BranchModel, branch.id) if branch.id else None
         if not model:
             model = BranchMapper.from_entity(branch)
             try:
                 self.session.add(model)
-                self.session.commit()
+                self.session.flush()
             except sa_exc.SQLAlchemyError as e:
-                self.session.rollback()
                 raise RepositoryError('Failed to save branch', cause=e) from e
             branch.id = str(model.id)
             return branch
@@ -57,18 +69,16 @@ class SQLAlchemyBranchRepository:
         model.manager_id = uuid.UUID(branch.manager_id) if branch.manager_id else None
         model.status = BranchStatus(branch.status)
         try:
-            self.session.commit()
+            self.session.flush()
         except sa_exc.SQLAlchemyError as e:
-            self.session.rollback()
             raise RepositoryError('Failed to update branch', cause=e) from e
         return branch
 
     def delete_by_id(self, branch_id: str) -> None:
+        identity_map.discard(Branch, branch_id)
         try:
             self.session.query(BranchModel).filter_by(id=branch_id).delete()
-            self.session.commit()
         except sa_exc.SQLAlchemyError as e:
-            self.session.rollback()
             raise RepositoryError('Failed to delete branch', cause=e) from e
 
 
@@ -76,20 +86,28 @@ class SQLAlchemyStaffRepository:
     def __init__(self, session: sa_orm.scoped_session[Session]) -> None:
         self.session = session
 
-    def find_all(self) -> list[Staff]:
+    def find_all(self, *, limit: int | None = None, after: str | None = None) -> list[Staff]:
         try:
-            models = self.session.query(StaffModel).all()
+            models = keyset(self.session.query(StaffModel), StaffModel.id, limit=limit, after=after).all()
             return [StaffMapper.to_entity(m) for m in models]
         except sa_exc.SQLAlchemyError as e:
             raise RepositoryError('Failed to retrieve staff members', cause=e) from e
 
     def get_by_id(self, staff_id: str) -> Staff | None:
+        if (staff := identity_map.get(Staff, staff_id)) is not None:
+            return staff
         try:
             model = self.session.get(StaffModel, staff_id)
-            return StaffMapper.to_entity(model) if model else None
+            return identity_map.add(Staff, staff_id, StaffMapper.to_entity(model)) if model else None
         except sa_exc.SQLAlchemyError as e:
             raise RepositoryError('Failed to retrieve staff member', cause=e) from e
 
+    def get_by_ids(self, staff_ids: t.Sequence[str]) -> dict[str, Staff]:
+        try:
+            return load_by_ids(self.session, StaffModel, Staff, StaffMapper.to_entity, staff_ids)
+        except sa_exc.SQLAlchemyError as e:
+            raise RepositoryError('Failed to retrieve staff members', cause=e) from e
+
     def exists_by_email(self, email: str) -> bool:
         try:
             q = self.session.query(StaffModel).filter_by(email=email)
@@ -99,14 +117,14 @@ class SQLAlchemyStaffRepository:
             raise RepositoryError('Failed to check staff existence by email', cause=e) from e
 
     def save(self, staff: Staff) -> Staff:
+        identity_map.discard(Staff, staff.id)
         model = self.session.get(StaffModel, staff.id) if staff.id else None
         if not model:
             model = StaffMapper.from_entity(staff)
             try:
                 self.session.add(model)
-                self.session.commit()
+                self.session.flush()
             except sa_exc.SQLAlchemyError as e:
-                self.session.rollback()
                 raise RepositoryError('Failed to save staff member', cause=e) from e
             staff.id = str(model.id)
             return staff
@@ -115,16 +133,64 @@ class SQLAlchemyStaffRepository:
         model.role = StaffRole(staff.role)
         model.branch_id = uuid.UUID(staff.branch_id) if staff.branch_id else None
         try:
-            self.session.commit()
+            self.session.flush()
         except sa_exc.SQLAlchemyError as e:
-            self.session.rollback()
             raise RepositoryError('Failed to update staff member', cause=e) from e
         return staff
 
     def delete_by_id(self, staff_id: str) -> None:
+        identity_map.discard(Staff, staff_id)
         try:
             self.session.query(StaffModel).filter_by(id=staff_id).delete()
-            self.session.commit()
         except sa_exc.SQLAlchemyError as e:
-            self.session.rollback()
             raise RepositoryError('Failed to delete staff member', cause=e) from e
+
+
+class CachedBranchRepository(CachedReads, SQLAlchemyBranchRepository):
+    kind = 'branch'
+
+    def __init__(self, session: sa_orm.scoped_session[Session], cache: ReferenceCache) -> None:
+        super().__init__(session)
+        self.cache = cache
+
+    def get_by_id(self, branch_id: str) -> Branch | None:
+        return self._cached(Branch, branch_id, super().get_by_id)
+
+    def get_by_ids(self, branch_ids: t.Sequence[str]) -> dict[str, Branch]:
+        return self._cached_many(Branch, branch_ids, super().get_by_ids)
+
+    def save(self, branch: Branch) -> Branch:
+        self._written(branch.id)
+        return super().save(branch)
+
+    def delete_by_id(self, branch_id: str) -> None:
+        self._written(branch_id)
+        super().delete_by_id(branch_id)
+
+    def preload(self, limit: int) -> int:
+        return self._preload(super().find_all(limit=limit))
+
+
+class CachedStaffRepository(CachedReads, SQLAlchemyStaffRepository):
+    kind = 'staff'
+
+    def __init__(self, session: sa_orm.scoped_session[Session], cache: ReferenceCache) -> None:
+        super().__init__(session)
+        self.cache = cache
+
+    def get_by_id(self, staff_id: str) -> Staff | None:
+        return self._cached(Staff, staff_id, super().get_by_id)
+
+    def get_by_ids(self, staff_ids: t.Sequence[str]) -> dict[str, Staff]:
+        return self._cached_many(Staff, staff_ids, super().get_by_ids)
+
+    def save(self, staff: Staff) -> Staff:
+        self._written(staff.id)
+        return super().save(staff)
+
+    def delete_by_id(self, staff_id: str) -> None:
+        self._written(staff_id)
+        super().delete_by_id(staff_id)
+
+    def preload(self, limit: int) -> int:
+        return self._preload(super().find_all(limit=limit))
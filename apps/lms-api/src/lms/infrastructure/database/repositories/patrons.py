@@ -1,33 +1,48 @@
 from __future__ import annotations
 
+import typing as t
+from decimal import Decimal
+
+import sqlalchemy as sa
 import sqlalchemy.exc as sa_exc
 import sqlalchemy.orm as sa_orm
 from flask_sqlalchemy.session import Session
 
-from lms.domain.patrons.entities import Fine, Patron
-from lms.infrastructure.database import RepositoryError
+from lms.domain.patrons.entities import Fine, Patron, PatronEligibility
+from lms.infrastructure.database import RepositoryError, identity_map
+from lms.infrastructure.database.batching import load_by_ids
+from lms.infrastructure.database.pagination import keyset
 from lms.infrastructure.database.models.patrons import FineModel, FineStatus, PatronModel, PatronStatus
 from lms.infrastructure.database.mappers.patrons import FineMapper, PatronMapper
+from lms.infrastructure.database.models.circulations import HoldModel, LoanModel, HoldStatus
 
 
 class SQLAlchemyPatronRepository:
     def __init__(self, session: sa_orm.scoped_session[Session]) -> None:
         self.session = session
 
-    def find_all(self) -> list[Patron]:
+    def find_all(self, *, limit: int | None = None, after: str | None = None) -> list[Patron]:
         try:
-            models = self.session.query(PatronModel).all()
+            models = keyset(self.session.query(PatronModel), PatronModel.id, limit=limit, after=after).all()
             return [PatronMapper.to_entity(m) for m in models]
         except sa_exc.SQLAlchemyError as e:
             raise RepositoryError('Failed to retrieve patrons', cause=e) from e
 
     def get_by_id(self, patron_id: str) -> Patron | None:
+        if (patron := identity_map.get(Patron, patron_id)) is not None:
+            return patron
         try:
             model = self.session.get(PatronModel, patron_id)
-            return PatronMapper.to_entity(model) if model else None
+            return identity_map.add(Patron, patron_id, PatronMapper.to_entity(model)) if model else None
         except sa_exc.SQLAlchemyError as e:
             raise RepositoryError('Failed to retrieve patron', cause=e) from e
 
+    def get_by_ids(self, patron_ids: t.Sequence[str]) -> dict[str, Patron]:
+        try:
+            return load_by_ids(self.session, PatronModel, Patron, PatronMapper.to_entity, patron_ids)
+        except sa_exc.SQLAlchemyError as e:
+            raise RepositoryError('Failed to retrieve patrons', cause=e) from e
+
     def exists_by_email(self, email: str) -> bool:
         try:
             q = self.session.query(PatronModel).filter_by(email=email)
@@ -36,15 +51,45 @@ class SQLAlchemyPatronRepository:
         except sa_exc.SQLAlchemyError as e:
             raise RepositoryError('Failed to check patron existence by email', cause=e) from e
 
+    def get_eligibility(self, patron_id: str, *, copy_id: str | None = None) -> PatronEligibility | None:
+        # Correlated aggregates keep this a single round trip regardless of the patron's history.
+        active_loans = sa.and_(LoanModel.patron_id == PatronModel.id, LoanModel.return_date.is_(None))
+        columns = [
+            PatronModel.status,
+            sa.select(sa.func.count(LoanModel.id)).where(active_loans).scalar_subquery(),
+            sa.select(sa.func.count(HoldModel.id))
+            .where(HoldModel.patron_id == PatronModel.id, HoldModel.status == HoldStatus.PENDING)
+            .scalar_subquery(),
+            sa.select(sa.func.coalesce(sa.func.sum(FineModel.amount), 0))
+            .where(FineModel.patron_id == PatronModel.id, FineModel.status.in_((FineStatus.CREATED, FineStatus.UNPAID)))
+            .scalar_subquery(),
+        ]
+        if copy_id is not None:
+            columns.append(sa.exists().where(active_loans, LoanModel.copy_id == copy_id))
+        try:
+            row = self.session.execute(sa.select(*columns).where(PatronModel.id == patron_id)).first()
+        except sa_exc.SQLAlchemyError as e:
+            raise RepositoryError('Failed to retrieve patron eligibility', cause=e) from e
+        if row is None:
+            return None
+        return PatronEligibility(
+            patron_id=patron_id,
+            status=PatronStatus(row[0]).value,
+            active_loans=row[1],
+            pending_holds=row[2],
+            outstanding_fines=Decimal(row[3]),
+            has_copy_on_loan=bool(row[4]) if copy_id is not None else False,
+        )
+
     def save(self, patron: Patron) -> Patron:
+        identity_map.discard(Patron, patron.id)
         model = self.session.get(PatronModel, patron.id)
         if not model:
             model = PatronMapper.from_entity(patron)
             try:
                 self.session.add(model)
-                self.session.commit()
+                self.session.flush()
             except sa_exc.SQLAlchemyError as e:
-                self.session.rollback()
                 raise RepositoryError('Failed to save patron', cause=e) from e
             patron.id = str(model.id)
             return patron
@@ -52,18 +97,16 @@ class SQLAlchemyPatronRepository:
         model.email = patron.email
         model.status = PatronStatus(patron.status)
         try:
-            self.session.commit()
+            self.session.flush()
         except sa_exc.SQLAlchemyError as e:
-            self.session.rollback()
             raise RepositoryError('Failed to update patron', cause=e) from e
         return patron
 
     def delete_by_id(self, patron_id: str) -> None:
+        identity_map.discard(Patron, patron_id)
         try:
             self.session.query(PatronModel).filter_by(id=patron_id).delete()
-            self.session.commit()
         except sa_exc.SQLAlchemyError as e:
-            self.session.rollback()
             raise RepositoryError('Failed to delete patron', cause=e) from e
 
 
@@ -71,45 +114,59 @@ class SQLAlchemyFineRepository:
     def __init__(self, session: sa_orm.scoped_session[Session]) -> None:
         self.session = session
 
-    def find_all(self) -> list[Fine]:
+    def find_all(self, *, limit: int | None = None, after: str | None = None) -> list[Fine]:
         try:
-            models = self.session.query(FineModel).all()
+            models = keyset(self.session.query(FineModel), FineModel.id, limit=limit, after=after).all()
             return [FineMapper.to_entity(m) for m in models]
         except sa_exc.SQLAlchemyError as e:
             raise RepositoryError('Failed to retrieve fines', cause=e) from e
 
     def get_by_id(self, fine_id: str) -> Fine | None:
+        if (fine := identity_map.get(Fine, fine_id)) is not None:
+            return fine
         try:
             model = self.session.get(FineModel, fine_id)
-            return FineMapper.to_entity(model) if model else None
+            return identity_map.add(Fine, fine_id, FineMapper.to_entity(model)) if model else None
         except sa_exc.SQLAlchemyError as e:
             raise RepositoryError('Failed to retrieve fine', cause=e) from e
 
+    def get_by_ids(self, fine_ids: t.Sequence[str]) -> dict[str, Fine]:
+        try:
+            return load_by_ids(self.session, FineModel, Fine, FineMapper.to_entity, fine_ids)
+        except sa_exc.SQLAlchemyError as e:
+            raise RepositoryError('Failed to retrieve fines', cause=e) from e
+
+    def find_by_loan_id(self, loan_id: str) -> Fine | None:
+        try:
+            model = self.session.query(FineModel).filter(FineModel.loan_id == loan_id).order_by(FineModel.id).first()
+            return FineMapper.to_entity(model) if model else None
+        except sa_exc.SQLAlchemyError as e:
+            raise RepositoryError('Failed to retrieve fine for loan', cause=e) from e
+
     def save(self, fine: Fine) -> Fine:
+        identity_map.discard(Fine, fine.id)
         model = self.session.get(FineModel, fine.id)
         if not model:
             model = FineMapper.from_entity(fine)
             try:
                 self.session.add(model)
-                self.session.commit()
+                self.session.flush()
             except sa_exc.SQLAlchemyError as e:
-                self.session.rollback()
                 raise RepositoryError('Failed to save fine', cause=e) from e
             fine.id = str(model.id)
             return fine
+        model.amount = fine.amount
         model.paid_date = fine.paid_date
         model.status = FineStatus(fine.status)
         try:
-            self.session.commit()
+            self.session.flush()
         except sa_exc.SQLAlchemyError as e:
-            self.session.rollback()
             raise RepositoryError('Failed to update fine', cause=e) from e
         return fine
 
     def delete_by_id(self, fine_id: str) -> None:
+        identity_map.discard(Fine, fine_id)
         try:
             self.session.query(FineModel).filter_by(id=fine_id).delete()
-            self.session.commit()
         except sa_exc.SQLAlchemyError as e:
-            self.session.rollback()
             raise RepositoryError('Failed to delete fine', cause=e) from e
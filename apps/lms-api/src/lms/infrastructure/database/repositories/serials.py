@@ -1,11 +1,15 @@
 from __future__ import annotations
 
+import typing as t
+
 import sqlalchemy.exc as sa_exc
 import sqlalchemy.orm as sa_orm
 from flask_sqlalchemy.session import Session
 
 from lms.domain.serials.entities import Serial, SerialIssue
-from lms.infrastructure.database import RepositoryError
+from lms.infrastructure.database import RepositoryError, identity_map
+from lms.infrastructure.database.batching import load_by_ids
+from lms.infrastructure.database.pagination import keyset
 from lms.infrastructure.database.models.serials import (
     SerialModel,
     SerialStatus,
@@ -20,29 +24,37 @@ class SQLAlchemySerialRepository:
     def __init__(self, session: sa_orm.scoped_session[Session]) -> None:
         self.session = session
 
-    def find_all(self) -> list[Serial]:
+    def find_all(self, *, limit: int | None = None, after: str | None = None) -> list[Serial]:
         try:
-            models = self.session.query(SerialModel).all()
+            models = keyset(self.session.query(SerialModel), SerialModel.id, limit=limit, after=after).all()
             return [SerialMapper.to_entity(m) for m in models]
         except sa_exc.SQLAlchemyError as e:
             raise RepositoryError('Failed to retrieve serials', cause=e) from e
 
     def get_by_id(self, serial_id: str) -> Serial | None:
+        if (serial := identity_map.get(Serial, serial_id)) is not None:
+            return serial
         try:
             model = self.session.get(SerialModel, serial_id)
-            return SerialMapper.to_entity(model) if model else None
+            return identity_map.add(Serial, serial_id, SerialMapper.to_entity(model)) if model else None
         except sa_exc.SQLAlchemyError as e:
             raise RepositoryError('Failed to retrieve serial', cause=e) from e
 
+    def get_by_ids(self, serial_ids: t.Sequence[str]) -> dict[str, Serial]:
+        try:
+            return load_by_ids(self.session, SerialModel, Serial, SerialMapper.to_entity, serial_ids)
+        except sa_exc.SQLAlchemyError as e:
+            raise RepositoryError('Failed to retrieve serials', cause=e) from e
+
     def save(self, serial: Serial) -> Serial:
+        identity_map.discard(Serial, serial.id)
         model = self.session.get(SerialModel, serial.id)
         if not model:
             model = SerialMapper.from_entity(serial)
             try:
                 self.session.add(model)
-                self.session.commit()
+                self.session.flush()
             except sa_exc.SQLAlchemyError as e:
-                self.session.rollback()
                 raise RepositoryError('Failed to save serial', cause=e) from e
             serial.id = str(model.id)
             return serial
@@ -52,18 +64,16 @@ class SQLAlchemySerialRepository:
         model.description = serial.description
         model.status = SerialStatus(serial.status)
         try:
-            self.session.commit()
+            self.session.flush()
         except sa_exc.SQLAlchemyError as e:
-            self.session.rollback()
             raise RepositoryError('Failed to save serial', cause=e) from e
         return serial
 
     def delete_by_id(self, serial_id: str) -> None:
+        identity_map.discard(Serial, serial_id)
         try:
             self.session.query(SerialModel).filter_by(id=serial_id).delete()
-            self.session.commit()
         except sa_exc.SQLAlchemyError as e:
-            self.session.rollback()
             raise RepositoryError('Failed to delete serial', cause=e) from e
 
 
@@ -71,29 +81,37 @@ class SQLAlchemySerialIssueRepository:
     def __init__(self, session: sa_orm.scoped_session[Session]) -> None:
         self.session = session
 
-    def find_all(self) -> list[SerialIssue]:
+    def find_all(self, *, limit: int | None = None, after: str | None = None) -> list[SerialIssue]:
         try:
-            models = self.session.query(SerialIssueModel).all()
+            models = keyset(self.session.query(SerialIssueModel), SerialIssueModel.id, limit=limit, after=after).all()
             return [SerialIssueMapper.to_entity(m) for m in models]
         except sa_exc.SQLAlchemyError as e:
             raise RepositoryError('Failed to retrieve serial issues', cause=e) from e
 
     def get_by_id(self, issue_id: str) -> SerialIssue | None:
+        if (issue := identity_map.get(SerialIssue, issue_id)) is not None:
+            return issue
         try:
             model = self.session.get(SerialIssueModel, issue_id)
-            return SerialIssueMapper.to_entity(model) if model else None
+            return identity_map.add(SerialIssue, issue_id, SerialIssueMapper.to_entity(model)) if model else None
         except sa_exc.SQLAlchemyError as e:
             raise RepositoryError('Failed to retrieve serial issue', cause=e) from e
 
+    def get_by_ids(self, issue_ids: t.Sequence[str]) -> dict[str, SerialIssue]:
+        try:
+            return load_by_ids(self.session, SerialIssueModel, SerialIssue, SerialIssueMapper.to_entity, issue_ids)
+        except sa_exc.SQLAlchemyError as e:
+            raise RepositoryError('Failed to retrieve serial issues', cause=e) from e
+
     def save(self, issue: SerialIssue) -> SerialIssue:
+        identity_map.discard(SerialIssue, issue.id)
         model = self.session.get(SerialIssueModel, issue.id)
         if not model:
             model = SerialIssueMapper.from_entity(issue)
             try:
                 self.session.add(model)
-                self.session.commit()
+                self.session.flush()
             except sa_exc.SQLAlchemyError as e:
-                self.session.rollback()
                 raise RepositoryError('Failed to save serial issue', cause=e) from e
             issue.id = str(model.id)
             return issue
@@ -101,16 +119,14 @@ class SQLAlchemySerialIssueRepository:
         model.date_received = issue.date_received
         model.status = SerialIssueStatus(issue.status)
         try:
-            self.session.commit()
+            self.session.flush()
         except sa_exc.SQLAlchemyError as e:
-            self.session.rollback()
             raise RepositoryError('Failed to update serial issue', cause=e) from e
         return issue
 
     def delete_by_id(self, issue_id: str) -> None:
+        identity_map.discard(SerialIssue, issue_id)
         try:
             self.session.query(SerialIssueModel).filter_by(id=issue_id).delete()
-            self.session.commit()
         except sa_exc.SQLAlchemyError as e:
-            self.session.rollback()
             raise RepositoryError('Failed to delete serial issue', cause=e) from e
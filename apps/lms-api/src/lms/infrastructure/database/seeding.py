@@ -0,0 +1,423 @@
+from __future__ import annotations
+
+import uuid
+import random
+import typing as t
+from decimal import Decimal
+import datetime
+import itertools
+from contextlib import contextmanager
+from dataclasses import field, dataclass
+
+import sqlalchemy as sa
+import sqlalchemy.orm as sa_orm
+from flask_sqlalchemy.session import Session
+
+from lms.infrastructure.logging import get_logger
+from lms.infrastructure.database.models.patrons import FineModel, FineStatus, PatronModel, PatronStatus
+from lms.infrastructure.database.models.catalogs import (
+    CopyModel,
+    ItemModel,
+    CopyStatus,
+    ItemFormat,
+    AuthorModel,
+    CategoryModel,
+    PublisherModel,
+    item_author_association,
+)
+from lms.infrastructure.database.models.acquisitions import (
+    OrderStatus,
+    VendorModel,
+    OrderLineStatus,
+    AcquisitionOrderModel,
+    AcquisitionOrderLineModel,
+)
+from lms.infrastructure.database.models.circulations import HoldModel, LoanModel, HoldStatus
+from lms.infrastructure.database.models.organizations import StaffRole, StaffModel, BranchModel, BranchStatus
+
+logger = get_logger(__name__)
+
+INSERT_CHUNK_SIZE = 10_000
+LOAN_DAYS = 14
+HOLD_DAYS = 7
+DAILY_FINE = Decimal('0.25')
+EPOCH = datetime.date(1970, 1, 1)
+CATEGORIES = (
+    'Fiction',
+    'Mystery',
+    'Science Fiction',
+    'Fantasy',
+    'Romance',
+    'Biography',
+    'History',
+    'Science',
+    'Technology',
+    'Travel',
+    'Cooking',
+    'Art',
+    'Poetry',
+    'Children',
+    'Young Adult',
+    'Reference',
+)
+FORMATS = ((ItemFormat.BOOK, 0.8), (ItemFormat.EBOOK, 0.1), (ItemFormat.DVD, 0.05), (ItemFormat.CD, 0.05))
+
+
+@dataclass(frozen=True)
+class SeedOptions:
+    branches: int = 10
+    items: int = 10_000
+    copies_per_item: int = 3
+    patrons: int = 5_000
+    loan_history_years: int = 1
+    staff_per_branch: int = 5
+    # Yearly checkouts of an average patron; the most active patrons borrow far more than that.
+    loans_per_patron_year: float = 4.0
+    # Share of patrons with a copy out today; the domain allows one active loan per patron.
+    active_loan_rate: float = 0.3
+    # Share of loans returned, or still out, past their due date.
+    overdue_rate: float = 0.08
+    # Share of patrons waiting on a hold.
+    hold_rate: float = 0.05
+    # Exponent of the Zipf law item popularity follows; higher values concentrate demand on fewer titles.
+    zipf_exponent: float = 1.0
+    seed: int = 0
+    as_of: datetime.date = field(default_factory=datetime.date.today)
+
+
+@dataclass
+class _Zipf:
+    """Draws from ``population`` with the rank-``r`` element weighted ``1 / r ** exponent``; ranks are shuffled."""
+
+    population: list[t.Any]
+    cum_weights: list[float]
+
+    @classmethod
+    def over(cls, population: t.Sequence[t.Any], exponent: float, rng: random.Random) -> _Zipf:
+        ranked = list(population)
+        rng.shuffle(ranked)
+        return cls(ranked, list(itertools.accumulate(1 / rank**exponent for rank in range(1, len(ranked) + 1))))
+
+    def draw(self, rng: random.Random, k: int = 1) -> list[t.Any]:
+        return rng.choices(self.population, cum_weights=self.cum_weights, k=k)
+
+
+class DatasetGenerator:
+    """Fills an empty database with a synthetic library through bulk inserts.
+
+    The same options and seed always produce the same rows, ids included: ids follow the UUIDv7 layout with the
+    timestamp taken from the date the row stands for and the random bits from the seeded generator.
+    """
+
+    def __init__(self, session: sa_orm.scoped_session[Session], options: SeedOptions) -> None:
+        self.session = session
+        self.options = options
+        self.rng = random.Random(options.seed)
+        self.today = options.as_of
+        self.counts: dict[str, int] = {}
+
+    def generate(self) -> dict[str, int]:
+        with self._fast_inserts():
+            self._organizations()
+            self._catalog()
+            self._patrons()
+            self._loans()
+            self._holds()
+            self._acquisitions()
+            self.session.commit()
+        return self.counts
+
+    @contextmanager
+    def _fast_inserts(self) -> t.Iterator[None]:
+        if self.session.get_bind().dialect.name != 'sqlite':
+            yield
+            return
+        # An interrupted run is redone from the seed, so there is nothing worth syncing to disk row by row.
+        self.session.execute(sa.text('PRAGMA synchronous = OFF'))
+        try:
+            yield
+        finally:
+            self.session.execute(sa.text('PRAGMA synchronous = FULL'))
+
+    def _id(self, day: datetime.date) -> uuid.UUID:
+        # One draw feeds the time of day (26 bits of milliseconds, about 18 hours) and the 74 random bits.
+        bits = self.rng.getrandbits(100)
+        ms = (day - EPOCH).days * 86_400_000 + (bits >> 74)
+        return uuid.UUID(int=ms << 80 | 0x7 << 76 | (bits >> 62 & 0xFFF) << 64 | 0b10 << 62 | bits & (1 << 62) - 1)
+
+    def _days_ago(self, low: int, high: int) -> datetime.date:
+        return self.today - datetime.timedelta(days=low + int(self.rng.random() * (high - low + 1)))
+
+    def _insert(self, model: type[t.Any] | sa.Table, rows: t.Iterable[dict[str, t.Any]]) -> None:
+        # Core inserts go straight to executemany; ORM bulk inserts split the rows into batches by their None values.
+        table: sa.Table = model if isinstance(model, sa.Table) else model.__table__
+        rows = iter(rows)
+        while chunk := list(itertools.islice(rows, INSERT_CHUNK_SIZE)):
+            self.session.execute(table.insert(), chunk)
+            self.counts[table.name] = self.counts.get(table.name, 0) + len(chunk)
+        logger.info('Seeded %d %s', self.counts.get(table.name, 0), table.name)
+
+    def _organizations(self) -> None:
+        opened = self.today - datetime.timedelta(days=365 * (self.options.loan_history_years + 5))
+        self.branch_ids = [self._id(opened) for _ in range(self.options.branches)]
+        self._insert(
+            BranchModel,
+            (
+                {
+                    'id': branch_id,
+                    'name': f'Branch {n + 1}',
+                    'address': f'{n + 1} Library Street',
+                    'email': f'branch{n + 1}@library.test',
+                    'status': BranchStatus.ACTIVE,
+                }
+                for n, branch_id in enumerate(self.branch_ids)
+            ),
+        )
+        # A central library and a tail of neighbourhood branches: patrons and copies concentrate on the first ranks.
+        self.branches = _Zipf.over(self.branch_ids, 1.0, self.rng)
+        self.staff: dict[uuid.UUID, list[uuid.UUID]] = {}
+        staff_rows: list[dict[str, t.Any]] = []
+        for branch_id in self.branch_ids:
+            for n in range(self.options.staff_per_branch):
+                staff_id = self._id(opened)
+                self.staff.setdefault(branch_id, []).append(staff_id)
+                staff_rows.append(
+                    {
+                        'id': staff_id,
+                        'name': f'Staff {len(staff_rows) + 1}',
+                        'email': f'staff{len(staff_rows) + 1}@library.test',
+                        'role': StaffRole.MANAGER if n == 0 else StaffRole.LIBRARIAN,
+                        'branch_id': branch_id,
+                        'hire_date': opened,
+                    }
+                )
+        self._insert(StaffModel, staff_rows)
+        self.session.execute(
+            sa.update(BranchModel),
+            [{'id': branch_id, 'manager_id': staff[0]} for branch_id, staff in self.staff.items()],
+        )
+
+    def _catalog(self) -> None:
+        options = self.options
+        since = self.today - datetime.timedelta(days=365 * (options.loan_history_years + 5))
+        publisher_ids = [self._id(since) for _ in range(max(options.items // 1_000, 10))]
+        self._insert(PublisherModel, ({'id': p, 'name': f'Publisher {n + 1}'} for n, p in enumerate(publisher_ids)))
+        category_ids = [self._id(since) for _ in CATEGORIES]
+        self._insert(CategoryModel, ({'id': c, 'name': name} for c, name in zip(category_ids, CATEGORIES, strict=True)))
+        author_ids = [self._id(since) for _ in range(max(options.items // 5, 1))]
+        self._insert(AuthorModel, ({'id': a, 'name': f'Author {n + 1}'} for n, a in enumerate(author_ids)))
+        publishers = _Zipf.over(publisher_ids, 1.0, self.rng)
+        authors = _Zipf.over(author_ids, 0.8, self.rng)
+        formats = [item_format for item_format, _ in FORMATS]
+        weights = [weight for _, weight in FORMATS]
+
+        self.item_ids = [self._id(since) for _ in range(options.items)]
+        self._insert(
+            ItemModel,
+            (
+                {
+                    'id': item_id,
+                    'title': f'Title {n + 1}',
+                    'isbn': f'978{n:010d}',
+                    'publisher_id': publishers.draw(self.rng)[0],
+                    'category_id': self.rng.choice(category_ids),
+                    'publication_year': self.today.year - min(int(self.rng.expovariate(1 / 12)), 150),
+                    'format': self.rng.choices(formats, weights)[0],
+                }
+                for n, item_id in enumerate(self.item_ids)
+            ),
+        )
+        self._insert(
+            item_author_association,
+            ({'item_id': item_id, 'author_id': authors.draw(self.rng)[0]} for item_id in self.item_ids),
+        )
+        self.items = _Zipf.over(range(options.items), options.zipf_exponent, self.rng)
+
+        # Copies of item ``i`` are ``i * copies_per_item`` up to the next item's first copy.
+        self.copy_acquired = [self._days_ago(0, 365 * 5) for _ in range(options.items * options.copies_per_item)]
+        self.copy_ids = [self._id(acquired) for acquired in self.copy_acquired]
+        self.copy_branch = self.branches.draw(self.rng, k=len(self.copy_ids))
+        self.checked_out: set[int] = set()
+
+    def _copies(self) -> None:
+        self._insert(
+            CopyModel,
+            (
+                {
+                    'id': copy_id,
+                    'item_id': self.item_ids[n // self.options.copies_per_item],
+                    'branch_id': self.copy_branch[n],
+                    'barcode': f'C{n:012d}',
+                    'status': CopyStatus.CHECKED_OUT if n in self.checked_out else CopyStatus.AVAILABLE,
+                    'acquisition_date': self.copy_acquired[n],
+                }
+                for n, copy_id in enumerate(self.copy_ids)
+            ),
+        )
+
+    def _patrons(self) -> None:
+        since = self.today - datetime.timedelta(days=365 * (self.options.loan_history_years + 5))
+        self.patron_ids = [self._id(since) for _ in range(self.options.patrons)]
+        statuses = (PatronStatus.ACTIVE, PatronStatus.REGISTERED, PatronStatus.SUSPENDED, PatronStatus.ARCHIVED)
+        self.patron_status = self.rng.choices(statuses, (0.9, 0.03, 0.02, 0.05), k=len(self.patron_ids))
+        self._insert(
+            PatronModel,
+            (
+                {
+                    'id': patron_id,
+                    'name': f'Patron {n + 1}',
+                    'email': f'patron{n + 1}@library.test',
+                    'branch_id': self.branches.draw(self.rng)[0],
+                    'member_since': self._days_ago(0, 365 * (self.options.loan_history_years + 5)),
+                    'status': self.patron_status[n],
+                }
+                for n, patron_id in enumerate(self.patron_ids)
+            ),
+        )
+        # A few avid readers account for a large share of the checkouts.
+        self.readers = _Zipf.over(range(len(self.patron_ids)), 0.6, self.rng)
+
+    def _copy_of(self, item: int) -> int:
+        return item * self.options.copies_per_item + self.rng.randrange(self.options.copies_per_item)
+
+    def _loan(
+        self, copy: int, patron: int, loan_date: datetime.date, return_date: datetime.date | None
+    ) -> dict[str, t.Any]:
+        branch_id = self.copy_branch[copy]
+        staff = self.staff[branch_id]
+        return {
+            'id': self._id(loan_date),
+            'copy_id': self.copy_ids[copy],
+            'patron_id': self.patron_ids[patron],
+            'branch_id': branch_id,
+            'staff_out_id': self.rng.choice(staff),
+            'staff_in_id': self.rng.choice(staff) if return_date else None,
+            'loan_date': loan_date,
+            'due_date': loan_date + datetime.timedelta(days=LOAN_DAYS),
+            'return_date': return_date,
+        }
+
+    def _loans(self) -> None:
+        options = self.options
+        self.borrowing: set[int] = set()
+        active_patrons = [n for n, status in enumerate(self.patron_status) if status is PatronStatus.ACTIVE]
+        active = []
+        for patron in self.rng.sample(active_patrons, int(len(active_patrons) * options.active_loan_rate)):
+            # Popular items are the likeliest to be out; fall back to any copy once their copies are all taken.
+            for item in [*self.items.draw(self.rng, k=3), self.rng.randrange(options.items)]:
+                copy = self._copy_of(item)
+                if copy not in self.checked_out:
+                    break
+            else:
+                continue
+            overdue = self.rng.random() < options.overdue_rate
+            loan_date = self._days_ago(LOAN_DAYS + 1, LOAN_DAYS + 60) if overdue else self._days_ago(0, LOAN_DAYS)
+            active.append(self._loan(copy, patron, loan_date, None))
+            self.checked_out.add(copy)
+            self.borrowing.add(patron)
+        self._copies()
+        self._insert(LoanModel, active)
+
+        fines: list[dict[str, t.Any]] = []
+        total = int(options.patrons * options.loans_per_patron_year * options.loan_history_years)
+        days = 365 * options.loan_history_years
+
+        def history() -> t.Iterator[dict[str, t.Any]]:
+            for start in range(0, total, INSERT_CHUNK_SIZE):
+                count = min(INSERT_CHUNK_SIZE, total - start)
+                for item, patron in zip(
+                    self.items.draw(self.rng, count), self.readers.draw(self.rng, count), strict=True
+                ):
+                    loan_date = self._days_ago(LOAN_DAYS + 1, days)
+                    late = self.rng.random() < options.overdue_rate
+                    kept = self.rng.randint(LOAN_DAYS + 1, LOAN_DAYS + 45) if late else self.rng.randint(1, LOAN_DAYS)
+                    return_date = min(loan_date + datetime.timedelta(days=kept), self.today)
+                    row = self._loan(self._copy_of(item), patron, loan_date, return_date)
+                    if return_date > row['due_date']:
+                        fines.append(self._fine(row))
+                    yield row
+
+        self._insert(LoanModel, history())
+        self._insert(FineModel, fines)
+
+    def _fine(self, loan: dict[str, t.Any]) -> dict[str, t.Any]:
+        days_late = (loan['return_date'] - loan['due_date']).days
+        settled = loan['return_date'] < self.today - datetime.timedelta(days=60)
+        status = self.rng.choices((FineStatus.PAID, FineStatus.WAIVED), (0.9, 0.1))[0] if settled else FineStatus.UNPAID
+        return {
+            'id': self._id(loan['return_date']),
+            'patron_id': loan['patron_id'],
+            'loan_id': loan['id'],
+            'amount': DAILY_FINE * days_late,
+            'reason': f'Returned {days_late} days late',
+            'issued_date': loan['return_date'],
+            'paid_date': loan['return_date'] + datetime.timedelta(days=self.rng.randint(0, 30))
+            if status is FineStatus.PAID
+            else None,
+            'status': status,
+        }
+
+    def _holds(self) -> None:
+        # Mostly patrons waiting for a title that is out, at most two holds each as the domain allows.
+        waiting: dict[int, int] = {}
+        holds = []
+        patrons = [n for n, status in enumerate(self.patron_status) if status is PatronStatus.ACTIVE]
+        for _ in range(int(len(self.patron_ids) * self.options.hold_rate)):
+            patron = self.rng.choice(patrons)
+            if waiting.get(patron, 0) >= 2:
+                continue
+            waiting[patron] = waiting.get(patron, 0) + 1
+            request_date = self._days_ago(0, HOLD_DAYS - 1)
+            holds.append(
+                {
+                    'id': self._id(request_date),
+                    'patron_id': self.patron_ids[patron],
+                    'item_id': self.item_ids[self.items.draw(self.rng)[0]],
+                    'request_date': request_date,
+                    'expiry_date': request_date + datetime.timedelta(days=HOLD_DAYS),
+                    'status': HoldStatus.PENDING,
+                }
+            )
+        self._insert(HoldModel, holds)
+
+    def _acquisitions(self) -> None:
+        vendor_ids = [self._id(self._days_ago(365, 365 * 5)) for _ in range(max(self.options.branches, 5))]
+        self._insert(VendorModel, ({'id': v, 'name': f'Vendor {n + 1}'} for n, v in enumerate(vendor_ids)))
+        orders, lines = [], []
+        # Each branch orders about once a month; the last month's orders are still open.
+        for _ in range(self.options.branches * 12 * self.options.loan_history_years):
+            order_date = self._days_ago(0, 365 * self.options.loan_history_years)
+            received = order_date < self.today - datetime.timedelta(days=30)
+            order_id = self._id(order_date)
+            orders.append(
+                {
+                    'id': order_id,
+                    'vendor_id': self.rng.choice(vendor_ids),
+                    'staff_id': self.staff[self.branches.draw(self.rng)[0]][0],
+                    'order_date': order_date,
+                    'received_date': order_date + datetime.timedelta(days=self.rng.randint(5, 30))
+                    if received
+                    else None,
+                    'status': OrderStatus.RECEIVED if received else OrderStatus.SUBMITTED,
+                }
+            )
+            for item in dict.fromkeys(self.items.draw(self.rng, k=self.rng.randint(1, 10))):
+                quantity = self.rng.randint(1, self.options.copies_per_item)
+                lines.append(
+                    {
+                        'id': self._id(order_date),
+                        'order_id': order_id,
+                        'item_id': self.item_ids[item],
+                        'quantity': quantity,
+                        'unit_price': Decimal(self.rng.randint(800, 6000)) / 100,
+                        'received_quantity': quantity if received else None,
+                        'status': OrderLineStatus.RECEIVED if received else OrderLineStatus.PENDING,
+                    }
+                )
+        self._insert(AcquisitionOrderModel, orders)
+        self._insert(AcquisitionOrderLineModel, lines)
+
+
+def seed(session: sa_orm.scoped_session[Session], options: SeedOptions) -> dict[str, int]:
+    """Seeds an empty database; returns the number of rows inserted per table."""
+    return DatasetGenerator(session, options).generate()
@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import types
+import typing as t
+
+import sqlalchemy.exc as sa_exc
+import sqlalchemy.orm as sa_orm
+from flask_sqlalchemy.session import Session
+
+from lms.infrastructure.database import RepositoryError, identity_map
+from lms.infrastructure.event_bus import event_bus
+from lms.infrastructure.database.cache import forget_written, invalidate_written
+
+if t.TYPE_CHECKING:
+    from lms.infrastructure.database.outbox import SQLAlchemyOutbox
+
+_DEPTH_KEY = 'unit_of_work_depth'
+
+
+class SQLAlchemyUnitOfWork:
+    """Commit once per service call, then publish the domain events raised during it.
+
+    With an outbox, events that have background handlers are written to it in the same transaction.
+    The identity map of the current call is emptied once the transaction ends, and the reference cache entries of the
+    rows written in it are evicted once it commits.
+    Nested blocks join the outermost one. The depth is kept in ``session.info`` so it follows
+    the scoped session rather than this shared instance.
+    """
+
+    def __init__(self, session: sa_orm.scoped_session[Session], *, outbox: SQLAlchemyOutbox | None = None) -> None:
+        self.session = session
+        self.outbox = outbox
+
+    def __enter__(self) -> t.Self:
+        self.session.info[_DEPTH_KEY] = self.session.info.get(_DEPTH_KEY, 0) + 1
+        return self
+
+    def __exit__(
+        self, exc_type: type[BaseException] | None, exc: BaseException | None, traceback: types.TracebackType | None
+    ) -> None:
+        depth = self.session.info[_DEPTH_KEY] - 1
+        self.session.info[_DEPTH_KEY] = depth
+        if depth > 0:
+            return
+        if exc_type is not None:
+            self.rollback()
+            return
+        if self.outbox is not None:
+            try:
+                self.outbox.add_all(event_bus.pending_events())
+            except RepositoryError:
+                self.rollback()
+                raise
+        try:
+            self.session.commit()
+        except sa_exc.SQLAlchemyError as e:
+            self.rollback()
+            raise RepositoryError('Failed to commit unit of work', cause=e) from e
+        # Like the session's own identity map, mapped entities do not outlive the transaction they were read in.
+        identity_map.clear()
+        invalidate_written(self.session)
+        # With an outbox the background handlers are left to the relay, which reads the rows committed above.
+        event_bus.publish_events(background=self.outbox is None)
+        if self.outbox is not None:
+            event_bus.discard_events()
+
+    def rollback(self) -> None:
+        self.session.rollback()
+        identity_map.clear()
+        forget_written(self.session)
+        event_bus.discard_events()
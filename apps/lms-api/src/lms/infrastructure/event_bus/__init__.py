@@ -1,32 +1,167 @@
 from __future__ import annotations
 
+import time
 import typing as t
+import functools
+import threading
+from concurrent import futures
+from contextlib import contextmanager
+import contextvars
+from contextvars import ContextVar
 
 from blinker import Namespace
 
+from lms.infrastructure.logging import logger
+from lms.infrastructure.event_bus.metrics import EventBusMetrics
+
+
+class BackgroundDispatcher:
+    def __init__(
+        self,
+        *,
+        max_workers: int,
+        max_pending: int,
+        submit_timeout: float,
+        context: t.Callable[[], t.ContextManager[t.Any]],
+    ) -> None:
+        self._executor = futures.ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='event-bus')
+        # Bounds handlers queued or running; once every slot is taken the publisher waits, then runs the handler itself.
+        self._slots = threading.BoundedSemaphore(max_workers + max_pending)
+        self._submit_timeout = submit_timeout
+        self._context = context
+        self._pending: set[futures.Future[None]] = set()
+        self._lock = threading.Lock()
+
+    def submit(self, handler: t.Callable[[object], t.Any], event: object) -> None:
+        if not self._slots.acquire(timeout=self._submit_timeout):
+            logger.warning('Event bus queue is full, running %s inline', handler.__name__)
+            handler(event)
+            return
+        try:
+            future = self._executor.submit(contextvars.Context().run, self._run, handler, event)
+        except RuntimeError:
+            self._slots.release()
+            handler(event)
+            return
+        with self._lock:
+            self._pending.add(future)
+        future.add_done_callback(self._done)
+
+    def _run(self, handler: t.Callable[[object], t.Any], event: object) -> None:
+        try:
+            with self._context():
+                handler(event)
+        except Exception:
+            logger.exception('Background handler %s failed for %s', handler.__name__, type(event).__name__)
+
+    def _done(self, future: futures.Future[None]) -> None:
+        with self._lock:
+            self._pending.discard(future)
+        self._slots.release()
+
+    def drain(self, timeout: float | None = None) -> bool:
+        with self._lock:
+            pending = set(self._pending)
+        _, not_done = futures.wait(pending, timeout=timeout)
+        return not not_done
+
+    def shutdown(self, wait: bool = True) -> None:
+        self._executor.shutdown(wait=wait)
+
 
 class BlinkerEventBus:
     def __init__(self) -> None:
         self._namespace = Namespace()
-        self._events: list[tuple[str, object]] = []
+        # Handlers subscribed with background=True; kept apart so they can be handed to the dispatcher or delivered
+        # later from the outbox instead of running inline after the commit.
+        self._background_namespace = Namespace()
+        self._background_event_types: dict[str, type[object]] = {}
+        # Pending events live in the current context (thread, greenlet or task), so concurrent requests served by
+        # the same process never flush or drop each other's events. The buffer is an immutable tuple because a
+        # copied context shares its values with the context it was copied from. The flag of each entry tells whether
+        # its inline handlers have still to run.
+        self._events: ContextVar[tuple[tuple[str, object, bool], ...]] = ContextVar(f'event_bus_{id(self)}', default=())
+        self._dispatcher: BackgroundDispatcher | None = None
+        self.metrics = EventBusMetrics()
 
     def add_event(self, event: object) -> None:
-        self._events.append((type(event).__name__, event))
+        self._events.set((*self._events.get(), (type(event).__name__, event, True)))
+
+    def pending_events(self) -> list[object]:
+        return [event for _, event, _ in self._events.get()]
 
-    def subscribe(self, event_type: type[object], handler: t.Callable[..., t.Any]) -> None:
-        signal = self._namespace.signal(event_type.__name__)
-        signal.connect(handler)
+    @contextmanager
+    def savepoint(self) -> t.Iterator[None]:
+        token = self._events.set(self._events.get())
+        try:
+            yield
+        except BaseException:
+            self._events.reset(token)
+            raise
+
+    def subscribe(self, event_type: type[object], handler: t.Callable[..., t.Any], *, background: bool = False) -> None:
+        if background:
+            self._background_event_types[event_type.__name__] = event_type
+            self._background_namespace.signal(event_type.__name__).connect(handler)
+        else:
+            self._namespace.signal(event_type.__name__).connect(handler)
+
+    def use_dispatcher(self, dispatcher: BackgroundDispatcher | None) -> None:
+        self._dispatcher = dispatcher
+
+    def background_event_type(self, name: str) -> type[object] | None:
+        return self._background_event_types.get(name)
+
+    def has_background_handlers(self, event: object) -> bool:
+        return bool(self._background_namespace.signal(type(event).__name__).receivers)
 
     def publish(self, event: object) -> None:
-        signal = self._namespace.signal(type(event).__name__)
-        signal.send(event)
-
-    def publish_events(self) -> None:
-        events = self._events[:]
-        self._events = []
-        for name, event in events:
-            signal = self._namespace.signal(name)
-            signal.send(event)
+        self._send(type(event).__name__, event, inline=True, background=True)
+
+    def publish_events(self, *, background: bool = True) -> None:
+        # Without background, only the inline handlers run; events that also have background handlers stay pending
+        # for them, so a unit of work can still hand them to the outbox or the dispatcher once it commits.
+        events = self._events.get()
+        self._events.set(())
+        deferred: list[tuple[str, object, bool]] = []
+        for name, event, inline in events:
+            self._send(name, event, inline=inline, background=background)
+            if not background and self._background_namespace.signal(name).receivers:
+                deferred.append((name, event, False))
+        if deferred:
+            self._events.set((*deferred, *self._events.get()))
+
+    def deliver(self, event: object) -> None:
+        # Runs the background handlers of an event on the calling thread; used by the outbox relay.
+        for handler in self._background_namespace.signal(type(event).__name__).receivers_for(event):
+            self._call(handler, event)
+
+    def discard_events(self) -> None:
+        self._events.set(())
+
+    def _send(self, name: str, event: object, *, inline: bool, background: bool) -> None:
+        # Receivers are called one by one rather than through Signal.send so each handler is timed on its own.
+        if inline:
+            for handler in self._namespace.signal(name).receivers_for(event):
+                self._call(handler, event)
+        if not background:
+            return
+        for handler in self._background_namespace.signal(name).receivers_for(event):
+            if self._dispatcher is None:
+                self._call(handler, event)
+            else:
+                self._dispatcher.submit(
+                    functools.update_wrapper(functools.partial(self._call, handler), handler), event
+                )
+
+    def _call(self, handler: t.Callable[[object], t.Any], event: object) -> None:
+        started = time.perf_counter()
+        try:
+            handler(event)
+        except BaseException:
+            self.metrics.record(event, handler, time.perf_counter() - started, failed=True)
+            raise
+        self.metrics.record(event, handler, time.perf_counter() - started, failed=False)
 
 
 event_bus = BlinkerEventBus()
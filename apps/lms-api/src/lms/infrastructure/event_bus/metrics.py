@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import bisect
+import typing as t
+import threading
+from dataclasses import field, dataclass
+
+from lms.infrastructure.logging import logger
+from lms.infrastructure.metrics import LATENCY_BUCKETS
+
+
+def handler_name(handler: t.Callable[..., t.Any]) -> str:
+    return f'{handler.__module__}.{handler.__qualname__}'
+
+
+@dataclass
+class HandlerStats:
+    count: int = 0
+    errors: int = 0
+    total_seconds: float = 0.0
+    # One slot per bucket plus the +Inf overflow; cumulated only when reported.
+    buckets: list[int] = field(default_factory=lambda: [0] * (len(LATENCY_BUCKETS) + 1))
+
+
+class EventBusMetrics:
+    def __init__(self, *, slow_threshold: float | None = None) -> None:
+        self.slow_threshold = slow_threshold
+        self._stats: dict[tuple[str, str], HandlerStats] = {}
+        self._lock = threading.Lock()
+
+    def record(self, event: object, handler: t.Callable[..., t.Any], seconds: float, *, failed: bool) -> None:
+        key = (type(event).__name__, handler_name(handler))
+        with self._lock:
+            stats = self._stats.get(key)
+            if stats is None:
+                stats = self._stats[key] = HandlerStats()
+            stats.count += 1
+            stats.errors += failed
+            stats.total_seconds += seconds
+            stats.buckets[bisect.bisect_left(LATENCY_BUCKETS, seconds)] += 1
+        if self.slow_threshold is not None and seconds >= self.slow_threshold:
+            logger.warning('Slow event handler %s took %.3fs for %r', key[1], seconds, event)
+
+    def snapshot(self) -> list[dict[str, t.Any]]:
+        with self._lock:
+            items = [
+                (key, HandlerStats(s.count, s.errors, s.total_seconds, list(s.buckets)))
+                for key, s in self._stats.items()
+            ]
+        snapshot = []
+        for (event_type, handler), stats in sorted(items):
+            cumulative, buckets = 0, []
+            for le, count in zip((*LATENCY_BUCKETS, '+Inf'), stats.buckets, strict=True):
+                cumulative += count
+                buckets.append({'le': le, 'count': cumulative})
+            snapshot.append(
+                {
+                    'event_type': event_type,
+                    'handler': handler,
+                    'count': stats.count,
+                    'errors': stats.errors,
+                    'total_seconds': stats.total_seconds,
+                    'buckets': buckets,
+                }
+            )
+        return snapshot
+
+    def reset(self) -> None:
+        with self._lock:
+            self._stats.clear()
@@ -1,6 +1,15 @@
 from __future__ import annotations
 
+import copy
+import queue
+import atexit
+import random
+import typing as t
 import logging
+import datetime
+from logging.handlers import QueueHandler, QueueListener
+
+import msgspec
 
 formatter = logging.Formatter('[%(name)s][%(asctime)s] %(levelname)s in %(module)s: %(message)s')
 default_handler = logging.StreamHandler()
@@ -9,3 +18,148 @@ default_handler.setFormatter(formatter)
 logger = logging.getLogger('lms')
 logger.setLevel(logging.DEBUG)
 logger.addHandler(default_handler)
+
+_listener: DrainingQueueListener | None = None
+_queue_handler: NonBlockingQueueHandler | None = None
+
+
+def get_logger(name: str) -> logging.Logger:
+    # Module loggers are children of `lms`, so they share its handler and can be given their own level.
+    return logging.getLogger(name)
+
+
+class JSONFormatter(logging.Formatter):
+    _encoder = msgspec.json.Encoder()
+
+    def format(self, record: logging.LogRecord) -> str:
+        payload: dict[str, t.Any] = {
+            'time': datetime.datetime.fromtimestamp(record.created, tz=datetime.UTC).isoformat(),
+            'level': record.levelname,
+            'logger': record.name,
+            'module': record.module,
+            'thread': record.threadName,
+            'message': record.getMessage(),
+        }
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            payload['exc_info'] = record.exc_text
+        if record.stack_info:
+            payload['stack_info'] = self.formatStack(record.stack_info)
+        return self._encoder.encode(payload).decode()
+
+
+class NonBlockingQueueHandler(QueueHandler):
+    """Hands records to a bounded queue drained by a writer thread.
+
+    While the queue is full, DEBUG and INFO records are dropped and counted in ``dropped``; warnings and errors are
+    never dropped but written by the calling thread to ``overflow``.
+    """
+
+    def __init__(self, records: queue.Queue[t.Any], *, overflow: logging.Handler = default_handler) -> None:
+        super().__init__(records)
+        self.overflow = overflow
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # The message and traceback are rendered here because the arguments and the traceback may not outlive the
+        # call, but the final formatting is left to the writer thread.
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = formatter.formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            if record.levelno < logging.WARNING:
+                self.dropped += 1
+            elif record.levelno >= self.overflow.level:
+                self.overflow.handle(record)
+
+
+class DrainingQueueListener(QueueListener):
+    def enqueue_sentinel(self) -> None:
+        # The queue may be full when stopping; wait for the writer to make room instead of failing with queue.Full.
+        t.cast('queue.Queue[t.Any]', self.queue).put(self._sentinel)  # type: ignore[attr-defined]
+
+
+class SamplingFilter(logging.Filter):
+    """Keeps a fraction of the INFO and DEBUG records of a logger and its children; warnings always pass."""
+
+    def __init__(self, rates: dict[str, float]) -> None:
+        super().__init__()
+        self.rates = rates
+        self._cache: dict[str, float] = {}
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno > logging.INFO:
+            return True
+        rate = self._cache.get(record.name)
+        if rate is None:
+            rate = self._cache[record.name] = self._rate(record.name)
+        return rate >= 1.0 or random.random() < rate
+
+    def _rate(self, name: str) -> float:
+        while name:
+            if name in self.rates:
+                return self.rates[name]
+            name = name.rpartition('.')[0]
+        return 1.0
+
+
+def configure(
+    *,
+    levels: dict[str, str],
+    sample_rates: dict[str, float],
+    queue_size: int,
+    json: bool = True,
+    handler: logging.Handler = default_handler,
+) -> QueueListener:
+    """Routes the `lms` logger through a non-blocking queue; call `shutdown` to flush it."""
+    global _listener, _queue_handler
+    shutdown()
+    handler.setFormatter(JSONFormatter() if json else formatter)
+    queue_handler = NonBlockingQueueHandler(queue.Queue(maxsize=queue_size), overflow=handler)
+    if sample_rates:
+        queue_handler.addFilter(SamplingFilter(sample_rates))
+    for name, level in levels.items():
+        logging.getLogger(name).setLevel(level.upper())
+    logger.handlers = [queue_handler]
+    _queue_handler = queue_handler
+    _listener = DrainingQueueListener(queue_handler.queue, handler, respect_handler_level=True)
+    _listener.start()
+    return _listener
+
+
+def dropped_records() -> int:
+    return _queue_handler.dropped if _queue_handler is not None else 0
+
+
+def shutdown() -> None:
+    global _listener, _queue_handler
+    if _listener is not None:
+        # Stopping enqueues a sentinel behind the pending records and waits for the writer to get through them.
+        _listener.stop()
+        if _queue_handler is not None and _queue_handler.dropped:
+            # The writer is gone, so the count is written straight to the handler it fed.
+            record = logger.makeRecord(
+                logger.name,
+                logging.WARNING,
+                __file__,
+                0,
+                'Dropped %s log records while the logging queue was full',
+                (_queue_handler.dropped,),
+                None,
+            )
+            for handler in _listener.handlers:
+                handler.handle(record)
+        _listener = None
+        _queue_handler = None
+
+
+atexit.register(shutdown)
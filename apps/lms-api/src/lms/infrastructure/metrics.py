@@ -0,0 +1,252 @@
+from __future__ import annotations
+
+import os
+import bisect
+from pathlib import Path
+import secrets
+import threading
+import contextlib
+
+import msgspec
+
+from lms.infrastructure.logging import logger
+
+LATENCY_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class MethodStats(msgspec.Struct):
+    count: int = 0
+    errors: dict[str, int] = msgspec.field(default_factory=dict)
+    total_seconds: float = 0.0
+    # One slot per bucket plus the +Inf overflow; cumulated only when rendered.
+    buckets: list[int] = msgspec.field(default_factory=lambda: [0] * (len(LATENCY_BUCKETS) + 1))
+    in_flight: int = 0
+    queries: int = 0
+    query_seconds: float = 0.0
+    repeated_queries: int = 0
+
+
+class ProcessSnapshot(msgspec.Struct):
+    pid: int
+    methods: dict[str, MethodStats]
+
+
+class RPCMetrics:
+    """Per-method JSON-RPC counters kept in process memory.
+
+    With a directory configured every process also dumps its counters there from a daemon thread, once per flush
+    interval whenever they changed, and ``collect`` merges the dumps of the processes still running; the directory
+    must be shared by the gunicorn workers. Files are named after the pid and a token drawn when the process starts,
+    so a worker that reuses the pid of an exited one never writes over its file; the files of exited processes,
+    including those left by an earlier server, are removed rather than merged.
+    """
+
+    def __init__(self) -> None:
+        self.directory: Path | None = None
+        self.flush_interval = 1.0
+        self._methods: dict[str, MethodStats] = {}
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._changes = 0
+        self._flushed_changes = 0
+        self._flusher: threading.Thread | None = None
+        self._stopped = threading.Event()
+        self._token = secrets.token_hex(8)
+        self._claimed = False
+        self._encoder = msgspec.msgpack.Encoder()
+        self._decoder = msgspec.msgpack.Decoder(ProcessSnapshot)
+        os.register_at_fork(after_in_child=self._after_fork)
+
+    def configure(self, *, directory: str | None, flush_interval: float) -> None:
+        self.directory = Path(directory) if directory else None
+        self.flush_interval = flush_interval
+        if self.directory is not None:
+            self.directory.mkdir(parents=True, exist_ok=True)
+
+    def started(self, method: str) -> None:
+        with self._lock:
+            self._stats(method).in_flight += 1
+            self._changes += 1
+            # Started by the first call a process handles, so that every forked worker runs a flusher of its own.
+            if self._flusher is None and self.directory is not None:
+                self._flusher = threading.Thread(
+                    target=self._flush_periodically, args=(self._stopped,), name='rpc-metrics-flusher', daemon=True
+                )
+                self._flusher.start()
+
+    def finished(
+        self,
+        method: str,
+        seconds: float,
+        *,
+        error: str | None = None,
+        queries: int = 0,
+        query_seconds: float = 0.0,
+        repeated_queries: int = 0,
+    ) -> None:
+        with self._lock:
+            stats = self._stats(method)
+            stats.in_flight -= 1
+            stats.count += 1
+            stats.total_seconds += seconds
+            stats.queries += queries
+            stats.query_seconds += query_seconds
+            stats.repeated_queries += repeated_queries
+            stats.buckets[bisect.bisect_left(LATENCY_BUCKETS, seconds)] += 1
+            if error is not None:
+                stats.errors[error] = stats.errors.get(error, 0) + 1
+            self._changes += 1
+
+    def flush(self) -> None:
+        if self.directory is None or not self._flush_lock.acquire(blocking=False):
+            return
+        try:
+            changes = self._changes
+            if changes == self._flushed_changes:
+                return
+            if not self._claimed:
+                self._remove_predecessors(self.directory)
+                self._claimed = True
+            path = self._path(self.directory)
+            tmp_path = path.with_suffix('.tmp')
+            tmp_path.write_bytes(self._encoder.encode(self._snapshot()))
+            tmp_path.replace(path)
+            self._flushed_changes = changes
+        except OSError:
+            logger.exception('Failed to write RPC metrics to %s', self.directory)
+        finally:
+            self._flush_lock.release()
+
+    def collect(self) -> dict[str, MethodStats]:
+        merged = self._snapshot().methods
+        if self.directory is None:
+            return merged
+        own_path = self._path(self.directory)
+        for path in self.directory.glob('rpc-*.msgpack'):
+            if path == own_path:
+                continue
+            try:
+                snapshot = self._decoder.decode(path.read_bytes())
+            except (OSError, msgspec.DecodeError):
+                logger.warning('Skipping unreadable RPC metrics file %s', path)
+                continue
+            # A file under this pid but another token was left by an exited process that had the same pid.
+            if snapshot.pid == os.getpid() or not _is_alive(snapshot.pid):
+                with contextlib.suppress(OSError):
+                    path.unlink()
+                continue
+            for method, stats in snapshot.methods.items():
+                _merge(merged.setdefault(method, MethodStats()), stats)
+        return merged
+
+    def stop(self) -> None:
+        self._stopped.set()
+
+    def reset(self) -> None:
+        with self._lock:
+            self._methods = {}
+            self._changes += 1
+
+    def _after_fork(self) -> None:
+        # The flusher thread does not survive the fork, and the child starts from the counters of its parent; drop
+        # them so nothing is counted twice.
+        self._flusher = None
+        self._stopped = threading.Event()
+        self._token = secrets.token_hex(8)
+        self._claimed = False
+        self.reset()
+
+    def _path(self, directory: Path) -> Path:
+        return directory / f'rpc-{os.getpid()}-{self._token}.msgpack'
+
+    def _remove_predecessors(self, directory: Path) -> None:
+        own_path = self._path(directory)
+        for path in directory.glob(f'rpc-{os.getpid()}-*.msgpack'):
+            if path != own_path:
+                with contextlib.suppress(OSError):
+                    path.unlink()
+
+    def _flush_periodically(self, stopped: threading.Event) -> None:
+        while not stopped.wait(self.flush_interval):
+            self.flush()
+
+    def _stats(self, method: str) -> MethodStats:
+        stats = self._methods.get(method)
+        if stats is None:
+            stats = self._methods[method] = MethodStats()
+        return stats
+
+    def _snapshot(self) -> ProcessSnapshot:
+        with self._lock:
+            methods = {
+                method: msgspec.structs.replace(stats, errors=dict(stats.errors), buckets=list(stats.buckets))
+                for method, stats in self._methods.items()
+            }
+        return ProcessSnapshot(pid=os.getpid(), methods=methods)
+
+
+def _is_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def _merge(into: MethodStats, stats: MethodStats) -> None:
+    into.count += stats.count
+    into.total_seconds += stats.total_seconds
+    into.queries += stats.queries
+    into.query_seconds += stats.query_seconds
+    into.repeated_queries += stats.repeated_queries
+    into.buckets = [a + b for a, b in zip(into.buckets, stats.buckets, strict=True)]
+    for error, count in stats.errors.items():
+        into.errors[error] = into.errors.get(error, 0) + count
+    into.in_flight += stats.in_flight
+
+
+def _label(value: str) -> str:
+    return value.replace('\\', r'\\').replace('"', r'\"').replace('\n', r'\n')
+
+
+def render_prometheus(methods: dict[str, MethodStats]) -> str:
+    requests = ['# HELP lms_rpc_requests_total JSON-RPC calls handled.', '# TYPE lms_rpc_requests_total counter']
+    errors = ['# HELP lms_rpc_errors_total JSON-RPC calls failed, by error.', '# TYPE lms_rpc_errors_total counter']
+    latency = [
+        '# HELP lms_rpc_request_duration_seconds JSON-RPC call latency.',
+        '# TYPE lms_rpc_request_duration_seconds histogram',
+    ]
+    in_flight = ['# HELP lms_rpc_in_flight JSON-RPC calls being handled.', '# TYPE lms_rpc_in_flight gauge']
+    queries = [
+        '# HELP lms_rpc_queries_total SQL statements run by JSON-RPC calls.',
+        '# TYPE lms_rpc_queries_total counter',
+    ]
+    query_time = [
+        '# HELP lms_rpc_query_duration_seconds_total Time JSON-RPC calls spent in SQL statements.',
+        '# TYPE lms_rpc_query_duration_seconds_total counter',
+    ]
+    repeated = [
+        '# HELP lms_rpc_repeated_queries_total SQL statements repeating one already run by the same call.',
+        '# TYPE lms_rpc_repeated_queries_total counter',
+    ]
+    for method, stats in sorted(methods.items()):
+        label = f'method="{_label(method)}"'
+        requests.append(f'lms_rpc_requests_total{{{label}}} {stats.count}')
+        for error, count in sorted(stats.errors.items()):
+            errors.append(f'lms_rpc_errors_total{{{label},error="{_label(error)}"}} {count}')
+        cumulative = 0
+        for le, count in zip((*LATENCY_BUCKETS, '+Inf'), stats.buckets, strict=True):
+            cumulative += count
+            latency.append(f'lms_rpc_request_duration_seconds_bucket{{{label},le="{le}"}} {cumulative}')
+        latency.append(f'lms_rpc_request_duration_seconds_sum{{{label}}} {stats.total_seconds}')
+        latency.append(f'lms_rpc_request_duration_seconds_count{{{label}}} {stats.count}')
+        in_flight.append(f'lms_rpc_in_flight{{{label}}} {stats.in_flight}')
+        queries.append(f'lms_rpc_queries_total{{{label}}} {stats.queries}')
+        query_time.append(f'lms_rpc_query_duration_seconds_total{{{label}}} {stats.query_seconds}')
+        repeated.append(f'lms_rpc_repeated_queries_total{{{label}}} {stats.repeated_queries}')
+    return '\n'.join([*requests, *errors, *latency, *in_flight, *queries, *query_time, *repeated]) + '\n'
+
+
+rpc_metrics = RPCMetrics()
@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+import re
+import sys
+import time
+import types
+import typing as t
+import marshal
+from pathlib import Path
+import datetime
+import threading
+from contextlib import contextmanager
+
+from lms.infrastructure.logging import logger
+
+_UNSAFE = re.compile(r'[^A-Za-z0-9_.-]+')
+
+type _Function = tuple[str, int, str]
+
+
+class Profiler:
+    """Writes a pstats dump per profiled call to ``directory`` and keeps the ``keep`` most recent ones.
+
+    The call is sampled rather than traced: a helper thread reads the stack of the thread dispatching the call every
+    ``interval`` seconds. cProfile is not used because on Python 3.12 and later it hooks ``sys.monitoring``, which
+    records every thread of the process, so the dump of one call would also hold whatever the other workers ran
+    meanwhile. Call counts in the dump are sample counts, and time spent in C functions is charged to their Python
+    caller. A single call is profiled at a time to bound the overhead; a call arriving while another one is profiled
+    runs as is.
+    """
+
+    def __init__(self, directory: str, *, keep: int, interval: float = 0.001) -> None:
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.keep = keep
+        self.interval = interval
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def profile(self, method: str, request_id: object) -> t.Iterator[None]:
+        if not self._lock.acquire(blocking=False):
+            yield
+            return
+        try:
+            sampler = _Sampler(threading.get_ident(), self.interval)
+            sampler.start()
+            try:
+                yield
+            finally:
+                sampler.stop()
+                self._dump(sampler, method, request_id)
+        finally:
+            self._lock.release()
+
+    def profiles(self) -> list[dict[str, t.Any]]:
+        profiles = []
+        for path in self.directory.glob('*.prof'):
+            parts = path.stem.split('--', 2)
+            if len(parts) != 3:
+                continue
+            try:
+                stat = path.stat()
+            except OSError:
+                # Removed by the retention of a concurrent dump since the directory was listed.
+                continue
+            method, _, request_id = parts
+            profiles.append(
+                {
+                    'name': path.name,
+                    'method': method,
+                    'request_id': request_id,
+                    'size': stat.st_size,
+                    'created_at': datetime.datetime.fromtimestamp(stat.st_mtime, tz=datetime.UTC),
+                }
+            )
+        return sorted(profiles, key=lambda p: p['created_at'], reverse=True)
+
+    def _dump(self, sampler: _Sampler, method: str, request_id: object) -> None:
+        name = f'{_UNSAFE.sub("_", method)}--{time.time_ns()}--{_UNSAFE.sub("_", str(request_id))[:64]}'
+        path = self.directory / f'{name}.prof'
+        tmp_path = path.with_suffix('.tmp')
+        try:
+            tmp_path.write_bytes(marshal.dumps(sampler.stats()))
+            tmp_path.replace(path)
+            for stale in sorted(self.directory.glob('*.prof'), key=lambda p: p.stat().st_mtime)[: -self.keep]:
+                stale.unlink(missing_ok=True)
+        except OSError:
+            logger.exception('Failed to write profile %s', path)
+
+
+class _Sampler:
+    def __init__(self, ident: int, interval: float) -> None:
+        self._ident = ident
+        self._interval = interval
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._run, name='profiler-sampler', daemon=True)
+        # Per function: samples, seconds on top of the stack, seconds anywhere on it; per caller edge the same.
+        self._functions: dict[_Function, list[t.Any]] = {}
+        self._callers: dict[_Function, dict[_Function, list[t.Any]]] = {}
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stopped.set()
+        self._thread.join()
+
+    def stats(self) -> dict[_Function, tuple[t.Any, ...]]:
+        # The layout pstats.Stats loads: (primitive calls, calls, own time, cumulative time, callers).
+        return {
+            function: (
+                samples,
+                samples,
+                own,
+                cumulative,
+                {caller: tuple(edge) for caller, edge in self._callers.get(function, {}).items()},
+            )
+            for function, (samples, own, cumulative) in self._functions.items()
+        }
+
+    def _run(self) -> None:
+        last = time.perf_counter()
+        while not self._stopped.wait(self._interval):
+            frame = sys._current_frames().get(self._ident)
+            now = time.perf_counter()
+            if frame is not None:
+                self._record(frame, now - last)
+            last = now
+
+    def _record(self, frame: types.FrameType, seconds: float) -> None:
+        stack: list[_Function] = []
+        current: types.FrameType | None = frame
+        while current is not None:
+            code = current.f_code
+            stack.append((code.co_filename, code.co_firstlineno, code.co_name))
+            current = current.f_back
+        seen: set[_Function] = set()
+        for depth, function in enumerate(stack):
+            own = seconds if depth == 0 else 0.0
+            # A recursive function is counted once per sample, at its innermost frame.
+            if function not in seen:
+                seen.add(function)
+                totals = self._functions.setdefault(function, [0, 0.0, 0.0])
+                totals[0] += 1
+                totals[1] += own
+                totals[2] += seconds
+            if depth + 1 < len(stack):
+                edge = self._callers.setdefault(function, {}).setdefault(stack[depth + 1], [0, 0, 0.0, 0.0])
+                edge[0] += 1
+                edge[1] += 1
+                edge[2] += own
+                edge[3] += seconds
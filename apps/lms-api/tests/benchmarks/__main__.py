@@ -0,0 +1,178 @@
+"""Benchmarks the circulation, catalog and acquisition flows against seeded SQLite files.
+
+Usage: python -m tests.benchmarks --sizes 10000 100000 1000000 --output benchmarks.json
+"""
+
+from __future__ import annotations
+
+import sys
+import json
+import time
+import uuid
+import typing as t
+from pathlib import Path
+import sqlite3
+import argparse
+import datetime
+import platform
+import tempfile
+import statistics
+import subprocess
+from dataclasses import field, dataclass
+
+from flask import Flask
+from flask.testing import FlaskClient
+
+from lms.app import create_app
+from lms.config import Config
+from lms.app.extensions import db
+from lms.infrastructure.database.db import init_db
+
+from .dataset import Dataset, seed
+
+LIST_METHODS = {
+    '/api/organizations': ('Branches.list', 'Staff.list'),
+    '/api/patrons': ('Patrons.list', 'Fines.list'),
+    '/api/catalogs': ('Items.list', 'Copies.list'),
+    '/api/circulations': ('Loans.list', 'Holds.list'),
+    '/api/acquisitions': ('AcquisitionOrders.list', 'Vendors.list'),
+    '/api/serials': ('Serials.list',),
+}
+
+
+@dataclass
+class Result:
+    method: str
+    seconds: list[float] = field(default_factory=list)
+    errors: int = 0
+
+    def summary(self) -> dict[str, t.Any]:
+        total = sum(self.seconds)
+        # Inclusive quantiles treat the samples as the whole population, which keeps p99 within the observed range.
+        percentiles = statistics.quantiles(self.seconds, n=100, method='inclusive') if len(self.seconds) > 1 else []
+        return {
+            'method': self.method,
+            'calls': len(self.seconds),
+            'errors': self.errors,
+            'error_rate': self.errors / len(self.seconds) if self.seconds else 0.0,
+            'throughput': len(self.seconds) / total if total else 0.0,
+            'mean_ms': statistics.fmean(self.seconds) * 1000 if self.seconds else 0.0,
+            'p50_ms': percentiles[49] * 1000 if percentiles else 0.0,
+            'p99_ms': percentiles[98] * 1000 if percentiles else 0.0,
+            'max_ms': max(self.seconds) * 1000 if self.seconds else 0.0,
+        }
+
+
+def create_benchmark_app(database: Path) -> Flask:
+    config = type(
+        'BenchmarkConfig',
+        (Config,),
+        {
+            'TESTING': True,
+            'SQLALCHEMY_DATABASE_URI': f'sqlite:///{database}',
+            # Per-call logging would otherwise dominate the latencies being measured.
+            'LOG_LEVELS': {'lms': 'WARNING'},
+        },
+    )
+    return create_app(config)
+
+
+def call(client: FlaskClient, result: Result, path: str, params: dict[str, t.Any]) -> None:
+    payload = {'jsonrpc': '2.0', 'method': result.method, 'params': params, 'id': str(uuid.uuid4())}
+    started = time.perf_counter()
+    response = client.post(path, json=payload)
+    result.seconds.append(time.perf_counter() - started)
+    if response.status_code != 200 or 'error' in response.get_json():
+        result.errors += 1
+
+
+def run_flows(client: FlaskClient, dataset: Dataset, *, iterations: int) -> list[Result]:
+    staff = dataset.staff_ids
+    checkout = Result('Loans.checkout_copy')
+    for n, (patron_id, copy_id) in enumerate(dataset.checkouts):
+        params = {'patron_id': patron_id, 'copy_id': copy_id, 'staff_id': staff[n % len(staff)]}
+        call(client, checkout, '/api/circulations', params)
+    checkin = Result('Loans.checkin_copy')
+    for n, loan_id in enumerate(dataset.checkins):
+        call(client, checkin, '/api/circulations', {'loan_id': loan_id, 'staff_id': staff[n % len(staff)]})
+    place = Result('Holds.place')
+    for patron_id, item_id in dataset.hold_placements:
+        call(client, place, '/api/circulations', {'patron_id': patron_id, 'item_id': item_id})
+    pickup = Result('Holds.pickup')
+    for n, (hold_id, copy_id) in enumerate(dataset.pickups):
+        params = {'hold_id': hold_id, 'staff_id': staff[n % len(staff)], 'copy_id': copy_id}
+        call(client, pickup, '/api/circulations', params)
+    receive = Result('AcquisitionOrders.receive_line')
+    for order_id, order_line_id in dataset.receipts:
+        call(client, receive, '/api/acquisitions', {'order_id': order_id, 'order_line_id': order_line_id})
+    results = [checkout, checkin, place, pickup, receive]
+    for path, methods in LIST_METHODS.items():
+        for method in methods:
+            result = Result(method)
+            for _ in range(iterations):
+                call(client, result, path, {})
+            results.append(result)
+    return results
+
+
+def benchmark(workdir: Path, *, size: int, iterations: int, seed_value: int) -> list[dict[str, t.Any]]:
+    database = workdir / f'benchmark-{size}.db'
+    database.unlink(missing_ok=True)
+    app = create_benchmark_app(database)
+    init_db(app)
+    with app.app_context():
+        started = time.perf_counter()
+        dataset = seed(db.session, size=size, iterations=iterations, seed=seed_value)
+        sys.stderr.write(f'seeded {size} copies and loans in {time.perf_counter() - started:.1f}s\n')
+        db.session.remove()
+    with app.test_client() as client:
+        results = run_flows(client, dataset, iterations=iterations)
+    with app.app_context():
+        db.engine.dispose()
+    return [{'size': size, **result.summary()} for result in results]
+
+
+def metadata() -> dict[str, t.Any]:
+    try:
+        revision = subprocess.run(
+            ['git', 'rev-parse', 'HEAD'], capture_output=True, text=True, check=True, cwd=Path(__file__).parent
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        revision = None
+    return {
+        'started_at': datetime.datetime.now(tz=datetime.UTC).isoformat(),
+        'revision': revision,
+        'python': platform.python_version(),
+        'sqlite': sqlite3.sqlite_version,
+        'platform': platform.platform(),
+    }
+
+
+def main(argv: list[str] | None = None) -> dict[str, t.Any]:
+    parser = argparse.ArgumentParser(prog='python -m tests.benchmarks', description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10_000, 100_000, 1_000_000])
+    parser.add_argument('--iterations', type=int, default=200, help='Calls per benchmarked method')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--workdir', type=Path, help='Where the SQLite files go; a temporary directory by default')
+    parser.add_argument('--output', type=Path, help='JSON report path; printed to stdout by default')
+    args = parser.parse_args(argv)
+
+    report: dict[str, t.Any] = {'meta': {**metadata(), 'iterations': args.iterations, 'seed': args.seed}}
+    with tempfile.TemporaryDirectory() as tmp:
+        workdir = args.workdir or Path(tmp)
+        workdir.mkdir(parents=True, exist_ok=True)
+        report['results'] = [
+            row
+            for size in args.sizes
+            for row in benchmark(workdir, size=size, iterations=args.iterations, seed_value=args.seed)
+        ]
+    output = json.dumps(report, indent=2) + '\n'
+    if args.output:
+        args.output.write_text(output)
+    else:
+        sys.stdout.write(output)
+    return report
+
+
+if __name__ == '__main__':
+    main()
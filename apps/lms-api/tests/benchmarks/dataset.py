@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+import uuid
+import typing as t
+from decimal import Decimal
+import datetime
+from dataclasses import field, dataclass
+
+import sqlalchemy as sa
+import sqlalchemy.orm as sa_orm
+
+from lms.infrastructure.database.seeding import HOLD_DAYS, SeedOptions, DatasetGenerator
+from lms.infrastructure.database.models.patrons import PatronModel, PatronStatus
+from lms.infrastructure.database.models.catalogs import CopyModel, CopyStatus
+from lms.infrastructure.database.models.acquisitions import (
+    OrderStatus,
+    VendorModel,
+    OrderLineStatus,
+    AcquisitionOrderModel,
+    AcquisitionOrderLineModel,
+)
+from lms.infrastructure.database.models.circulations import HoldModel, LoanModel, HoldStatus
+from lms.infrastructure.database.models.organizations import StaffModel
+
+COPIES_PER_ITEM = 3
+
+
+@dataclass
+class Dataset:
+    """Ids of the seeded rows the benchmarked operations consume, one pool entry per iteration."""
+
+    staff_ids: list[str] = field(default_factory=list)
+    # (patron_id, copy_id): active patrons without loans and available copies.
+    checkouts: list[tuple[str, str]] = field(default_factory=list)
+    # Active loans whose item has a pending hold, so checking them in readies that hold.
+    checkins: list[str] = field(default_factory=list)
+    # (patron_id, item_id): patrons without holds and items with a copy out.
+    hold_placements: list[tuple[str, str]] = field(default_factory=list)
+    # (hold_id, copy_id): pending holds of patrons without loans and an available copy of the held item.
+    pickups: list[tuple[str, str]] = field(default_factory=list)
+    # (order_id, order_line_id): submitted single-line orders.
+    receipts: list[tuple[str, str]] = field(default_factory=list)
+
+
+def _pool[T](rows: t.Sequence[T], count: int, what: str) -> t.Sequence[T]:
+    if len(rows) < count:
+        raise ValueError(f'The seeded library has {len(rows)} {what}, the benchmark needs {count}')
+    return rows
+
+
+def seed(session: sa_orm.Session, *, size: int, iterations: int, seed: int = 0) -> Dataset:
+    """Seeds a library of ``size`` copies and about ``size`` loans, then the rows the benchmarked calls consume."""
+    patrons = max(size // 4, 8 * iterations)
+    options = SeedOptions(
+        items=max(size // COPIES_PER_ITEM, 1),
+        copies_per_item=COPIES_PER_ITEM,
+        patrons=patrons,
+        loans_per_patron_year=size / patrons,
+        seed=seed,
+    )
+    DatasetGenerator(session, options).generate()
+    today = options.as_of
+
+    staff_ids = session.scalars(sa.select(StaffModel.id).order_by(StaffModel.id)).all()
+    active_loan = sa.select(LoanModel.id).where(LoanModel.patron_id == PatronModel.id, LoanModel.return_date.is_(None))
+    pending_hold = sa.select(HoldModel.id).where(
+        HoldModel.patron_id == PatronModel.id, HoldModel.status == HoldStatus.PENDING
+    )
+    free_patrons = session.scalars(
+        sa.select(PatronModel.id)
+        .where(PatronModel.status == PatronStatus.ACTIVE, ~active_loan.exists(), ~pending_hold.exists())
+        .order_by(PatronModel.id)
+        .limit(4 * iterations)
+    ).all()
+    available_copies = session.execute(
+        sa.select(CopyModel.id, CopyModel.item_id)
+        .where(CopyModel.status == CopyStatus.AVAILABLE)
+        .order_by(CopyModel.id)
+        .limit(2 * iterations)
+    ).all()
+    active_loans = session.execute(
+        sa.select(LoanModel.id, CopyModel.item_id)
+        .join(CopyModel, CopyModel.id == LoanModel.copy_id)
+        .where(LoanModel.return_date.is_(None))
+        .order_by(LoanModel.id)
+        .limit(iterations)
+    ).all()
+    free_patrons = _pool(free_patrons, 4 * iterations, 'patrons free to borrow')
+    available_copies = _pool(available_copies, 2 * iterations, 'available copies')
+    active_loans = _pool(active_loans, iterations, 'active loans')
+    pickup_patrons, checkout_patrons, placement_patrons, waiting_patrons = (
+        free_patrons[n * iterations : (n + 1) * iterations] for n in range(4)
+    )
+    checkout_copies, pickup_copies = available_copies[:iterations], available_copies[iterations:]
+
+    def hold(patron_id: uuid.UUID, item_id: uuid.UUID) -> dict[str, t.Any]:
+        return {
+            'id': uuid.uuid7(),
+            'patron_id': patron_id,
+            'item_id': item_id,
+            'request_date': today - datetime.timedelta(days=1),
+            'expiry_date': today + datetime.timedelta(days=HOLD_DAYS),
+            'status': HoldStatus.PENDING,
+        }
+
+    checkin_holds = [hold(p, item_id) for p, (_, item_id) in zip(waiting_patrons, active_loans, strict=True)]
+    pickup_holds = [hold(p, item_id) for p, (_, item_id) in zip(pickup_patrons, pickup_copies, strict=True)]
+    session.execute(sa.insert(HoldModel.__table__), checkin_holds + pickup_holds)
+
+    vendor_id = session.scalars(sa.select(VendorModel.id).limit(1)).one()
+    orders = [(uuid.uuid7(), uuid.uuid7(), item_id) for _, item_id in checkout_copies]
+    session.execute(
+        sa.insert(AcquisitionOrderModel.__table__),
+        [
+            {'id': o, 'vendor_id': vendor_id, 'staff_id': staff_ids[0], 'status': OrderStatus.SUBMITTED}
+            for o, *_ in orders
+        ],
+    )
+    session.execute(
+        sa.insert(AcquisitionOrderLineModel.__table__),
+        [
+            {
+                'id': line,
+                'order_id': o,
+                'item_id': item_id,
+                'quantity': COPIES_PER_ITEM,
+                'unit_price': Decimal('19.90'),
+                'status': OrderLineStatus.PENDING,
+            }
+            for o, line, item_id in orders
+        ],
+    )
+    session.commit()
+
+    return Dataset(
+        staff_ids=[str(s) for s in staff_ids],
+        checkouts=[(str(p), str(c)) for p, (c, _) in zip(checkout_patrons, checkout_copies, strict=True)],
+        checkins=[str(loan_id) for loan_id, _ in active_loans],
+        hold_placements=[(str(p), str(i)) for p, (_, i) in zip(placement_patrons, active_loans, strict=True)],
+        pickups=[(str(h['id']), str(c)) for h, (c, _) in zip(pickup_holds, pickup_copies, strict=True)],
+        receipts=[(str(o), str(line)) for o, line, _ in orders],
+    )
@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from .__main__ import LIST_METHODS, main
+
+
+def test_benchmark_report(tmp_path: Path) -> None:
+    output = tmp_path / 'report.json'
+
+    report = main(['--sizes', '200', '--iterations', '3', '--workdir', str(tmp_path), '--output', str(output)])
+
+    assert json.loads(output.read_text()) == report
+    assert report['meta']['iterations'] == 3
+    methods = [row['method'] for row in report['results']]
+    assert methods[:5] == [
+        'Loans.checkout_copy',
+        'Loans.checkin_copy',
+        'Holds.place',
+        'Holds.pickup',
+        'AcquisitionOrders.receive_line',
+    ]
+    assert set(methods[5:]) == {method for methods in LIST_METHODS.values() for method in methods}
+    for row in report['results']:
+        assert row['size'] == 200
+        assert row['calls'] == 3
+        assert row['errors'] == 0, row['method']
+        assert 0 < row['p50_ms'] <= row['p99_ms'] <= row['max_ms']
@@ -0,0 +1,118 @@
+"""Drives a running LMS API with a mixed JSON-RPC workload from several processes.
+
+Usage: python -m tests.load --url http://localhost:5000 --database-url sqlite:///lms.db --processes 4 --steps 1 2 4 8
+
+With --mode closed every step is a number of concurrent patrons per process, each sending its next call as soon as
+the previous one returns. With --mode open every step is a total arrival rate in calls per second; arrivals are
+scheduled up front and latency counts from the scheduled time, so a saturated server shows up as growing latency
+rather than as a lower request rate.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import json
+import typing as t
+from pathlib import Path
+import argparse
+import datetime
+import platform
+import subprocess
+import dataclasses
+
+import sqlalchemy as sa
+import sqlalchemy.orm as sa_orm
+
+from .runner import Step, run_step
+from .workload import DEFAULT_MIX, Fixtures, parse_mix
+
+
+def metadata() -> dict[str, t.Any]:
+    try:
+        revision = subprocess.run(
+            ['git', 'rev-parse', 'HEAD'], capture_output=True, text=True, check=True, cwd=Path(__file__).parent
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        revision = None
+    return {
+        'started_at': datetime.datetime.now(tz=datetime.UTC).isoformat(),
+        'revision': revision,
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpus': os.cpu_count(),
+    }
+
+
+def main(argv: list[str] | None = None) -> dict[str, t.Any]:
+    parser = argparse.ArgumentParser(prog='python -m tests.load', description=__doc__.splitlines()[0])
+    parser.add_argument('--url', default='http://localhost:5000', help='Base URL of the running API')
+    parser.add_argument(
+        '--database-url',
+        default=os.getenv('DATABASE_URL', 'sqlite:///lms.db'),
+        help='Database the API serves, read once for patron, copy, item and fine ids',
+    )
+    parser.add_argument('--mode', choices=('closed', 'open'), default='closed')
+    parser.add_argument(
+        '--steps',
+        type=float,
+        nargs='+',
+        default=[1, 2, 4, 8],
+        help='Concurrent patrons per process (closed) or total calls per second (open), one run each',
+    )
+    parser.add_argument('--processes', type=int, default=os.cpu_count() or 1)
+    parser.add_argument('--duration', type=float, default=30.0, help='Seconds per step')
+    parser.add_argument(
+        '--users', type=int, default=64, help='Patrons per process; in open loop also the calls in flight'
+    )
+    parser.add_argument('--think-time', type=float, default=0.0, help='Mean pause between calls in closed loop')
+    parser.add_argument('--timeout', type=float, default=30.0)
+    parser.add_argument(
+        '--mix',
+        type=parse_mix,
+        default=DEFAULT_MIX,
+        help='Operation weights, e.g. browse=60,checkout=15,return=15,hold=7,fine=3',
+    )
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', type=Path, help='JSON report path; printed to stdout by default')
+    args = parser.parse_args(argv)
+
+    users = args.users if args.mode == 'open' else max(args.users, int(max(args.steps)))
+    engine = sa.create_engine(args.database_url)
+    try:
+        with sa_orm.Session(engine) as session:
+            fixtures = Fixtures.load(
+                session, patrons=users * args.processes, copies=users * args.processes * 2, items=10_000, fines=100_000
+            )
+    finally:
+        engine.dispose()
+    if len(fixtures.patrons) < users * args.processes or not fixtures.staff or not fixtures.items:
+        parser.error(f'{args.database_url} does not hold enough free patrons, staff and items; seed it first')
+
+    steps = []
+    for n, value in enumerate(args.steps):
+        step = Step(
+            mode=args.mode,
+            value=value,
+            duration=args.duration,
+            users=users,
+            think_time=args.think_time,
+            timeout=args.timeout,
+            url=args.url,
+            mix=args.mix,
+            seed=args.seed,
+        )
+        # A fine can only be paid once, so every step gets fines of its own.
+        step_fixtures = dataclasses.replace(fixtures, fines=fixtures.fines[n :: len(args.steps)])
+        steps.append(run_step(step, step_fixtures, args.processes))
+    report = {'meta': {**metadata(), 'url': args.url, 'mix': args.mix, 'duration': args.duration}, 'steps': steps}
+    output = json.dumps(report, indent=2) + '\n'
+    if args.output:
+        args.output.write_text(output)
+    else:
+        sys.stdout.write(output)
+    return report
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+import sys
+import time
+import random
+import typing as t
+import threading
+import statistics
+import collections
+from dataclasses import replace, dataclass
+import multiprocessing
+from concurrent.futures import ThreadPoolExecutor
+
+from .workload import Call, Client, Fixtures, Workload
+
+
+@dataclass(frozen=True)
+class Step:
+    mode: str
+    value: float
+    duration: float
+    users: int
+    think_time: float
+    timeout: float
+    url: str
+    mix: dict[str, float]
+    seed: int
+
+
+def _closed_loop(step: Step, workload: Workload, deadline: float) -> list[Call]:
+    calls: list[Call] = []
+    lock = threading.Lock()
+
+    def user_loop(n: int) -> None:
+        client = Client(step.url, step.timeout)
+        rng = random.Random(step.seed + n)
+        user = workload.checkout_user(step.timeout)
+        try:
+            while time.monotonic() < deadline:
+                made = workload.run(client, user, workload.next_operation())
+                with lock:
+                    calls.extend(made)
+                if step.think_time:
+                    time.sleep(rng.expovariate(1 / step.think_time))
+        finally:
+            workload.release_user(user)
+            client.close()
+
+    threads = [threading.Thread(target=user_loop, args=(n,)) for n in range(int(step.value))]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return calls
+
+
+def _open_loop(step: Step, workload: Workload, deadline: float, rate: float) -> list[Call]:
+    calls: list[Call] = []
+    lock = threading.Lock()
+    clients = threading.local()
+    rng = random.Random(step.seed)
+
+    def arrival(scheduled: float) -> None:
+        if not hasattr(clients, 'client'):
+            clients.client = Client(step.url, step.timeout)
+        user = workload.checkout_user(step.timeout)
+        try:
+            made = workload.run(clients.client, user, workload.next_operation())
+        finally:
+            workload.release_user(user)
+        if made:
+            # Time spent waiting for a free thread or patron is part of what the caller would have seen.
+            made[0].seconds += max(time.monotonic() - scheduled - sum(call.seconds for call in made), 0.0)
+        with lock:
+            calls.extend(made)
+
+    with ThreadPoolExecutor(max_workers=step.users) as executor:
+        scheduled = time.monotonic()
+        while (scheduled := scheduled + rng.expovariate(rate)) < deadline:
+            time.sleep(max(scheduled - time.monotonic(), 0))
+            executor.submit(arrival, scheduled)
+    return calls
+
+
+def run_worker(step: Step, fixtures: Fixtures, rate: float) -> list[tuple[str, float, str | None]]:
+    workload = Workload(fixtures, step.mix, seed=step.seed)
+    deadline = time.monotonic() + step.duration
+    if step.mode == 'closed':
+        calls = _closed_loop(step, workload, deadline)
+    else:
+        calls = _open_loop(step, workload, deadline, rate)
+    client = Client(step.url, step.timeout)
+    workload.drain(client)
+    client.close()
+    return [(call.method, call.seconds, call.error) for call in calls]
+
+
+def summarize(calls: list[tuple[str, float, str | None]], elapsed: float) -> dict[str, t.Any]:
+    by_method: dict[str, list[tuple[float, str | None]]] = collections.defaultdict(list)
+    for method, seconds, error in calls:
+        by_method[method].append((seconds, error))
+
+    def stats(samples: list[tuple[float, str | None]]) -> dict[str, t.Any]:
+        seconds = sorted(s for s, _ in samples)
+        errors = collections.Counter(e for _, e in samples if e is not None)
+        cuts = statistics.quantiles(seconds, n=1000, method='inclusive') if len(seconds) > 1 else seconds * 999
+        return {
+            'calls': len(samples),
+            'throughput': len(samples) / elapsed,
+            'errors': sum(errors.values()),
+            'error_rate': sum(errors.values()) / len(samples),
+            'error_kinds': dict(errors.most_common()),
+            'p50_ms': cuts[499] * 1000,
+            'p90_ms': cuts[899] * 1000,
+            'p99_ms': cuts[989] * 1000,
+            'p999_ms': cuts[998] * 1000,
+            'max_ms': seconds[-1] * 1000,
+        }
+
+    return {
+        'total': stats([(s, e) for _, s, e in calls]) if calls else {'calls': 0},
+        'methods': {method: stats(samples) for method, samples in sorted(by_method.items())},
+    }
+
+
+def run_step(step: Step, fixtures: Fixtures, processes: int) -> dict[str, t.Any]:
+    rate = step.value / processes
+    if processes == 1:
+        calls = run_worker(step, fixtures, rate)
+    else:
+        jobs = [
+            (replace(step, seed=step.seed + n * 1000), part, rate)
+            for n, part in enumerate(fixtures.partition(processes))
+        ]
+        with multiprocessing.get_context('spawn').Pool(processes) as pool:
+            calls = [call for calls in pool.starmap(run_worker, jobs) for call in calls]
+    summary = summarize(calls, step.duration)
+    total = summary['total']
+    sys.stderr.write(
+        f'{step.mode} {step.value:g}: {total.get("throughput", 0):.1f} calls/s, '
+        f'{total.get("error_rate", 0):.2%} errors, p99 {total.get("p99_ms", 0):.1f} ms\n'
+    )
+    return {'mode': step.mode, 'value': step.value, 'processes': processes, 'users': step.users, **summary}
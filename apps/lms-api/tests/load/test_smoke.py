@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+import typing as t
+from pathlib import Path
+import datetime
+import threading
+
+import pytest
+from werkzeug.serving import make_server
+
+from lms.app import create_app
+from lms.app.extensions import db
+from tests.unit.conftest import Config
+from lms.infrastructure.database.db import init_db
+from lms.infrastructure.database.seeding import SeedOptions, seed
+
+from .__main__ import main
+
+
+@pytest.fixture
+def server(tmp_path: Path) -> t.Generator[tuple[str, str]]:
+    database_url = f'sqlite:///{tmp_path / "load.db"}'
+    app = create_app(type('LoadConfig', (Config,), {'SQLALCHEMY_DATABASE_URI': database_url}))
+    init_db(app)
+    with app.app_context():
+        seed(db.session, SeedOptions(branches=2, items=50, patrons=40, as_of=datetime.date.today()))
+    server = make_server('127.0.0.1', 0, app, threaded=True)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f'http://127.0.0.1:{server.server_port}', database_url
+    server.shutdown()
+    thread.join()
+
+
+@pytest.mark.parametrize(('mode', 'step'), [('closed', '2'), ('open', '20')])
+def test_load_report(server: tuple[str, str], mode: str, step: str) -> None:
+    url, database_url = server
+    args = ['--url', url, '--database-url', database_url, '--processes', '1', '--users', '4', '--duration', '1']
+    args += ['--mode', mode, '--steps', step, '--mix', 'browse=2,checkout=2,return=2,hold=1,fine=1']
+
+    report = main(args)
+
+    [result] = report['steps']
+    assert result['mode'] == mode
+    assert result['total']['calls'] > 0
+    assert result['total']['errors'] == 0, result['total']['error_kinds']
+    assert {'Items.get', 'Loans.checkout_copy'} <= set(result['methods'])
+    for stats in result['methods'].values():
+        assert stats['p50_ms'] <= stats['p99_ms'] <= stats['max_ms']
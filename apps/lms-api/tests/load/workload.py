@@ -0,0 +1,257 @@
+from __future__ import annotations
+
+import json
+import time
+import uuid
+import queue
+import random
+import typing as t
+import itertools
+import threading
+import collections
+from dataclasses import field, dataclass
+import http.client
+from urllib.parse import urlsplit
+
+import sqlalchemy as sa
+import sqlalchemy.orm as sa_orm
+
+from lms.infrastructure.database.models.patrons import FineModel, FineStatus, PatronModel, PatronStatus
+from lms.infrastructure.database.models.catalogs import CopyModel, ItemModel, CopyStatus
+from lms.infrastructure.database.models.circulations import HoldModel, LoanModel, HoldStatus
+from lms.infrastructure.database.models.organizations import StaffModel
+
+OPERATIONS = ('browse', 'checkout', 'return', 'hold', 'fine')
+DEFAULT_MIX = {'browse': 60, 'checkout': 15, 'return': 15, 'hold': 7, 'fine': 3}
+
+BLUEPRINTS = {
+    'Items': 'catalogs',
+    'Copies': 'catalogs',
+    'Loans': 'circulations',
+    'Holds': 'circulations',
+    'Fines': 'patrons',
+}
+
+
+@dataclass
+class Fixtures:
+    """Ids a worker process drives the API with; copies are free of holds and held items have no such copies."""
+
+    staff: list[str] = field(default_factory=list)
+    patrons: list[str] = field(default_factory=list)
+    copies: list[str] = field(default_factory=list)
+    items: list[str] = field(default_factory=list)
+    fines: list[str] = field(default_factory=list)
+
+    @classmethod
+    def load(cls, session: sa_orm.Session, *, patrons: int, copies: int, items: int, fines: int) -> Fixtures:
+        active_loan = sa.select(LoanModel.id).where(
+            LoanModel.patron_id == PatronModel.id, LoanModel.return_date.is_(None)
+        )
+        pending_hold = sa.select(HoldModel.id).where(
+            HoldModel.patron_id == PatronModel.id, HoldModel.status == HoldStatus.PENDING
+        )
+        item_hold = sa.select(HoldModel.id).where(
+            HoldModel.item_id == CopyModel.item_id, HoldModel.status == HoldStatus.PENDING
+        )
+        copy_rows = session.execute(
+            sa.select(CopyModel.id, CopyModel.item_id)
+            .where(CopyModel.status == CopyStatus.AVAILABLE, ~item_hold.exists())
+            .order_by(CopyModel.id)
+            .limit(copies)
+        ).all()
+        # Holds go to other items, so returning a checked out copy never readies a hold and takes it out of the pool.
+        lent_items = {item_id for _, item_id in copy_rows}
+        item_ids = session.scalars(sa.select(ItemModel.id).order_by(ItemModel.id).limit(items + len(lent_items)))
+        return cls(
+            staff=[str(s) for s in session.scalars(sa.select(StaffModel.id).order_by(StaffModel.id))],
+            patrons=[
+                str(p)
+                for p in session.scalars(
+                    sa.select(PatronModel.id)
+                    .where(PatronModel.status == PatronStatus.ACTIVE, ~active_loan.exists(), ~pending_hold.exists())
+                    .order_by(PatronModel.id)
+                    .limit(patrons)
+                )
+            ],
+            copies=[str(copy_id) for copy_id, _ in copy_rows],
+            items=[str(i) for i in item_ids if i not in lent_items][:items],
+            fines=[
+                str(f)
+                for f in session.scalars(
+                    sa.select(FineModel.id)
+                    .where(FineModel.status.in_([FineStatus.CREATED, FineStatus.UNPAID]))
+                    .order_by(FineModel.id)
+                    .limit(fines)
+                )
+            ],
+        )
+
+    def partition(self, count: int) -> list[Fixtures]:
+        """Splits patrons, copies and fines between ``count`` workers so no two of them contend for the same rows."""
+        return [
+            Fixtures(
+                staff=self.staff,
+                patrons=self.patrons[n::count],
+                copies=self.copies[n::count],
+                items=self.items,
+                fines=self.fines[n::count],
+            )
+            for n in range(count)
+        ]
+
+
+@dataclass
+class Call:
+    method: str
+    seconds: float
+    error: str | None
+
+
+class Client:
+    """Posts JSON-RPC requests over one persistent connection; a closed connection is reopened by the next request."""
+
+    def __init__(self, url: str, timeout: float) -> None:
+        parts = urlsplit(url)
+        connection = http.client.HTTPSConnection if parts.scheme == 'https' else http.client.HTTPConnection
+        self.connection = connection(parts.netloc, timeout=timeout)
+        self.prefix = parts.path.rstrip('/')
+
+    def call(self, method: str, params: dict[str, t.Any]) -> tuple[t.Any, str | None]:
+        path = f'{self.prefix}/api/{BLUEPRINTS[method.partition(".")[0]]}'
+        body = json.dumps({'jsonrpc': '2.0', 'method': method, 'params': params, 'id': str(uuid.uuid4())})
+        try:
+            self.connection.request('POST', path, body, {'Content-Type': 'application/json'})
+            response = self.connection.getresponse()
+            payload = json.loads(response.read() or b'null')
+        except (OSError, http.client.HTTPException, ValueError) as e:
+            self.connection.close()
+            return None, type(e).__name__
+        if isinstance(payload, dict) and 'error' in payload:
+            error = payload['error']
+            data = error.get('data') or {}
+            return None, f'{error.get("code")}:{data.get("code") or data.get("message") or error.get("message")}'
+        if response.status != 200:
+            return None, f'HTTP {response.status}'
+        return payload.get('result'), None
+
+    def close(self) -> None:
+        self.connection.close()
+
+
+@dataclass
+class User:
+    """A patron's state between calls; each user is driven by one thread at a time."""
+
+    patron_id: str
+    loan: tuple[str, str] | None = None
+    hold_id: str | None = None
+
+
+class Workload:
+    """Turns an operation mix into JSON-RPC calls against the fixtures of one worker process.
+
+    Checkout and return alternate per patron, as do placing and cancelling a hold, so a drawn checkout for a patron
+    holding a copy returns it instead; across patrons the two still balance out.
+    """
+
+    def __init__(self, fixtures: Fixtures, mix: dict[str, float], *, seed: int) -> None:
+        self.fixtures = fixtures
+        self.operations = [op for op in OPERATIONS if mix.get(op)]
+        self.cum_weights = list(itertools.accumulate(mix[op] for op in self.operations))
+        self.rng = random.Random(seed)
+        self.users: queue.Queue[User] = queue.Queue()
+        for patron_id in fixtures.patrons:
+            self.users.put(User(patron_id))
+        self.copies = collections.deque(fixtures.copies)
+        self.fines = collections.deque(fixtures.fines)
+        self._lock = threading.Lock()
+
+    def checkout_user(self, timeout: float | None = None) -> User:
+        try:
+            return self.users.get(timeout=timeout)
+        except queue.Empty:
+            raise TimeoutError('No idle patron left; raise --users') from None
+
+    def release_user(self, user: User) -> None:
+        self.users.put(user)
+
+    def next_operation(self) -> str:
+        with self._lock:
+            return self.rng.choices(self.operations, cum_weights=self.cum_weights)[0]
+
+    def run(self, client: Client, user: User, operation: str) -> list[Call]:
+        calls: list[Call] = []
+
+        def call(method: str, params: dict[str, t.Any]) -> dict[str, t.Any] | None:
+            started = time.perf_counter()
+            result, error = client.call(method, params)
+            calls.append(Call(method, time.perf_counter() - started, error))
+            return result if error is None else None
+
+        if operation in ('checkout', 'return'):
+            self._circulate(call, user)
+        elif operation == 'hold':
+            self._hold(call, user)
+        elif operation == 'fine' and (fine_id := self._pop(self.fines)):
+            call('Fines.pay', {'fine_id': fine_id})
+        elif self.rng.random() < 0.2:
+            call('Items.list', {'limit': 20})
+        else:
+            call('Items.get', {'item_id': self.rng.choice(self.fixtures.items)})
+        return calls
+
+    def drain(self, client: Client) -> None:
+        """Returns the copies and cancels the holds still out, so the next run starts from the same state."""
+        for user in list(self.users.queue):
+            if user.loan is not None:
+                self._circulate(lambda method, params: client.call(method, params)[0], user)
+            if user.hold_id is not None:
+                self._hold(lambda method, params: client.call(method, params)[0], user)
+
+    def _circulate(self, call: t.Callable[[str, dict[str, t.Any]], t.Any], user: User) -> None:
+        staff_id = self.rng.choice(self.fixtures.staff)
+        if user.loan is not None:
+            loan_id, copy_id = user.loan
+            user.loan = None
+            if call('Loans.checkin_copy', {'loan_id': loan_id, 'staff_id': staff_id}) is not None:
+                self._push(self.copies, copy_id)
+            return
+        copy_id = self._pop(self.copies)
+        if copy_id is None:
+            return
+        result = call('Loans.checkout_copy', {'patron_id': user.patron_id, 'copy_id': copy_id, 'staff_id': staff_id})
+        if result is None:
+            self._push(self.copies, copy_id)
+        else:
+            user.loan = (result['id'], copy_id)
+
+    def _hold(self, call: t.Callable[[str, dict[str, t.Any]], t.Any], user: User) -> None:
+        if user.hold_id is not None:
+            hold_id, user.hold_id = user.hold_id, None
+            call('Holds.cancel', {'hold_id': hold_id})
+            return
+        result = call('Holds.place', {'patron_id': user.patron_id, 'item_id': self.rng.choice(self.fixtures.items)})
+        if result is not None:
+            user.hold_id = result['id']
+
+    def _pop(self, pool: collections.deque[str]) -> str | None:
+        with self._lock:
+            return pool.popleft() if pool else None
+
+    def _push(self, pool: collections.deque[str], value: str) -> None:
+        with self._lock:
+            pool.append(value)
+
+
+def parse_mix(value: str) -> dict[str, float]:
+    """Parses ``browse=60,checkout=15`` into weights; operations left out are not run."""
+    mix = {}
+    for entry in filter(None, (part.strip() for part in value.split(','))):
+        operation, _, weight = entry.partition('=')
+        if operation not in OPERATIONS:
+            raise ValueError(f'Unknown operation {operation!r}; expected one of {", ".join(OPERATIONS)}')
+        mix[operation] = float(weight)
+    if not any(mix.values()):
+        raise ValueError('The mix needs at least one operation with a positive weight')
+    return mix
@@ -22,11 +22,7 @@ def test_handle_acquisition_order_received_creates_copies(app: Flask) -> None:
     mock_staff_service.get_staff.return_value = mock_staff
 
     # Mock copy creation
-    mock_copy = MagicMock()
-    mock_copy.id = str(uuid.uuid4())
-    mock_copy.item_id = str(uuid.uuid4())
-    mock_copy.barcode = f'BC-{str(uuid.uuid4())}'
-    mock_item_service.add_copy_to_item.return_value = mock_copy
+    mock_item_service.add_copies_to_items.return_value = [MagicMock(), MagicMock(), MagicMock()]
 
     # Inject mocks into container
     mock_container = MagicMock()
@@ -51,22 +47,13 @@ def test_handle_acquisition_order_received_creates_copies(app: Flask) -> None:
     # Verify staff was retrieved
     mock_staff_service.get_staff.assert_called_once_with(event.staff_id)
 
-    # Verify copies were created (2 for item_id_1, 1 for item_id_2)
-    assert mock_item_service.add_copy_to_item.call_count == 3
-
-    # Verify first item copies
-    calls = mock_item_service.add_copy_to_item.call_args_list
-    assert calls[0].kwargs['item_id'] == item_id_1
-    assert calls[0].kwargs['branch_id'] == mock_staff.branch_id
-    assert calls[0].kwargs['acquisition_date'] == event.acquisition_date
-    assert calls[0].kwargs['barcode'].startswith('BC-')
-
-    assert calls[1].kwargs['item_id'] == item_id_1
-    assert calls[1].kwargs['branch_id'] == mock_staff.branch_id
-
-    # Verify second item copy
-    assert calls[2].kwargs['item_id'] == item_id_2
-    assert calls[2].kwargs['branch_id'] == mock_staff.branch_id
+    # Verify all copies were created in one batch (2 for item_id_1, 1 for item_id_2)
+    mock_item_service.add_copies_to_items.assert_called_once()
+    call_kwargs = mock_item_service.add_copies_to_items.call_args.kwargs
+    assert call_kwargs['branch_id'] == mock_staff.branch_id
+    assert call_kwargs['acquisition_date'] == event.acquisition_date
+    assert [item_id for item_id, _ in call_kwargs['item_barcodes']] == [item_id_1, item_id_1, item_id_2]
+    assert all(barcode.startswith('BC-') for _, barcode in call_kwargs['item_barcodes'])
 
 
 def test_handle_acquisition_order_received_single_item_single_quantity(app: Flask) -> None:
@@ -78,9 +65,7 @@ def test_handle_acquisition_order_received_single_item_single_quantity(app: Flas
     mock_staff.branch_id = str(uuid.uuid4())
     mock_staff_service.get_staff.return_value = mock_staff
 
-    mock_copy = MagicMock()
-    mock_copy.id = str(uuid.uuid4())
-    mock_item_service.add_copy_to_item.return_value = mock_copy
+    mock_item_service.add_copies_to_items.return_value = [MagicMock()]
 
     # Inject mocks into container
     mock_container = MagicMock()
@@ -100,8 +85,9 @@ def test_handle_acquisition_order_received_single_item_single_quantity(app: Flas
     handle_acquisition_order_received(event)
 
     # Verify only one copy was created
-    assert mock_item_service.add_copy_to_item.call_count == 1
-    mock_item_service.add_copy_to_item.assert_called_once()
+    mock_item_service.add_copies_to_items.assert_called_once()
+    assert mock_item_service.add_copies_to_items.call_args.kwargs['item_barcodes'][0][0] == item_id
+    assert len(mock_item_service.add_copies_to_items.call_args.kwargs['item_barcodes']) == 1
 
 
 def test_handle_acquisition_order_received_empty_items(app: Flask) -> None:
@@ -129,8 +115,9 @@ def test_handle_acquisition_order_received_empty_items(app: Flask) -> None:
 
     handle_acquisition_order_received(event)
 
-    # Verify no copies were created
-    mock_item_service.add_copy_to_item.assert_not_called()
+    # Verify no copies were requested
+    mock_item_service.add_copies_to_items.assert_called_once()
+    assert mock_item_service.add_copies_to_items.call_args.kwargs['item_barcodes'] == []
 
 
 def test_handle_acquisition_order_received_generates_unique_barcodes(app: Flask) -> None:
@@ -142,8 +129,7 @@ def test_handle_acquisition_order_received_generates_unique_barcodes(app: Flask)
     mock_staff.branch_id = str(uuid.uuid4())
     mock_staff_service.get_staff.return_value = mock_staff
 
-    mock_copy = MagicMock()
-    mock_item_service.add_copy_to_item.return_value = mock_copy
+    mock_item_service.add_copies_to_items.return_value = []
 
     # Inject mocks into container
     mock_container = MagicMock()
@@ -163,7 +149,7 @@ def test_handle_acquisition_order_received_generates_unique_barcodes(app: Flask)
     handle_acquisition_order_received(event)
 
     # Get all barcodes
-    barcodes = [call.kwargs['barcode'] for call in mock_item_service.add_copy_to_item.call_args_list]
+    barcodes = [barcode for _, barcode in mock_item_service.add_copies_to_items.call_args.kwargs['item_barcodes']]
 
     # Verify all barcodes are unique
     assert len(barcodes) == 3
@@ -178,7 +164,9 @@ def test_handle_acquisition_order_received_generates_unique_barcodes(app: Flask)
 def test_register_handler_subscribes_to_event(mock_event_bus: MagicMock, app: Flask) -> None:
     register_handler(app)
 
-    mock_event_bus.subscribe.assert_called_once_with(AcquisitionOrderReceivedEvent, handle_acquisition_order_received)
+    mock_event_bus.subscribe.assert_called_once_with(
+        AcquisitionOrderReceivedEvent, handle_acquisition_order_received, background=True
+    )
 
 
 def test_handle_acquisition_order_received_uses_correct_acquisition_date(app: Flask) -> None:
@@ -190,8 +178,7 @@ def test_handle_acquisition_order_received_uses_correct_acquisition_date(app: Fl
     mock_staff.branch_id = str(uuid.uuid4())
     mock_staff_service.get_staff.return_value = mock_staff
 
-    mock_copy = MagicMock()
-    mock_item_service.add_copy_to_item.return_value = mock_copy
+    mock_item_service.add_copies_to_items.return_value = []
 
     # Inject mocks into container
     mock_container = MagicMock()
@@ -211,5 +198,5 @@ def test_handle_acquisition_order_received_uses_correct_acquisition_date(app: Fl
     handle_acquisition_order_received(event)
 
     # Verify acquisition date was passed correctly
-    call_kwargs = mock_item_service.add_copy_to_item.call_args.kwargs
+    call_kwargs = mock_item_service.add_copies_to_items.call_args.kwargs
     assert call_kwargs['acquisition_date'] == acquisition_date
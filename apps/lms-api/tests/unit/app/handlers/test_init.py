@@ -5,6 +5,7 @@ from unittest.mock import MagicMock, patch
 from flask import Flask
 
 from lms.app.handlers import register
+from lms.infrastructure.event_bus import BackgroundDispatcher
 
 
 @patch('lms.app.handlers.catalogs.register_handler')
@@ -50,3 +51,34 @@ def test_register_passes_app_to_all_handlers(
     assert mock_orgs_register.call_args[0][0] is app
     assert mock_patrons_register.call_args[0][0] is app
     assert mock_catalogs_register.call_args[0][0] is app
+
+
+def test_register_keeps_background_handlers_inline_by_default(app: Flask) -> None:
+    register(app)
+
+    assert app.extensions['event_bus_dispatcher'] is None
+
+
+@patch('lms.app.handlers.atexit.register')
+@patch('lms.app.handlers.event_bus')
+def test_register_installs_background_dispatcher(
+    mock_event_bus: MagicMock, mock_atexit_register: MagicMock, app: Flask
+) -> None:
+    app.config['EVENT_BUS_WORKERS'] = 2
+
+    register(app)
+
+    dispatcher = app.extensions['event_bus_dispatcher']
+    assert isinstance(dispatcher, BackgroundDispatcher)
+    mock_event_bus.use_dispatcher.assert_called_once_with(dispatcher)
+    mock_atexit_register.assert_called_once_with(dispatcher.shutdown)
+    dispatcher.shutdown()
+
+
+@patch('lms.app.handlers.event_bus')
+def test_register_sets_slow_handler_threshold(mock_event_bus: MagicMock, app: Flask) -> None:
+    app.config['EVENT_BUS_SLOW_HANDLER_SECONDS'] = 0.5
+
+    register(app)
+
+    assert mock_event_bus.metrics.slow_threshold == 0.5
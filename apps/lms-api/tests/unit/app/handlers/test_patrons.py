@@ -135,6 +135,7 @@ def test_register_handler_subscribes_to_all_events(mock_event_bus: MagicMock, ap
 
     # Verify LoanOverdueEvent subscription
     assert calls[0].args == (LoanOverdueEvent, handle_loan_overdue)
+    assert calls[0].kwargs == {}
 
     # Verify LoanMarkedLostEvent subscription
     assert calls[1].args == (LoanMarkedLostEvent, handle_loan_marked_lost)
@@ -1,10 +1,88 @@
 from __future__ import annotations
 
+import uuid
+from pathlib import Path
+
+from flask import Flask
 from flask.testing import FlaskClient
 
+from lms.infrastructure.logging import dropped_records
+from lms.infrastructure.metrics import rpc_metrics
+from lms.infrastructure.event_bus import event_bus
+from lms.infrastructure.profiling import Profiler
+
 
 def test_health(client: FlaskClient) -> None:
     rv = client.get('/monitoring/health')
     assert rv.status_code == 200
     rv_data = rv.get_json()
     assert rv_data == {'status': 'OK'}
+
+
+def test_event_bus_metrics(client: FlaskClient) -> None:
+    def handler(event: object) -> None:
+        pass
+
+    event_bus.metrics.reset()
+    event_bus.metrics.record(object(), handler, 0.01, failed=False)
+
+    rv = client.get('/monitoring/event-bus')
+    assert rv.status_code == 200
+    [stats] = rv.get_json()['handlers']
+    assert stats['event_type'] == 'object'
+    assert stats['count'] == 1
+    assert stats['errors'] == 0
+    assert stats['buckets'][-1] == {'le': '+Inf', 'count': 1}
+    event_bus.metrics.reset()
+
+
+def test_logging_stats(client: FlaskClient) -> None:
+    rv = client.get('/monitoring/logging')
+    assert rv.status_code == 200
+    assert rv.get_json() == {'dropped': dropped_records()}
+
+
+def test_reference_cache_stats(app: Flask, client: FlaskClient) -> None:
+    cache = app.container.reference_cache  # type: ignore
+    cache.get('staff', str(uuid.uuid7()), lambda _: None)
+
+    rv = client.get('/monitoring/reference-cache')
+    assert rv.status_code == 200
+    assert rv.get_json() == {
+        'max_size': cache.max_size,
+        'size': 0,
+        'kinds': {'staff': {'size': 0, 'hits': 0, 'misses': 1, 'evictions': 0, 'invalidations': 0}},
+    }
+
+
+def test_metrics(client: FlaskClient) -> None:
+    rpc_metrics.reset()
+    rpc_metrics.started('Patrons.list')
+    rpc_metrics.finished('Patrons.list', 0.01)
+
+    rv = client.get('/monitoring/metrics')
+    assert rv.status_code == 200
+    assert rv.mimetype == 'text/plain'
+    assert 'lms_rpc_requests_total{method="Patrons.list"} 1' in rv.get_data(as_text=True).splitlines()
+    rpc_metrics.reset()
+
+
+def test_profiles_not_found_when_profiling_is_off(client: FlaskClient) -> None:
+    assert client.get('/monitoring/profiles').status_code == 404
+    assert client.get('/monitoring/profiles/any.prof').status_code == 404
+
+
+def test_profiles(app: Flask, client: FlaskClient, tmp_path: Path) -> None:
+    profiler = app.extensions['profiler'] = Profiler(str(tmp_path), keep=10)
+    with profiler.profile('Patrons.list', 'abc'):
+        pass
+
+    rv = client.get('/monitoring/profiles')
+    assert rv.status_code == 200
+    [profile] = rv.get_json()['profiles']
+    assert profile['method'] == 'Patrons.list'
+    assert profile['request_id'] == 'abc'
+
+    rv = client.get(f'/monitoring/profiles/{profile["name"]}')
+    assert rv.status_code == 200
+    assert len(rv.data) == profile['size']
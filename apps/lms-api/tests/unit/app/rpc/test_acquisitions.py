@@ -4,6 +4,7 @@ import uuid
 
 from flask.testing import FlaskClient
 
+from lms.app.extensions import db
 from tests.unit.factories import (
     ItemFactory,
     StaffFactory,
@@ -11,7 +12,8 @@ from tests.unit.factories import (
     AcquisitionOrderFactory,
     AcquisitionOrderLineFactory,
 )
-from lms.infrastructure.database.models.acquisitions import OrderStatus
+from lms.infrastructure.database.models.catalogs import CopyModel
+from lms.infrastructure.database.models.acquisitions import OrderStatus, AcquisitionOrderLineModel
 
 
 def test_vendor_list_empty(client: FlaskClient) -> None:
@@ -347,6 +349,42 @@ def test_acquisition_order_submit(client: FlaskClient) -> None:
     assert rv_data['result']['status'] == 'submitted'
 
 
+def test_acquisition_order_line_ids_stable_across_saves(client: FlaskClient) -> None:
+    order = AcquisitionOrderFactory()
+    line = AcquisitionOrderLineFactory(order=order)
+    item = ItemFactory(title='New Item')
+
+    rv = client.post(
+        '/api/acquisitions',
+        json={
+            'id': str(uuid.uuid4()),
+            'jsonrpc': '2.0',
+            'method': 'AcquisitionOrders.add_line',
+            'params': {
+                'order_line': {'order_id': str(order.id), 'item_id': str(item.id), 'quantity': 5, 'unit_price': 15.75}
+            },
+        },
+    )
+    assert rv.status_code == 200, rv.data
+    line_ids = [order_line['id'] for order_line in rv.get_json()['result']['order_lines']]
+    assert str(line.id) in line_ids
+    assert len(line_ids) == 2
+
+    rv = client.post(
+        '/api/acquisitions',
+        json={
+            'id': str(uuid.uuid4()),
+            'jsonrpc': '2.0',
+            'method': 'AcquisitionOrders.submit',
+            'params': {'order_id': str(order.id)},
+        },
+    )
+    assert rv.status_code == 200, rv.data
+    db.session.expire_all()
+    stored_ids = {str(line_id) for (line_id,) in db.session.query(AcquisitionOrderLineModel.id).all()}
+    assert stored_ids == set(line_ids)
+
+
 def test_acquisition_order_submit_not_found(client: FlaskClient) -> None:
     fake_id = str(uuid.uuid7())
 
@@ -418,6 +456,25 @@ def test_acquisition_order_receive_line_full(client: FlaskClient) -> None:
     assert order_line['status'] == 'received'
 
 
+def test_acquisition_order_receive_line_full_adds_copies(client: FlaskClient) -> None:
+    order = AcquisitionOrderFactory(status=OrderStatus.SUBMITTED)
+    line = AcquisitionOrderLineFactory(order=order, quantity=25)
+
+    rv = client.post(
+        '/api/acquisitions',
+        json={
+            'id': str(uuid.uuid4()),
+            'jsonrpc': '2.0',
+            'method': 'AcquisitionOrders.receive_line',
+            'params': {'order_id': str(order.id), 'order_line_id': str(line.id), 'received_quantity': 25},
+        },
+    )
+    assert rv.status_code == 200, rv.data
+    copies = db.session.query(CopyModel).filter_by(item_id=line.item_id).all()
+    assert len(copies) == 25
+    assert len({copy.barcode for copy in copies}) == 25
+
+
 def test_acquisition_order_receive_line_partial(client: FlaskClient) -> None:
     order = AcquisitionOrderFactory(status=OrderStatus.SUBMITTED)
     line = AcquisitionOrderLineFactory(order=order, quantity=10)
@@ -266,3 +266,49 @@ def test_item_creation_and_retrieval(client: FlaskClient) -> None:
     assert result['title'] == 'Retrieval Test Book'
     assert result['format'] == 'ebook'
     assert result['description'] == 'A test book for retrieval'
+
+
+def test_copies_get_many_keeps_order_and_reports_missing_ids(client: FlaskClient) -> None:
+    first, second = str(CopyFactory().id), str(CopyFactory().id)
+    missing = str(uuid.uuid7())
+
+    rv = client.post(
+        '/api/catalogs',
+        json={
+            'id': str(uuid.uuid4()),
+            'jsonrpc': '2.0',
+            'method': 'Copies.get_many',
+            'params': {'copy_ids': [second, missing, first, second]},
+        },
+    )
+    assert rv.status_code == 200, rv.data
+    results = rv.get_json()['result']
+    assert [r['id'] for r in results] == [second, missing, first, second]
+    assert [r['result']['id'] for r in results if 'result' in r] == [second, first, second]
+    assert results[1] == {
+        'id': missing,
+        'error': {'code': 'CopyNotFoundError', 'message': f'Copy with id {missing} not found'},
+    }
+
+
+def test_items_get_many_keeps_order_and_reports_missing_ids(client: FlaskClient) -> None:
+    first, second = str(ItemFactory().id), str(ItemFactory().id)
+    missing = str(uuid.uuid7())
+
+    rv = client.post(
+        '/api/catalogs',
+        json={
+            'id': str(uuid.uuid4()),
+            'jsonrpc': '2.0',
+            'method': 'Items.get_many',
+            'params': {'item_ids': [second, missing, first, second]},
+        },
+    )
+    assert rv.status_code == 200, rv.data
+    results = rv.get_json()['result']
+    assert [r['id'] for r in results] == [second, missing, first, second]
+    assert [r['result']['id'] for r in results if 'result' in r] == [second, first, second]
+    assert results[1] == {
+        'id': missing,
+        'error': {'code': 'ItemNotFoundError', 'message': f'Item with id {missing} not found'},
+    }
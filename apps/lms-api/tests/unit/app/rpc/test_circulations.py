@@ -1,10 +1,14 @@
 from __future__ import annotations
 
 import uuid
+import typing as t
 import datetime
+from unittest.mock import patch
 
+from flask import Flask
 from flask.testing import FlaskClient
 
+from lms.app.extensions import db
 from tests.unit.factories import CopyFactory, HoldFactory, ItemFactory, LoanFactory, StaffFactory, PatronFactory
 from lms.infrastructure.database.models.patrons import PatronStatus
 from lms.infrastructure.database.models.catalogs import CopyStatus
@@ -33,6 +37,40 @@ def test_loans_list_with_loans(client: FlaskClient) -> None:
     assert len(rv_data['result']['results']) == 2
 
 
+def test_loans_list_paginated(client: FlaskClient) -> None:
+    loans = sorted((LoanFactory() for _ in range(3)), key=lambda loan: loan.id)
+
+    params: dict[str, t.Any] = {'limit': 2}
+    rv = client.post(
+        '/api/circulations', json={'jsonrpc': '2.0', 'method': 'Loans.list', 'params': params, 'id': str(uuid.uuid4())}
+    )
+    assert rv.status_code == 200, rv.data
+    first_page = rv.get_json()['result']
+    assert first_page['count'] == 2
+    assert [loan['id'] for loan in first_page['results']] == [str(loan.id) for loan in loans[:2]]
+    assert first_page['next_cursor'] is not None
+
+    params = {'limit': 2, 'after': first_page['next_cursor']}
+    rv = client.post(
+        '/api/circulations', json={'jsonrpc': '2.0', 'method': 'Loans.list', 'params': params, 'id': str(uuid.uuid4())}
+    )
+    assert rv.status_code == 200, rv.data
+    last_page = rv.get_json()['result']
+    assert last_page['count'] == 1
+    assert [loan['id'] for loan in last_page['results']] == [str(loans[2].id)]
+    assert last_page.get('next_cursor') is None
+
+
+def test_loans_list_invalid_cursor(client: FlaskClient) -> None:
+    params = {'after': 'not-a-cursor'}
+    rv = client.post(
+        '/api/circulations', json={'jsonrpc': '2.0', 'method': 'Loans.list', 'params': params, 'id': str(uuid.uuid4())}
+    )
+    assert rv.status_code == 500, rv.data
+    rv_data = rv.get_json()
+    assert rv_data['error']['data']['message'] == "Invalid pagination cursor 'not-a-cursor'"
+
+
 def test_loans_checkout_copy_success(client: FlaskClient) -> None:
     patron = PatronFactory()
     copy = CopyFactory(status=CopyStatus.AVAILABLE)
@@ -52,6 +90,37 @@ def test_loans_checkout_copy_success(client: FlaskClient) -> None:
     assert loan['return_date'] is None
 
 
+def test_loans_checkout_copy_ignores_returned_loans(client: FlaskClient) -> None:
+    patron = PatronFactory(status=PatronStatus.ACTIVE)
+    for _ in range(3):
+        LoanFactory(patron=patron, return_date=datetime.date.today() - datetime.timedelta(days=30))
+    copy = CopyFactory(status=CopyStatus.AVAILABLE)
+    staff = StaffFactory()
+
+    params = {'patron_id': str(patron.id), 'copy_id': str(copy.id), 'staff_id': str(staff.id)}
+    rv = client.post(
+        '/api/circulations',
+        json={'id': str(uuid.uuid4()), 'jsonrpc': '2.0', 'method': 'Loans.checkout_copy', 'params': params},
+    )
+    assert rv.status_code == 200, rv.data
+    assert rv.get_json()['result']['patron_id'] == str(patron.id)
+
+
+def test_loans_checkout_copy_patron_has_active_loan(client: FlaskClient) -> None:
+    patron = PatronFactory(status=PatronStatus.ACTIVE)
+    LoanFactory(patron=patron, return_date=None)
+    copy = CopyFactory(status=CopyStatus.AVAILABLE)
+    staff = StaffFactory()
+
+    params = {'patron_id': str(patron.id), 'copy_id': str(copy.id), 'staff_id': str(staff.id)}
+    rv = client.post(
+        '/api/circulations',
+        json={'id': str(uuid.uuid4()), 'jsonrpc': '2.0', 'method': 'Loans.checkout_copy', 'params': params},
+    )
+    assert rv.status_code == 500, rv.data
+    assert 'error' in rv.get_json()
+
+
 def test_loans_checkout_copy_patron_not_found(client: FlaskClient) -> None:
     fake_patron_id = str(uuid.uuid7())
     copy = CopyFactory(status=CopyStatus.AVAILABLE)
@@ -275,6 +344,58 @@ def test_holds_get_not_found(client: FlaskClient) -> None:
     assert 'error' in rv_data
 
 
+def test_holds_position_follows_request_order(client: FlaskClient) -> None:
+    item = ItemFactory()
+    today = datetime.date.today()
+    newest = HoldFactory(item=item, request_date=today)
+    oldest = HoldFactory(item=item, request_date=today - datetime.timedelta(days=2))
+    middle = HoldFactory(item=item, request_date=today - datetime.timedelta(days=1))
+    HoldFactory(item=item, request_date=today - datetime.timedelta(days=3), status=HoldStatus.CANCELLED)
+    HoldFactory(request_date=today - datetime.timedelta(days=3))
+
+    positions = {}
+    for hold in (newest, oldest, middle):
+        params = {'hold_id': str(hold.id)}
+        rv = client.post(
+            '/api/circulations',
+            json={'id': str(uuid.uuid4()), 'jsonrpc': '2.0', 'method': 'Holds.position', 'params': params},
+        )
+        assert rv.status_code == 200, rv.data
+        result = rv.get_json()['result']
+        assert result['item_id'] == str(item.id)
+        assert result['patron_id'] == str(hold.patron_id)
+        positions[hold.id] = result['position']
+
+    assert positions == {oldest.id: 1, middle.id: 2, newest.id: 3}
+
+
+def test_holds_position_not_pending(client: FlaskClient) -> None:
+    hold = HoldFactory(status=HoldStatus.FULFILLED)
+
+    params = {'hold_id': str(hold.id)}
+    rv = client.post(
+        '/api/circulations',
+        json={'id': str(uuid.uuid4()), 'jsonrpc': '2.0', 'method': 'Holds.position', 'params': params},
+    )
+    assert rv.status_code == 500, rv.data
+    assert rv.get_json()['error']['data']['message'] == 'The hold is not waiting in the queue'
+
+
+def test_hold_queue_serves_oldest_hold_first(app: Flask) -> None:
+    item = ItemFactory()
+    copy = CopyFactory(item=item, status=CopyStatus.AVAILABLE)
+    today = datetime.date.today()
+    newer = HoldFactory(item=item, request_date=today)
+    older = HoldFactory(item=item, request_date=today - datetime.timedelta(days=1))
+
+    app.container.hold_service.process_holds_for_returned_copy(copy_id=str(copy.id))  # type: ignore
+
+    db.session.refresh(older)
+    db.session.refresh(newer)
+    assert older.status == HoldStatus.READY
+    assert newer.status == HoldStatus.PENDING
+
+
 def test_holds_place_success(client: FlaskClient) -> None:
     patron = PatronFactory()
     item = ItemFactory()
@@ -349,6 +470,21 @@ def test_holds_pickup_success(client: FlaskClient) -> None:
     assert loan['copy_id'] == str(copy.id)
 
 
+def test_holds_pickup_commits_once(client: FlaskClient) -> None:
+    hold = HoldFactory(status=HoldStatus.PENDING)
+    staff = StaffFactory()
+    copy = CopyFactory(status=CopyStatus.AVAILABLE)
+
+    params = {'hold_id': str(hold.id), 'staff_id': str(staff.id), 'copy_id': str(copy.id)}
+    with patch.object(db.session, 'commit', wraps=db.session.commit) as mock_commit:
+        rv = client.post(
+            '/api/circulations',
+            json={'id': str(uuid.uuid4()), 'jsonrpc': '2.0', 'method': 'Holds.pickup', 'params': params},
+        )
+    assert rv.status_code == 200, rv.data
+    mock_commit.assert_called_once()
+
+
 def test_holds_pickup_hold_not_found(client: FlaskClient) -> None:
     fake_hold_id = str(uuid.uuid7())
     staff = StaffFactory()
@@ -511,3 +647,49 @@ def test_damaged_and_lost_copy_handling(client: FlaskClient) -> None:
     )
     assert rv.status_code == 200
     assert rv.get_json()['result']['count'] == 2
+
+
+def test_loans_get_many_keeps_order_and_reports_missing_ids(client: FlaskClient) -> None:
+    first, second = str(LoanFactory().id), str(LoanFactory().id)
+    missing = str(uuid.uuid7())
+
+    rv = client.post(
+        '/api/circulations',
+        json={
+            'id': str(uuid.uuid4()),
+            'jsonrpc': '2.0',
+            'method': 'Loans.get_many',
+            'params': {'loan_ids': [second, missing, first, second]},
+        },
+    )
+    assert rv.status_code == 200, rv.data
+    results = rv.get_json()['result']
+    assert [r['id'] for r in results] == [second, missing, first, second]
+    assert [r['result']['id'] for r in results if 'result' in r] == [second, first, second]
+    assert results[1] == {
+        'id': missing,
+        'error': {'code': 'LoanNotFoundError', 'message': f'Loan with id {missing} not found'},
+    }
+
+
+def test_holds_get_many_keeps_order_and_reports_missing_ids(client: FlaskClient) -> None:
+    first, second = str(HoldFactory().id), str(HoldFactory().id)
+    missing = str(uuid.uuid7())
+
+    rv = client.post(
+        '/api/circulations',
+        json={
+            'id': str(uuid.uuid4()),
+            'jsonrpc': '2.0',
+            'method': 'Holds.get_many',
+            'params': {'hold_ids': [second, missing, first, second]},
+        },
+    )
+    assert rv.status_code == 200, rv.data
+    results = rv.get_json()['result']
+    assert [r['id'] for r in results] == [second, missing, first, second]
+    assert [r['result']['id'] for r in results if 'result' in r] == [second, first, second]
+    assert results[1] == {
+        'id': missing,
+        'error': {'code': 'HoldNotFoundError', 'message': f'Hold with id {missing} not found'},
+    }
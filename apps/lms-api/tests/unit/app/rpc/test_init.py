@@ -0,0 +1,231 @@
+from __future__ import annotations
+
+import time
+import uuid
+import typing as t
+from pathlib import Path
+import threading
+from concurrent import futures
+from unittest.mock import patch
+
+from flask import Flask
+from flask.testing import FlaskClient
+
+import pytest
+
+from lms.app.rpc import patrons, add_query_headers
+from lms.app.extensions import db
+from lms.app.services.patrons import FineService, PatronService
+from lms.app.exceptions.patrons import PatronNotFoundError
+from lms.infrastructure.metrics import rpc_metrics
+from lms.infrastructure.profiling import Profiler
+
+
+def call(client: FlaskClient, path: str, method: str, params: dict[str, str]) -> None:
+    client.post(path, json={'jsonrpc': '2.0', 'method': method, 'params': params, 'id': str(uuid.uuid4())})
+
+
+def test_rpc_calls_are_metered_per_method(client: FlaskClient) -> None:
+    rpc_metrics.reset()
+
+    call(client, '/api/patrons', 'Patrons.list', {})
+    call(client, '/api/patrons', 'Patrons.get', {'patron_id': str(uuid.uuid4())})
+
+    methods = rpc_metrics.collect()
+    assert methods['Patrons.list'].count == 1
+    assert methods['Patrons.list'].errors == {}
+    assert methods['Patrons.get'].count == 1
+    assert methods['Patrons.get'].errors == {'PatronNotFoundError': 1}
+    assert methods['Patrons.get'].in_flight == 0
+    rpc_metrics.reset()
+
+
+def test_unknown_rpc_methods_are_not_metered(client: FlaskClient) -> None:
+    rpc_metrics.reset()
+
+    call(client, '/api/patrons', 'Patrons.nope', {})
+
+    assert rpc_metrics.collect() == {}
+
+
+def test_rpc_calls_record_their_queries(client: FlaskClient) -> None:
+    rpc_metrics.reset()
+
+    call(client, '/api/patrons', 'Patrons.list', {})
+
+    assert rpc_metrics.collect()['Patrons.list'].queries == 1
+    rpc_metrics.reset()
+
+
+def test_query_debug_headers(app: Flask, client: FlaskClient) -> None:
+    app.config['QUERY_DEBUG_HEADERS'] = True
+    app.after_request(add_query_headers)
+
+    rv = client.post(
+        '/api/patrons', json={'jsonrpc': '2.0', 'method': 'Patrons.list', 'params': {}, 'id': str(uuid.uuid4())}
+    )
+
+    assert rv.headers['X-Query-Count'] == '1'
+    assert rv.headers['X-Query-Repeated'] == '0'
+    assert float(rv.headers['X-Query-Time-Ms']) >= 0
+
+
+def test_query_budget_logs_when_exceeded(app: Flask, client: FlaskClient) -> None:
+    app.config['QUERY_BUDGETS'] = {'Patrons.list': 0}
+
+    with patch('lms.app.rpc.logger') as mock_logger:
+        call(client, '/api/patrons', 'Patrons.list', {})
+
+    mock_logger.warning.assert_called_once()
+
+
+def test_query_budget_fails_the_call_when_configured(app: Flask, client: FlaskClient) -> None:
+    app.config['QUERY_BUDGET'] = 0
+    app.config['QUERY_BUDGET_ACTION'] = 'raise'
+
+    rv = client.post(
+        '/api/patrons', json={'jsonrpc': '2.0', 'method': 'Patrons.list', 'params': {}, 'id': str(uuid.uuid4())}
+    )
+
+    assert rv.status_code == 500
+    assert rv.get_json()['error']['data'] == {'message': 'Patrons.list ran 1 queries, over its budget of 0'}
+
+
+def test_profile_header_profiles_the_call(app: Flask, client: FlaskClient, tmp_path: Path) -> None:
+    app.extensions['profiler'] = Profiler(str(tmp_path), keep=10)
+
+    call(client, '/api/patrons', 'Patrons.list', {})
+    assert app.extensions['profiler'].profiles() == []
+
+    client.post(
+        '/api/patrons',
+        json={'jsonrpc': '2.0', 'method': 'Patrons.list', 'params': {}, 'id': 'profiled'},
+        headers={'X-Profile': '1'},
+    )
+    [profile] = app.extensions['profiler'].profiles()
+    assert profile['method'] == 'Patrons.list'
+    assert profile['request_id'] == 'profiled'
+
+
+def test_profile_header_must_match_the_secret(app: Flask, client: FlaskClient, tmp_path: Path) -> None:
+    app.extensions['profiler'] = Profiler(str(tmp_path), keep=10)
+    app.config['PROFILE_SECRET'] = 's3cret'
+
+    client.post(
+        '/api/patrons',
+        json={'jsonrpc': '2.0', 'method': 'Patrons.list', 'params': {}, 'id': '1'},
+        headers={'X-Profile': 'guess'},
+    )
+    assert app.extensions['profiler'].profiles() == []
+
+    client.post(
+        '/api/patrons',
+        json={'jsonrpc': '2.0', 'method': 'Patrons.list', 'params': {}, 'id': '2'},
+        headers={'X-Profile': 's3cret'},
+    )
+    assert len(app.extensions['profiler'].profiles()) == 1
+
+
+def test_profile_sample_rate(app: Flask, client: FlaskClient, tmp_path: Path) -> None:
+    app.extensions['profiler'] = Profiler(str(tmp_path), keep=10)
+    app.config['PROFILE_SAMPLE_RATE'] = 1.0
+
+    call(client, '/api/patrons', 'Patrons.list', {})
+
+    assert len(app.extensions['profiler'].profiles()) == 1
+
+
+@pytest.fixture
+def batch_executor(app: Flask) -> t.Generator[futures.ThreadPoolExecutor]:
+    with futures.ThreadPoolExecutor(max_workers=4) as executor:
+        app.extensions['rpc_batch_executor'] = executor
+        yield executor
+    app.extensions['rpc_batch_executor'] = None
+
+
+def batch(client: FlaskClient, path: str, *calls: tuple[str, dict[str, str]]) -> list[dict[str, t.Any]]:
+    payload = [
+        {'jsonrpc': '2.0', 'method': method, 'params': params, 'id': n} for n, (method, params) in enumerate(calls)
+    ]
+    rv = client.post(path, json=payload)
+    assert rv.status_code == 200, rv.data
+    return rv.get_json()
+
+
+def test_read_only_batch_calls_run_side_by_side(
+    client: FlaskClient, batch_executor: futures.ThreadPoolExecutor
+) -> None:
+    # Both calls have to be inside their read at the same time to get past the barrier.
+    barrier = threading.Barrier(2, timeout=5)
+    sessions = []
+
+    def read(self: object, **kwargs: t.Any) -> list[t.Any]:  # noqa: ANN401
+        sessions.append(db.session())
+        barrier.wait()
+        return []
+
+    with patch.object(PatronService, 'find_all_patrons', read), patch.object(FineService, 'find_all_fines', read):
+        responses = batch(client, '/api/patrons', ('Patrons.list', {}), ('Fines.list', {}))
+
+    assert [(r['id'], r['result']['count']) for r in responses] == [(0, 0), (1, 0)]
+    assert sessions[0] is not sessions[1]
+
+
+def test_writes_in_a_batch_keep_their_place(client: FlaskClient, batch_executor: futures.ThreadPoolExecutor) -> None:
+    calls = []
+
+    def read_patrons(self: object, **kwargs: t.Any) -> list[t.Any]:  # noqa: ANN401
+        time.sleep(0.05)
+        calls.append('Patrons.list')
+        return []
+
+    def activate(self: object, patron_id: str) -> None:
+        calls.append('Patrons.activate')
+        raise PatronNotFoundError
+
+    def read_fines(self: object, **kwargs: t.Any) -> list[t.Any]:  # noqa: ANN401
+        calls.append('Fines.list')
+        return []
+
+    with (
+        patch.object(PatronService, 'find_all_patrons', read_patrons),
+        patch.object(PatronService, 'activate_patron', activate),
+        patch.object(FineService, 'find_all_fines', read_fines),
+    ):
+        responses = batch(
+            client,
+            '/api/patrons',
+            ('Patrons.list', {}),
+            ('Patrons.activate', {'patron_id': str(uuid.uuid7())}),
+            ('Fines.list', {}),
+            ('Patrons.list', {}),
+        )
+
+    # The write waits for the read sent before it; the two reads sent after it start once it is done.
+    assert calls[:2] == ['Patrons.list', 'Patrons.activate']
+    assert sorted(calls[2:]) == ['Fines.list', 'Patrons.list']
+    assert [r['id'] for r in responses] == [0, 1, 2, 3]
+    assert responses[1]['error']['data']['code'] == 'PatronNotFoundError'
+
+
+def test_batches_run_in_order_without_an_executor(client: FlaskClient) -> None:
+    threads = []
+
+    def read(self: object, **kwargs: t.Any) -> list[t.Any]:  # noqa: ANN401
+        threads.append(threading.current_thread())
+        return []
+
+    with patch.object(PatronService, 'find_all_patrons', read), patch.object(FineService, 'find_all_fines', read):
+        responses = batch(client, '/api/patrons', ('Patrons.list', {}), ('Fines.list', {}))
+
+    assert [r['id'] for r in responses] == [0, 1]
+    assert threads == [threading.current_thread()] * 2
+
+
+def test_read_only_methods_are_annotated(app: Flask) -> None:
+    site = patrons.jsonrpc_bp.get_jsonrpc_site()
+
+    assert site.is_read_only({'method': 'Patrons.get_many'})
+    assert not site.is_read_only({'method': 'Patrons.activate'})
+    assert not site.is_read_only({'method': ['Patrons.list']})
+    assert not site.is_read_only('Patrons.list')
@@ -522,3 +522,49 @@ def test_staff_inactivate_not_found(client: FlaskClient) -> None:
     assert rv.status_code == 500, rv.data
     rv_data = rv.get_json()
     assert 'error' in rv_data
+
+
+def test_branches_get_many_keeps_order_and_reports_missing_ids(client: FlaskClient) -> None:
+    first, second = str(BranchFactory().id), str(BranchFactory().id)
+    missing = str(uuid.uuid7())
+
+    rv = client.post(
+        '/api/organizations',
+        json={
+            'id': str(uuid.uuid4()),
+            'jsonrpc': '2.0',
+            'method': 'Branches.get_many',
+            'params': {'branch_ids': [second, missing, first, second]},
+        },
+    )
+    assert rv.status_code == 200, rv.data
+    results = rv.get_json()['result']
+    assert [r['id'] for r in results] == [second, missing, first, second]
+    assert [r['result']['id'] for r in results if 'result' in r] == [second, first, second]
+    assert results[1] == {
+        'id': missing,
+        'error': {'code': 'BranchNotFoundError', 'message': f'Branch with id {missing} not found'},
+    }
+
+
+def test_staff_get_many_keeps_order_and_reports_missing_ids(client: FlaskClient) -> None:
+    first, second = str(StaffFactory().id), str(StaffFactory().id)
+    missing = str(uuid.uuid7())
+
+    rv = client.post(
+        '/api/organizations',
+        json={
+            'id': str(uuid.uuid4()),
+            'jsonrpc': '2.0',
+            'method': 'Staff.get_many',
+            'params': {'staff_ids': [second, missing, first, second]},
+        },
+    )
+    assert rv.status_code == 200, rv.data
+    results = rv.get_json()['result']
+    assert [r['id'] for r in results] == [second, missing, first, second]
+    assert [r['result']['id'] for r in results if 'result' in r] == [second, first, second]
+    assert results[1] == {
+        'id': missing,
+        'error': {'code': 'StaffNotFoundError', 'message': f'Staff with id {missing} not found'},
+    }
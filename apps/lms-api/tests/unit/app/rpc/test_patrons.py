@@ -631,3 +631,62 @@ def test_multiple_fines_for_single_patron(client: FlaskClient) -> None:
     )
     assert rv.status_code == 200, rv.data
     assert rv.get_json()['result']['status'] == FineStatus.UNPAID.value
+
+
+def test_patrons_get_many_keeps_order_and_reports_missing_ids(client: FlaskClient) -> None:
+    first, second = str(PatronFactory().id), str(PatronFactory().id)
+    missing = str(uuid.uuid7())
+
+    rv = client.post(
+        '/api/patrons',
+        json={
+            'id': str(uuid.uuid4()),
+            'jsonrpc': '2.0',
+            'method': 'Patrons.get_many',
+            'params': {'patron_ids': [second, missing, first, second]},
+        },
+    )
+    assert rv.status_code == 200, rv.data
+    results = rv.get_json()['result']
+    assert [r['id'] for r in results] == [second, missing, first, second]
+    assert [r['result']['id'] for r in results if 'result' in r] == [second, first, second]
+    assert results[1] == {
+        'id': missing,
+        'error': {'code': 'PatronNotFoundError', 'message': f'Patron with id {missing} not found'},
+    }
+
+
+def test_fines_get_many_keeps_order_and_reports_missing_ids(client: FlaskClient) -> None:
+    first, second = str(FineFactory().id), str(FineFactory().id)
+    missing = str(uuid.uuid7())
+
+    rv = client.post(
+        '/api/patrons',
+        json={
+            'id': str(uuid.uuid4()),
+            'jsonrpc': '2.0',
+            'method': 'Fines.get_many',
+            'params': {'fine_ids': [second, missing, first, second]},
+        },
+    )
+    assert rv.status_code == 200, rv.data
+    results = rv.get_json()['result']
+    assert [r['id'] for r in results] == [second, missing, first, second]
+    assert [r['result']['id'] for r in results if 'result' in r] == [second, first, second]
+    assert results[1] == {
+        'id': missing,
+        'error': {'code': 'FineNotFoundError', 'message': f'Fine with id {missing} not found'},
+    }
+
+
+def test_patrons_get_many_limits_the_number_of_ids(client: FlaskClient) -> None:
+    rv = client.post(
+        '/api/patrons',
+        json={
+            'id': str(uuid.uuid4()),
+            'jsonrpc': '2.0',
+            'method': 'Patrons.get_many',
+            'params': {'patron_ids': [str(uuid.uuid7()) for _ in range(501)]},
+        },
+    )
+    assert rv.status_code == 400, rv.data
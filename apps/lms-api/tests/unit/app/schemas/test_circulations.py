@@ -1,8 +1,17 @@
 from __future__ import annotations
 
+import pytest
+from pydantic import ValidationError
 
-def test_circulations_module_exists() -> None:
-    from lms.app.schemas import circulations  # noqa: F401
+from lms.app.schemas.circulations import HoldPosition
 
-    # Module exists but contains no schemas yet
-    assert True
+
+def test_hold_position() -> None:
+    position = HoldPosition(hold_id='hold1', item_id='item1', patron_id='patron1', position=1)
+
+    assert position.position == 1
+
+
+def test_hold_position_starts_at_one() -> None:
+    with pytest.raises(ValidationError):
+        HoldPosition(hold_id='hold1', item_id='item1', patron_id='patron1', position=0)
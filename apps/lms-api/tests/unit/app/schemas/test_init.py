@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+import uuid
+
+import pytest
+
+from lms.app.schemas import Page, decode_cursor, encode_cursor
+from lms.app.exceptions import InvalidCursorError
+from lms.domain.organizations.entities import Branch
+
+
+def test_cursor_round_trip() -> None:
+    entity_id = str(uuid.uuid7())
+    cursor = encode_cursor(entity_id)
+    assert '=' not in cursor
+    assert decode_cursor(cursor) == entity_id
+
+
+def test_decode_cursor_none() -> None:
+    assert decode_cursor(None) is None
+
+
+def test_decode_cursor_invalid() -> None:
+    with pytest.raises(InvalidCursorError):
+        decode_cursor('not-a-cursor')
+
+
+def test_page_paginate() -> None:
+    branches = [Branch(id=str(uuid.uuid7()), name=f'Branch {i}') for i in range(5)]
+
+    def find_all(*, limit: int, after: str | None = None) -> list[Branch]:
+        start = 0 if after is None else [b.id for b in branches].index(after) + 1
+        return branches[start : start + limit]
+
+    first = Page[Branch].paginate(find_all, limit=2)
+    assert first.count == 2
+    assert first.results == branches[:2]
+    assert first.next_cursor == encode_cursor(str(branches[1].id))
+
+    last = Page[Branch].paginate(find_all, limit=3, after=first.next_cursor)
+    assert last.results == branches[2:]
+    assert last.next_cursor is None
@@ -8,6 +8,7 @@ import pytest
 from lms.app.services.acquisitions import VendorService, AcquisitionOrderService
 from lms.app.exceptions.acquisitions import VendorNotFoundError, AcquisitionOrderNotFoundError
 from lms.domain.acquisitions.entities import Vendor, AcquisitionOrder
+from lms.infrastructure.database.unit_of_work import SQLAlchemyUnitOfWork
 
 
 @pytest.fixture
@@ -26,14 +27,23 @@ def mock_order_line_repository() -> Mock:
 
 
 @pytest.fixture
-def vendor_service(mock_vendor_repository: Mock) -> VendorService:
-    return VendorService(vendor_repository=mock_vendor_repository)
+def unit_of_work() -> SQLAlchemyUnitOfWork:
+    return SQLAlchemyUnitOfWork(MagicMock(info={}))
 
 
 @pytest.fixture
-def order_service(mock_order_repository: Mock, mock_order_line_repository: Mock) -> AcquisitionOrderService:
+def vendor_service(mock_vendor_repository: Mock, unit_of_work: SQLAlchemyUnitOfWork) -> VendorService:
+    return VendorService(vendor_repository=mock_vendor_repository, unit_of_work=unit_of_work)
+
+
+@pytest.fixture
+def order_service(
+    mock_order_repository: Mock, mock_order_line_repository: Mock, unit_of_work: SQLAlchemyUnitOfWork
+) -> AcquisitionOrderService:
     return AcquisitionOrderService(
-        acquisition_order_repository=mock_order_repository, acquisition_order_line_repository=mock_order_line_repository
+        acquisition_order_repository=mock_order_repository,
+        acquisition_order_line_repository=mock_order_line_repository,
+        unit_of_work=unit_of_work,
     )
 
 
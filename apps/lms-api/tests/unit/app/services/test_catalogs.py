@@ -8,6 +8,7 @@ import pytest
 from lms.app.services.catalogs import CopyService, ItemService, AuthorService, CategoryService, PublisherService
 from lms.app.exceptions.catalogs import CopyNotFoundError, ItemNotFoundError, CategoryNotFoundError
 from lms.domain.catalogs.entities import Copy, Item, Author, Category
+from lms.infrastructure.database.unit_of_work import SQLAlchemyUnitOfWork
 
 
 @pytest.fixture
@@ -36,28 +37,37 @@ def mock_publisher_repository() -> Mock:
 
 
 @pytest.fixture
-def copy_service(mock_copy_repository: Mock) -> CopyService:
-    return CopyService(copy_repository=mock_copy_repository)
+def unit_of_work() -> SQLAlchemyUnitOfWork:
+    return SQLAlchemyUnitOfWork(MagicMock(info={}))
 
 
 @pytest.fixture
-def item_service(mock_item_repository: Mock, mock_copy_repository: Mock) -> ItemService:
-    return ItemService(item_repository=mock_item_repository, copy_repository=mock_copy_repository)
+def copy_service(mock_copy_repository: Mock, unit_of_work: SQLAlchemyUnitOfWork) -> CopyService:
+    return CopyService(copy_repository=mock_copy_repository, unit_of_work=unit_of_work)
 
 
 @pytest.fixture
-def author_service(mock_author_repository: Mock) -> AuthorService:
-    return AuthorService(author_repository=mock_author_repository)
+def item_service(
+    mock_item_repository: Mock, mock_copy_repository: Mock, unit_of_work: SQLAlchemyUnitOfWork
+) -> ItemService:
+    return ItemService(
+        item_repository=mock_item_repository, copy_repository=mock_copy_repository, unit_of_work=unit_of_work
+    )
 
 
 @pytest.fixture
-def category_service(mock_category_repository: Mock) -> CategoryService:
-    return CategoryService(category_repository=mock_category_repository)
+def author_service(mock_author_repository: Mock, unit_of_work: SQLAlchemyUnitOfWork) -> AuthorService:
+    return AuthorService(author_repository=mock_author_repository, unit_of_work=unit_of_work)
 
 
 @pytest.fixture
-def publisher_service(mock_publisher_repository: Mock) -> PublisherService:
-    return PublisherService(publisher_repository=mock_publisher_repository)
+def category_service(mock_category_repository: Mock, unit_of_work: SQLAlchemyUnitOfWork) -> CategoryService:
+    return CategoryService(category_repository=mock_category_repository, unit_of_work=unit_of_work)
+
+
+@pytest.fixture
+def publisher_service(mock_publisher_repository: Mock, unit_of_work: SQLAlchemyUnitOfWork) -> PublisherService:
+    return PublisherService(publisher_repository=mock_publisher_repository, unit_of_work=unit_of_work)
 
 
 def test_copy_service_create_copy(copy_service: CopyService, mock_copy_repository: Mock) -> None:
@@ -171,6 +181,44 @@ def test_item_service_add_copy_to_item(
     mock_copy_repository.save.assert_called_once()
 
 
+def test_item_service_add_copies_to_items(
+    item_service: ItemService, mock_item_repository: Mock, mock_copy_repository: Mock
+) -> None:
+    mock_item_repository.get_by_ids.side_effect = lambda item_ids: {i: Mock(spec=Item, id=i) for i in item_ids}
+    mock_copy_repository.bulk_add.side_effect = lambda copies: copies
+
+    result = item_service.add_copies_to_items(
+        item_barcodes=[('item-1', 'BC1'), ('item-1', 'BC2'), ('item-2', 'BC3')],
+        branch_id='branch-456',
+        acquisition_date=datetime.date.today(),
+    )
+
+    assert [(copy.item_id, copy.barcode) for copy in result] == [
+        ('item-1', 'BC1'),
+        ('item-1', 'BC2'),
+        ('item-2', 'BC3'),
+    ]
+    mock_item_repository.get_by_ids.assert_called_once_with(['item-1', 'item-2'])
+    mock_item_repository.get_by_id.assert_not_called()
+    mock_copy_repository.bulk_add.assert_called_once()
+    mock_copy_repository.save.assert_not_called()
+
+
+def test_item_service_add_copies_to_items_item_not_found(
+    item_service: ItemService, mock_item_repository: Mock, mock_copy_repository: Mock
+) -> None:
+    mock_item_repository.get_by_ids.return_value = {'item-1': Mock(spec=Item, id='item-1')}
+
+    with pytest.raises(ItemNotFoundError, match='Item with id item-999 not found'):
+        item_service.add_copies_to_items(
+            item_barcodes=[('item-1', 'BC1'), ('item-999', 'BC2')],
+            branch_id='branch-456',
+            acquisition_date=datetime.date.today(),
+        )
+
+    mock_copy_repository.bulk_add.assert_not_called()
+
+
 def test_item_service_update_item(item_service: ItemService, mock_item_repository: Mock) -> None:
     item = Mock(spec=Item, id='item-123', title='Old Title')
     mock_item_repository.get_by_id.return_value = item
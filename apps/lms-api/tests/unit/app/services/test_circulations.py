@@ -1,16 +1,21 @@
 from __future__ import annotations
 
-from unittest.mock import Mock, MagicMock
+import datetime
+from unittest.mock import Mock, MagicMock, call, patch
 
 import pytest
 
+from lms.app.exceptions import ServiceFailed
 from lms.app.exceptions.patrons import PatronNotFoundError
 from lms.domain.patrons.entities import Patron
 from lms.domain.catalogs.entities import Copy
 from lms.app.services.circulations import HoldService, LoanService
 from lms.app.exceptions.circulations import LoanNotFoundError
-from lms.domain.circulations.entities import Hold, Loan
+from lms.domain.circulations.entities import Hold, Loan, SweepCheckpoint
 from lms.domain.organizations.entities import Staff, Branch
+from lms.infrastructure.database.unit_of_work import SQLAlchemyUnitOfWork
+from lms.infrastructure.database.models.catalogs import CopyStatus
+from lms.infrastructure.database.models.circulations import HoldStatus
 
 
 @pytest.fixture
@@ -48,6 +53,11 @@ def mock_branch_repository() -> Mock:
     return MagicMock()
 
 
+@pytest.fixture
+def mock_sweep_checkpoint_repository() -> Mock:
+    return MagicMock()
+
+
 @pytest.fixture
 def mock_loan_policy_service() -> Mock:
     return MagicMock()
@@ -68,6 +78,11 @@ def mock_patron_holding_service() -> Mock:
     return MagicMock()
 
 
+@pytest.fixture
+def unit_of_work() -> SQLAlchemyUnitOfWork:
+    return SQLAlchemyUnitOfWork(MagicMock(info={}))
+
+
 @pytest.fixture
 def loan_service(
     mock_loan_repository: Mock,
@@ -75,8 +90,10 @@ def loan_service(
     mock_branch_repository: Mock,
     mock_staff_repository: Mock,
     mock_copy_repository: Mock,
+    mock_sweep_checkpoint_repository: Mock,
     mock_loan_policy_service: Mock,
     mock_patron_barring_service: Mock,
+    unit_of_work: SQLAlchemyUnitOfWork,
 ) -> LoanService:
     return LoanService(
         loan_repository=mock_loan_repository,
@@ -84,8 +101,10 @@ def loan_service(
         branch_repository=mock_branch_repository,
         staff_repository=mock_staff_repository,
         copy_repository=mock_copy_repository,
+        sweep_checkpoint_repository=mock_sweep_checkpoint_repository,
         loan_policy_service=mock_loan_policy_service,
         patron_barring_service=mock_patron_barring_service,
+        unit_of_work=unit_of_work,
     )
 
 
@@ -102,6 +121,7 @@ def hold_service(
     mock_hold_policy_service: Mock,
     mock_patron_barring_service: Mock,
     mock_loan_policy_service: Mock,
+    unit_of_work: SQLAlchemyUnitOfWork,
 ) -> HoldService:
     return HoldService(
         hold_repository=mock_hold_repository,
@@ -115,6 +135,7 @@ def hold_service(
         hold_policy_service=mock_hold_policy_service,
         patron_barring_service=mock_patron_barring_service,
         loan_policy_service=mock_loan_policy_service,
+        unit_of_work=unit_of_work,
     )
 
 
@@ -242,6 +263,67 @@ def test_loan_service_renew_loan(
     loan.renew.assert_called_once()
 
 
+def test_loan_service_sweep_overdue_loans(
+    loan_service: LoanService, mock_loan_repository: Mock, mock_sweep_checkpoint_repository: Mock
+) -> None:
+    today = datetime.date(2026, 1, 18)
+    loan1 = Mock(spec=Loan, id='loan-1', due_date=datetime.date(2026, 1, 10))
+    loan2 = Mock(spec=Loan, id='loan-2', due_date=datetime.date(2026, 1, 12))
+    loan3 = Mock(spec=Loan, id='loan-3', due_date=datetime.date(2026, 1, 15))
+    mock_loan_repository.find_overdue.side_effect = [[loan1, loan2], [loan3], []]
+    mock_sweep_checkpoint_repository.get_by_name.return_value = None
+
+    with patch('lms.app.services.circulations.event_bus') as mock_event_bus:
+        swept = loan_service.sweep_overdue_loans(today, chunk_size=2)
+
+    assert swept == 3
+    for loan in (loan1, loan2, loan3):
+        loan.mark_overdue.assert_called_once_with(today)
+    assert mock_event_bus.publish_events.call_count == 2
+    assert mock_loan_repository.find_overdue.call_args_list == [
+        call(today, limit=2, after=None),
+        call(today, limit=2, after=(datetime.date(2026, 1, 12), 'loan-2')),
+        call(today, limit=2, after=(datetime.date(2026, 1, 15), 'loan-3')),
+    ]
+    checkpoint = mock_sweep_checkpoint_repository.save.call_args.args[0]
+    assert checkpoint.position == (datetime.date(2026, 1, 15), 'loan-3')
+
+
+def test_loan_service_sweep_overdue_loans_resumes_from_checkpoint(
+    loan_service: LoanService, mock_loan_repository: Mock, mock_sweep_checkpoint_repository: Mock
+) -> None:
+    today = datetime.date(2026, 1, 18)
+    mock_sweep_checkpoint_repository.get_by_name.return_value = SweepCheckpoint(
+        name='overdue_loans', run_date=today, last_due_date=datetime.date(2026, 1, 12), last_loan_id='loan-2'
+    )
+    mock_loan_repository.find_overdue.return_value = []
+
+    swept = loan_service.sweep_overdue_loans(today)
+
+    assert swept == 0
+    mock_loan_repository.find_overdue.assert_called_once_with(
+        today, limit=500, after=(datetime.date(2026, 1, 12), 'loan-2')
+    )
+    mock_sweep_checkpoint_repository.save.assert_not_called()
+
+
+def test_loan_service_sweep_overdue_loans_restarts_on_new_day(
+    loan_service: LoanService, mock_loan_repository: Mock, mock_sweep_checkpoint_repository: Mock
+) -> None:
+    today = datetime.date(2026, 1, 19)
+    mock_sweep_checkpoint_repository.get_by_name.return_value = SweepCheckpoint(
+        name='overdue_loans',
+        run_date=datetime.date(2026, 1, 18),
+        last_due_date=datetime.date(2026, 1, 12),
+        last_loan_id='loan-2',
+    )
+    mock_loan_repository.find_overdue.return_value = []
+
+    loan_service.sweep_overdue_loans(today)
+
+    mock_loan_repository.find_overdue.assert_called_once_with(today, limit=500, after=None)
+
+
 def test_hold_service_find_all_holds(hold_service: HoldService, mock_hold_repository: Mock) -> None:
     holds = [Mock(spec=Hold), Mock(spec=Hold)]
     mock_hold_repository.find_all.return_value = holds
@@ -249,3 +331,84 @@ def test_hold_service_find_all_holds(hold_service: HoldService, mock_hold_reposi
     result = hold_service.find_all_holds()
 
     assert result == holds
+
+
+def test_hold_service_get_hold_position(hold_service: HoldService, mock_hold_repository: Mock) -> None:
+    hold = Hold(id='hold1', item_id='item1', patron_id='patron1')
+    mock_hold_repository.get_by_id.return_value = hold
+    mock_hold_repository.count_holds_ahead.return_value = 2
+
+    result = hold_service.get_hold_position('hold1')
+
+    assert result == 3
+    mock_hold_repository.count_holds_ahead.assert_called_once_with(hold)
+
+
+def test_hold_service_get_hold_position_not_pending(hold_service: HoldService, mock_hold_repository: Mock) -> None:
+    mock_hold_repository.get_by_id.return_value = Hold(
+        id='hold1', item_id='item1', patron_id='patron1', status=HoldStatus.FULFILLED.value
+    )
+    mock_hold_repository.count_holds_ahead.return_value = 0
+
+    with pytest.raises(ServiceFailed, match='The hold is not waiting in the queue'):
+        hold_service.get_hold_position('hold1')
+
+
+def test_hold_service_sweep_expired_holds(
+    hold_service: HoldService, mock_hold_repository: Mock, mock_copy_repository: Mock
+) -> None:
+    today = datetime.date(2026, 1, 18)
+    hold1 = Mock(spec=Hold, id='hold-1', copy_id='copy-1')
+    hold2 = Mock(spec=Hold, id='hold-2', copy_id=None)
+    hold3 = Mock(spec=Hold, id='hold-3', copy_id='copy-1')
+    hold4 = Mock(spec=Hold, id='hold-4', copy_id='copy-2')
+    hold5 = Mock(spec=Hold, id='hold-5', copy_id='copy-3')
+    hold6 = Mock(spec=Hold, id='hold-6', copy_id='copy-missing')
+    copies = {
+        'copy-1': Copy(id='copy-1', item_id='item-1', branch_id='b1', barcode='1'),
+        'copy-2': Copy(id='copy-2', item_id='item-2', branch_id='b1', barcode='2'),
+        'copy-3': Copy(id='copy-3', item_id='item-3', branch_id='b1', barcode='3', status=CopyStatus.CHECKED_OUT.value),
+    }
+    mock_hold_repository.expire_pending_holds.side_effect = [[hold1, hold2], [hold3, hold4], [hold5, hold6], []]
+    mock_copy_repository.get_by_ids.side_effect = lambda copy_ids: {i: copies[i] for i in copy_ids if i in copies}
+
+    with patch.object(hold_service, '_ready_next_hold') as mock_ready:
+        expired = hold_service.sweep_expired_holds(today, batch_size=2)
+
+    assert expired == 6
+    for hold in (hold1, hold2, hold3, hold4, hold5, hold6):
+        hold.record_expiry.assert_called_once_with()
+    assert mock_hold_repository.expire_pending_holds.call_args_list == [call(today, limit=2)] * 4
+    assert mock_copy_repository.get_by_ids.call_args_list == [
+        call(['copy-1']),
+        call(['copy-1', 'copy-2']),
+        call(['copy-3', 'copy-missing']),
+    ]
+    mock_copy_repository.get_by_id.assert_not_called()
+    assert mock_ready.call_args_list == [call(copies['copy-1']), call(copies['copy-1']), call(copies['copy-2'])]
+
+
+def test_hold_service_sweep_expired_holds_nothing_to_expire(
+    hold_service: HoldService, mock_hold_repository: Mock
+) -> None:
+    mock_hold_repository.expire_pending_holds.return_value = []
+
+    assert hold_service.sweep_expired_holds(datetime.date(2026, 1, 18)) == 0
+    mock_hold_repository.expire_pending_holds.assert_called_once_with(datetime.date(2026, 1, 18), limit=500)
+
+
+def test_hold_service_process_holds_for_returned_copy(
+    hold_service: HoldService, mock_hold_repository: Mock, mock_copy_repository: Mock
+) -> None:
+    copy = Mock(spec=Copy, id='copy1', item_id='item1')
+    mock_copy_repository.get_by_id.return_value = copy
+    next_hold = Hold(id='hold1', item_id='item1', patron_id='patron1')
+    mock_hold_repository.find_next_hold_for_item.return_value = next_hold
+    mock_hold_repository.get_by_id.return_value = next_hold
+    mock_hold_repository.save.side_effect = lambda hold: hold
+
+    hold_service.process_holds_for_returned_copy('copy1')
+
+    mock_hold_repository.find_next_hold_for_item.assert_called_once_with(item_id='item1')
+    mock_hold_repository.find_active_holds_by_item.assert_not_called()
+    assert next_hold.status == HoldStatus.READY.value
@@ -7,6 +7,7 @@ import pytest
 from lms.app.services.organizations import StaffService, BranchService
 from lms.app.exceptions.organizations import StaffNotFoundError, BranchNotFoundError
 from lms.domain.organizations.entities import Staff, Branch
+from lms.infrastructure.database.unit_of_work import SQLAlchemyUnitOfWork
 
 
 @pytest.fixture
@@ -34,20 +35,35 @@ def mock_staff_uniqueness_service() -> Mock:
     return MagicMock()
 
 
+@pytest.fixture
+def unit_of_work() -> SQLAlchemyUnitOfWork:
+    return SQLAlchemyUnitOfWork(MagicMock(info={}))
+
+
 @pytest.fixture
 def branch_service(
-    mock_branch_repository: Mock, mock_branch_uniqueness_service: Mock, mock_branch_assignment_service: Mock
+    mock_branch_repository: Mock,
+    mock_branch_uniqueness_service: Mock,
+    mock_branch_assignment_service: Mock,
+    unit_of_work: SQLAlchemyUnitOfWork,
 ) -> BranchService:
     return BranchService(
         branch_repository=mock_branch_repository,
         branch_uniqueness_service=mock_branch_uniqueness_service,
         branch_assignment_service=mock_branch_assignment_service,
+        unit_of_work=unit_of_work,
     )
 
 
 @pytest.fixture
-def staff_service(mock_staff_repository: Mock, mock_staff_uniqueness_service: Mock) -> StaffService:
-    return StaffService(staff_repository=mock_staff_repository, staff_uniqueness_service=mock_staff_uniqueness_service)
+def staff_service(
+    mock_staff_repository: Mock, mock_staff_uniqueness_service: Mock, unit_of_work: SQLAlchemyUnitOfWork
+) -> StaffService:
+    return StaffService(
+        staff_repository=mock_staff_repository,
+        staff_uniqueness_service=mock_staff_uniqueness_service,
+        unit_of_work=unit_of_work,
+    )
 
 
 def test_branch_service_find_all_branches(branch_service: BranchService, mock_branch_repository: Mock) -> None:
@@ -7,6 +7,7 @@ import pytest
 from lms.app.services.patrons import FineService, PatronService
 from lms.app.exceptions.patrons import FineNotFoundError, PatronNotFoundError
 from lms.domain.patrons.entities import Fine, Patron
+from lms.infrastructure.database.unit_of_work import SQLAlchemyUnitOfWork
 
 
 @pytest.fixture
@@ -34,20 +35,33 @@ def mock_fine_policy_service() -> Mock:
     return MagicMock()
 
 
+@pytest.fixture
+def unit_of_work() -> SQLAlchemyUnitOfWork:
+    return SQLAlchemyUnitOfWork(MagicMock(info={}))
+
+
 @pytest.fixture
 def patron_service(
-    mock_patron_repository: Mock, mock_patron_uniqueness_service: Mock, mock_patron_reinstatement_service: Mock
+    mock_patron_repository: Mock,
+    mock_patron_uniqueness_service: Mock,
+    mock_patron_reinstatement_service: Mock,
+    unit_of_work: SQLAlchemyUnitOfWork,
 ) -> PatronService:
     return PatronService(
         patron_repository=mock_patron_repository,
         patron_uniqueness_service=mock_patron_uniqueness_service,
         patron_reinstatement_service=mock_patron_reinstatement_service,
+        unit_of_work=unit_of_work,
     )
 
 
 @pytest.fixture
-def fine_service(mock_fine_repository: Mock, mock_fine_policy_service: Mock) -> FineService:
-    return FineService(fine_repository=mock_fine_repository, fine_policy_service=mock_fine_policy_service)
+def fine_service(
+    mock_fine_repository: Mock, mock_fine_policy_service: Mock, unit_of_work: SQLAlchemyUnitOfWork
+) -> FineService:
+    return FineService(
+        fine_repository=mock_fine_repository, fine_policy_service=mock_fine_policy_service, unit_of_work=unit_of_work
+    )
 
 
 def test_patron_service_find_all_patrons(patron_service: PatronService, mock_patron_repository: Mock) -> None:
@@ -212,9 +226,38 @@ def test_fine_service_waive_fine(fine_service: FineService, mock_fine_repository
 
 def test_fine_service_process_overdue_loan(fine_service: FineService, mock_fine_repository: Mock) -> None:
     fine = Mock(spec=Fine)
+    mock_fine_repository.find_by_loan_id.return_value = None
     mock_fine_repository.save.return_value = fine
 
     result = fine_service.process_overdue_loan(loan_id='loan-123', patron_id='patron-456', days_late=5)
 
     assert result == fine
+    mock_fine_repository.find_by_loan_id.assert_called_once_with('loan-123')
     mock_fine_repository.save.assert_called_once()
+
+
+def test_fine_service_process_overdue_loan_accrues_outstanding_fine(
+    fine_service: FineService, mock_fine_repository: Mock
+) -> None:
+    fine = Mock(spec=Fine, settled=False)
+    mock_fine_repository.find_by_loan_id.return_value = fine
+    mock_fine_repository.save.return_value = fine
+
+    result = fine_service.process_overdue_loan(loan_id='loan-123', patron_id='patron-456', days_late=6)
+
+    assert result == fine
+    fine.accrue_overdue.assert_called_once_with(days_late=6, fine_policy_service=ANY)
+    mock_fine_repository.save.assert_called_once_with(fine)
+
+
+def test_fine_service_process_overdue_loan_keeps_settled_fine(
+    fine_service: FineService, mock_fine_repository: Mock
+) -> None:
+    fine = Mock(spec=Fine, settled=True)
+    mock_fine_repository.find_by_loan_id.return_value = fine
+
+    result = fine_service.process_overdue_loan(loan_id='loan-123', patron_id='patron-456', days_late=6)
+
+    assert result == fine
+    fine.accrue_overdue.assert_not_called()
+    mock_fine_repository.save.assert_not_called()
@@ -9,6 +9,7 @@ from lms.app.exceptions.serials import SerialNotFoundError
 from lms.app.exceptions.catalogs import ItemNotFoundError
 from lms.domain.serials.entities import Serial
 from lms.domain.catalogs.entities import Item
+from lms.infrastructure.database.unit_of_work import SQLAlchemyUnitOfWork
 
 
 @pytest.fixture
@@ -26,14 +27,23 @@ def mock_item_repository() -> Mock:
     return MagicMock()
 
 
+@pytest.fixture
+def unit_of_work() -> SQLAlchemyUnitOfWork:
+    return SQLAlchemyUnitOfWork(MagicMock(info={}))
+
+
 @pytest.fixture
 def serial_service(
-    mock_serial_repository: Mock, mock_serial_issue_repository: Mock, mock_item_repository: Mock
+    mock_serial_repository: Mock,
+    mock_serial_issue_repository: Mock,
+    mock_item_repository: Mock,
+    unit_of_work: SQLAlchemyUnitOfWork,
 ) -> SerialService:
     return SerialService(
         serial_repository=mock_serial_repository,
         serial_issue_repository=mock_serial_issue_repository,
         item_repository=mock_item_repository,
+        unit_of_work=unit_of_work,
     )
 
 
@@ -0,0 +1,13 @@
+from __future__ import annotations
+
+from unittest.mock import patch
+
+from flask import Flask
+
+
+def test_app_context_teardown_discards_unpublished_events(app: Flask) -> None:
+    with patch('lms.infrastructure.event_bus.event_bus.discard_events') as mock_discard_events:
+        with app.app_context():
+            mock_discard_events.assert_not_called()
+
+        mock_discard_events.assert_called_once_with()
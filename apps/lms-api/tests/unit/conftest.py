@@ -17,6 +17,7 @@ class Config(BaseConfig):
     DEBUG = False
     SECRET_KEY = 'testkey'
     SQLALCHEMY_DATABASE_URI = 'sqlite:///:memory:'
+    REFERENCE_CACHE_PRELOAD = False
 
 
 @pytest.fixture(scope='function')
@@ -25,6 +26,7 @@ def app() -> t.Generator[Flask]:
 
     with app.app_context():
         from lms.infrastructure.database.models import (  # noqa: F401
+            outbox,
             patrons,
             serials,
             catalogs,
@@ -7,7 +7,8 @@ from collections.abc import Iterator
 
 import pytest
 
-from lms.domain.circulations.entities import Hold, Loan
+from lms.domain.circulations.events import LoanOverdueEvent
+from lms.domain.circulations.entities import Hold, Loan, SweepCheckpoint
 from lms.domain.circulations.exceptions import LoanOverdue, HoldNotPending, LoanAlreadyReturned
 from lms.infrastructure.database.models.circulations import HoldStatus
 
@@ -274,6 +275,86 @@ class TestLoan:
         with pytest.raises(LoanOverdue):
             loan.renew(mock_patron, mock_copy, mock_patron_barring_service, mock_loan_policy_service)
 
+    def test_mark_overdue(self, mock_event_bus: MagicMock) -> None:
+        loan = Loan(
+            id='loan1',
+            copy_id='copy1',
+            patron_id='patron1',
+            branch_id='branch1',
+            staff_out_id='staff1',
+            loan_date=datetime.date(2026, 1, 1),
+            due_date=datetime.date(2026, 1, 15),
+        )
+
+        loan.mark_overdue(datetime.date(2026, 1, 18))
+
+        event = mock_event_bus.add_event.call_args.args[0]
+        assert isinstance(event, LoanOverdueEvent)
+        assert (event.loan_id, event.patron_id, event.days_late) == ('loan1', 'patron1', 3)
+
+    def test_mark_overdue_already_returned(self, mock_event_bus: MagicMock) -> None:
+        loan = Loan(
+            id='loan1',
+            copy_id='copy1',
+            patron_id='patron1',
+            branch_id='branch1',
+            staff_out_id='staff1',
+            loan_date=datetime.date(2026, 1, 1),
+            due_date=datetime.date(2026, 1, 15),
+            return_date=datetime.date(2026, 1, 16),
+        )
+
+        with pytest.raises(LoanAlreadyReturned):
+            loan.mark_overdue(datetime.date(2026, 1, 18))
+        mock_event_bus.add_event.assert_not_called()
+
+
+class TestSweepCheckpoint:
+    def test_position_is_none_until_advanced(self) -> None:
+        checkpoint = SweepCheckpoint(name='overdue_loans', run_date=datetime.date(2026, 1, 18))
+
+        assert checkpoint.position is None
+
+    def test_advance(self) -> None:
+        checkpoint = SweepCheckpoint(name='overdue_loans', run_date=datetime.date(2026, 1, 18))
+        loan = Loan(
+            id='loan1',
+            copy_id='copy1',
+            patron_id='patron1',
+            branch_id='branch1',
+            staff_out_id='staff1',
+            due_date=datetime.date(2026, 1, 15),
+        )
+
+        checkpoint.advance(loan)
+
+        assert checkpoint.position == (datetime.date(2026, 1, 15), 'loan1')
+
+    def test_start_same_day_keeps_position(self) -> None:
+        checkpoint = SweepCheckpoint(
+            name='overdue_loans',
+            run_date=datetime.date(2026, 1, 18),
+            last_due_date=datetime.date(2026, 1, 15),
+            last_loan_id='loan1',
+        )
+
+        checkpoint.start(datetime.date(2026, 1, 18))
+
+        assert checkpoint.position == (datetime.date(2026, 1, 15), 'loan1')
+
+    def test_start_new_day_resets_position(self) -> None:
+        checkpoint = SweepCheckpoint(
+            name='overdue_loans',
+            run_date=datetime.date(2026, 1, 18),
+            last_due_date=datetime.date(2026, 1, 15),
+            last_loan_id='loan1',
+        )
+
+        checkpoint.start(datetime.date(2026, 1, 19))
+
+        assert checkpoint.run_date == datetime.date(2026, 1, 19)
+        assert checkpoint.position is None
+
 
 class TestHold:
     def test_create_hold(
@@ -360,6 +441,14 @@ class TestHold:
         assert hold.status == HoldStatus.EXPIRED.value
         mock_event_bus.add_event.assert_called_once()
 
+    def test_record_expiry(self, mock_event_bus: MagicMock) -> None:
+        hold = Hold(id='hold1', item_id='item1', patron_id='patron1', status=HoldStatus.EXPIRED.value)
+
+        hold.record_expiry()
+
+        assert hold.status == HoldStatus.EXPIRED.value
+        mock_event_bus.add_event.assert_called_once()
+
     def test_cancel(self, mock_event_bus: object) -> None:
         hold = Hold(id='hold1', item_id='item1', patron_id='patron1', status=HoldStatus.PENDING.value)
 
@@ -373,3 +462,15 @@ class TestHold:
 
         with pytest.raises(HoldNotPending):
             hold.cancel()
+
+    def test_queue_position(self) -> None:
+        hold = Hold(id='hold1', item_id='item1', patron_id='patron1', status=HoldStatus.PENDING.value)
+
+        assert hold.queue_position(holds_ahead=0) == 1
+        assert hold.queue_position(holds_ahead=4) == 5
+
+    def test_queue_position_not_pending(self) -> None:
+        hold = Hold(id='hold1', item_id='item1', patron_id='patron1', status=HoldStatus.READY.value)
+
+        with pytest.raises(HoldNotPending):
+            hold.queue_position(holds_ahead=0)
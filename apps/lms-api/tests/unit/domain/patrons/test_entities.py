@@ -288,6 +288,25 @@ class TestFine:
         assert fine.status == FineStatus.UNPAID.value
         assert 'Lost fine' in fine.reason
 
+    def test_accrue_overdue(self, mock_event_bus: object, mock_fine_policy_service: Mock) -> None:
+        fine = Fine(
+            id='fine1', patron_id='patron1', loan_id='loan1', amount=Decimal('3.00'), status=FineStatus.UNPAID.value
+        )
+
+        fine.accrue_overdue(days_late=5, fine_policy_service=mock_fine_policy_service)
+
+        assert fine.amount == Decimal('5.00')
+        mock_fine_policy_service.calculate_overdue_fine.assert_called_once_with(days_late=5)
+
+    def test_accrue_overdue_already_paid(self, mock_event_bus: object, mock_fine_policy_service: Mock) -> None:
+        fine = Fine(
+            id='fine1', patron_id='patron1', loan_id='loan1', amount=Decimal('3.00'), status=FineStatus.PAID.value
+        )
+
+        with pytest.raises(FineAlreadyPaid):
+            fine.accrue_overdue(days_late=5, fine_policy_service=mock_fine_policy_service)
+        assert fine.amount == Decimal('3.00')
+
     def test_pay_fine(self, mock_event_bus: object) -> None:
         fine = Fine(
             id='fine1', patron_id='patron1', loan_id='loan1', amount=Decimal('10.00'), status=FineStatus.UNPAID.value
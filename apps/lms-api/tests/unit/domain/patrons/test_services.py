@@ -5,7 +5,7 @@ from collections.abc import Iterator
 import pytest
 
 from lms.domain import DomainNotFound
-from lms.domain.patrons.entities import Patron
+from lms.domain.patrons.entities import PatronEligibility
 from lms.domain.patrons.services import (
     FinePolicyService,
     PatronBarringService,
@@ -14,7 +14,6 @@ from lms.domain.patrons.services import (
     PatronReinstatementService,
 )
 from lms.domain.catalogs.entities import Copy, Item
-from lms.domain.circulations.entities import Hold, Loan
 from lms.infrastructure.database.models.patrons import PatronStatus
 from lms.infrastructure.database.models.catalogs import ItemFormat
 
@@ -45,126 +44,82 @@ class TestPatronUniquenessService:
         mock_patron_repository.exists_by_email.assert_called_once_with('existing@example.com')
 
 
+def _eligibility(status: str = PatronStatus.ACTIVE.value, **kwargs: object) -> PatronEligibility:
+    return PatronEligibility(patron_id='p1', status=status, **kwargs)
+
+
 class TestPatronBarringService:
     @pytest.fixture
     def mock_patron_repository(self) -> Iterator:
         return Mock()
 
     @pytest.fixture
-    def mock_loan_repository(self) -> Iterator:
-        return Mock()
-
-    @pytest.fixture
-    def service(self: Iterator, mock_patron_repository: Iterator, mock_loan_repository: Iterator) -> Iterator:
-        return PatronBarringService(patron_repository=mock_patron_repository, loan_repository=mock_loan_repository)
+    def service(self: Iterator, mock_patron_repository: Iterator) -> Iterator:
+        return PatronBarringService(patron_repository=mock_patron_repository)
 
-    def test_can_borrow_copies_when_active_and_no_loans(
-        self, service: object, mock_patron_repository: object, mock_loan_repository: object
-    ) -> None:
-        mock_patron = Mock(spec=Patron)
-        mock_patron.status = PatronStatus.ACTIVE.value
-        mock_patron_repository.get_by_id.return_value = mock_patron
-        mock_loan_repository.find_by_patron_id.return_value = []
+    def test_can_borrow_copies_when_active_and_no_loans(self, service: object, mock_patron_repository: object) -> None:
+        mock_patron_repository.get_eligibility.return_value = _eligibility()
 
         result = service.can_borrow_copies('p1')
 
         assert result is True
+        mock_patron_repository.get_eligibility.assert_called_once_with('p1')
+        mock_patron_repository.get_by_id.assert_not_called()
 
     def test_can_borrow_copies_when_patron_not_found(self, service: object, mock_patron_repository: object) -> None:
-        mock_patron_repository.get_by_id.return_value = None
+        mock_patron_repository.get_eligibility.return_value = None
 
         result = service.can_borrow_copies('p1')
 
         assert result is False
 
-    def test_can_borrow_copies_when_patron_not_active(
-        self, service: object, mock_patron_repository: object, mock_loan_repository: object
-    ) -> None:
-        mock_patron = Mock(spec=Patron)
-        mock_patron.status = PatronStatus.SUSPENDED.value
-        mock_patron_repository.get_by_id.return_value = mock_patron
-        mock_loan_repository.find_by_patron_id.return_value = []
+    def test_can_borrow_copies_when_patron_not_active(self, service: object, mock_patron_repository: object) -> None:
+        mock_patron_repository.get_eligibility.return_value = _eligibility(PatronStatus.SUSPENDED.value)
 
         result = service.can_borrow_copies('p1')
 
         assert result is False
 
-    def test_can_borrow_copies_when_has_existing_loans(
-        self, service: object, mock_patron_repository: object, mock_loan_repository: object
-    ) -> None:
-        mock_patron = Mock(spec=Patron)
-        mock_patron.status = PatronStatus.ACTIVE.value
-        mock_patron_repository.get_by_id.return_value = mock_patron
-        mock_loan_repository.find_by_patron_id.return_value = [Mock(spec=Loan)]
+    def test_can_borrow_copies_when_has_existing_loans(self, service: object, mock_patron_repository: object) -> None:
+        mock_patron_repository.get_eligibility.return_value = _eligibility(active_loans=1)
 
         result = service.can_borrow_copies('p1')
 
         assert result is False
 
-    def test_can_renew_copy_when_valid(
-        self, service: object, mock_patron_repository: object, mock_loan_repository: object
-    ) -> None:
-        mock_patron = Mock(spec=Patron)
-        mock_patron.status = PatronStatus.ACTIVE.value
-        mock_patron_repository.get_by_id.return_value = mock_patron
-
-        mock_loan = Mock(spec=Loan)
-        mock_loan.copy_id = 'c1'
-        mock_loan_repository.find_by_patron_id.return_value = [mock_loan]
+    def test_can_renew_copy_when_valid(self, service: object, mock_patron_repository: object) -> None:
+        mock_patron_repository.get_eligibility.return_value = _eligibility(active_loans=1, has_copy_on_loan=True)
 
         result = service.can_renew_copy('p1', 'c1')
 
         assert result is True
+        mock_patron_repository.get_eligibility.assert_called_once_with('p1', copy_id='c1')
 
     def test_can_renew_copy_when_patron_not_found(self, service: object, mock_patron_repository: object) -> None:
-        mock_patron_repository.get_by_id.return_value = None
+        mock_patron_repository.get_eligibility.return_value = None
 
         result = service.can_renew_copy('p1', 'c1')
 
         assert result is False
 
-    def test_can_renew_copy_when_loan_not_found(
-        self, service: object, mock_patron_repository: object, mock_loan_repository: object
-    ) -> None:
-        mock_patron = Mock(spec=Patron)
-        mock_patron.status = PatronStatus.ACTIVE.value
-        mock_patron_repository.get_by_id.return_value = mock_patron
-
-        mock_loan = Mock(spec=Loan)
-        mock_loan.copy_id = 'c2'
-        mock_loan_repository.find_by_patron_id.return_value = [mock_loan]
+    def test_can_renew_copy_when_loan_not_found(self, service: object, mock_patron_repository: object) -> None:
+        mock_patron_repository.get_eligibility.return_value = _eligibility(active_loans=1, has_copy_on_loan=False)
 
         result = service.can_renew_copy('p1', 'c1')
 
         assert result is False
 
-    def test_can_renew_copy_when_patron_not_active(
-        self, service: object, mock_patron_repository: object, mock_loan_repository: object
-    ) -> None:
-        mock_patron = Mock(spec=Patron)
-        mock_patron.status = PatronStatus.SUSPENDED.value
-        mock_patron_repository.get_by_id.return_value = mock_patron
-
-        mock_loan = Mock(spec=Loan)
-        mock_loan.copy_id = 'c1'
-        mock_loan_repository.find_by_patron_id.return_value = [mock_loan]
+    def test_can_renew_copy_when_patron_not_active(self, service: object, mock_patron_repository: object) -> None:
+        mock_patron_repository.get_eligibility.return_value = _eligibility(
+            PatronStatus.SUSPENDED.value, active_loans=1, has_copy_on_loan=True
+        )
 
         result = service.can_renew_copy('p1', 'c1')
 
         assert result is False
 
-    def test_can_renew_copy_when_multiple_loans(
-        self, service: object, mock_patron_repository: object, mock_loan_repository: object
-    ) -> None:
-        mock_patron = Mock(spec=Patron)
-        mock_patron.status = PatronStatus.ACTIVE.value
-        mock_patron_repository.get_by_id.return_value = mock_patron
-
-        mock_loan1 = Mock(spec=Loan)
-        mock_loan1.copy_id = 'c1'
-        mock_loan2 = Mock(spec=Loan)
-        mock_loan2.copy_id = 'c2'
-        mock_loan_repository.find_by_patron_id.return_value = [mock_loan1, mock_loan2]
+    def test_can_renew_copy_when_multiple_loans(self, service: object, mock_patron_repository: object) -> None:
+        mock_patron_repository.get_eligibility.return_value = _eligibility(active_loans=2, has_copy_on_loan=True)
 
         result = service.can_renew_copy('p1', 'c1')
 
@@ -173,35 +128,42 @@ class TestPatronBarringService:
 
 class TestPatronHoldingService:
     @pytest.fixture
-    def mock_hold_repository(self) -> Iterator:
+    def mock_patron_repository(self) -> Iterator:
         return Mock()
 
     @pytest.fixture
-    def service(self: Iterator, mock_hold_repository: Iterator) -> Iterator:
-        return PatronHoldingService(hold_repository=mock_hold_repository)
+    def service(self: Iterator, mock_patron_repository: Iterator) -> Iterator:
+        return PatronHoldingService(patron_repository=mock_patron_repository)
 
-    def test_can_place_holds_when_no_holds(self, service: object, mock_hold_repository: object) -> None:
-        mock_hold_repository.find_active_holds_by_patron.return_value = []
+    def test_can_place_holds_when_no_holds(self, service: object, mock_patron_repository: object) -> None:
+        mock_patron_repository.get_eligibility.return_value = _eligibility()
 
         result = service.can_place_holds('p1')
 
         assert result is True
-        mock_hold_repository.find_active_holds_by_patron.assert_called_once_with(patron_id='p1')
+        mock_patron_repository.get_eligibility.assert_called_once_with('p1')
 
-    def test_can_place_holds_when_one_hold(self, service: object, mock_hold_repository: object) -> None:
-        mock_hold_repository.find_active_holds_by_patron.return_value = [Mock(spec=Hold)]
+    def test_can_place_holds_when_one_hold(self, service: object, mock_patron_repository: object) -> None:
+        mock_patron_repository.get_eligibility.return_value = _eligibility(pending_holds=1)
 
         result = service.can_place_holds('p1')
 
         assert result is True
 
-    def test_can_place_holds_when_two_holds(self, service: object, mock_hold_repository: object) -> None:
-        mock_hold_repository.find_active_holds_by_patron.return_value = [Mock(spec=Hold), Mock(spec=Hold)]
+    def test_can_place_holds_when_two_holds(self, service: object, mock_patron_repository: object) -> None:
+        mock_patron_repository.get_eligibility.return_value = _eligibility(pending_holds=2)
 
         result = service.can_place_holds('p1')
 
         assert result is False
 
+    def test_can_place_holds_when_patron_not_found(self, service: object, mock_patron_repository: object) -> None:
+        mock_patron_repository.get_eligibility.return_value = None
+
+        result = service.can_place_holds('p1')
+
+        assert result is True
+
 
 class TestPatronReinstatementService:
     @pytest.fixture
@@ -209,53 +171,32 @@ class TestPatronReinstatementService:
         return Mock()
 
     @pytest.fixture
-    def mock_loan_repository(self) -> Iterator:
-        return Mock()
-
-    @pytest.fixture
-    def service(self: Iterator, mock_patron_repository: Iterator, mock_loan_repository: Iterator) -> Iterator:
-        return PatronReinstatementService(
-            patron_repository=mock_patron_repository, loan_repository=mock_loan_repository
-        )
+    def service(self: Iterator, mock_patron_repository: Iterator) -> Iterator:
+        return PatronReinstatementService(patron_repository=mock_patron_repository)
 
-    def test_can_reinstate_when_suspended_and_no_loans(
-        self, service: object, mock_patron_repository: object, mock_loan_repository: object
-    ) -> None:
-        mock_patron = Mock(spec=Patron)
-        mock_patron.status = PatronStatus.SUSPENDED.value
-        mock_patron_repository.get_by_id.return_value = mock_patron
-        mock_loan_repository.find_by_patron_id.return_value = []
+    def test_can_reinstate_when_suspended_and_no_loans(self, service: object, mock_patron_repository: object) -> None:
+        mock_patron_repository.get_eligibility.return_value = _eligibility(PatronStatus.SUSPENDED.value)
 
         result = service.can_reinstate('p1')
 
         assert result is True
 
     def test_can_reinstate_when_patron_not_found(self, service: object, mock_patron_repository: object) -> None:
-        mock_patron_repository.get_by_id.return_value = None
+        mock_patron_repository.get_eligibility.return_value = None
 
         result = service.can_reinstate('p1')
 
         assert result is False
 
-    def test_can_reinstate_when_patron_not_suspended(
-        self, service: object, mock_patron_repository: object, mock_loan_repository: object
-    ) -> None:
-        mock_patron = Mock(spec=Patron)
-        mock_patron.status = PatronStatus.ACTIVE.value
-        mock_patron_repository.get_by_id.return_value = mock_patron
-        mock_loan_repository.find_by_patron_id.return_value = []
+    def test_can_reinstate_when_patron_not_suspended(self, service: object, mock_patron_repository: object) -> None:
+        mock_patron_repository.get_eligibility.return_value = _eligibility(PatronStatus.ACTIVE.value)
 
         result = service.can_reinstate('p1')
 
         assert result is False
 
-    def test_can_reinstate_when_has_loans(
-        self, service: object, mock_patron_repository: object, mock_loan_repository: object
-    ) -> None:
-        mock_patron = Mock(spec=Patron)
-        mock_patron.status = PatronStatus.SUSPENDED.value
-        mock_patron_repository.get_by_id.return_value = mock_patron
-        mock_loan_repository.find_by_patron_id.return_value = [Mock(spec=Loan)]
+    def test_can_reinstate_when_has_loans(self, service: object, mock_patron_repository: object) -> None:
+        mock_patron_repository.get_eligibility.return_value = _eligibility(PatronStatus.SUSPENDED.value, active_loans=1)
 
         result = service.can_reinstate('p1')
 
@@ -77,7 +77,7 @@ class CategoryFactory(factory.alchemy.SQLAlchemyModelFactory):
         sqlalchemy_session = db_session
         sqlalchemy_session_persistence = 'flush'
 
-    name = factory.Faker('word')
+    name = factory.Sequence(lambda n: f'category-{n}')
     description = factory.Faker('text', max_nb_chars=100)
 
 
@@ -99,6 +99,30 @@ def test_copy_mapper_from_entity_without_id() -> None:
     assert model.status == CopyStatus.DAMAGED
 
 
+def test_copy_mapper_to_row() -> None:
+    entity = Copy(
+        id=str(uuid.uuid4()),
+        item_id=str(uuid.uuid4()),
+        branch_id=str(uuid.uuid4()),
+        barcode='BC123456',
+        status='available',
+        location='Shelf A1',
+        acquisition_date=date(2024, 1, 15),
+    )
+
+    row = CopyMapper.to_row(entity)
+
+    assert row == {
+        'id': uuid.UUID(entity.id),
+        'item_id': uuid.UUID(entity.item_id),
+        'branch_id': uuid.UUID(entity.branch_id),
+        'barcode': 'BC123456',
+        'status': CopyStatus.AVAILABLE,
+        'location': 'Shelf A1',
+        'acquisition_date': date(2024, 1, 15),
+    }
+
+
 # ItemMapper Tests
 def test_item_mapper_to_entity_with_all_fields() -> None:
     model = ItemModel()
@@ -112,6 +112,7 @@ def test_fine_mapper_to_entity_with_all_fields() -> None:
     model = FineModel()
     model.id = uuid.uuid4()
     model.patron_id = uuid.uuid4()
+    model.loan_id = uuid.uuid4()
     model.amount = Decimal('15.50')
     model.reason = 'Late return'
     model.issued_date = date(2024, 1, 20)
@@ -122,7 +123,7 @@ def test_fine_mapper_to_entity_with_all_fields() -> None:
 
     assert entity.id == str(model.id)
     assert entity.patron_id == str(model.patron_id)
-    assert entity.loan_id == ''  # Mapper hardcodes this
+    assert entity.loan_id == str(model.loan_id)
     assert entity.amount == Decimal('15.50')
     assert entity.reason == 'Late return'
     assert entity.issued_date == date(2024, 1, 20)
@@ -142,6 +143,7 @@ def test_fine_mapper_to_entity_with_optional_fields_none() -> None:
 
     entity = FineMapper.to_entity(model)
 
+    assert entity.loan_id == ''
     assert entity.paid_date is None
     assert entity.status == 'unpaid'
 
@@ -165,7 +167,7 @@ def test_fine_mapper_to_entity_without_id() -> None:
 def test_fine_mapper_from_entity_with_all_fields() -> None:
     entity = Fine(
         id=str(uuid.uuid4()),
-        loan_id='',
+        loan_id=str(uuid.uuid4()),
         patron_id=str(uuid.uuid4()),
         amount=Decimal('15.50'),
         reason='Late return',
@@ -178,6 +180,7 @@ def test_fine_mapper_from_entity_with_all_fields() -> None:
 
     assert str(model.id) == entity.id
     assert str(model.patron_id) == entity.patron_id
+    assert str(model.loan_id) == entity.loan_id
     assert model.amount == Decimal('15.50')
     assert model.reason == 'Late return'
     assert model.issued_date == date(2024, 1, 20)
@@ -199,6 +202,7 @@ def test_fine_mapper_from_entity_with_optional_fields_none() -> None:
 
     model = FineMapper.from_entity(entity)
 
+    assert model.loan_id is None
     assert model.paid_date is None
     assert model.status == FineStatus.UNPAID
 
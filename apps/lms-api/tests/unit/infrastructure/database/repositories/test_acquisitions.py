@@ -1,5 +1,7 @@
 """Unit tests for acquisitions repositories - function-based with 100% coverage."""
 
+import uuid
+from decimal import Decimal
 from unittest.mock import Mock, patch
 
 import pytest
@@ -7,6 +9,9 @@ import sqlalchemy.exc as sa_exc
 
 from tests.unit.factories import VendorFactory, AcquisitionOrderFactory
 from lms.infrastructure.database import RepositoryError
+from lms.domain.acquisitions.entities import AcquisitionOrderLine
+from lms.infrastructure.database.models.acquisitions import OrderStatus, OrderLineStatus, AcquisitionOrderLineModel
+from lms.infrastructure.database.mappers.acquisitions import AcquisitionOrderLineMapper
 from lms.infrastructure.database.repositories.acquisitions import (
     SQLAlchemyVendorRepository,
     SQLAlchemyAcquisitionOrderRepository,
@@ -25,7 +30,7 @@ def test_acquisition_order_find_all(mock_session: Mock) -> None:
     repo = SQLAlchemyAcquisitionOrderRepository(session=mock_session)
     mock_order1 = AcquisitionOrderFactory.build()
     mock_order2 = AcquisitionOrderFactory.build()
-    mock_session.query.return_value.all.return_value = [mock_order1, mock_order2]
+    mock_session.query.return_value.order_by.return_value.all.return_value = [mock_order1, mock_order2]
 
     with patch('lms.infrastructure.database.repositories.acquisitions.AcquisitionOrderMapper') as mock_mapper:
         mock_mapper.to_entity.side_effect = lambda m: m
@@ -86,18 +91,18 @@ def test_acquisition_order_save_new_order(mock_session: Mock) -> None:
         result = repo.save(mock_order)
 
         mock_session.add.assert_called_once_with(mock_model)
-        mock_session.commit.assert_called_once()
+        mock_session.flush.assert_called_once()
         assert result == mock_order
 
 
-def test_acquisition_order_save_new_order_rollback_on_error(mock_session: Mock) -> None:
+def test_acquisition_order_save_new_order_raises_repository_error_on_db_error(mock_session: Mock) -> None:
     repo = SQLAlchemyAcquisitionOrderRepository(session=mock_session)
     mock_order = Mock()
     mock_order.id = None
     mock_model = AcquisitionOrderFactory.build()
 
     mock_session.get.return_value = None
-    mock_session.commit.side_effect = sa_exc.SQLAlchemyError('DB Error')
+    mock_session.flush.side_effect = sa_exc.SQLAlchemyError('DB Error')
 
     with patch('lms.infrastructure.database.repositories.acquisitions.AcquisitionOrderMapper') as mock_mapper:
         mock_mapper.from_entity.return_value = mock_model
@@ -105,7 +110,19 @@ def test_acquisition_order_save_new_order_rollback_on_error(mock_session: Mock)
         with pytest.raises(RepositoryError, match='Failed to save acquisition order'):
             repo.save(mock_order)
 
-        mock_session.rollback.assert_called_once()
+        mock_session.rollback.assert_not_called()
+
+
+def _order_line_model(order_id: uuid.UUID, quantity: int = 1) -> AcquisitionOrderLineModel:
+    model = AcquisitionOrderLineModel()
+    model.id = uuid.uuid7()
+    model.order_id = order_id
+    model.item_id = uuid.uuid7()
+    model.unit_price = Decimal('25.99')
+    model.quantity = quantity
+    model.received_quantity = None
+    model.status = OrderLineStatus.PENDING
+    return model
 
 
 def test_acquisition_order_save_existing_order(mock_session: Mock) -> None:
@@ -113,37 +130,58 @@ def test_acquisition_order_save_existing_order(mock_session: Mock) -> None:
 
     repo = SQLAlchemyAcquisitionOrderRepository(session=mock_session)
 
+    order_id = uuid.uuid7()
+    mock_model = Mock()
+    mock_model.order_lines = [_order_line_model(order_id), _order_line_model(order_id)]
+    mock_session.get.return_value = mock_model
+
     mock_order = Mock()
-    mock_order.id = 'order1'
+    mock_order.id = str(order_id)
     mock_order.received_date = date(2024, 1, 15)
     mock_order.status = 'received'
+    mock_order.order_lines = [AcquisitionOrderLineMapper.to_entity(m) for m in mock_model.order_lines]
 
-    # Create mock lines to test line deletion and ID assignment
-    mock_order_line = Mock()
-    mock_order_line.id = None
-    mock_order.order_lines = [mock_order_line]
+    result = repo.save(mock_order)
 
-    mock_model = Mock()
-    mock_old_line = Mock()
-    mock_model.order_lines = [mock_old_line]
+    assert mock_model.received_date == date(2024, 1, 15)
+    assert mock_model.status == OrderStatus.RECEIVED
+    mock_session.execute.assert_not_called()
+    mock_session.delete.assert_not_called()
+    mock_session.flush.assert_called_once()
+    assert result == mock_order
 
-    mock_new_line_model = Mock()
-    mock_new_line_model.id = 'line123'
 
+def test_acquisition_order_save_existing_order_syncs_changed_lines(mock_session: Mock) -> None:
+    repo = SQLAlchemyAcquisitionOrderRepository(session=mock_session)
+
+    order_id = uuid.uuid7()
+    unchanged, changed, removed = (_order_line_model(order_id) for _ in range(3))
+    mock_model = Mock()
+    mock_model.order_lines = [unchanged, changed, removed]
     mock_session.get.return_value = mock_model
 
-    with patch('lms.infrastructure.database.repositories.acquisitions.AcquisitionOrderLineMapper') as mock_mapper:
-        mock_mapper.from_entity.return_value = mock_new_line_model
-        result = repo.save(mock_order)
+    changed_line = AcquisitionOrderLineMapper.to_entity(changed)
+    changed_line.received(received_quantity=1)
+    added_line = AcquisitionOrderLine.create(
+        order_id=str(order_id), item_id=str(uuid.uuid7()), unit_price=Decimal('10.00'), quantity=2
+    )
+    mock_order = Mock()
+    mock_order.id = str(order_id)
+    mock_order.received_date = None
+    mock_order.status = 'submitted'
+    mock_order.order_lines = [AcquisitionOrderLineMapper.to_entity(unchanged), changed_line, added_line]
 
-        assert mock_model.received_date == date(2024, 1, 15)
-        mock_session.delete.assert_called_once_with(mock_old_line)
-        mock_session.commit.assert_called_once()
-        assert mock_order_line.id == 'line123'
-        assert result == mock_order
+    repo.save(mock_order)
+
+    delete_call, update_call, insert_call = mock_session.execute.call_args_list
+    assert delete_call.args[0].is_delete
+    assert update_call.args[1] == [AcquisitionOrderLineMapper.to_row(changed_line)]
+    assert insert_call.args[1] == [AcquisitionOrderLineMapper.to_row(added_line)]
+    assert str(changed.id) == changed_line.id
+    mock_session.flush.assert_called_once()
 
 
-def test_acquisition_order_save_existing_order_rollback_on_error(mock_session: Mock) -> None:
+def test_acquisition_order_save_existing_order_raises_repository_error_on_db_error(mock_session: Mock) -> None:
     from datetime import date
 
     repo = SQLAlchemyAcquisitionOrderRepository(session=mock_session)
@@ -158,13 +196,13 @@ def test_acquisition_order_save_existing_order_rollback_on_error(mock_session: M
     mock_model.order_lines = []
 
     mock_session.get.return_value = mock_model
-    mock_session.commit.side_effect = sa_exc.SQLAlchemyError('DB Error')
+    mock_session.flush.side_effect = sa_exc.SQLAlchemyError('DB Error')
 
     with patch('lms.infrastructure.database.repositories.acquisitions.AcquisitionOrderLineMapper'):
         with pytest.raises(RepositoryError, match='Failed to update acquisition order'):
             repo.save(mock_order)
 
-        mock_session.rollback.assert_called_once()
+        mock_session.rollback.assert_not_called()
 
 
 # SQLAlchemyAcquisitionOrderLineRepository Tests
@@ -224,7 +262,7 @@ def test_vendor_find_all(mock_session: Mock) -> None:
     repo = SQLAlchemyVendorRepository(session=mock_session)
     mock_vendor1 = VendorFactory.build()
     mock_vendor2 = VendorFactory.build()
-    mock_session.query.return_value.all.return_value = [mock_vendor1, mock_vendor2]
+    mock_session.query.return_value.order_by.return_value.all.return_value = [mock_vendor1, mock_vendor2]
 
     with patch('lms.infrastructure.database.repositories.acquisitions.VendorMapper') as mock_mapper:
         mock_mapper.to_entity.side_effect = lambda m: m
@@ -284,18 +322,18 @@ def test_vendor_save_new_vendor(mock_session: Mock) -> None:
         result = repo.save(mock_vendor)
 
         mock_session.add.assert_called_once_with(mock_model)
-        mock_session.commit.assert_called_once()
+        mock_session.flush.assert_called_once()
         assert result == mock_vendor
 
 
-def test_vendor_save_new_vendor_rollback_on_error(mock_session: Mock) -> None:
+def test_vendor_save_new_vendor_raises_repository_error_on_db_error(mock_session: Mock) -> None:
     repo = SQLAlchemyVendorRepository(session=mock_session)
     mock_vendor = Mock()
     mock_vendor.id = None
     mock_model = VendorFactory.build()
 
     mock_session.get.return_value = None
-    mock_session.commit.side_effect = sa_exc.SQLAlchemyError('DB Error')
+    mock_session.flush.side_effect = sa_exc.SQLAlchemyError('DB Error')
 
     with patch('lms.infrastructure.database.repositories.acquisitions.VendorMapper') as mock_mapper:
         mock_mapper.from_entity.return_value = mock_model
@@ -303,7 +341,7 @@ def test_vendor_save_new_vendor_rollback_on_error(mock_session: Mock) -> None:
         with pytest.raises(RepositoryError, match='Failed to save vendor'):
             repo.save(mock_vendor)
 
-        mock_session.rollback.assert_called_once()
+        mock_session.rollback.assert_not_called()
 
 
 def test_vendor_save_existing_vendor(mock_session: Mock) -> None:
@@ -324,11 +362,11 @@ def test_vendor_save_existing_vendor(mock_session: Mock) -> None:
     assert mock_model.address == 'New Address'
     assert mock_model.email == 'new@vendor.com'
     assert mock_model.phone == '555-0123'
-    mock_session.commit.assert_called_once()
+    mock_session.flush.assert_called_once()
     assert result == mock_vendor
 
 
-def test_vendor_save_existing_vendor_rollback_on_error(mock_session: Mock) -> None:
+def test_vendor_save_existing_vendor_raises_repository_error_on_db_error(mock_session: Mock) -> None:
     repo = SQLAlchemyVendorRepository(session=mock_session)
     mock_vendor = Mock()
     mock_vendor.id = 'vendor1'
@@ -339,9 +377,9 @@ def test_vendor_save_existing_vendor_rollback_on_error(mock_session: Mock) -> No
 
     mock_model = Mock()
     mock_session.get.return_value = mock_model
-    mock_session.commit.side_effect = sa_exc.SQLAlchemyError('DB Error')
+    mock_session.flush.side_effect = sa_exc.SQLAlchemyError('DB Error')
 
     with pytest.raises(RepositoryError, match='Failed to update vendor'):
         repo.save(mock_vendor)
 
-    mock_session.rollback.assert_called_once()
+    mock_session.rollback.assert_not_called()
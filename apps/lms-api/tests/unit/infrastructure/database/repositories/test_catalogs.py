@@ -1,5 +1,6 @@
 """Unit tests for catalogs repositories - function-based with 100% coverage."""
 
+import uuid
 from datetime import date
 from unittest.mock import Mock, patch
 
@@ -8,6 +9,7 @@ import sqlalchemy.exc as sa_exc
 
 from tests.unit.factories import CopyFactory, ItemFactory, AuthorFactory, CategoryFactory, PublisherFactory
 from lms.infrastructure.database import RepositoryError
+from lms.domain.catalogs.entities import Copy
 from lms.infrastructure.database.repositories.catalogs import (
     SQLAlchemyCopyRepository,
     SQLAlchemyItemRepository,
@@ -28,7 +30,7 @@ def test_copy_find_all(mock_session: Mock) -> None:
     repo = SQLAlchemyCopyRepository(session=mock_session)
     mock_copy1 = CopyFactory.build()
     mock_copy2 = CopyFactory.build()
-    mock_session.query.return_value.all.return_value = [mock_copy1, mock_copy2]
+    mock_session.query.return_value.order_by.return_value.all.return_value = [mock_copy1, mock_copy2]
 
     with patch('lms.infrastructure.database.repositories.catalogs.CopyMapper') as mock_mapper:
         mock_mapper.to_entity.side_effect = lambda m: m
@@ -89,18 +91,18 @@ def test_copy_save_new_copy(mock_session: Mock) -> None:
         repo.save(mock_copy)
 
         mock_session.add.assert_called_once_with(mock_model)
-        mock_session.commit.assert_called_once()
+        mock_session.flush.assert_called_once()
         assert mock_copy.id == str(mock_model.id)
 
 
-def test_copy_save_new_copy_rollback_on_error(mock_session: Mock) -> None:
+def test_copy_save_new_copy_raises_repository_error_on_db_error(mock_session: Mock) -> None:
     repo = SQLAlchemyCopyRepository(session=mock_session)
     mock_copy = Mock()
     mock_copy.id = None
     mock_model = CopyFactory.build()
 
     mock_session.get.return_value = None
-    mock_session.commit.side_effect = sa_exc.SQLAlchemyError('DB Error')
+    mock_session.flush.side_effect = sa_exc.SQLAlchemyError('DB Error')
 
     with patch('lms.infrastructure.database.repositories.catalogs.CopyMapper') as mock_mapper:
         mock_mapper.from_entity.return_value = mock_model
@@ -108,7 +110,7 @@ def test_copy_save_new_copy_rollback_on_error(mock_session: Mock) -> None:
         with pytest.raises(RepositoryError, match='Failed to save copy'):
             repo.save(mock_copy)
 
-        mock_session.rollback.assert_called_once()
+        mock_session.rollback.assert_not_called()
 
 
 def test_copy_save_existing_copy(mock_session: Mock) -> None:
@@ -123,11 +125,11 @@ def test_copy_save_existing_copy(mock_session: Mock) -> None:
     result = repo.save(mock_copy)
 
     # Check that status was set (the CopyStatus enum call)
-    mock_session.commit.assert_called_once()
+    mock_session.flush.assert_called_once()
     assert result == mock_copy
 
 
-def test_copy_save_existing_copy_rollback_on_error(mock_session: Mock) -> None:
+def test_copy_save_existing_copy_raises_repository_error_on_db_error(mock_session: Mock) -> None:
     repo = SQLAlchemyCopyRepository(session=mock_session)
     mock_copy = Mock()
     mock_copy.id = 'copy1'
@@ -135,12 +137,42 @@ def test_copy_save_existing_copy_rollback_on_error(mock_session: Mock) -> None:
 
     mock_model = Mock()
     mock_session.get.return_value = mock_model
-    mock_session.commit.side_effect = sa_exc.SQLAlchemyError('DB Error')
+    mock_session.flush.side_effect = sa_exc.SQLAlchemyError('DB Error')
 
     with pytest.raises(RepositoryError, match='Failed to save copy'):
         repo.save(mock_copy)
 
-    mock_session.rollback.assert_called_once()
+    mock_session.rollback.assert_not_called()
+
+
+def test_copy_bulk_add(mock_session: Mock) -> None:
+    repo = SQLAlchemyCopyRepository(session=mock_session)
+    copies = [Copy(id=None, item_id=str(uuid.uuid7()), branch_id=str(uuid.uuid7()), barcode=f'BC{i}') for i in range(3)]
+
+    result = repo.bulk_add(copies)
+
+    assert result == copies
+    mock_session.execute.assert_called_once()
+    rows = mock_session.execute.call_args.args[1]
+    assert [row['barcode'] for row in rows] == ['BC0', 'BC1', 'BC2']
+    assert [str(row['id']) for row in rows] == [copy.id for copy in copies]
+    mock_session.add.assert_not_called()
+
+
+def test_copy_bulk_add_empty(mock_session: Mock) -> None:
+    repo = SQLAlchemyCopyRepository(session=mock_session)
+
+    assert repo.bulk_add([]) == []
+    mock_session.execute.assert_not_called()
+
+
+def test_copy_bulk_add_raises_repository_error_on_db_error(mock_session: Mock) -> None:
+    repo = SQLAlchemyCopyRepository(session=mock_session)
+    mock_session.execute.side_effect = sa_exc.SQLAlchemyError('DB Error')
+    copies = [Copy(id=None, item_id=str(uuid.uuid7()), branch_id=str(uuid.uuid7()), barcode='BC1')]
+
+    with pytest.raises(RepositoryError, match='Failed to bulk add copies'):
+        repo.bulk_add(copies)
 
 
 def test_copy_delete_by_id(mock_session: Mock) -> None:
@@ -149,17 +181,17 @@ def test_copy_delete_by_id(mock_session: Mock) -> None:
     repo.delete_by_id('copy1')
 
     mock_session.query.return_value.filter_by.return_value.delete.assert_called_once()
-    mock_session.commit.assert_called_once()
+    mock_session.commit.assert_not_called()
 
 
-def test_copy_delete_by_id_rollback_on_error(mock_session: Mock) -> None:
+def test_copy_delete_by_id_raises_repository_error_on_db_error(mock_session: Mock) -> None:
     repo = SQLAlchemyCopyRepository(session=mock_session)
     mock_session.query.return_value.filter_by.return_value.delete.side_effect = sa_exc.SQLAlchemyError('DB error')
 
     with pytest.raises(RepositoryError, match='Failed to delete copy'):
         repo.delete_by_id('copy1')
 
-    mock_session.rollback.assert_called_once()
+    mock_session.rollback.assert_not_called()
 
 
 # SQLAlchemyItemRepository Tests
@@ -167,7 +199,7 @@ def test_item_find_all(mock_session: Mock) -> None:
     repo = SQLAlchemyItemRepository(session=mock_session)
     mock_item1 = ItemFactory.build()
     mock_item2 = ItemFactory.build()
-    mock_session.query.return_value.all.return_value = [mock_item1, mock_item2]
+    mock_session.query.return_value.order_by.return_value.all.return_value = [mock_item1, mock_item2]
 
     with patch('lms.infrastructure.database.repositories.catalogs.ItemMapper') as mock_mapper:
         mock_mapper.to_entity.side_effect = lambda m: m
@@ -257,17 +289,17 @@ def test_item_save_new_item(mock_session: Mock) -> None:
         repo.save(mock_item)
 
         mock_session.add.assert_called_once_with(mock_model)
-        mock_session.commit.assert_called_once()
+        mock_session.flush.assert_called_once()
 
 
-def test_item_save_new_item_rollback_on_error(mock_session: Mock) -> None:
+def test_item_save_new_item_raises_repository_error_on_db_error(mock_session: Mock) -> None:
     repo = SQLAlchemyItemRepository(session=mock_session)
     mock_item = Mock()
     mock_item.id = None
     mock_model = ItemFactory.build()
 
     mock_session.get.return_value = None
-    mock_session.commit.side_effect = sa_exc.SQLAlchemyError('DB Error')
+    mock_session.flush.side_effect = sa_exc.SQLAlchemyError('DB Error')
 
     with patch('lms.infrastructure.database.repositories.catalogs.ItemMapper') as mock_mapper:
         mock_mapper.from_entity.return_value = mock_model
@@ -275,7 +307,7 @@ def test_item_save_new_item_rollback_on_error(mock_session: Mock) -> None:
         with pytest.raises(RepositoryError, match='Failed to save item'):
             repo.save(mock_item)
 
-        mock_session.rollback.assert_called_once()
+        mock_session.rollback.assert_not_called()
 
 
 def test_item_save_existing_item(mock_session: Mock) -> None:
@@ -293,21 +325,21 @@ def test_item_save_existing_item(mock_session: Mock) -> None:
     assert mock_model.publication_year == 2024
     assert mock_model.edition == 2
     assert mock_model.description == 'Updated'
-    mock_session.commit.assert_called_once()
+    mock_session.flush.assert_called_once()
 
 
-def test_item_save_existing_item_rollback_on_error(mock_session: Mock) -> None:
+def test_item_save_existing_item_raises_repository_error_on_db_error(mock_session: Mock) -> None:
     repo = SQLAlchemyItemRepository(session=mock_session)
     mock_item = Mock(id='item1', title='Updated', isbn='123', publication_year=2024, edition=2, description='Test')
     mock_model = Mock()
 
     mock_session.get.return_value = mock_model
-    mock_session.commit.side_effect = sa_exc.SQLAlchemyError('DB Error')
+    mock_session.flush.side_effect = sa_exc.SQLAlchemyError('DB Error')
 
     with pytest.raises(RepositoryError, match='Failed to save item'):
         repo.save(mock_item)
 
-    mock_session.rollback.assert_called_once()
+    mock_session.rollback.assert_not_called()
 
 
 def test_item_delete_by_id(mock_session: Mock) -> None:
@@ -316,17 +348,17 @@ def test_item_delete_by_id(mock_session: Mock) -> None:
     repo.delete_by_id('item1')
 
     mock_session.query.return_value.filter_by.return_value.delete.assert_called_once()
-    mock_session.commit.assert_called_once()
+    mock_session.commit.assert_not_called()
 
 
-def test_item_delete_by_id_rollback_on_error(mock_session: Mock) -> None:
+def test_item_delete_by_id_raises_repository_error_on_db_error(mock_session: Mock) -> None:
     repo = SQLAlchemyItemRepository(session=mock_session)
     mock_session.query.return_value.filter_by.return_value.delete.side_effect = sa_exc.SQLAlchemyError('DB error')
 
     with pytest.raises(RepositoryError, match='Failed to delete item'):
         repo.delete_by_id('item1')
 
-    mock_session.rollback.assert_called_once()
+    mock_session.rollback.assert_not_called()
 
 
 # SQLAlchemyAuthorRepository Tests
@@ -334,7 +366,7 @@ def test_author_find_all(mock_session: Mock) -> None:
     repo = SQLAlchemyAuthorRepository(session=mock_session)
     mock_author1 = AuthorFactory.build()
     mock_author2 = AuthorFactory.build()
-    mock_session.query.return_value.all.return_value = [mock_author1, mock_author2]
+    mock_session.query.return_value.order_by.return_value.all.return_value = [mock_author1, mock_author2]
 
     with patch('lms.infrastructure.database.repositories.catalogs.AuthorMapper') as mock_mapper:
         mock_mapper.to_entity.side_effect = lambda m: m
@@ -394,17 +426,17 @@ def test_author_save_new_author(mock_session: Mock) -> None:
         repo.save(mock_author)
 
         mock_session.add.assert_called_once()
-        mock_session.commit.assert_called_once()
+        mock_session.flush.assert_called_once()
 
 
-def test_author_save_new_author_rollback_on_error(mock_session: Mock) -> None:
+def test_author_save_new_author_raises_repository_error_on_db_error(mock_session: Mock) -> None:
     repo = SQLAlchemyAuthorRepository(session=mock_session)
     mock_author = Mock()
     mock_author.id = None
     mock_model = AuthorFactory.build()
 
     mock_session.get.return_value = None
-    mock_session.commit.side_effect = sa_exc.SQLAlchemyError('DB Error')
+    mock_session.flush.side_effect = sa_exc.SQLAlchemyError('DB Error')
 
     with patch('lms.infrastructure.database.repositories.catalogs.AuthorMapper') as mock_mapper:
         mock_mapper.from_entity.return_value = mock_model
@@ -412,7 +444,7 @@ def test_author_save_new_author_rollback_on_error(mock_session: Mock) -> None:
         with pytest.raises(RepositoryError, match='Failed to save author'):
             repo.save(mock_author)
 
-        mock_session.rollback.assert_called_once()
+        mock_session.rollback.assert_not_called()
 
 
 def test_author_save_existing_author(mock_session: Mock) -> None:
@@ -430,22 +462,22 @@ def test_author_save_existing_author(mock_session: Mock) -> None:
     assert mock_model.name == 'Updated Name'
     assert mock_model.bio == 'Updated Bio'
     assert mock_model.birth_date == date(1980, 1, 1)
-    mock_session.commit.assert_called_once()
+    mock_session.flush.assert_called_once()
     assert result == mock_author
 
 
-def test_author_save_existing_author_rollback_on_error(mock_session: Mock) -> None:
+def test_author_save_existing_author_raises_repository_error_on_db_error(mock_session: Mock) -> None:
     repo = SQLAlchemyAuthorRepository(session=mock_session)
     mock_author = Mock(id='author1', name='Updated', bio='Bio', birth_date=date(1980, 1, 1))
     mock_model = Mock()
 
     mock_session.get.return_value = mock_model
-    mock_session.commit.side_effect = sa_exc.SQLAlchemyError('DB Error')
+    mock_session.flush.side_effect = sa_exc.SQLAlchemyError('DB Error')
 
     with pytest.raises(RepositoryError, match='Failed to save author'):
         repo.save(mock_author)
 
-    mock_session.rollback.assert_called_once()
+    mock_session.rollback.assert_not_called()
 
 
 def test_author_delete_by_id(mock_session: Mock) -> None:
@@ -454,17 +486,17 @@ def test_author_delete_by_id(mock_session: Mock) -> None:
     repo.delete_by_id('author1')
 
     mock_session.query.return_value.filter_by.return_value.delete.assert_called_once()
-    mock_session.commit.assert_called_once()
+    mock_session.commit.assert_not_called()
 
 
-def test_author_delete_by_id_rollback_on_error(mock_session: Mock) -> None:
+def test_author_delete_by_id_raises_repository_error_on_db_error(mock_session: Mock) -> None:
     repo = SQLAlchemyAuthorRepository(session=mock_session)
     mock_session.query.return_value.filter_by.return_value.delete.side_effect = sa_exc.SQLAlchemyError('DB error')
 
     with pytest.raises(RepositoryError, match='Failed to delete author'):
         repo.delete_by_id('author1')
 
-    mock_session.rollback.assert_called_once()
+    mock_session.rollback.assert_not_called()
 
 
 # SQLAlchemyPublisherRepository Tests
@@ -472,7 +504,7 @@ def test_publisher_find_all(mock_session: Mock) -> None:
     repo = SQLAlchemyPublisherRepository(session=mock_session)
     mock_pub1 = PublisherFactory.build()
     mock_pub2 = PublisherFactory.build()
-    mock_session.query.return_value.all.return_value = [mock_pub1, mock_pub2]
+    mock_session.query.return_value.order_by.return_value.all.return_value = [mock_pub1, mock_pub2]
 
     with patch('lms.infrastructure.database.repositories.catalogs.PublisherMapper') as mock_mapper:
         mock_mapper.to_entity.side_effect = lambda m: m
@@ -531,17 +563,17 @@ def test_publisher_save_new_publisher(mock_session: Mock) -> None:
         repo.save(mock_publisher)
 
         mock_session.add.assert_called_once()
-        mock_session.commit.assert_called_once()
+        mock_session.flush.assert_called_once()
 
 
-def test_publisher_save_new_publisher_rollback_on_error(mock_session: Mock) -> None:
+def test_publisher_save_new_publisher_raises_repository_error_on_db_error(mock_session: Mock) -> None:
     repo = SQLAlchemyPublisherRepository(session=mock_session)
     mock_publisher = Mock()
     mock_publisher.id = None
     mock_model = PublisherFactory.build()
 
     mock_session.get.return_value = None
-    mock_session.commit.side_effect = sa_exc.SQLAlchemyError('DB Error')
+    mock_session.flush.side_effect = sa_exc.SQLAlchemyError('DB Error')
 
     with patch('lms.infrastructure.database.repositories.catalogs.PublisherMapper') as mock_mapper:
         mock_mapper.from_entity.return_value = mock_model
@@ -549,7 +581,7 @@ def test_publisher_save_new_publisher_rollback_on_error(mock_session: Mock) -> N
         with pytest.raises(RepositoryError, match='Failed to save publisher'):
             repo.save(mock_publisher)
 
-        mock_session.rollback.assert_called_once()
+        mock_session.rollback.assert_not_called()
 
 
 def test_publisher_save_existing_publisher(mock_session: Mock) -> None:
@@ -567,22 +599,22 @@ def test_publisher_save_existing_publisher(mock_session: Mock) -> None:
     assert mock_model.name == 'Updated Name'
     assert mock_model.address == 'New Address'
     assert mock_model.email == 'new@pub.com'
-    mock_session.commit.assert_called_once()
+    mock_session.flush.assert_called_once()
     assert result == mock_publisher
 
 
-def test_publisher_save_existing_publisher_rollback_on_error(mock_session: Mock) -> None:
+def test_publisher_save_existing_publisher_raises_repository_error_on_db_error(mock_session: Mock) -> None:
     repo = SQLAlchemyPublisherRepository(session=mock_session)
     mock_publisher = Mock(id='pub1', name='Updated', address='Address', email='email@pub.com')
     mock_model = Mock()
 
     mock_session.get.return_value = mock_model
-    mock_session.commit.side_effect = sa_exc.SQLAlchemyError('DB Error')
+    mock_session.flush.side_effect = sa_exc.SQLAlchemyError('DB Error')
 
     with pytest.raises(RepositoryError, match='Failed to save publisher'):
         repo.save(mock_publisher)
 
-    mock_session.rollback.assert_called_once()
+    mock_session.rollback.assert_not_called()
 
 
 def test_publisher_delete_by_id(mock_session: Mock) -> None:
@@ -591,17 +623,17 @@ def test_publisher_delete_by_id(mock_session: Mock) -> None:
     repo.delete_by_id('pub1')
 
     mock_session.query.return_value.filter_by.return_value.delete.assert_called_once()
-    mock_session.commit.assert_called_once()
+    mock_session.commit.assert_not_called()
 
 
-def test_publisher_delete_by_id_rollback_on_error(mock_session: Mock) -> None:
+def test_publisher_delete_by_id_raises_repository_error_on_db_error(mock_session: Mock) -> None:
     repo = SQLAlchemyPublisherRepository(session=mock_session)
     mock_session.query.return_value.filter_by.return_value.delete.side_effect = sa_exc.SQLAlchemyError('DB error')
 
     with pytest.raises(RepositoryError, match='Failed to delete publisher'):
         repo.delete_by_id('pub1')
 
-    mock_session.rollback.assert_called_once()
+    mock_session.rollback.assert_not_called()
 
 
 # SQLAlchemyCategoryRepository Tests
@@ -609,7 +641,7 @@ def test_category_find_all(mock_session: Mock) -> None:
     repo = SQLAlchemyCategoryRepository(session=mock_session)
     mock_cat1 = CategoryFactory.build()
     mock_cat2 = CategoryFactory.build()
-    mock_session.query.return_value.all.return_value = [mock_cat1, mock_cat2]
+    mock_session.query.return_value.order_by.return_value.all.return_value = [mock_cat1, mock_cat2]
 
     with patch('lms.infrastructure.database.repositories.catalogs.CategoryMapper') as mock_mapper:
         mock_mapper.to_entity.side_effect = lambda m: m
@@ -668,17 +700,17 @@ def test_category_save_new_category(mock_session: Mock) -> None:
         repo.save(mock_category)
 
         mock_session.add.assert_called_once()
-        mock_session.commit.assert_called_once()
+        mock_session.flush.assert_called_once()
 
 
-def test_category_save_new_category_rollback_on_error(mock_session: Mock) -> None:
+def test_category_save_new_category_raises_repository_error_on_db_error(mock_session: Mock) -> None:
     repo = SQLAlchemyCategoryRepository(session=mock_session)
     mock_category = Mock()
     mock_category.id = None
     mock_model = CategoryFactory.build()
 
     mock_session.get.return_value = None
-    mock_session.commit.side_effect = sa_exc.SQLAlchemyError('DB Error')
+    mock_session.flush.side_effect = sa_exc.SQLAlchemyError('DB Error')
 
     with patch('lms.infrastructure.database.repositories.catalogs.CategoryMapper') as mock_mapper:
         mock_mapper.from_entity.return_value = mock_model
@@ -686,7 +718,7 @@ def test_category_save_new_category_rollback_on_error(mock_session: Mock) -> Non
         with pytest.raises(RepositoryError, match='Failed to save category'):
             repo.save(mock_category)
 
-        mock_session.rollback.assert_called_once()
+        mock_session.rollback.assert_not_called()
 
 
 def test_category_save_existing_category(mock_session: Mock) -> None:
@@ -702,22 +734,22 @@ def test_category_save_existing_category(mock_session: Mock) -> None:
 
     assert mock_model.name == 'Updated Category'
     assert mock_model.description == 'Updated Description'
-    mock_session.commit.assert_called_once()
+    mock_session.flush.assert_called_once()
     assert result == mock_category
 
 
-def test_category_save_existing_category_rollback_on_error(mock_session: Mock) -> None:
+def test_category_save_existing_category_raises_repository_error_on_db_error(mock_session: Mock) -> None:
     repo = SQLAlchemyCategoryRepository(session=mock_session)
     mock_category = Mock(id='cat1', name='Updated', description='Description')
     mock_model = Mock()
 
     mock_session.get.return_value = mock_model
-    mock_session.commit.side_effect = sa_exc.SQLAlchemyError('DB Error')
+    mock_session.flush.side_effect = sa_exc.SQLAlchemyError('DB Error')
 
     with pytest.raises(RepositoryError, match='Failed to save category'):
         repo.save(mock_category)
 
-    mock_session.rollback.assert_called_once()
+    mock_session.rollback.assert_not_called()
 
 
 def test_category_delete_by_id(mock_session: Mock) -> None:
@@ -726,14 +758,14 @@ def test_category_delete_by_id(mock_session: Mock) -> None:
     repo.delete_by_id('cat1')
 
     mock_session.query.return_value.filter_by.return_value.delete.assert_called_once()
-    mock_session.commit.assert_called_once()
+    mock_session.commit.assert_not_called()
 
 
-def test_category_delete_by_id_rollback_on_error(mock_session: Mock) -> None:
+def test_category_delete_by_id_raises_repository_error_on_db_error(mock_session: Mock) -> None:
     repo = SQLAlchemyCategoryRepository(session=mock_session)
     mock_session.query.return_value.filter_by.return_value.delete.side_effect = sa_exc.SQLAlchemyError('DB error')
 
     with pytest.raises(RepositoryError, match='Failed to delete category'):
         repo.delete_by_id('cat1')
 
-    mock_session.rollback.assert_called_once()
+    mock_session.rollback.assert_not_called()
@@ -1,5 +1,7 @@
 """Unit tests for circulations repositories - function-based with 100% coverage."""
 
+import uuid
+import datetime
 from unittest.mock import Mock, patch
 
 import pytest
@@ -7,7 +9,12 @@ import sqlalchemy.exc as sa_exc
 
 from tests.unit.factories import HoldFactory, LoanFactory
 from lms.infrastructure.database import RepositoryError
-from lms.infrastructure.database.repositories.circulations import SQLAlchemyHoldRepository, SQLAlchemyLoanRepository
+from lms.domain.circulations.entities import Hold, SweepCheckpoint
+from lms.infrastructure.database.repositories.circulations import (
+    SQLAlchemyHoldRepository,
+    SQLAlchemyLoanRepository,
+    SQLAlchemySweepCheckpointRepository,
+)
 
 
 # Fixtures
@@ -21,7 +28,7 @@ def test_loan_find_all(mock_session: Mock) -> None:
     repo = SQLAlchemyLoanRepository(session=mock_session)
     mock_loan1 = LoanFactory.build()
     mock_loan2 = LoanFactory.build()
-    mock_session.query.return_value.all.return_value = [mock_loan1, mock_loan2]
+    mock_session.query.return_value.order_by.return_value.all.return_value = [mock_loan1, mock_loan2]
 
     with patch('lms.infrastructure.database.repositories.circulations.LoanMapper') as mock_mapper:
         mock_mapper.to_entity.side_effect = lambda m: m
@@ -31,6 +38,21 @@ def test_loan_find_all(mock_session: Mock) -> None:
         assert mock_mapper.to_entity.call_count == 2
 
 
+def test_loan_find_all_with_cursor(mock_session: Mock) -> None:
+    repo = SQLAlchemyLoanRepository(session=mock_session)
+    mock_loan = LoanFactory.build()
+    query = mock_session.query.return_value.filter.return_value.order_by.return_value
+    query.limit.return_value.all.return_value = [mock_loan]
+
+    with patch('lms.infrastructure.database.repositories.circulations.LoanMapper') as mock_mapper:
+        mock_mapper.to_entity.side_effect = lambda m: m
+        loans = repo.find_all(limit=1, after=str(uuid.uuid7()))
+
+        assert loans == [mock_loan]
+        mock_session.query.return_value.filter.assert_called_once()
+        query.limit.assert_called_once_with(1)
+
+
 def test_loan_find_all_raises_repository_error_on_db_error(mock_session: Mock) -> None:
     repo = SQLAlchemyLoanRepository(session=mock_session)
     mock_session.query.side_effect = sa_exc.SQLAlchemyError('DB error')
@@ -63,6 +85,43 @@ def test_loan_find_by_patron_id_raises_repository_error_on_db_error(mock_session
         repo.find_by_patron_id('patron1')
 
 
+def test_loan_find_overdue(mock_session: Mock) -> None:
+    repo = SQLAlchemyLoanRepository(session=mock_session)
+    mock_loan = LoanFactory.build()
+    query = mock_session.query.return_value.filter.return_value.order_by.return_value
+    query.limit.return_value.all.return_value = [mock_loan]
+
+    with patch('lms.infrastructure.database.repositories.circulations.LoanMapper') as mock_mapper:
+        mock_mapper.to_entity.side_effect = lambda m: m
+        loans = repo.find_overdue(datetime.date(2026, 1, 18), limit=500)
+
+        assert loans == [mock_loan]
+        query.limit.assert_called_once_with(500)
+
+
+def test_loan_find_overdue_after_position(mock_session: Mock) -> None:
+    repo = SQLAlchemyLoanRepository(session=mock_session)
+    query = mock_session.query.return_value.filter.return_value.filter.return_value.order_by.return_value
+    query.limit.return_value.all.return_value = []
+
+    loans = repo.find_overdue(
+        datetime.date(2026, 1, 18), limit=500, after=(datetime.date(2026, 1, 10), str(uuid.uuid7()))
+    )
+
+    assert loans == []
+    mock_session.query.return_value.filter.return_value.filter.assert_called_once()
+    query.limit.assert_called_once_with(500)
+
+
+def test_loan_find_overdue_raises_repository_error_on_db_error(mock_session: Mock) -> None:
+    repo = SQLAlchemyLoanRepository(session=mock_session)
+    query = mock_session.query.return_value.filter.return_value.order_by.return_value
+    query.limit.return_value.all.side_effect = sa_exc.SQLAlchemyError('DB error')
+
+    with pytest.raises(RepositoryError, match='Failed to retrieve overdue loans'):
+        repo.find_overdue(datetime.date(2026, 1, 18), limit=500)
+
+
 def test_loan_get_by_id(mock_session: Mock) -> None:
     repo = SQLAlchemyLoanRepository(session=mock_session)
     mock_loan = LoanFactory.build()
@@ -122,11 +181,11 @@ def test_loan_save_new_loan(mock_session: Mock) -> None:
             repo.save(mock_loan, mock_copy)
 
             mock_session.add.assert_called_once_with(mock_loan_model)
-            assert mock_session.commit.call_count >= 1
+            assert mock_session.flush.call_count >= 1
             assert mock_loan.id == str(mock_loan_model.id)
 
 
-def test_loan_save_new_loan_rollback_on_error(mock_session: Mock) -> None:
+def test_loan_save_new_loan_raises_repository_error_on_db_error(mock_session: Mock) -> None:
     repo = SQLAlchemyLoanRepository(session=mock_session)
     mock_loan = Mock()
     mock_loan.id = None
@@ -145,7 +204,7 @@ def test_loan_save_new_loan_rollback_on_error(mock_session: Mock) -> None:
             return None
 
         mock_session.get.side_effect = get_side_effect
-        mock_session.commit.side_effect = sa_exc.SQLAlchemyError('DB Error')
+        mock_session.flush.side_effect = sa_exc.SQLAlchemyError('DB Error')
 
         with patch('lms.infrastructure.database.repositories.circulations.LoanMapper') as mock_mapper:
             mock_mapper.from_entity.return_value = Mock()
@@ -153,7 +212,7 @@ def test_loan_save_new_loan_rollback_on_error(mock_session: Mock) -> None:
             with pytest.raises(RepositoryError, match='Failed to save loan'):
                 repo.save(mock_loan, mock_copy)
 
-            mock_session.rollback.assert_called_once()
+            mock_session.rollback.assert_not_called()
 
 
 def test_loan_save_copy_status_update_error(mock_session: Mock) -> None:
@@ -199,11 +258,11 @@ def test_loan_save_existing_loan(mock_session: Mock) -> None:
         mock_session.get.side_effect = get_side_effect
         result = repo.save(mock_loan, mock_copy)
 
-        assert mock_session.commit.call_count >= 1
+        assert mock_session.flush.call_count >= 1
         assert result == mock_loan
 
 
-def test_loan_save_existing_loan_rollback_on_error(mock_session: Mock) -> None:
+def test_loan_save_existing_loan_raises_repository_error_on_db_error(mock_session: Mock) -> None:
     repo = SQLAlchemyLoanRepository(session=mock_session)
     mock_loan = Mock()
     mock_loan.id = 'loan1'
@@ -230,12 +289,12 @@ def test_loan_save_existing_loan_rollback_on_error(mock_session: Mock) -> None:
             return None
 
         mock_session.get.side_effect = get_side_effect
-        mock_session.commit.side_effect = sa_exc.SQLAlchemyError('DB Error')
+        mock_session.flush.side_effect = sa_exc.SQLAlchemyError('DB Error')
 
         with pytest.raises(RepositoryError, match='Failed to update loan'):
             repo.save(mock_loan, mock_copy)
 
-        mock_session.rollback.assert_called_once()
+        mock_session.rollback.assert_not_called()
 
 
 def test_loan_delete_by_id(mock_session: Mock) -> None:
@@ -244,17 +303,17 @@ def test_loan_delete_by_id(mock_session: Mock) -> None:
     repo.delete_by_id('loan1')
 
     mock_session.query.return_value.filter_by.return_value.delete.assert_called_once()
-    mock_session.commit.assert_called_once()
+    mock_session.commit.assert_not_called()
 
 
-def test_loan_delete_by_id_rollback_on_error(mock_session: Mock) -> None:
+def test_loan_delete_by_id_raises_repository_error_on_db_error(mock_session: Mock) -> None:
     repo = SQLAlchemyLoanRepository(session=mock_session)
     mock_session.query.return_value.filter_by.return_value.delete.side_effect = sa_exc.SQLAlchemyError('DB error')
 
     with pytest.raises(RepositoryError, match='Failed to delete loan'):
         repo.delete_by_id('loan1')
 
-    mock_session.rollback.assert_called_once()
+    mock_session.rollback.assert_not_called()
 
 
 # SQLAlchemyHoldRepository Tests
@@ -262,7 +321,7 @@ def test_hold_find_all(mock_session: Mock) -> None:
     repo = SQLAlchemyHoldRepository(session=mock_session)
     mock_hold1 = HoldFactory.build()
     mock_hold2 = HoldFactory.build()
-    mock_session.query.return_value.all.return_value = [mock_hold1, mock_hold2]
+    mock_session.query.return_value.order_by.return_value.all.return_value = [mock_hold1, mock_hold2]
 
     with patch('lms.infrastructure.database.repositories.circulations.HoldMapper') as mock_mapper:
         mock_mapper.to_entity.side_effect = lambda m: m
@@ -310,7 +369,7 @@ def test_hold_find_active_holds_by_item(mock_session: Mock) -> None:
     mock_hold2 = HoldFactory.build()
     mock_query = Mock()
     mock_session.query.return_value = mock_query
-    mock_query.join.return_value.filter.return_value.all.return_value = [mock_hold1, mock_hold2]
+    mock_query.filter.return_value.order_by.return_value.all.return_value = [mock_hold1, mock_hold2]
 
     with patch('lms.infrastructure.database.repositories.circulations.HoldMapper') as mock_mapper:
         mock_mapper.to_entity.side_effect = lambda m: m
@@ -322,12 +381,78 @@ def test_hold_find_active_holds_by_item(mock_session: Mock) -> None:
 
 def test_hold_find_active_holds_by_item_raises_repository_error(mock_session: Mock) -> None:
     repo = SQLAlchemyHoldRepository(session=mock_session)
-    mock_session.query.return_value.join.side_effect = sa_exc.SQLAlchemyError('DB error')
+    mock_session.query.return_value.filter.side_effect = sa_exc.SQLAlchemyError('DB error')
 
     with pytest.raises(RepositoryError, match='Failed to retrieve active holds for item'):
         repo.find_active_holds_by_item('item1')
 
 
+def test_hold_find_next_hold_for_item(mock_session: Mock) -> None:
+    repo = SQLAlchemyHoldRepository(session=mock_session)
+    mock_hold = HoldFactory.build()
+    mock_session.query.return_value.filter.return_value.order_by.return_value.first.return_value = mock_hold
+
+    with patch('lms.infrastructure.database.repositories.circulations.HoldMapper') as mock_mapper:
+        mock_mapper.to_entity.side_effect = lambda m: m
+        hold = repo.find_next_hold_for_item('item1')
+
+        assert hold == mock_hold
+
+
+def test_hold_find_next_hold_for_item_returns_none_when_queue_empty(mock_session: Mock) -> None:
+    repo = SQLAlchemyHoldRepository(session=mock_session)
+    mock_session.query.return_value.filter.return_value.order_by.return_value.first.return_value = None
+
+    assert repo.find_next_hold_for_item('item1') is None
+
+
+def test_hold_find_next_hold_for_item_raises_repository_error(mock_session: Mock) -> None:
+    repo = SQLAlchemyHoldRepository(session=mock_session)
+    mock_session.query.return_value.filter.side_effect = sa_exc.SQLAlchemyError('DB error')
+
+    with pytest.raises(RepositoryError, match='Failed to retrieve next hold for item'):
+        repo.find_next_hold_for_item('item1')
+
+
+def test_hold_count_holds_ahead(mock_session: Mock) -> None:
+    repo = SQLAlchemyHoldRepository(session=mock_session)
+    mock_session.execute.return_value.scalar_one.return_value = 3
+    hold = Hold(id=str(uuid.uuid7()), item_id=str(uuid.uuid7()), patron_id=str(uuid.uuid7()))
+
+    assert repo.count_holds_ahead(hold) == 3
+    mock_session.execute.assert_called_once()
+
+
+def test_hold_count_holds_ahead_raises_repository_error(mock_session: Mock) -> None:
+    repo = SQLAlchemyHoldRepository(session=mock_session)
+    mock_session.execute.side_effect = sa_exc.SQLAlchemyError('DB error')
+    hold = Hold(id=str(uuid.uuid7()), item_id=str(uuid.uuid7()), patron_id=str(uuid.uuid7()))
+
+    with pytest.raises(RepositoryError, match='Failed to count holds ahead in queue'):
+        repo.count_holds_ahead(hold)
+
+
+def test_hold_expire_pending_holds(mock_session: Mock) -> None:
+    repo = SQLAlchemyHoldRepository(session=mock_session)
+    mock_hold = HoldFactory.build()
+    mock_session.scalars.return_value.all.return_value = [mock_hold]
+
+    with patch('lms.infrastructure.database.repositories.circulations.HoldMapper') as mock_mapper:
+        mock_mapper.to_entity.side_effect = lambda m: m
+        holds = repo.expire_pending_holds(datetime.date(2026, 1, 18), limit=500)
+
+        assert holds == [mock_hold]
+        mock_session.scalars.assert_called_once()
+
+
+def test_hold_expire_pending_holds_raises_repository_error(mock_session: Mock) -> None:
+    repo = SQLAlchemyHoldRepository(session=mock_session)
+    mock_session.scalars.side_effect = sa_exc.SQLAlchemyError('DB error')
+
+    with pytest.raises(RepositoryError, match='Failed to expire pending holds'):
+        repo.expire_pending_holds(datetime.date(2026, 1, 18), limit=500)
+
+
 def test_hold_get_by_id(mock_session: Mock) -> None:
     repo = SQLAlchemyHoldRepository(session=mock_session)
     mock_hold = HoldFactory.build()
@@ -371,18 +496,18 @@ def test_hold_save_new_hold(mock_session: Mock) -> None:
         repo.save(mock_hold)
 
         mock_session.add.assert_called_once_with(mock_model)
-        mock_session.commit.assert_called_once()
+        mock_session.flush.assert_called_once()
         assert mock_hold.id == str(mock_model.id)
 
 
-def test_hold_save_new_hold_rollback_on_error(mock_session: Mock) -> None:
+def test_hold_save_new_hold_raises_repository_error_on_db_error(mock_session: Mock) -> None:
     repo = SQLAlchemyHoldRepository(session=mock_session)
     mock_hold = Mock()
     mock_hold.id = None
     mock_model = HoldFactory.build()
 
     mock_session.get.return_value = None
-    mock_session.commit.side_effect = sa_exc.SQLAlchemyError('DB Error')
+    mock_session.flush.side_effect = sa_exc.SQLAlchemyError('DB Error')
 
     with patch('lms.infrastructure.database.repositories.circulations.HoldMapper') as mock_mapper:
         mock_mapper.from_entity.return_value = mock_model
@@ -390,7 +515,7 @@ def test_hold_save_new_hold_rollback_on_error(mock_session: Mock) -> None:
         with pytest.raises(RepositoryError, match='Failed to save hold'):
             repo.save(mock_hold)
 
-        mock_session.rollback.assert_called_once()
+        mock_session.rollback.assert_not_called()
 
 
 def test_hold_save_existing_hold(mock_session: Mock) -> None:
@@ -405,11 +530,11 @@ def test_hold_save_existing_hold(mock_session: Mock) -> None:
 
     result = repo.save(mock_hold)
 
-    mock_session.commit.assert_called_once()
+    mock_session.flush.assert_called_once()
     assert result == mock_hold
 
 
-def test_hold_save_existing_hold_rollback_on_error(mock_session: Mock) -> None:
+def test_hold_save_existing_hold_raises_repository_error_on_db_error(mock_session: Mock) -> None:
     repo = SQLAlchemyHoldRepository(session=mock_session)
     mock_hold = Mock()
     mock_hold.id = 'hold1'
@@ -418,12 +543,12 @@ def test_hold_save_existing_hold_rollback_on_error(mock_session: Mock) -> None:
 
     mock_model = Mock()
     mock_session.get.return_value = mock_model
-    mock_session.commit.side_effect = sa_exc.SQLAlchemyError('DB Error')
+    mock_session.flush.side_effect = sa_exc.SQLAlchemyError('DB Error')
 
     with pytest.raises(RepositoryError, match='Failed to update hold'):
         repo.save(mock_hold)
 
-    mock_session.rollback.assert_called_once()
+    mock_session.rollback.assert_not_called()
 
 
 def test_hold_delete_by_id(mock_session: Mock) -> None:
@@ -432,14 +557,66 @@ def test_hold_delete_by_id(mock_session: Mock) -> None:
     repo.delete_by_id('hold1')
 
     mock_session.query.return_value.filter_by.return_value.delete.assert_called_once()
-    mock_session.commit.assert_called_once()
+    mock_session.commit.assert_not_called()
 
 
-def test_hold_delete_by_id_rollback_on_error(mock_session: Mock) -> None:
+def test_hold_delete_by_id_raises_repository_error_on_db_error(mock_session: Mock) -> None:
     repo = SQLAlchemyHoldRepository(session=mock_session)
     mock_session.query.return_value.filter_by.return_value.delete.side_effect = sa_exc.SQLAlchemyError('DB error')
 
     with pytest.raises(RepositoryError, match='Failed to delete hold'):
         repo.delete_by_id('hold1')
 
-    mock_session.rollback.assert_called_once()
+    mock_session.rollback.assert_not_called()
+
+
+# SQLAlchemySweepCheckpointRepository Tests
+def test_sweep_checkpoint_get_by_name(mock_session: Mock) -> None:
+    repo = SQLAlchemySweepCheckpointRepository(session=mock_session)
+    checkpoint = SweepCheckpoint(name='overdue_loans', run_date=datetime.date(2026, 1, 18))
+
+    with patch('lms.infrastructure.database.repositories.circulations.SweepCheckpointMapper') as mock_mapper:
+        mock_mapper.to_entity.return_value = checkpoint
+        result = repo.get_by_name('overdue_loans')
+
+        assert result == checkpoint
+        mock_session.get.assert_called_once()
+
+
+def test_sweep_checkpoint_get_by_name_returns_none_when_not_found(mock_session: Mock) -> None:
+    repo = SQLAlchemySweepCheckpointRepository(session=mock_session)
+    mock_session.get.return_value = None
+
+    assert repo.get_by_name('overdue_loans') is None
+
+
+def test_sweep_checkpoint_get_by_name_raises_repository_error_on_db_error(mock_session: Mock) -> None:
+    repo = SQLAlchemySweepCheckpointRepository(session=mock_session)
+    mock_session.get.side_effect = sa_exc.SQLAlchemyError('DB error')
+
+    with pytest.raises(RepositoryError, match='Failed to retrieve sweep checkpoint'):
+        repo.get_by_name('overdue_loans')
+
+
+def test_sweep_checkpoint_save(mock_session: Mock) -> None:
+    repo = SQLAlchemySweepCheckpointRepository(session=mock_session)
+    checkpoint = SweepCheckpoint(
+        name='overdue_loans',
+        run_date=datetime.date(2026, 1, 18),
+        last_due_date=datetime.date(2026, 1, 10),
+        last_loan_id=str(uuid.uuid7()),
+    )
+
+    result = repo.save(checkpoint)
+
+    assert result == checkpoint
+    mock_session.merge.assert_called_once()
+    mock_session.flush.assert_called_once()
+
+
+def test_sweep_checkpoint_save_raises_repository_error_on_db_error(mock_session: Mock) -> None:
+    repo = SQLAlchemySweepCheckpointRepository(session=mock_session)
+    mock_session.flush.side_effect = sa_exc.SQLAlchemyError('DB error')
+
+    with pytest.raises(RepositoryError, match='Failed to save sweep checkpoint'):
+        repo.save(SweepCheckpoint(name='overdue_loans', run_date=datetime.date(2026, 1, 18)))
@@ -22,7 +22,7 @@ def test_branch_find_all(mock_session: Mock) -> None:
     repo = SQLAlchemyBranchRepository(session=mock_session)
     mock_branch1 = BranchFactory.build()
     mock_branch2 = BranchFactory.build()
-    mock_session.query.return_value.all.return_value = [mock_branch1, mock_branch2]
+    mock_session.query.return_value.order_by.return_value.all.return_value = [mock_branch1, mock_branch2]
 
     with patch('lms.infrastructure.database.repositories.organizations.BranchMapper') as mock_mapper:
         mock_mapper.to_entity.side_effect = lambda m: m
@@ -113,18 +113,18 @@ def test_branch_save_new_branch(mock_session: Mock) -> None:
         repo.save(mock_branch)
 
         mock_session.add.assert_called_once_with(mock_model)
-        mock_session.commit.assert_called_once()
+        mock_session.flush.assert_called_once()
         assert mock_branch.id == str(mock_model.id)
 
 
-def test_branch_save_new_branch_rollback_on_error(mock_session: Mock) -> None:
+def test_branch_save_new_branch_raises_repository_error_on_db_error(mock_session: Mock) -> None:
     repo = SQLAlchemyBranchRepository(session=mock_session)
     mock_branch = Mock()
     mock_branch.id = None
     mock_model = BranchFactory.build()
 
     mock_session.get.return_value = None
-    mock_session.commit.side_effect = sa_exc.SQLAlchemyError('DB error')
+    mock_session.flush.side_effect = sa_exc.SQLAlchemyError('DB error')
 
     with patch('lms.infrastructure.database.repositories.organizations.BranchMapper') as mock_mapper:
         mock_mapper.from_entity.return_value = mock_model
@@ -132,7 +132,7 @@ def test_branch_save_new_branch_rollback_on_error(mock_session: Mock) -> None:
         with pytest.raises(RepositoryError, match='Failed to save branch'):
             repo.save(mock_branch)
 
-        mock_session.rollback.assert_called_once()
+        mock_session.rollback.assert_not_called()
 
 
 def test_branch_save_existing_branch(mock_session: Mock) -> None:
@@ -152,11 +152,11 @@ def test_branch_save_existing_branch(mock_session: Mock) -> None:
     result = repo.save(mock_branch)
 
     assert mock_model.name == 'Updated Branch'
-    mock_session.commit.assert_called_once()
+    mock_session.flush.assert_called_once()
     assert result == mock_branch
 
 
-def test_branch_save_existing_branch_rollback_on_error(mock_session: Mock) -> None:
+def test_branch_save_existing_branch_raises_repository_error_on_db_error(mock_session: Mock) -> None:
     repo = SQLAlchemyBranchRepository(session=mock_session)
     mock_branch = Mock()
     mock_branch.id = 'branch1'
@@ -169,12 +169,12 @@ def test_branch_save_existing_branch_rollback_on_error(mock_session: Mock) -> No
 
     mock_model = Mock()
     mock_session.get.return_value = mock_model
-    mock_session.commit.side_effect = sa_exc.SQLAlchemyError('DB Error')
+    mock_session.flush.side_effect = sa_exc.SQLAlchemyError('DB Error')
 
     with pytest.raises(RepositoryError, match='Failed to update branch'):
         repo.save(mock_branch)
 
-    mock_session.rollback.assert_called_once()
+    mock_session.rollback.assert_not_called()
 
 
 def test_branch_delete_by_id(mock_session: Mock) -> None:
@@ -183,17 +183,17 @@ def test_branch_delete_by_id(mock_session: Mock) -> None:
     repo.delete_by_id('branch1')
 
     mock_session.query.return_value.filter_by.return_value.delete.assert_called_once()
-    mock_session.commit.assert_called_once()
+    mock_session.commit.assert_not_called()
 
 
-def test_branch_delete_by_id_rollback_on_error(mock_session: Mock) -> None:
+def test_branch_delete_by_id_raises_repository_error_on_db_error(mock_session: Mock) -> None:
     repo = SQLAlchemyBranchRepository(session=mock_session)
     mock_session.query.return_value.filter_by.return_value.delete.side_effect = sa_exc.SQLAlchemyError('DB error')
 
     with pytest.raises(RepositoryError, match='Failed to delete branch'):
         repo.delete_by_id('branch1')
 
-    mock_session.rollback.assert_called_once()
+    mock_session.rollback.assert_not_called()
 
 
 # SQLAlchemyStaffRepository Tests
@@ -201,7 +201,7 @@ def test_staff_find_all(mock_session: Mock) -> None:
     repo = SQLAlchemyStaffRepository(session=mock_session)
     mock_staff1 = StaffFactory.build()
     mock_staff2 = StaffFactory.build()
-    mock_session.query.return_value.all.return_value = [mock_staff1, mock_staff2]
+    mock_session.query.return_value.order_by.return_value.all.return_value = [mock_staff1, mock_staff2]
 
     with patch('lms.infrastructure.database.repositories.organizations.StaffMapper') as mock_mapper:
         mock_mapper.to_entity.side_effect = lambda m: m
@@ -292,18 +292,18 @@ def test_staff_save_new_staff(mock_session: Mock) -> None:
         repo.save(mock_staff)
 
         mock_session.add.assert_called_once_with(mock_model)
-        mock_session.commit.assert_called_once()
+        mock_session.flush.assert_called_once()
         assert mock_staff.id == str(mock_model.id)
 
 
-def test_staff_save_new_staff_rollback_on_error(mock_session: Mock) -> None:
+def test_staff_save_new_staff_raises_repository_error_on_db_error(mock_session: Mock) -> None:
     repo = SQLAlchemyStaffRepository(session=mock_session)
     mock_staff = Mock()
     mock_staff.id = None
     mock_model = StaffFactory.build()
 
     mock_session.get.return_value = None
-    mock_session.commit.side_effect = sa_exc.SQLAlchemyError('DB Error')
+    mock_session.flush.side_effect = sa_exc.SQLAlchemyError('DB Error')
 
     with patch('lms.infrastructure.database.repositories.organizations.StaffMapper') as mock_mapper:
         mock_mapper.from_entity.return_value = mock_model
@@ -311,7 +311,7 @@ def test_staff_save_new_staff_rollback_on_error(mock_session: Mock) -> None:
         with pytest.raises(RepositoryError, match='Failed to save staff member'):
             repo.save(mock_staff)
 
-        mock_session.rollback.assert_called_once()
+        mock_session.rollback.assert_not_called()
 
 
 def test_staff_save_existing_staff(mock_session: Mock) -> None:
@@ -330,11 +330,11 @@ def test_staff_save_existing_staff(mock_session: Mock) -> None:
 
     assert mock_model.name == 'Updated Name'
     assert mock_model.email == 'updated@example.com'
-    mock_session.commit.assert_called_once()
+    mock_session.flush.assert_called_once()
     assert result == mock_staff
 
 
-def test_staff_save_existing_staff_rollback_on_error(mock_session: Mock) -> None:
+def test_staff_save_existing_staff_raises_repository_error_on_db_error(mock_session: Mock) -> None:
     repo = SQLAlchemyStaffRepository(session=mock_session)
     mock_staff = Mock()
     mock_staff.id = 'staff1'
@@ -345,12 +345,12 @@ def test_staff_save_existing_staff_rollback_on_error(mock_session: Mock) -> None
 
     mock_model = Mock()
     mock_session.get.return_value = mock_model
-    mock_session.commit.side_effect = sa_exc.SQLAlchemyError('DB Error')
+    mock_session.flush.side_effect = sa_exc.SQLAlchemyError('DB Error')
 
     with pytest.raises(RepositoryError, match='Failed to update staff member'):
         repo.save(mock_staff)
 
-    mock_session.rollback.assert_called_once()
+    mock_session.rollback.assert_not_called()
 
 
 def test_staff_delete_by_id(mock_session: Mock) -> None:
@@ -359,14 +359,14 @@ def test_staff_delete_by_id(mock_session: Mock) -> None:
     repo.delete_by_id('staff1')
 
     mock_session.query.return_value.filter_by.return_value.delete.assert_called_once()
-    mock_session.commit.assert_called_once()
+    mock_session.commit.assert_not_called()
 
 
-def test_staff_delete_by_id_rollback_on_error(mock_session: Mock) -> None:
+def test_staff_delete_by_id_raises_repository_error_on_db_error(mock_session: Mock) -> None:
     repo = SQLAlchemyStaffRepository(session=mock_session)
     mock_session.query.return_value.filter_by.return_value.delete.side_effect = sa_exc.SQLAlchemyError('DB error')
 
     with pytest.raises(RepositoryError, match='Failed to delete staff member'):
         repo.delete_by_id('staff1')
 
-    mock_session.rollback.assert_called_once()
+    mock_session.rollback.assert_not_called()
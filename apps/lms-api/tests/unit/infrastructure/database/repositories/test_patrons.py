@@ -1,12 +1,15 @@
 """Unit tests for patrons repositories - function-based with 100% coverage."""
 
+from decimal import Decimal
 from unittest.mock import Mock, patch
 
 import pytest
 import sqlalchemy.exc as sa_exc
 
 from tests.unit.factories import FineFactory, PatronFactory
+from lms.domain.patrons.entities import PatronEligibility
 from lms.infrastructure.database import RepositoryError
+from lms.infrastructure.database.models.patrons import PatronStatus
 from lms.infrastructure.database.repositories.patrons import SQLAlchemyFineRepository, SQLAlchemyPatronRepository
 
 
@@ -21,7 +24,7 @@ def test_patron_find_all(mock_session: Mock) -> None:
     repo = SQLAlchemyPatronRepository(session=mock_session)
     mock_patron1 = PatronFactory.build()
     mock_patron2 = PatronFactory.build()
-    mock_session.query.return_value.all.return_value = [mock_patron1, mock_patron2]
+    mock_session.query.return_value.order_by.return_value.all.return_value = [mock_patron1, mock_patron2]
 
     with patch('lms.infrastructure.database.repositories.patrons.PatronMapper') as mock_mapper:
         mock_mapper.to_entity.side_effect = lambda m: m
@@ -99,6 +102,41 @@ def test_patron_exists_by_email_raises_repository_error_on_db_error(mock_session
         repo.exists_by_email('test@example.com')
 
 
+def test_patron_get_eligibility(mock_session: Mock) -> None:
+    repo = SQLAlchemyPatronRepository(session=mock_session)
+    mock_session.execute.return_value.first.return_value = (PatronStatus.ACTIVE, 1, 2, Decimal('7.50'), 1)
+
+    result = repo.get_eligibility('p1', copy_id='c1')
+
+    assert result == PatronEligibility(
+        patron_id='p1',
+        status=PatronStatus.ACTIVE.value,
+        active_loans=1,
+        pending_holds=2,
+        outstanding_fines=Decimal('7.50'),
+        has_copy_on_loan=True,
+    )
+    mock_session.execute.assert_called_once()
+    mock_session.get.assert_not_called()
+
+
+def test_patron_get_eligibility_returns_none_when_not_found(mock_session: Mock) -> None:
+    repo = SQLAlchemyPatronRepository(session=mock_session)
+    mock_session.execute.return_value.first.return_value = None
+
+    result = repo.get_eligibility('p1')
+
+    assert result is None
+
+
+def test_patron_get_eligibility_raises_repository_error_on_db_error(mock_session: Mock) -> None:
+    repo = SQLAlchemyPatronRepository(session=mock_session)
+    mock_session.execute.side_effect = sa_exc.SQLAlchemyError('DB error')
+
+    with pytest.raises(RepositoryError, match='Failed to retrieve patron eligibility'):
+        repo.get_eligibility('p1')
+
+
 def test_patron_save_new_patron(mock_session: Mock) -> None:
     repo = SQLAlchemyPatronRepository(session=mock_session)
     mock_patron = Mock()
@@ -112,18 +150,18 @@ def test_patron_save_new_patron(mock_session: Mock) -> None:
         repo.save(mock_patron)
 
         mock_session.add.assert_called_once_with(mock_model)
-        mock_session.commit.assert_called_once()
+        mock_session.flush.assert_called_once()
         assert mock_patron.id == str(mock_model.id)
 
 
-def test_patron_save_new_patron_rollback_on_error(mock_session: Mock) -> None:
+def test_patron_save_new_patron_raises_repository_error_on_db_error(mock_session: Mock) -> None:
     repo = SQLAlchemyPatronRepository(session=mock_session)
     mock_patron = Mock()
     mock_patron.id = None
     mock_model = PatronFactory.build()
 
     mock_session.get.return_value = None
-    mock_session.commit.side_effect = sa_exc.SQLAlchemyError('DB error')
+    mock_session.flush.side_effect = sa_exc.SQLAlchemyError('DB error')
 
     with patch('lms.infrastructure.database.repositories.patrons.PatronMapper') as mock_mapper:
         mock_mapper.from_entity.return_value = mock_model
@@ -131,7 +169,7 @@ def test_patron_save_new_patron_rollback_on_error(mock_session: Mock) -> None:
         with pytest.raises(RepositoryError, match='Failed to save patron'):
             repo.save(mock_patron)
 
-        mock_session.rollback.assert_called_once()
+        mock_session.rollback.assert_not_called()
 
 
 def test_patron_save_existing_patron(mock_session: Mock) -> None:
@@ -151,11 +189,11 @@ def test_patron_save_existing_patron(mock_session: Mock) -> None:
 
     assert mock_model.name == 'Updated Patron'
     assert mock_model.email == 'updated@example.com'
-    mock_session.commit.assert_called_once()
+    mock_session.flush.assert_called_once()
     assert result == mock_patron
 
 
-def test_patron_save_existing_patron_rollback_on_error(mock_session: Mock) -> None:
+def test_patron_save_existing_patron_raises_repository_error_on_db_error(mock_session: Mock) -> None:
     repo = SQLAlchemyPatronRepository(session=mock_session)
     mock_patron = Mock()
     mock_patron.id = 'patron1'
@@ -167,12 +205,12 @@ def test_patron_save_existing_patron_rollback_on_error(mock_session: Mock) -> No
 
     mock_model = Mock()
     mock_session.get.return_value = mock_model
-    mock_session.commit.side_effect = sa_exc.SQLAlchemyError('DB Error')
+    mock_session.flush.side_effect = sa_exc.SQLAlchemyError('DB Error')
 
     with pytest.raises(RepositoryError, match='Failed to update patron'):
         repo.save(mock_patron)
 
-    mock_session.rollback.assert_called_once()
+    mock_session.rollback.assert_not_called()
 
 
 def test_patron_delete_by_id(mock_session: Mock) -> None:
@@ -181,17 +219,17 @@ def test_patron_delete_by_id(mock_session: Mock) -> None:
     repo.delete_by_id('patron1')
 
     mock_session.query.return_value.filter_by.return_value.delete.assert_called_once()
-    mock_session.commit.assert_called_once()
+    mock_session.commit.assert_not_called()
 
 
-def test_patron_delete_by_id_rollback_on_error(mock_session: Mock) -> None:
+def test_patron_delete_by_id_raises_repository_error_on_db_error(mock_session: Mock) -> None:
     repo = SQLAlchemyPatronRepository(session=mock_session)
     mock_session.query.return_value.filter_by.return_value.delete.side_effect = sa_exc.SQLAlchemyError('DB error')
 
     with pytest.raises(RepositoryError, match='Failed to delete patron'):
         repo.delete_by_id('patron1')
 
-    mock_session.rollback.assert_called_once()
+    mock_session.rollback.assert_not_called()
 
 
 # SQLAlchemyFineRepository Tests
@@ -199,7 +237,7 @@ def test_fine_find_all(mock_session: Mock) -> None:
     repo = SQLAlchemyFineRepository(session=mock_session)
     mock_fine1 = FineFactory.build()
     mock_fine2 = FineFactory.build()
-    mock_session.query.return_value.all.return_value = [mock_fine1, mock_fine2]
+    mock_session.query.return_value.order_by.return_value.all.return_value = [mock_fine1, mock_fine2]
 
     with patch('lms.infrastructure.database.repositories.patrons.FineMapper') as mock_mapper:
         mock_mapper.to_entity.side_effect = lambda m: m
@@ -217,6 +255,33 @@ def test_fine_find_all_raises_repository_error_on_db_error(mock_session: Mock) -
         repo.find_all()
 
 
+def test_fine_find_by_loan_id(mock_session: Mock) -> None:
+    repo = SQLAlchemyFineRepository(session=mock_session)
+    mock_fine = FineFactory.build()
+    mock_session.query.return_value.filter.return_value.order_by.return_value.first.return_value = mock_fine
+
+    with patch('lms.infrastructure.database.repositories.patrons.FineMapper') as mock_mapper:
+        mock_mapper.to_entity.return_value = mock_fine
+        fine = repo.find_by_loan_id('loan1')
+
+        assert fine == mock_fine
+
+
+def test_fine_find_by_loan_id_returns_none_when_not_found(mock_session: Mock) -> None:
+    repo = SQLAlchemyFineRepository(session=mock_session)
+    mock_session.query.return_value.filter.return_value.order_by.return_value.first.return_value = None
+
+    assert repo.find_by_loan_id('loan1') is None
+
+
+def test_fine_find_by_loan_id_raises_repository_error_on_db_error(mock_session: Mock) -> None:
+    repo = SQLAlchemyFineRepository(session=mock_session)
+    mock_session.query.side_effect = sa_exc.SQLAlchemyError('DB error')
+
+    with pytest.raises(RepositoryError, match='Failed to retrieve fine for loan'):
+        repo.find_by_loan_id('loan1')
+
+
 def test_fine_get_by_id(mock_session: Mock) -> None:
     repo = SQLAlchemyFineRepository(session=mock_session)
     mock_fine = FineFactory.build()
@@ -260,18 +325,18 @@ def test_fine_save_new_fine(mock_session: Mock) -> None:
         repo.save(mock_fine)
 
         mock_session.add.assert_called_once_with(mock_model)
-        mock_session.commit.assert_called_once()
+        mock_session.flush.assert_called_once()
         assert mock_fine.id == str(mock_model.id)
 
 
-def test_fine_save_new_fine_rollback_on_error(mock_session: Mock) -> None:
+def test_fine_save_new_fine_raises_repository_error_on_db_error(mock_session: Mock) -> None:
     repo = SQLAlchemyFineRepository(session=mock_session)
     mock_fine = Mock()
     mock_fine.id = None
     mock_model = FineFactory.build()
 
     mock_session.get.return_value = None
-    mock_session.commit.side_effect = sa_exc.SQLAlchemyError('DB error')
+    mock_session.flush.side_effect = sa_exc.SQLAlchemyError('DB error')
 
     with patch('lms.infrastructure.database.repositories.patrons.FineMapper') as mock_mapper:
         mock_mapper.from_entity.return_value = mock_model
@@ -279,7 +344,7 @@ def test_fine_save_new_fine_rollback_on_error(mock_session: Mock) -> None:
         with pytest.raises(RepositoryError, match='Failed to save fine'):
             repo.save(mock_fine)
 
-        mock_session.rollback.assert_called_once()
+        mock_session.rollback.assert_not_called()
 
 
 def test_fine_save_existing_fine(mock_session: Mock) -> None:
@@ -295,11 +360,11 @@ def test_fine_save_existing_fine(mock_session: Mock) -> None:
     result = repo.save(mock_fine)
 
     assert mock_model.paid_date is None
-    mock_session.commit.assert_called_once()
+    mock_session.flush.assert_called_once()
     assert result == mock_fine
 
 
-def test_fine_save_existing_fine_rollback_on_error(mock_session: Mock) -> None:
+def test_fine_save_existing_fine_raises_repository_error_on_db_error(mock_session: Mock) -> None:
     repo = SQLAlchemyFineRepository(session=mock_session)
     mock_fine = Mock()
     mock_fine.id = 'fine1'
@@ -308,12 +373,12 @@ def test_fine_save_existing_fine_rollback_on_error(mock_session: Mock) -> None:
 
     mock_model = Mock()
     mock_session.get.return_value = mock_model
-    mock_session.commit.side_effect = sa_exc.SQLAlchemyError('DB Error')
+    mock_session.flush.side_effect = sa_exc.SQLAlchemyError('DB Error')
 
     with pytest.raises(RepositoryError, match='Failed to update fine'):
         repo.save(mock_fine)
 
-    mock_session.rollback.assert_called_once()
+    mock_session.rollback.assert_not_called()
 
 
 def test_fine_delete_by_id(mock_session: Mock) -> None:
@@ -322,14 +387,14 @@ def test_fine_delete_by_id(mock_session: Mock) -> None:
     repo.delete_by_id('fine1')
 
     mock_session.query.return_value.filter_by.return_value.delete.assert_called_once()
-    mock_session.commit.assert_called_once()
+    mock_session.commit.assert_not_called()
 
 
-def test_fine_delete_by_id_rollback_on_error(mock_session: Mock) -> None:
+def test_fine_delete_by_id_raises_repository_error_on_db_error(mock_session: Mock) -> None:
     repo = SQLAlchemyFineRepository(session=mock_session)
     mock_session.query.return_value.filter_by.return_value.delete.side_effect = sa_exc.SQLAlchemyError('DB error')
 
     with pytest.raises(RepositoryError, match='Failed to delete fine'):
         repo.delete_by_id('fine1')
 
-    mock_session.rollback.assert_called_once()
+    mock_session.rollback.assert_not_called()
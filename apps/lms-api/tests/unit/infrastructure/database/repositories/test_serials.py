@@ -21,7 +21,7 @@ def test_serial_find_all(mock_session: Mock) -> None:
     repo = SQLAlchemySerialRepository(session=mock_session)
     mock_serial1 = SerialFactory.build()
     mock_serial2 = SerialFactory.build()
-    mock_session.query.return_value.all.return_value = [mock_serial1, mock_serial2]
+    mock_session.query.return_value.order_by.return_value.all.return_value = [mock_serial1, mock_serial2]
 
     with patch('lms.infrastructure.database.repositories.serials.SerialMapper') as mock_mapper:
         mock_mapper.to_entity.side_effect = lambda m: m
@@ -82,18 +82,18 @@ def test_serial_save_new_serial(mock_session: Mock) -> None:
         repo.save(mock_serial)
 
         mock_session.add.assert_called_once_with(mock_model)
-        mock_session.commit.assert_called_once()
+        mock_session.flush.assert_called_once()
         assert mock_serial.id == str(mock_model.id)
 
 
-def test_serial_save_new_serial_rollback_on_error(mock_session: Mock) -> None:
+def test_serial_save_new_serial_raises_repository_error_on_db_error(mock_session: Mock) -> None:
     repo = SQLAlchemySerialRepository(session=mock_session)
     mock_serial = Mock()
     mock_serial.id = None
     mock_model = SerialFactory.build()
 
     mock_session.get.return_value = None
-    mock_session.commit.side_effect = sa_exc.SQLAlchemyError('DB error')
+    mock_session.flush.side_effect = sa_exc.SQLAlchemyError('DB error')
 
     with patch('lms.infrastructure.database.repositories.serials.SerialMapper') as mock_mapper:
         mock_mapper.from_entity.return_value = mock_model
@@ -101,7 +101,7 @@ def test_serial_save_new_serial_rollback_on_error(mock_session: Mock) -> None:
         with pytest.raises(RepositoryError, match='Failed to save serial'):
             repo.save(mock_serial)
 
-        mock_session.rollback.assert_called_once()
+        mock_session.rollback.assert_not_called()
 
 
 def test_serial_save_existing_serial(mock_session: Mock) -> None:
@@ -121,11 +121,11 @@ def test_serial_save_existing_serial(mock_session: Mock) -> None:
 
     assert mock_model.title == 'Updated Serial'
     assert mock_model.issn == '1234-5678'
-    mock_session.commit.assert_called_once()
+    mock_session.flush.assert_called_once()
     assert result == mock_serial
 
 
-def test_serial_save_existing_serial_rollback_on_error(mock_session: Mock) -> None:
+def test_serial_save_existing_serial_raises_repository_error_on_db_error(mock_session: Mock) -> None:
     repo = SQLAlchemySerialRepository(session=mock_session)
     mock_serial = Mock()
     mock_serial.id = 'serial1'
@@ -137,12 +137,12 @@ def test_serial_save_existing_serial_rollback_on_error(mock_session: Mock) -> No
 
     mock_model = Mock()
     mock_session.get.return_value = mock_model
-    mock_session.commit.side_effect = sa_exc.SQLAlchemyError('DB Error')
+    mock_session.flush.side_effect = sa_exc.SQLAlchemyError('DB Error')
 
     with pytest.raises(RepositoryError, match='Failed to save serial'):
         repo.save(mock_serial)
 
-    mock_session.rollback.assert_called_once()
+    mock_session.rollback.assert_not_called()
 
 
 def test_serial_delete_by_id(mock_session: Mock) -> None:
@@ -151,17 +151,17 @@ def test_serial_delete_by_id(mock_session: Mock) -> None:
     repo.delete_by_id('serial1')
 
     mock_session.query.return_value.filter_by.return_value.delete.assert_called_once()
-    mock_session.commit.assert_called_once()
+    mock_session.commit.assert_not_called()
 
 
-def test_serial_delete_by_id_rollback_on_error(mock_session: Mock) -> None:
+def test_serial_delete_by_id_raises_repository_error_on_db_error(mock_session: Mock) -> None:
     repo = SQLAlchemySerialRepository(session=mock_session)
     mock_session.query.return_value.filter_by.return_value.delete.side_effect = sa_exc.SQLAlchemyError('DB error')
 
     with pytest.raises(RepositoryError, match='Failed to delete serial'):
         repo.delete_by_id('serial1')
 
-    mock_session.rollback.assert_called_once()
+    mock_session.rollback.assert_not_called()
 
 
 # SQLAlchemySerialIssueRepository Tests
@@ -169,7 +169,7 @@ def test_serial_issue_find_all(mock_session: Mock) -> None:
     repo = SQLAlchemySerialIssueRepository(session=mock_session)
     mock_issue1 = SerialIssueFactory.build()
     mock_issue2 = SerialIssueFactory.build()
-    mock_session.query.return_value.all.return_value = [mock_issue1, mock_issue2]
+    mock_session.query.return_value.order_by.return_value.all.return_value = [mock_issue1, mock_issue2]
 
     with patch('lms.infrastructure.database.repositories.serials.SerialIssueMapper') as mock_mapper:
         mock_mapper.to_entity.side_effect = lambda m: m
@@ -230,18 +230,18 @@ def test_serial_issue_save_new_issue(mock_session: Mock) -> None:
         repo.save(mock_issue)
 
         mock_session.add.assert_called_once_with(mock_model)
-        mock_session.commit.assert_called_once()
+        mock_session.flush.assert_called_once()
         assert mock_issue.id == str(mock_model.id)
 
 
-def test_serial_issue_save_new_issue_rollback_on_error(mock_session: Mock) -> None:
+def test_serial_issue_save_new_issue_raises_repository_error_on_db_error(mock_session: Mock) -> None:
     repo = SQLAlchemySerialIssueRepository(session=mock_session)
     mock_issue = Mock()
     mock_issue.id = None
     mock_model = SerialIssueFactory.build()
 
     mock_session.get.return_value = None
-    mock_session.commit.side_effect = sa_exc.SQLAlchemyError('DB error')
+    mock_session.flush.side_effect = sa_exc.SQLAlchemyError('DB error')
 
     with patch('lms.infrastructure.database.repositories.serials.SerialIssueMapper') as mock_mapper:
         mock_mapper.from_entity.return_value = mock_model
@@ -249,7 +249,7 @@ def test_serial_issue_save_new_issue_rollback_on_error(mock_session: Mock) -> No
         with pytest.raises(RepositoryError, match='Failed to save serial issue'):
             repo.save(mock_issue)
 
-        mock_session.rollback.assert_called_once()
+        mock_session.rollback.assert_not_called()
 
 
 def test_serial_issue_save_existing_issue(mock_session: Mock) -> None:
@@ -266,11 +266,11 @@ def test_serial_issue_save_existing_issue(mock_session: Mock) -> None:
     result = repo.save(mock_issue)
 
     assert mock_model.issue_number == '42'
-    mock_session.commit.assert_called_once()
+    mock_session.flush.assert_called_once()
     assert result == mock_issue
 
 
-def test_serial_issue_save_existing_issue_rollback_on_error(mock_session: Mock) -> None:
+def test_serial_issue_save_existing_issue_raises_repository_error_on_db_error(mock_session: Mock) -> None:
     repo = SQLAlchemySerialIssueRepository(session=mock_session)
     mock_issue = Mock()
     mock_issue.id = 'issue1'
@@ -280,12 +280,12 @@ def test_serial_issue_save_existing_issue_rollback_on_error(mock_session: Mock)
 
     mock_model = Mock()
     mock_session.get.return_value = mock_model
-    mock_session.commit.side_effect = sa_exc.SQLAlchemyError('DB Error')
+    mock_session.flush.side_effect = sa_exc.SQLAlchemyError('DB Error')
 
     with pytest.raises(RepositoryError, match='Failed to update serial issue'):
         repo.save(mock_issue)
 
-    mock_session.rollback.assert_called_once()
+    mock_session.rollback.assert_not_called()
 
 
 def test_serial_issue_delete_by_id(mock_session: Mock) -> None:
@@ -294,14 +294,14 @@ def test_serial_issue_delete_by_id(mock_session: Mock) -> None:
     repo.delete_by_id('issue1')
 
     mock_session.query.return_value.filter_by.return_value.delete.assert_called_once()
-    mock_session.commit.assert_called_once()
+    mock_session.commit.assert_not_called()
 
 
-def test_serial_issue_delete_by_id_rollback_on_error(mock_session: Mock) -> None:
+def test_serial_issue_delete_by_id_raises_repository_error_on_db_error(mock_session: Mock) -> None:
     repo = SQLAlchemySerialIssueRepository(session=mock_session)
     mock_session.query.return_value.filter_by.return_value.delete.side_effect = sa_exc.SQLAlchemyError('DB error')
 
     with pytest.raises(RepositoryError, match='Failed to delete serial issue'):
         repo.delete_by_id('issue1')
 
-    mock_session.rollback.assert_called_once()
+    mock_session.rollback.assert_not_called()
@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import uuid
+from unittest.mock import patch
+
+from flask import Flask
+
+from lms.app.extensions import db
+from tests.unit.factories import PatronFactory, CategoryFactory, AcquisitionOrderLineFactory
+from lms.domain.patrons.entities import Patron
+from lms.infrastructure.database import identity_map
+from lms.infrastructure.database.cache import ReferenceCache
+from lms.infrastructure.database.batching import load_by_ids
+from lms.infrastructure.database.identity_map import identity_scope
+from lms.infrastructure.database.models.patrons import PatronModel
+from lms.infrastructure.database.instrumentation import track_queries
+from lms.infrastructure.database.mappers.patrons import PatronMapper
+from lms.infrastructure.database.repositories.patrons import SQLAlchemyPatronRepository
+from lms.infrastructure.database.repositories.catalogs import CachedCategoryRepository
+from lms.infrastructure.database.repositories.acquisitions import SQLAlchemyAcquisitionOrderRepository
+
+
+def test_load_by_ids_reads_one_chunk_per_query(app: Flask) -> None:
+    patron_ids = [str(PatronFactory().id) for _ in range(5)]
+    db.session.commit()
+    db.session.remove()
+
+    with track_queries() as queries:
+        patrons = load_by_ids(db.session, PatronModel, Patron, PatronMapper.to_entity, patron_ids, chunk_size=2)
+
+    assert queries.count == 3
+    assert {patron_id: patron.id for patron_id, patron in patrons.items()} == {i: i for i in patron_ids}
+
+
+def test_get_by_ids_keeps_caller_spelling_and_leaves_out_missing_ids(app: Flask) -> None:
+    patron_id = str(PatronFactory().id)
+    upper = patron_id.upper()
+    repository = SQLAlchemyPatronRepository(db.session)
+
+    patrons = repository.get_by_ids([patron_id, upper, str(uuid.uuid7()), 'not-an-id'])
+
+    assert patrons.keys() == {patron_id, upper}
+    assert patrons[patron_id].id == patron_id
+    assert repository.get_by_ids([]) == {}
+
+
+def test_get_by_ids_reuses_the_identity_map(app: Flask) -> None:
+    mapped_id, other_id = str(PatronFactory().id), str(PatronFactory().id)
+    repository = SQLAlchemyPatronRepository(db.session)
+
+    with identity_scope(), track_queries() as queries:
+        mapped = repository.get_by_id(mapped_id)
+        patrons = repository.get_by_ids([mapped_id, other_id])
+        assert identity_map.get(Patron, other_id) is patrons[other_id]
+
+    assert patrons[mapped_id] is mapped
+    assert queries.count == 2
+
+
+def test_get_by_ids_loads_order_lines_with_their_orders(app: Flask) -> None:
+    order_ids = [str(AcquisitionOrderLineFactory().order.id) for _ in range(3)]
+    db.session.commit()
+    db.session.remove()
+
+    with track_queries() as queries:
+        orders = SQLAlchemyAcquisitionOrderRepository(db.session).get_by_ids(order_ids)
+
+    assert [len(orders[order_id].order_lines) for order_id in order_ids] == [1, 1, 1]
+    assert queries.count == 2
+
+
+def test_cached_repository_loads_only_the_misses(app: Flask) -> None:
+    cached_id, other_id = str(CategoryFactory().id), str(CategoryFactory().id)
+    cache = ReferenceCache(max_size=10)
+    repository = CachedCategoryRepository(db.session, cache)
+    repository.get_by_id(cached_id)
+
+    with patch.object(db.session, 'scalars', wraps=db.session.scalars) as scalars:
+        categories = repository.get_by_ids([cached_id, other_id])
+        assert repository.get_by_ids([cached_id, other_id]).keys() == {cached_id, other_id}
+
+    scalars.assert_called_once()
+    assert categories.keys() == {cached_id, other_id}
+    assert cache.snapshot()['category'] == {'size': 2, 'hits': 3, 'misses': 2, 'evictions': 0, 'invalidations': 0}
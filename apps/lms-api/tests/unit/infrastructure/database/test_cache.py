@@ -0,0 +1,223 @@
+from __future__ import annotations
+
+import uuid
+import typing as t
+from unittest.mock import Mock, patch
+
+from flask import Flask
+
+import pytest
+import sqlalchemy.exc as sa_exc
+
+from lms.app.services import preload_reference_cache, preload_reference_cache_on_first_request
+from lms.app.extensions import db
+from tests.unit.factories import StaffFactory, BranchFactory, CategoryFactory
+from lms.infrastructure.database import RepositoryError
+from lms.domain.organizations.entities import Branch
+from lms.infrastructure.database.cache import ReferenceCache
+from lms.infrastructure.database.models.organizations import BranchStatus
+from lms.infrastructure.database.repositories.organizations import CachedBranchRepository
+
+
+def _branch(name: str = 'Main') -> Branch:
+    return Branch(id=str(uuid.uuid7()), name=name)
+
+
+def test_reference_cache_counts_hits_and_misses() -> None:
+    cache = ReferenceCache(max_size=10)
+    branch = _branch()
+    load = Mock(return_value=branch)
+
+    first = cache.get('branch', branch.id, load)
+    second = cache.get('branch', branch.id.upper(), load)
+
+    assert first == second == branch
+    assert second is not branch
+    load.assert_called_once_with(branch.id)
+    assert cache.snapshot() == {'branch': {'size': 1, 'hits': 1, 'misses': 1, 'evictions': 0, 'invalidations': 0}}
+
+
+def test_reference_cache_hands_out_copies() -> None:
+    cache = ReferenceCache(max_size=10)
+    branch = _branch()
+    cache.get('branch', branch.id, lambda _: branch)
+
+    branch.name = 'Renamed'
+    cached = t.cast(Branch, cache.get('branch', branch.id, Mock()))
+    cached.status = BranchStatus.CLOSED.value
+
+    assert t.cast(Branch, cache.get('branch', branch.id, Mock())) == Branch(id=branch.id, name='Main')
+
+
+def test_reference_cache_copies_nested_values() -> None:
+    cache = ReferenceCache(max_size=10)
+    key = str(uuid.uuid7())
+    value = {'names': ['Main']}
+    cache.get('branch', key, lambda _: value)
+
+    value['names'].append('Annex')
+    t.cast(dict[str, list[str]], cache.get('branch', key, Mock()))['names'].append('Depot')
+
+    assert cache.get('branch', key, Mock()) == {'names': ['Main']}
+
+
+def test_reference_cache_evicts_least_recently_used() -> None:
+    cache = ReferenceCache(max_size=2)
+    a, b, c = _branch('a'), _branch('b'), _branch('c')
+    cache.put_many('branch', [(a.id, a), (b.id, b)])
+    cache.get('branch', a.id, Mock())
+
+    cache.put_many('branch', [(c.id, c)])
+
+    assert len(cache) == 2
+    assert cache.get('branch', b.id, lambda _: None) is None
+    assert cache.snapshot()['branch']['evictions'] == 1
+
+
+def test_reference_cache_reloads_expired_entries() -> None:
+    cache = ReferenceCache(max_size=10, ttl=30.0)
+    branch = _branch()
+    load = Mock(return_value=branch)
+
+    with patch('lms.infrastructure.database.cache.time.monotonic', side_effect=[100.0, 110.0, 140.0, 140.0]):
+        cache.get('branch', branch.id, load)
+        cache.get('branch', branch.id, load)
+        cache.get('branch', branch.id, load)
+
+    assert load.call_count == 2
+
+
+def test_reference_cache_drops_loads_racing_an_invalidation() -> None:
+    cache = ReferenceCache(max_size=10)
+    branch = _branch()
+
+    def load(key: str) -> Branch:
+        cache.invalidate('branch', key)
+        return branch
+
+    cache.get('branch', branch.id, load)
+
+    assert len(cache) == 0
+
+
+def test_reference_cache_skips_keys_that_are_not_ids() -> None:
+    cache = ReferenceCache(max_size=10)
+    load = Mock(return_value=None)
+
+    assert cache.get('branch', 'not-an-id', load) is None
+    cache.invalidate('branch', 'not-an-id')
+
+    load.assert_called_once_with('not-an-id')
+    assert cache.snapshot() == {}
+
+
+def test_cache_keys_ignore_id_spelling() -> None:
+    cache = ReferenceCache(max_size=10)
+    branch = _branch()
+    cache.put_many('branch', [(branch.id, branch)])
+
+    cache.invalidate('branch', uuid.UUID(branch.id).hex)
+
+    assert len(cache) == 0
+
+
+def test_cached_repository_serves_reads_from_cache(app: Flask) -> None:
+    branch_id = str(BranchFactory().id)
+    repository = CachedBranchRepository(db.session, ReferenceCache(max_size=10))
+    repository.get_by_id(branch_id)
+
+    with patch.object(db.session, 'get') as get:
+        branch = repository.get_by_id(branch_id)
+
+    get.assert_not_called()
+    assert branch is not None
+    assert branch.id == branch_id
+
+
+def test_cached_repository_reads_its_own_writes_from_the_session(app: Flask) -> None:
+    branch_id = str(BranchFactory(name='Old').id)
+    db.session.commit()
+    cache = ReferenceCache(max_size=10)
+    repository = CachedBranchRepository(db.session, cache)
+    branch = t.cast(Branch, repository.get_by_id(branch_id))
+
+    branch.name = 'New'
+    repository.save(branch)
+
+    assert t.cast(Branch, repository.get_by_id(branch_id)).name == 'New'
+    # Other sessions keep reading the committed row until the write commits.
+    assert len(cache) == 1
+    db.session.rollback()
+    db.session.remove()
+    assert t.cast(Branch, repository.get_by_id(branch_id)).name == 'Old'
+
+
+def test_unit_of_work_evicts_written_entries_after_the_commit(app: Flask) -> None:
+    branch_id, category_id = str(BranchFactory().id), str(CategoryFactory().id)
+    db.session.commit()
+    cache = app.container.reference_cache  # type: ignore
+    branch_service = app.container.branch_service  # type: ignore
+    category_service = app.container.category_service  # type: ignore
+    branch_service.get_branch(branch_id)
+    category_service.get_category(category_id)
+    db.session.remove()
+    committed = []
+
+    def invalidate(kind: str, key: str) -> None:
+        committed.append(not db.session().in_transaction())
+
+    with patch.object(cache, 'invalidate', side_effect=invalidate) as mock_invalidate:
+        branch_service.close_branch(branch_id)
+        category_service.update_category(category_id, name='Renamed')
+
+    assert [c.args for c in mock_invalidate.call_args_list] == [('branch', branch_id), ('category', category_id)]
+    assert committed == [True, True]
+
+
+def test_unit_of_work_keeps_entries_of_a_rolled_back_write(app: Flask) -> None:
+    branch_id = str(BranchFactory().id)
+    db.session.commit()
+    cache = app.container.reference_cache  # type: ignore
+    branch_service = app.container.branch_service  # type: ignore
+    branch_service.get_branch(branch_id)
+    db.session.remove()
+
+    failure = sa_exc.OperationalError('COMMIT', None, Exception('disk I/O error'))
+    with (
+        patch.object(cache, 'invalidate') as invalidate,
+        patch.object(db.session, 'commit', side_effect=failure),
+        pytest.raises(RepositoryError),
+    ):
+        branch_service.close_branch(branch_id)
+
+    invalidate.assert_not_called()
+    assert 'reference_cache_written' not in db.session.info
+    assert branch_service.get_branch(branch_id).status == BranchStatus.ACTIVE.value
+
+
+def test_preload_reference_cache(app: Flask) -> None:
+    StaffFactory.create_batch(2)
+    CategoryFactory()
+    db.session.commit()
+    cache = app.container.reference_cache  # type: ignore
+
+    preload_reference_cache(app)
+
+    assert {kind: stats['size'] for kind, stats in cache.snapshot().items()} == {
+        'branch': 2,
+        'staff': 2,
+        'category': 1,
+        'publisher': 0,
+    }
+
+
+def test_reference_cache_is_preloaded_by_the_first_request(app: Flask) -> None:
+    preload_reference_cache_on_first_request(app)
+
+    with patch('lms.app.services.preload_reference_cache') as preload:
+        client = app.test_client()
+        preload.assert_not_called()
+        client.get('/monitoring/health')
+        client.get('/monitoring/health')
+
+    preload.assert_called_once_with(app)
@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import uuid
+import typing as t
+import contextlib
+from unittest.mock import MagicMock, patch
+
+from flask import Flask
+from flask.testing import FlaskClient
+
+import pytest
+
+from lms.app.extensions import db
+from tests.unit.factories import CopyFactory, PatronFactory
+from lms.domain.patrons.entities import Patron
+from lms.infrastructure.database import identity_map
+from lms.domain.catalogs.entities import Copy
+from lms.infrastructure.database.identity_map import identity_scope
+from lms.infrastructure.database.unit_of_work import SQLAlchemyUnitOfWork
+from lms.infrastructure.database.repositories.patrons import SQLAlchemyPatronRepository
+from lms.infrastructure.database.repositories.catalogs import SQLAlchemyCopyRepository
+
+
+def test_identity_map_keys_by_type_and_canonical_id() -> None:
+    patron = Patron(id=str(uuid.uuid7()), name='Ada', email='ada@example.com', branch_id=str(uuid.uuid7()))
+    patron_id = t.cast(str, patron.id)
+
+    with identity_scope() as scope:
+        identity_map.add(Patron, patron_id, patron)
+
+        assert identity_map.get(Patron, patron_id.upper()) is patron
+        assert identity_map.get(Copy, patron_id) is None
+        assert identity_map.get(Patron, 'not-an-id') is None
+        identity_map.discard(Patron, uuid.UUID(patron_id).hex)
+        assert len(scope) == 0
+
+
+def test_identity_map_is_off_outside_a_scope() -> None:
+    patron = Patron(id=str(uuid.uuid7()), name='Ada', email='ada@example.com', branch_id=str(uuid.uuid7()))
+
+    assert identity_map.add(Patron, t.cast(str, patron.id), patron) is patron
+    assert identity_map.get(Patron, t.cast(str, patron.id)) is None
+
+
+def test_repository_maps_each_row_once_per_scope(app: Flask) -> None:
+    patron_id = str(PatronFactory().id)
+    repository = SQLAlchemyPatronRepository(db.session)
+
+    with identity_scope():
+        first = repository.get_by_id(patron_id)
+        with patch.object(db.session, 'get') as get:
+            second = repository.get_by_id(patron_id)
+
+    get.assert_not_called()
+    assert first is not None
+    assert second is first
+    assert repository.get_by_id(patron_id) is not first
+
+
+def test_repository_writes_drop_mapped_entities(app: Flask) -> None:
+    copy_id = str(CopyFactory().id)
+    repository = SQLAlchemyCopyRepository(db.session)
+
+    with identity_scope() as scope:
+        copy = t.cast(Copy, repository.get_by_id(copy_id))
+        repository.save(copy)
+        assert len(scope) == 0
+        repository.get_by_id(copy_id)
+        repository.delete_by_id(copy_id)
+        assert len(scope) == 0
+
+
+@pytest.mark.parametrize('fails', [False, True])
+def test_unit_of_work_empties_the_identity_map(fails: bool) -> None:
+    patron = Patron(id=str(uuid.uuid7()), name='Ada', email='ada@example.com', branch_id=str(uuid.uuid7()))
+
+    expectation = pytest.raises(ValueError) if fails else contextlib.nullcontext()
+
+    with identity_scope() as scope, patch('lms.infrastructure.database.unit_of_work.event_bus'):
+        with expectation, SQLAlchemyUnitOfWork(MagicMock(info={})):
+            identity_map.add(Patron, t.cast(str, patron.id), patron)
+            if fails:
+                raise ValueError
+        assert len(scope) == 0
+
+
+def test_rpc_calls_run_in_their_own_identity_scope(client: FlaskClient) -> None:
+    scopes = []
+
+    def get_all(self: SQLAlchemyPatronRepository, **kwargs: t.Any) -> list[Patron]:  # noqa: ANN401
+        scopes.append(identity_map._current.get())
+        return []
+
+    with patch.object(SQLAlchemyPatronRepository, 'find_all', get_all):
+        for _ in range(2):
+            rv = client.post('/api/patrons', json={'jsonrpc': '2.0', 'method': 'Patrons.list', 'params': {}, 'id': 1})
+            assert rv.status_code == 200
+
+    assert all(scope is not None for scope in scopes)
+    assert scopes[0] is not scopes[1]
@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import uuid
+import typing as t
+import datetime
+
+from flask import Flask
+
+import pytest
+import sqlalchemy as sa
+
+from lms.app.extensions import db
+from lms.domain.circulations.entities import Hold
+from lms.infrastructure.database.repositories.patrons import SQLAlchemyFineRepository, SQLAlchemyPatronRepository
+from lms.infrastructure.database.repositories.acquisitions import SQLAlchemyAcquisitionOrderLineRepository
+from lms.infrastructure.database.repositories.circulations import SQLAlchemyHoldRepository, SQLAlchemyLoanRepository
+
+ID = str(uuid.uuid7())
+
+
+def explain_query_plan(query: t.Callable[[], object]) -> str:
+    statements: list[tuple[str, t.Any]] = []
+
+    def record(conn: t.Any, cursor: t.Any, statement: str, parameters: t.Any, *args: t.Any) -> None:  # noqa: ANN401
+        statements.append((statement, parameters))
+
+    sa.event.listen(db.engine, 'before_cursor_execute', record)
+    try:
+        query()
+    finally:
+        sa.event.remove(db.engine, 'before_cursor_execute', record)
+    connection = db.session.connection()
+    return '\n'.join(
+        row[-1]
+        for statement, parameters in statements
+        for row in connection.exec_driver_sql(f'EXPLAIN QUERY PLAN {statement}', parameters)
+    )
+
+
+@pytest.mark.parametrize(
+    ('query', 'indexes'),
+    [
+        (
+            lambda: SQLAlchemyLoanRepository(db.session).find_by_patron_id(ID),
+            ['SEARCH loans USING INDEX ix_loans_patron_id_return_date'],
+        ),
+        (
+            lambda: SQLAlchemyHoldRepository(db.session).find_active_holds_by_patron(ID),
+            ['SEARCH holds USING INDEX ix_holds_patron_id_status'],
+        ),
+        (
+            lambda: SQLAlchemyHoldRepository(db.session).find_active_holds_by_item(ID),
+            ['SEARCH holds USING INDEX ix_holds_item_id_queue'],
+        ),
+        (
+            lambda: SQLAlchemyHoldRepository(db.session).find_next_hold_for_item(ID),
+            ['SEARCH holds USING INDEX ix_holds_item_id_queue'],
+        ),
+        (
+            lambda: SQLAlchemyHoldRepository(db.session).count_holds_ahead(
+                Hold(id=ID, item_id=ID, patron_id=ID, request_date=datetime.date.today())
+            ),
+            ['SEARCH holds USING INDEX ix_holds_item_id_queue'],
+        ),
+        (
+            lambda: SQLAlchemyHoldRepository(db.session).expire_pending_holds(datetime.date.today(), limit=500),
+            ['SEARCH holds USING INDEX ix_holds_expiry_date_pending'],
+        ),
+        (
+            lambda: SQLAlchemyPatronRepository(db.session).get_eligibility(ID, copy_id=ID),
+            [
+                'SEARCH loans USING INDEX ix_loans_patron_id_return_date',
+                'SEARCH holds USING INDEX ix_holds_patron_id_status',
+                'SEARCH fines USING INDEX ix_fines_patron_id_status',
+                'SEARCH loans USING INDEX ix_loans_copy_id_active',
+            ],
+        ),
+        (
+            lambda: SQLAlchemyLoanRepository(db.session).find_overdue(
+                datetime.date.today(), limit=500, after=(datetime.date.today(), ID)
+            ),
+            ['SEARCH loans USING INDEX ix_loans_due_date_active'],
+        ),
+        (
+            lambda: SQLAlchemyFineRepository(db.session).find_by_loan_id(ID),
+            ['SEARCH fines USING INDEX ix_fines_loan_id'],
+        ),
+        (
+            lambda: SQLAlchemyAcquisitionOrderLineRepository(db.session).find_by_order(ID),
+            ['SEARCH acquisition_order_lines USING INDEX ix_acquisition_order_lines_order_id'],
+        ),
+    ],
+    ids=[
+        'loans_by_patron',
+        'pending_holds_by_patron',
+        'pending_holds_by_item',
+        'next_hold_for_item',
+        'holds_ahead',
+        'expired_holds',
+        'patron_eligibility',
+        'overdue_loans',
+        'fine_by_loan',
+        'order_lines',
+    ],
+)
+def test_hot_queries_use_indexes(app: Flask, query: t.Callable[[], object], indexes: list[str]) -> None:
+    # Whether SQLite reports an index as covering depends on its version, so only the index name is checked.
+    plan = explain_query_plan(query).replace('USING COVERING INDEX', 'USING INDEX')
+
+    for index in indexes:
+        assert index in plan, plan
@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+import typing as t
+
+import pytest
+import sqlalchemy as sa
+
+from lms.infrastructure.database.instrumentation import instrument, track_queries
+
+
+@pytest.fixture
+def engine() -> t.Generator[sa.Engine]:
+    engine = sa.create_engine('sqlite://')
+    instrument(engine)
+    yield engine
+    engine.dispose()
+
+
+def test_track_queries_counts_statements_and_repeated_shapes(engine: sa.Engine) -> None:
+    with engine.connect() as conn, track_queries() as queries:
+        for value in range(3):
+            conn.execute(sa.text('SELECT :value'), {'value': value})
+        conn.execute(sa.text('SELECT 1'))
+
+    assert queries.count == 4
+    assert queries.seconds > 0
+    assert queries.repeated == 2
+    assert queries.most_repeated() == ('SELECT ?', 3)
+
+
+def test_queries_outside_tracking_are_ignored(engine: sa.Engine) -> None:
+    with engine.connect() as conn:
+        conn.execute(sa.text('SELECT 1'))
+        with track_queries() as queries:
+            pass
+
+    assert queries.count == 0
+    assert queries.most_repeated() is None
+
+
+def test_failed_statements_do_not_leave_their_start_time_on_the_connection(engine: sa.Engine) -> None:
+    with engine.connect() as conn, track_queries() as queries:
+        with pytest.raises(sa.exc.OperationalError):
+            conn.execute(sa.text('SELECT * FROM missing'))
+        conn.execute(sa.text('SELECT 1'))
+
+        assert conn.info['query_started'] == []
+    assert queries.count == 1
+
+
+def test_instrument_is_idempotent(engine: sa.Engine) -> None:
+    instrument(engine)
+
+    with engine.connect() as conn, track_queries() as queries:
+        conn.execute(sa.text('SELECT 1'))
+
+    assert queries.count == 1
@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+import uuid
+import typing as t
+import datetime
+from dataclasses import dataclass
+from unittest.mock import MagicMock, patch
+
+from flask import Flask
+
+import pytest
+import sqlalchemy as sa
+import sqlalchemy.exc as sa_exc
+
+from lms.domain import DomainEvent
+from lms.app.extensions import db
+from tests.unit.factories import BranchFactory
+from lms.infrastructure.database import RepositoryError
+from lms.infrastructure.event_bus import event_bus
+from lms.infrastructure.database.outbox import OutboxRelay, SQLAlchemyOutbox
+from lms.infrastructure.database.unit_of_work import SQLAlchemyUnitOfWork
+from lms.infrastructure.database.models.outbox import OutboxEventModel
+from lms.infrastructure.database.models.organizations import BranchModel
+
+
+@dataclass
+class OutboxTestEvent(DomainEvent):
+    branch_id: str
+    name: str
+
+
+@dataclass
+class UnhandledOutboxTestEvent(DomainEvent):
+    value: int
+
+
+@pytest.fixture
+def received() -> t.Generator[list[OutboxTestEvent]]:
+    received: list[OutboxTestEvent] = []
+
+    def handler(event: OutboxTestEvent) -> None:
+        # Writes through the same session, like a service handler would.
+        db.session.execute(sa.update(BranchModel).where(BranchModel.id == event.branch_id).values(name=event.name))
+        if event.name == 'fail':
+            raise ValueError('boom')
+        received.append(event)
+
+    event_bus.subscribe(OutboxTestEvent, handler, background=True)
+    # The bus holds handlers weakly, so the subscription ends with this fixture.
+    yield received
+
+
+@pytest.fixture
+def unit_of_work(app: Flask) -> SQLAlchemyUnitOfWork:
+    return SQLAlchemyUnitOfWork(db.session, outbox=SQLAlchemyOutbox(db.session))
+
+
+@pytest.fixture
+def relay(unit_of_work: SQLAlchemyUnitOfWork) -> OutboxRelay:
+    return OutboxRelay(db.session, unit_of_work, max_attempts=2)
+
+
+def test_events_with_background_handlers_are_stored_with_the_transaction(
+    unit_of_work: SQLAlchemyUnitOfWork, received: list[OutboxTestEvent]
+) -> None:
+    branch = BranchFactory()
+    event = OutboxTestEvent(branch_id=str(branch.id), name='Renamed')
+
+    with unit_of_work:
+        event_bus.add_event(event)
+        event_bus.add_event(UnhandledOutboxTestEvent(value=1))
+
+    assert received == []
+    model = db.session.scalars(sa.select(OutboxEventModel)).one()
+    assert model.id == uuid.UUID(event.event_id)
+    assert model.event_type == 'OutboxTestEvent'
+    assert model.delivered_at is None
+    assert model.attempts == 0
+
+
+def test_rolled_back_transaction_stores_no_events(unit_of_work: SQLAlchemyUnitOfWork, received: list) -> None:
+    with pytest.raises(ValueError), unit_of_work:
+        event_bus.add_event(OutboxTestEvent(branch_id=str(uuid.uuid7()), name='Renamed'))
+        raise ValueError('boom')
+
+    assert db.session.scalars(sa.select(OutboxEventModel)).all() == []
+
+
+def test_relay_delivers_events_in_order_and_marks_them(
+    unit_of_work: SQLAlchemyUnitOfWork, relay: OutboxRelay, received: list[OutboxTestEvent]
+) -> None:
+    branch = BranchFactory()
+    events = [OutboxTestEvent(branch_id=str(branch.id), name=f'Renamed {i}') for i in range(3)]
+    with unit_of_work:
+        for event in events:
+            event_bus.add_event(event)
+
+    assert relay.relay(batch_size=2) == 2
+    assert relay.relay(batch_size=2) == 1
+    assert relay.relay(batch_size=2) == 0
+
+    assert received == events
+    assert [e.event_id for e in received] == [e.event_id for e in events]
+    assert all(model.delivered_at is not None for model in db.session.scalars(sa.select(OutboxEventModel)))
+    assert db.session.get(BranchModel, branch.id).name == 'Renamed 2'
+
+
+def test_relay_rolls_back_a_failing_handler_and_retries_it(
+    unit_of_work: SQLAlchemyUnitOfWork, relay: OutboxRelay, received: list[OutboxTestEvent]
+) -> None:
+    branch = BranchFactory(name='Original')
+    failing = OutboxTestEvent(branch_id=str(branch.id), name='fail')
+    with unit_of_work:
+        event_bus.add_event(failing)
+        event_bus.add_event(OutboxTestEvent(branch_id=str(uuid.uuid7()), name='Other'))
+
+    assert relay.relay(batch_size=10) == 2
+    db.session.expire_all()
+    assert db.session.get(BranchModel, branch.id).name == 'Original'
+    assert db.session.get(OutboxEventModel, uuid.UUID(failing.event_id)).attempts == 1
+    assert [e.name for e in received] == ['Other']
+
+    assert relay.relay(batch_size=10) == 1
+    assert relay.relay(batch_size=10) == 0
+    model = db.session.get(OutboxEventModel, uuid.UUID(failing.event_id))
+    assert model.attempts == 2
+    assert model.delivered_at is None
+
+
+def test_relay_marks_events_without_handlers_delivered(relay: OutboxRelay) -> None:
+    db.session.execute(
+        sa.insert(OutboxEventModel),
+        [{'id': uuid.uuid7(), 'event_type': 'RemovedEvent', 'payload': b'\x80', 'created_at': datetime.datetime.now()}],
+    )
+
+    assert relay.relay(batch_size=10) == 1
+    assert db.session.scalars(sa.select(OutboxEventModel.delivered_at)).one() is not None
+
+
+def test_outbox_add_all_raises_repository_error_on_db_error(received: list) -> None:
+    session = MagicMock()
+    session.execute.side_effect = sa_exc.SQLAlchemyError('DB error')
+
+    with pytest.raises(RepositoryError, match='Failed to write events to the outbox'):
+        SQLAlchemyOutbox(session).add_all([OutboxTestEvent(branch_id='b', name='n')])
+
+
+def test_outbox_add_all_skips_events_without_background_handlers() -> None:
+    session = MagicMock()
+
+    SQLAlchemyOutbox(session).add_all([UnhandledOutboxTestEvent(value=1)])
+
+    session.execute.assert_not_called()
+
+
+def test_relay_raises_repository_error_when_the_outbox_cannot_be_read() -> None:
+    session = MagicMock(info={})
+    session.scalars.side_effect = sa_exc.SQLAlchemyError('DB error')
+
+    with (
+        patch('lms.infrastructure.database.unit_of_work.event_bus'),
+        pytest.raises(RepositoryError, match='Failed to read the outbox'),
+    ):
+        OutboxRelay(session, SQLAlchemyUnitOfWork(session)).relay(batch_size=10)
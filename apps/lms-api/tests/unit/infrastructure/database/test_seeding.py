@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import datetime
+
+from flask import Flask
+
+import sqlalchemy as sa
+
+from lms.app.extensions import db
+from lms.infrastructure.database.seeding import LOAN_DAYS, SeedOptions, seed
+from lms.infrastructure.database.models.patrons import FineModel
+from lms.infrastructure.database.models.catalogs import CopyModel, CopyStatus
+from lms.infrastructure.database.models.circulations import HoldModel, LoanModel, HoldStatus
+from lms.infrastructure.database.models.organizations import BranchModel
+
+OPTIONS = SeedOptions(
+    branches=3, items=60, copies_per_item=2, patrons=80, loan_history_years=1, as_of=datetime.date(2026, 6, 1)
+)
+
+
+def _snapshot() -> list[tuple[object, ...]]:
+    return [
+        tuple(row) for row in db.session.execute(sa.select(LoanModel.id, LoanModel.copy_id, LoanModel.patron_id)).all()
+    ]
+
+
+def test_seed_counts_rows_per_table(app: Flask) -> None:
+    counts = seed(db.session, OPTIONS)
+
+    assert counts['branches'] == 3
+    assert counts['staff'] == 3 * OPTIONS.staff_per_branch
+    assert counts['items'] == 60
+    assert counts['copies'] == 120
+    assert counts['patrons'] == 80
+    assert counts['loans'] == db.session.scalar(sa.select(sa.func.count()).select_from(LoanModel))
+    assert all(branch.manager_id is not None for branch in db.session.scalars(sa.select(BranchModel)))
+
+
+def test_seed_is_deterministic(app: Flask) -> None:
+    seed(db.session, OPTIONS)
+    first = _snapshot()
+    for table in reversed(db.metadata.sorted_tables):
+        db.session.execute(table.delete())
+    db.session.commit()
+
+    seed(db.session, OPTIONS)
+
+    assert _snapshot() == first
+
+
+def test_seed_respects_circulation_rules(app: Flask) -> None:
+    seed(db.session, OPTIONS)
+
+    active_loans = db.session.scalars(sa.select(LoanModel).where(LoanModel.return_date.is_(None))).all()
+    assert active_loans
+    assert len({loan.patron_id for loan in active_loans}) == len(active_loans)
+    checked_out = db.session.scalars(sa.select(CopyModel.id).where(CopyModel.status == CopyStatus.CHECKED_OUT)).all()
+    assert sorted(checked_out) == sorted(loan.copy_id for loan in active_loans)
+    pending = sa.select(sa.func.count()).where(HoldModel.status == HoldStatus.PENDING).group_by(HoldModel.patron_id)
+    assert max(db.session.scalars(pending), default=0) <= 2
+    for fine in db.session.scalars(sa.select(FineModel)):
+        loan = db.session.get(LoanModel, fine.loan_id)
+        assert loan.return_date > loan.loan_date + datetime.timedelta(days=LOAN_DAYS)
@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import typing as t
+from unittest.mock import MagicMock, patch
+
+import pytest
+import sqlalchemy.exc as sa_exc
+
+from lms.infrastructure.database import RepositoryError
+from lms.infrastructure.database.unit_of_work import SQLAlchemyUnitOfWork
+
+
+@pytest.fixture
+def mock_session() -> MagicMock:
+    return MagicMock(info={})
+
+
+@pytest.fixture
+def mock_event_bus() -> t.Generator[MagicMock]:
+    with patch('lms.infrastructure.database.unit_of_work.event_bus') as mock_event_bus:
+        yield mock_event_bus
+
+
+def test_unit_of_work_commits_then_publishes_events(mock_session: MagicMock, mock_event_bus: MagicMock) -> None:
+    manager = MagicMock()
+    manager.attach_mock(mock_session.commit, 'commit')
+    manager.attach_mock(mock_event_bus.publish_events, 'publish_events')
+
+    with SQLAlchemyUnitOfWork(mock_session):
+        pass
+
+    assert [c[0] for c in manager.mock_calls] == ['commit', 'publish_events']
+    mock_session.rollback.assert_not_called()
+
+
+def test_unit_of_work_nested_commits_once(mock_session: MagicMock, mock_event_bus: MagicMock) -> None:
+    uow = SQLAlchemyUnitOfWork(mock_session)
+
+    with uow:
+        with uow:
+            pass
+        mock_session.commit.assert_not_called()
+
+    mock_session.commit.assert_called_once()
+    mock_event_bus.publish_events.assert_called_once()
+    assert mock_session.info['unit_of_work_depth'] == 0
+
+
+def test_unit_of_work_rolls_back_and_discards_events_on_error(
+    mock_session: MagicMock, mock_event_bus: MagicMock
+) -> None:
+    with pytest.raises(ValueError), SQLAlchemyUnitOfWork(mock_session):
+        raise ValueError('boom')
+
+    mock_session.commit.assert_not_called()
+    mock_session.rollback.assert_called_once()
+    mock_event_bus.discard_events.assert_called_once()
+    mock_event_bus.publish_events.assert_not_called()
+
+
+def test_unit_of_work_commit_failure_raises_repository_error(
+    mock_session: MagicMock, mock_event_bus: MagicMock
+) -> None:
+    mock_session.commit.side_effect = sa_exc.SQLAlchemyError('DB error')
+
+    with pytest.raises(RepositoryError, match='Failed to commit unit of work'), SQLAlchemyUnitOfWork(mock_session):
+        pass
+
+    mock_session.rollback.assert_called_once()
+    mock_event_bus.discard_events.assert_called_once()
+    mock_event_bus.publish_events.assert_not_called()
+
+
+def test_unit_of_work_with_outbox_stores_events_before_commit(
+    mock_session: MagicMock, mock_event_bus: MagicMock
+) -> None:
+    outbox = MagicMock()
+    manager = MagicMock()
+    manager.attach_mock(outbox.add_all, 'add_all')
+    manager.attach_mock(mock_session.commit, 'commit')
+    manager.attach_mock(mock_event_bus.publish_events, 'publish_events')
+    manager.attach_mock(mock_event_bus.discard_events, 'discard_events')
+
+    with SQLAlchemyUnitOfWork(mock_session, outbox=outbox):
+        pass
+
+    assert [c[0] for c in manager.mock_calls] == ['add_all', 'commit', 'publish_events', 'discard_events']
+    outbox.add_all.assert_called_once_with(mock_event_bus.pending_events.return_value)
+    mock_event_bus.publish_events.assert_called_once_with(background=False)
+
+
+def test_unit_of_work_without_outbox_publishes_background_handlers(
+    mock_session: MagicMock, mock_event_bus: MagicMock
+) -> None:
+    with SQLAlchemyUnitOfWork(mock_session):
+        pass
+
+    mock_event_bus.publish_events.assert_called_once_with(background=True)
+
+
+def test_unit_of_work_outbox_failure_rolls_back(mock_session: MagicMock, mock_event_bus: MagicMock) -> None:
+    outbox = MagicMock()
+    outbox.add_all.side_effect = RepositoryError('Failed to write events to the outbox')
+
+    with (
+        pytest.raises(RepositoryError, match='Failed to write events to the outbox'),
+        SQLAlchemyUnitOfWork(mock_session, outbox=outbox),
+    ):
+        pass
+
+    mock_session.commit.assert_not_called()
+    mock_session.rollback.assert_called_once()
+    mock_event_bus.discard_events.assert_called_once()
@@ -0,0 +1,353 @@
+from __future__ import annotations
+
+import time
+import threading
+from contextlib import contextmanager
+import contextvars
+from dataclasses import dataclass
+from unittest.mock import patch
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from lms.infrastructure.event_bus import BlinkerEventBus, BackgroundDispatcher
+
+
+@dataclass
+class SampleEvent:
+    owner: int
+    sequence: int
+
+
+def test_publish_events_sends_pending_events_in_order() -> None:
+    bus = BlinkerEventBus()
+    received: list[SampleEvent] = []
+
+    def handler(event: SampleEvent) -> None:
+        received.append(event)
+
+    bus.subscribe(SampleEvent, handler)
+
+    bus.add_event(SampleEvent(owner=1, sequence=1))
+    bus.add_event(SampleEvent(owner=1, sequence=2))
+    bus.publish_events()
+    bus.publish_events()
+
+    assert received == [SampleEvent(owner=1, sequence=1), SampleEvent(owner=1, sequence=2)]
+
+
+def test_discard_events_drops_pending_events() -> None:
+    bus = BlinkerEventBus()
+    received: list[SampleEvent] = []
+
+    def handler(event: SampleEvent) -> None:
+        received.append(event)
+
+    bus.subscribe(SampleEvent, handler)
+
+    bus.add_event(SampleEvent(owner=1, sequence=1))
+    bus.discard_events()
+    bus.publish_events()
+
+    assert received == []
+
+
+def test_events_added_in_a_copied_context_stay_there() -> None:
+    bus = BlinkerEventBus()
+    received: list[SampleEvent] = []
+
+    def handler(event: SampleEvent) -> None:
+        received.append(event)
+
+    bus.subscribe(SampleEvent, handler)
+    bus.add_event(SampleEvent(owner=1, sequence=1))
+
+    contextvars.copy_context().run(bus.add_event, SampleEvent(owner=2, sequence=1))
+    bus.publish_events()
+
+    assert received == [SampleEvent(owner=1, sequence=1)]
+
+
+def test_concurrent_contexts_never_see_each_other_events() -> None:
+    bus = BlinkerEventBus()
+    workers, rounds, events_per_round = 32, 50, 5
+    barrier = threading.Barrier(workers)
+    received: dict[int, list[list[SampleEvent]]] = {owner: [] for owner in range(workers)}
+    current: dict[int, list[SampleEvent]] = {}
+
+    def handler(event: SampleEvent) -> None:
+        current[threading.get_ident()].append(event)
+
+    bus.subscribe(SampleEvent, handler)
+
+    def request(owner: int) -> None:
+        for round_ in range(rounds):
+            # Every worker buffers its events before anyone publishes or discards, maximising interleaving.
+            for sequence in range(events_per_round):
+                bus.add_event(SampleEvent(owner=owner, sequence=round_ * events_per_round + sequence))
+            barrier.wait()
+            current[threading.get_ident()] = []
+            if (owner + round_) % 3 == 0:
+                bus.discard_events()
+            bus.publish_events()
+            received[owner].append(current.pop(threading.get_ident()))
+            barrier.wait()
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for future in [executor.submit(request, owner) for owner in range(workers)]:
+            future.result()
+
+    for owner, rounds_received in received.items():
+        assert len(rounds_received) == rounds
+        for round_, events in enumerate(rounds_received):
+            expected = (
+                []
+                if (owner + round_) % 3 == 0
+                else [
+                    SampleEvent(owner=owner, sequence=round_ * events_per_round + sequence)
+                    for sequence in range(events_per_round)
+                ]
+            )
+            assert events == expected
+
+
+@contextmanager
+def handler_context() -> Iterator[None]:
+    yield
+
+
+def test_background_handler_runs_inline_without_dispatcher() -> None:
+    bus = BlinkerEventBus()
+    threads: list[int] = []
+
+    def handler(event: SampleEvent) -> None:
+        threads.append(threading.get_ident())
+
+    bus.subscribe(SampleEvent, handler, background=True)
+    bus.subscribe(SampleEvent, handler, background=True)
+    bus.add_event(SampleEvent(owner=1, sequence=1))
+    bus.publish_events()
+
+    assert threads == [threading.get_ident()]
+
+
+def test_background_handler_runs_on_the_pool_inside_its_context() -> None:
+    bus = BlinkerEventBus()
+    entered: list[int] = []
+    ran: list[tuple[int, SampleEvent]] = []
+
+    @contextmanager
+    def context() -> Iterator[None]:
+        entered.append(threading.get_ident())
+        yield
+
+    def handler(event: SampleEvent) -> None:
+        ran.append((threading.get_ident(), event))
+
+    dispatcher = BackgroundDispatcher(max_workers=2, max_pending=10, submit_timeout=1.0, context=context)
+    bus.use_dispatcher(dispatcher)
+    bus.subscribe(SampleEvent, handler, background=True)
+    try:
+        for sequence in range(5):
+            bus.add_event(SampleEvent(owner=1, sequence=sequence))
+        bus.publish_events()
+
+        assert dispatcher.drain(timeout=5)
+    finally:
+        dispatcher.shutdown()
+
+    assert sorted(event.sequence for _, event in ran) == [0, 1, 2, 3, 4]
+    assert threading.get_ident() not in {thread for thread, _ in ran}
+    assert [thread for thread, _ in ran] == entered
+
+
+def test_background_dispatcher_runs_inline_when_the_queue_is_full() -> None:
+    release = threading.Event()
+    ran: list[int] = []
+
+    def blocking_handler(event: SampleEvent) -> None:
+        release.wait(timeout=5)
+
+    def handler(event: SampleEvent) -> None:
+        ran.append(threading.get_ident())
+
+    dispatcher = BackgroundDispatcher(max_workers=1, max_pending=1, submit_timeout=0.01, context=handler_context)
+    try:
+        dispatcher.submit(blocking_handler, SampleEvent(owner=1, sequence=1))
+        dispatcher.submit(blocking_handler, SampleEvent(owner=1, sequence=2))
+        dispatcher.submit(handler, SampleEvent(owner=1, sequence=3))
+
+        assert ran == [threading.get_ident()]
+        assert not dispatcher.drain(timeout=0.01)
+    finally:
+        release.set()
+        dispatcher.shutdown()
+
+
+def test_background_dispatcher_drain_waits_for_pending_handlers() -> None:
+    done: list[int] = []
+
+    def handler(event: SampleEvent) -> None:
+        time.sleep(0.05)
+        done.append(event.sequence)
+
+    dispatcher = BackgroundDispatcher(max_workers=2, max_pending=10, submit_timeout=1.0, context=handler_context)
+    try:
+        for sequence in range(4):
+            dispatcher.submit(handler, SampleEvent(owner=1, sequence=sequence))
+
+        assert dispatcher.drain(timeout=5)
+        assert sorted(done) == [0, 1, 2, 3]
+    finally:
+        dispatcher.shutdown()
+
+
+def test_background_dispatcher_logs_handler_failures() -> None:
+    def handler(event: SampleEvent) -> None:
+        raise ValueError('boom')
+
+    dispatcher = BackgroundDispatcher(max_workers=1, max_pending=1, submit_timeout=1.0, context=handler_context)
+    try:
+        with patch('lms.infrastructure.event_bus.logger') as mock_logger:
+            dispatcher.submit(handler, SampleEvent(owner=1, sequence=1))
+            assert dispatcher.drain(timeout=5)
+
+        mock_logger.exception.assert_called_once()
+    finally:
+        dispatcher.shutdown()
+
+
+def test_background_dispatcher_runs_inline_after_shutdown() -> None:
+    ran: list[int] = []
+
+    def handler(event: SampleEvent) -> None:
+        ran.append(threading.get_ident())
+
+    dispatcher = BackgroundDispatcher(max_workers=1, max_pending=1, submit_timeout=1.0, context=handler_context)
+    dispatcher.shutdown()
+
+    dispatcher.submit(handler, SampleEvent(owner=1, sequence=1))
+
+    assert ran == [threading.get_ident()]
+
+
+def test_publish_events_without_background_leaves_background_handlers_out() -> None:
+    bus = BlinkerEventBus()
+    inline: list[SampleEvent] = []
+    background: list[SampleEvent] = []
+
+    def inline_handler(event: SampleEvent) -> None:
+        inline.append(event)
+
+    def background_handler(event: SampleEvent) -> None:
+        background.append(event)
+
+    bus.subscribe(SampleEvent, inline_handler)
+    bus.subscribe(SampleEvent, background_handler, background=True)
+    bus.add_event(SampleEvent(owner=1, sequence=1))
+    bus.publish_events(background=False)
+
+    assert inline == [SampleEvent(owner=1, sequence=1)]
+    assert background == []
+    assert bus.has_background_handlers(SampleEvent(owner=1, sequence=2))
+    assert bus.background_event_type('SampleEvent') is SampleEvent
+
+    bus.deliver(SampleEvent(owner=1, sequence=2))
+
+    assert inline == [SampleEvent(owner=1, sequence=1)]
+    assert background == [SampleEvent(owner=1, sequence=2)]
+
+
+def test_publish_events_without_background_keeps_events_pending_for_background_handlers() -> None:
+    bus = BlinkerEventBus()
+    inline: list[SampleEvent] = []
+    background: list[SampleEvent] = []
+
+    class OtherEvent(SampleEvent):
+        pass
+
+    def inline_handler(event: SampleEvent) -> None:
+        inline.append(event)
+
+    def background_handler(event: SampleEvent) -> None:
+        background.append(event)
+
+    bus.subscribe(SampleEvent, inline_handler)
+    bus.subscribe(OtherEvent, inline_handler)
+    bus.subscribe(SampleEvent, background_handler, background=True)
+    bus.add_event(SampleEvent(owner=1, sequence=1))
+    bus.add_event(OtherEvent(owner=1, sequence=2))
+    bus.publish_events(background=False)
+
+    assert inline == [SampleEvent(owner=1, sequence=1), OtherEvent(owner=1, sequence=2)]
+    assert bus.pending_events() == [SampleEvent(owner=1, sequence=1)]
+
+    bus.add_event(SampleEvent(owner=1, sequence=3))
+    bus.publish_events()
+
+    assert inline == [
+        SampleEvent(owner=1, sequence=1),
+        OtherEvent(owner=1, sequence=2),
+        SampleEvent(owner=1, sequence=3),
+    ]
+    assert background == [SampleEvent(owner=1, sequence=1), SampleEvent(owner=1, sequence=3)]
+    assert bus.pending_events() == []
+
+
+def test_savepoint_restores_pending_events_on_error() -> None:
+    bus = BlinkerEventBus()
+    bus.add_event(SampleEvent(owner=1, sequence=1))
+
+    with pytest.raises(ValueError), bus.savepoint():
+        bus.add_event(SampleEvent(owner=1, sequence=2))
+        raise ValueError('boom')
+    with bus.savepoint():
+        bus.add_event(SampleEvent(owner=1, sequence=3))
+
+    assert bus.pending_events() == [SampleEvent(owner=1, sequence=1), SampleEvent(owner=1, sequence=3)]
+
+
+def test_publish_records_metrics_per_handler() -> None:
+    bus = BlinkerEventBus()
+
+    def handler(event: SampleEvent) -> None:
+        pass
+
+    def failing_handler(event: SampleEvent) -> None:
+        raise ValueError('boom')
+
+    bus.subscribe(SampleEvent, handler)
+    bus.subscribe(SampleEvent, failing_handler, background=True)
+
+    bus.add_event(SampleEvent(owner=1, sequence=1))
+    bus.publish_events(background=False)
+    with pytest.raises(ValueError, match='boom'):
+        bus.deliver(SampleEvent(owner=1, sequence=2))
+
+    stats = {s['handler'].rsplit('.', 1)[-1]: s for s in bus.metrics.snapshot()}
+    assert stats['handler']['count'] == 1
+    assert stats['handler']['errors'] == 0
+    assert stats['failing_handler']['count'] == 1
+    assert stats['failing_handler']['errors'] == 1
+    assert {s['event_type'] for s in stats.values()} == {'SampleEvent'}
+
+
+def test_background_handler_on_the_pool_records_metrics() -> None:
+    bus = BlinkerEventBus()
+
+    def handler(event: SampleEvent) -> None:
+        pass
+
+    bus.subscribe(SampleEvent, handler, background=True)
+    dispatcher = BackgroundDispatcher(max_workers=1, max_pending=1, submit_timeout=1.0, context=handler_context)
+    bus.use_dispatcher(dispatcher)
+    try:
+        bus.publish(SampleEvent(owner=1, sequence=1))
+        assert dispatcher.drain(timeout=5)
+    finally:
+        dispatcher.shutdown()
+
+    [stats] = bus.metrics.snapshot()
+    assert stats['handler'].endswith('handler')
+    assert stats['count'] == 1
@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+from unittest.mock import patch
+
+from lms.infrastructure.event_bus.metrics import LATENCY_BUCKETS, EventBusMetrics
+
+
+class SampleEvent:
+    pass
+
+
+def handler(event: SampleEvent) -> None:
+    pass
+
+
+def test_record_counts_invocations_and_errors() -> None:
+    metrics = EventBusMetrics()
+
+    metrics.record(SampleEvent(), handler, 0.002, failed=False)
+    metrics.record(SampleEvent(), handler, 0.2, failed=True)
+
+    [stats] = metrics.snapshot()
+    assert stats['event_type'] == 'SampleEvent'
+    assert stats['handler'] == f'{__name__}.handler'
+    assert stats['count'] == 2
+    assert stats['errors'] == 1
+    assert stats['total_seconds'] == 0.202
+
+
+def test_snapshot_reports_cumulative_buckets() -> None:
+    metrics = EventBusMetrics()
+
+    metrics.record(SampleEvent(), handler, 0.002, failed=False)
+    metrics.record(SampleEvent(), handler, 0.2, failed=False)
+    metrics.record(SampleEvent(), handler, 60.0, failed=False)
+
+    buckets = {b['le']: b['count'] for b in metrics.snapshot()[0]['buckets']}
+    assert list(buckets) == [*LATENCY_BUCKETS, '+Inf']
+    assert buckets[0.001] == 0
+    assert buckets[0.005] == 1
+    assert buckets[0.25] == 2
+    assert buckets[10.0] == 2
+    assert buckets['+Inf'] == 3
+
+
+def test_slow_handler_is_logged_with_its_event() -> None:
+    metrics = EventBusMetrics(slow_threshold=0.1)
+    event = SampleEvent()
+
+    with patch('lms.infrastructure.event_bus.metrics.logger') as mock_logger:
+        metrics.record(event, handler, 0.05, failed=False)
+        mock_logger.warning.assert_not_called()
+        metrics.record(event, handler, 0.5, failed=False)
+
+    mock_logger.warning.assert_called_once()
+    assert mock_logger.warning.call_args.args[-1] is event
+
+
+def test_reset_clears_metrics() -> None:
+    metrics = EventBusMetrics()
+    metrics.record(SampleEvent(), handler, 0.01, failed=False)
+
+    metrics.reset()
+
+    assert metrics.snapshot() == []
@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import io
+import sys
+import json
+import queue
+import typing as t
+import logging
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from lms.infrastructure.logging import (
+    JSONFormatter,
+    SamplingFilter,
+    NonBlockingQueueHandler,
+    logger,
+    shutdown,
+    configure,
+    get_logger,
+    dropped_records,
+)
+
+
+class SlowHandler(logging.StreamHandler[io.StringIO]):
+    def __init__(self) -> None:
+        super().__init__(io.StringIO())
+        self.release = threading.Event()
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.release.wait(timeout=5)
+        super().emit(record)
+
+
+@pytest.fixture
+def restore_logger() -> t.Generator[None]:
+    handlers, level = logger.handlers, logger.level
+    yield
+    shutdown()
+    logger.handlers, logger.level = handlers, level
+    get_logger('lms.tests').setLevel(logging.NOTSET)
+
+
+def make_record(name: str = 'lms', level: int = logging.INFO) -> logging.LogRecord:
+    return logging.LogRecord(name, level, __file__, 1, 'hello %s', ('world',), None)
+
+
+def test_json_formatter_encodes_a_structured_record() -> None:
+    try:
+        raise ValueError('boom')
+    except ValueError:
+        record = logging.LogRecord('lms.app', logging.ERROR, __file__, 1, 'failed %s', ('x',), sys.exc_info())
+
+    payload = json.loads(JSONFormatter().format(record))
+
+    assert payload['level'] == 'ERROR'
+    assert payload['logger'] == 'lms.app'
+    assert payload['message'] == 'failed x'
+    assert 'ValueError: boom' in payload['exc_info']
+    assert payload['time'].endswith('+00:00')
+
+
+def test_queue_handler_never_blocks_and_counts_dropped_records() -> None:
+    handler = NonBlockingQueueHandler(queue.Queue(maxsize=1))
+
+    handler.handle(make_record())
+    handler.handle(make_record())
+
+    assert handler.queue.qsize() == 1
+    assert handler.dropped == 1
+    queued = handler.queue.get_nowait()
+    assert queued.msg == 'hello world'
+    assert queued.args is None
+
+
+def test_queue_handler_writes_warnings_through_when_the_queue_is_full() -> None:
+    overflow = logging.StreamHandler(io.StringIO())
+    handler = NonBlockingQueueHandler(queue.Queue(maxsize=1), overflow=overflow)
+
+    handler.handle(make_record())
+    handler.handle(make_record(level=logging.ERROR))
+
+    assert handler.dropped == 0
+    assert overflow.stream.getvalue() == 'hello world\n'
+
+
+def test_sampling_filter_keeps_a_fraction_of_info_records() -> None:
+    sampling = SamplingFilter({'lms.app.handlers': 0.0, 'lms.app.handlers.patrons': 1.0})
+
+    assert not sampling.filter(make_record('lms.app.handlers.catalogs'))
+    assert sampling.filter(make_record('lms.app.handlers.catalogs', logging.WARNING))
+    assert sampling.filter(make_record('lms.app.handlers.patrons'))
+    assert sampling.filter(make_record('lms.app.services'))
+    with patch('lms.infrastructure.logging.random.random', return_value=0.2):
+        assert SamplingFilter({'lms': 0.5}).filter(make_record())
+        assert not SamplingFilter({'lms': 0.1}).filter(make_record())
+
+
+@pytest.mark.usefixtures('restore_logger')
+def test_configure_writes_in_the_background_and_flushes_on_shutdown() -> None:
+    handler = SlowHandler()
+    configure(levels={'lms.tests': 'WARNING'}, sample_rates={}, queue_size=10, handler=handler)
+
+    get_logger('lms.tests').warning('written by %s', 'the writer')
+    get_logger('lms.tests').info('below the configured level')
+    # The writer thread is stuck in the handler, yet logging returned immediately.
+    assert handler.stream.getvalue() == ''
+
+    handler.release.set()
+    shutdown()
+
+    [line] = handler.stream.getvalue().splitlines()
+    assert json.loads(line)['message'] == 'written by the writer'
+
+
+@pytest.mark.usefixtures('restore_logger')
+def test_shutdown_reports_dropped_records() -> None:
+    handler = SlowHandler()
+    configure(levels={'lms.tests': 'INFO'}, sample_rates={}, queue_size=1, handler=handler)
+
+    # The first record is taken by the writer, which then waits; the second fills the queue and the rest are dropped.
+    for _ in range(5):
+        get_logger('lms.tests').info('busy')
+    assert dropped_records() >= 2
+
+    dropped = dropped_records()
+    handler.release.set()
+    shutdown()
+
+    last = json.loads(handler.stream.getvalue().splitlines()[-1])
+    assert last['level'] == 'WARNING'
+    assert last['message'] == f'Dropped {dropped} log records while the logging queue was full'
+    assert dropped_records() == 0
@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import os
+import time
+from pathlib import Path
+
+import msgspec
+
+from lms.infrastructure.metrics import LATENCY_BUCKETS, RPCMetrics, MethodStats, ProcessSnapshot, render_prometheus
+
+
+def test_finished_counts_calls_errors_and_latency() -> None:
+    metrics = RPCMetrics()
+
+    metrics.started('Loans.list')
+    assert metrics.collect()['Loans.list'].in_flight == 1
+    metrics.finished('Loans.list', 0.002)
+    metrics.started('Loans.list')
+    metrics.finished('Loans.list', 0.3, error='LoanNotFoundError')
+
+    stats = metrics.collect()['Loans.list']
+    assert stats.count == 2
+    assert stats.in_flight == 0
+    assert stats.errors == {'LoanNotFoundError': 1}
+    assert stats.buckets[LATENCY_BUCKETS.index(0.005)] == 1
+    assert stats.buckets[LATENCY_BUCKETS.index(0.5)] == 1
+
+
+def test_flush_writes_a_file_per_process_when_counters_changed(tmp_path: Path) -> None:
+    metrics = RPCMetrics()
+    metrics.configure(directory=str(tmp_path), flush_interval=60.0)
+
+    metrics.started('Loans.list')
+    metrics.finished('Loans.list', 0.01)
+    metrics.flush()
+    [path] = tmp_path.glob(f'rpc-{os.getpid()}-*.msgpack')
+    snapshot = msgspec.msgpack.decode(path.read_bytes(), type=ProcessSnapshot)
+    path.unlink()
+    metrics.flush()
+    metrics.stop()
+
+    assert snapshot.methods['Loans.list'].count == 1
+    assert not path.exists()
+
+
+def test_flusher_writes_the_counters_of_an_idle_process(tmp_path: Path) -> None:
+    metrics = RPCMetrics()
+    metrics.configure(directory=str(tmp_path), flush_interval=0.01)
+
+    metrics.started('Loans.list')
+    metrics.finished('Loans.list', 0.01)
+    # Nothing else happens in this process, yet the flusher writes the call out within its interval.
+    deadline = time.monotonic() + 5.0
+    while time.monotonic() < deadline and _flushed_count(tmp_path) != 1:
+        time.sleep(0.01)
+    metrics.stop()
+
+    assert _flushed_count(tmp_path) == 1
+
+
+def _flushed_count(directory: Path) -> int | None:
+    paths = list(directory.glob(f'rpc-{os.getpid()}-*.msgpack'))
+    if not paths:
+        return None
+    [path] = paths
+    stats = msgspec.msgpack.decode(path.read_bytes(), type=ProcessSnapshot).methods.get('Loans.list')
+    return stats.count if stats is not None else None
+
+
+def test_collect_merges_other_processes(tmp_path: Path) -> None:
+    metrics = RPCMetrics()
+    metrics.configure(directory=str(tmp_path), flush_interval=60.0)
+    metrics.started('Loans.list')
+    metrics.finished('Loans.list', 0.01)
+
+    alive = ProcessSnapshot(pid=os.getppid(), methods={'Loans.list': MethodStats(count=2, in_flight=1)})
+    dead = ProcessSnapshot(
+        pid=2**22 + 1, methods={'Loans.list': MethodStats(count=3, errors={'ServiceFailed': 1}, in_flight=4)}
+    )
+    (tmp_path / f'rpc-{alive.pid}-a.msgpack').write_bytes(msgspec.msgpack.encode(alive))
+    (tmp_path / f'rpc-{dead.pid}-b.msgpack').write_bytes(msgspec.msgpack.encode(dead))
+    (tmp_path / 'rpc-0-c.msgpack').write_bytes(b'garbage')
+
+    stats = metrics.collect()['Loans.list']
+    metrics.stop()
+    assert stats.count == 3
+    assert stats.errors == {}
+    assert stats.in_flight == 1
+    assert not (tmp_path / f'rpc-{dead.pid}-b.msgpack').exists()
+
+
+def test_a_process_reusing_a_pid_drops_the_file_of_its_predecessor(tmp_path: Path) -> None:
+    metrics = RPCMetrics()
+    metrics.configure(directory=str(tmp_path), flush_interval=60.0)
+    stale = ProcessSnapshot(pid=os.getpid(), methods={'Loans.list': MethodStats(count=5)})
+    stale_path = tmp_path / f'rpc-{os.getpid()}-stale.msgpack'
+    stale_path.write_bytes(msgspec.msgpack.encode(stale))
+
+    assert metrics.collect() == {}
+    stale_path.write_bytes(msgspec.msgpack.encode(stale))
+    metrics.started('Loans.list')
+    metrics.finished('Loans.list', 0.01)
+    metrics.flush()
+    metrics.stop()
+
+    assert not stale_path.exists()
+    [path] = tmp_path.glob('rpc-*.msgpack')
+    assert msgspec.msgpack.decode(path.read_bytes(), type=ProcessSnapshot).methods['Loans.list'].count == 1
+
+
+def test_render_prometheus() -> None:
+    stats = MethodStats(
+        count=2, errors={'PatronNotFoundError': 1}, total_seconds=0.5, in_flight=1, queries=9, repeated_queries=6
+    )
+    stats.buckets[LATENCY_BUCKETS.index(0.01)] = 1
+    stats.buckets[-1] = 1
+
+    lines = render_prometheus({'Patrons.get': stats}).splitlines()
+
+    assert 'lms_rpc_requests_total{method="Patrons.get"} 2' in lines
+    assert 'lms_rpc_errors_total{method="Patrons.get",error="PatronNotFoundError"} 1' in lines
+    assert 'lms_rpc_request_duration_seconds_bucket{method="Patrons.get",le="0.005"} 0' in lines
+    assert 'lms_rpc_request_duration_seconds_bucket{method="Patrons.get",le="0.01"} 1' in lines
+    assert 'lms_rpc_request_duration_seconds_bucket{method="Patrons.get",le="+Inf"} 2' in lines
+    assert 'lms_rpc_request_duration_seconds_sum{method="Patrons.get"} 0.5' in lines
+    assert 'lms_rpc_request_duration_seconds_count{method="Patrons.get"} 2' in lines
+    assert 'lms_rpc_in_flight{method="Patrons.get"} 1' in lines
+    assert 'lms_rpc_queries_total{method="Patrons.get"} 9' in lines
+    assert 'lms_rpc_repeated_queries_total{method="Patrons.get"} 6' in lines
+    assert '# TYPE lms_rpc_request_duration_seconds histogram' in lines
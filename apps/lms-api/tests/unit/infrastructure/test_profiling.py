@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import time
+import pstats
+from pathlib import Path
+import threading
+
+from lms.infrastructure.profiling import Profiler
+
+
+def work(seconds: float = 0.05) -> None:
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        sum(range(1000))
+
+
+def other_work(stopped: threading.Event) -> None:
+    while not stopped.is_set():
+        sum(range(1000))
+
+
+def test_profile_writes_a_dump_per_call(tmp_path: Path) -> None:
+    profiler = Profiler(str(tmp_path), keep=10)
+
+    with profiler.profile('Loans.list', 'req/1'):
+        work()
+
+    [profile] = profiler.profiles()
+    assert profile['method'] == 'Loans.list'
+    assert profile['request_id'] == 'req_1'
+    assert profile['size'] > 0
+    stats = pstats.Stats(str(tmp_path / profile['name']))
+    assert any(func[2] == 'work' for func in stats.stats)  # type: ignore[attr-defined]
+
+
+def test_profile_samples_only_the_dispatching_thread(tmp_path: Path) -> None:
+    profiler = Profiler(str(tmp_path), keep=10)
+    stopped = threading.Event()
+    thread = threading.Thread(target=other_work, args=(stopped,))
+    thread.start()
+    try:
+        with profiler.profile('Loans.list', 1):
+            work()
+    finally:
+        stopped.set()
+        thread.join()
+
+    [profile] = profiler.profiles()
+    functions = {func[2] for func in pstats.Stats(str(tmp_path / profile['name'])).stats}  # type: ignore[attr-defined]
+    assert 'work' in functions
+    assert 'other_work' not in functions
+
+
+def test_profiles_skips_files_it_did_not_write(tmp_path: Path) -> None:
+    profiler = Profiler(str(tmp_path), keep=10)
+    (tmp_path / 'manual.prof').write_bytes(b'')
+
+    with profiler.profile('Loans.list', 1):
+        work(0.0)
+
+    assert [p['method'] for p in profiler.profiles()] == ['Loans.list']
+
+
+def test_profile_keeps_the_most_recent_dumps(tmp_path: Path) -> None:
+    profiler = Profiler(str(tmp_path), keep=2)
+
+    for request_id in range(4):
+        with profiler.profile('Loans.list', request_id):
+            work(0.0)
+
+    assert len(profiler.profiles()) == 2
+
+
+def test_concurrent_calls_are_not_profiled_twice(tmp_path: Path) -> None:
+    profiler = Profiler(str(tmp_path), keep=10)
+    inner_done = threading.Event()
+
+    def inner() -> None:
+        with profiler.profile('Loans.get', 2):
+            work(0.0)
+        inner_done.set()
+
+    with profiler.profile('Loans.list', 1):
+        thread = threading.Thread(target=inner)
+        thread.start()
+        thread.join()
+
+    assert inner_done.is_set()
+    assert [p['method'] for p in profiler.profiles()] == ['Loans.list']
@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+from decimal import Decimal
+from pathlib import Path
+import sqlite3
+import datetime
+from unittest.mock import patch
+
+from flask import Flask
+
+from lms import seed_command, relay_outbox_command, sweep_expired_holds_command, sweep_overdue_loans_command
+from lms.app import create_app
+from lms.app.extensions import db
+from tests.unit.conftest import Config
+from tests.unit.factories import CopyFactory, HoldFactory, ItemFactory, LoanFactory
+from lms.domain.circulations.events import HoldReadyEvent, HoldExpiredEvent
+from lms.infrastructure.database.models.patrons import FineModel, FineStatus
+from lms.infrastructure.database.models.catalogs import CopyStatus
+from lms.infrastructure.database.models.circulations import HoldModel, HoldStatus, SweepCheckpointModel
+
+
+def test_sweep_overdue_loans_command_fines_each_overdue_loan_once(app: Flask) -> None:
+    today = datetime.date.today()
+    overdue_loans = [LoanFactory(due_date=today - datetime.timedelta(days=days)) for days in (1, 3, 5)]
+    LoanFactory(due_date=today + datetime.timedelta(days=7))
+    LoanFactory(due_date=today - datetime.timedelta(days=2), return_date=today)
+    db.session.commit()
+    runner = app.test_cli_runner()
+
+    result = runner.invoke(sweep_overdue_loans_command, ['--chunk-size', '2'])
+    assert result.exit_code == 0, result.output
+    assert 'Swept 3 overdue loans.' in result.output
+
+    result = runner.invoke(sweep_overdue_loans_command, ['--chunk-size', '2'])
+    assert result.exit_code == 0, result.output
+    assert 'Swept 0 overdue loans.' in result.output
+
+    fines = db.session.query(FineModel).all()
+    assert sorted(fine.loan_id for fine in fines) == sorted(loan.id for loan in overdue_loans)
+    checkpoint = db.session.get(SweepCheckpointModel, 'overdue_loans')
+    assert checkpoint is not None
+    assert checkpoint.run_date == today
+    assert checkpoint.last_due_date == today - datetime.timedelta(days=1)
+
+
+def test_sweep_overdue_loans_does_not_fine_a_paid_loan_again(app: Flask) -> None:
+    today = datetime.date.today()
+    loan = LoanFactory(due_date=today - datetime.timedelta(days=3))
+    db.session.commit()
+    loan_service = app.container.loan_service  # type: ignore
+    fine_service = app.container.fine_service  # type: ignore
+
+    loan_service.sweep_overdue_loans(today)
+    [fine] = db.session.query(FineModel).filter_by(loan_id=loan.id).all()
+    fine_service.pay_fine(str(fine.id))
+    loan_service.sweep_overdue_loans(today + datetime.timedelta(days=1))
+
+    [fine] = db.session.query(FineModel).filter_by(loan_id=loan.id).all()
+    assert fine.status == FineStatus.PAID
+    assert fine.amount == Decimal('1.50')
+
+
+def test_sweep_expired_holds_command_expires_past_due_holds(app: Flask) -> None:
+    today = datetime.date.today()
+    item = ItemFactory()
+    copy = CopyFactory(item=item)
+    expired_hold = HoldFactory(
+        item=item,
+        copy=copy,
+        loan=None,
+        request_date=today - datetime.timedelta(days=10),
+        expiry_date=today - datetime.timedelta(days=1),
+    )
+    waiting_hold = HoldFactory(
+        item=item,
+        copy=None,
+        loan=None,
+        request_date=today - datetime.timedelta(days=5),
+        expiry_date=today + datetime.timedelta(days=2),
+    )
+    db.session.commit()
+    runner = app.test_cli_runner()
+
+    with patch('lms.domain.circulations.entities.event_bus.add_event') as mock_add_event:
+        result = runner.invoke(sweep_expired_holds_command, ['--batch-size', '1'])
+
+    assert result.exit_code == 0, result.output
+    assert 'Expired 1 holds.' in result.output
+    assert [type(c.args[0]) for c in mock_add_event.call_args_list] == [HoldExpiredEvent, HoldReadyEvent]
+    db.session.expire_all()
+    assert db.session.get(HoldModel, expired_hold.id).status == HoldStatus.EXPIRED
+    assert db.session.get(HoldModel, waiting_hold.id).status == HoldStatus.READY
+
+
+def test_sweep_expired_holds_command_leaves_holds_on_a_copy_on_loan_pending(app: Flask) -> None:
+    today = datetime.date.today()
+    item = ItemFactory()
+    copy = CopyFactory(item=item, status=CopyStatus.CHECKED_OUT)
+    HoldFactory(
+        item=item,
+        copy=copy,
+        loan=None,
+        request_date=today - datetime.timedelta(days=10),
+        expiry_date=today - datetime.timedelta(days=1),
+    )
+    waiting_hold = HoldFactory(
+        item=item,
+        copy=None,
+        loan=None,
+        request_date=today - datetime.timedelta(days=5),
+        expiry_date=today + datetime.timedelta(days=2),
+    )
+    db.session.commit()
+
+    result = app.test_cli_runner().invoke(sweep_expired_holds_command)
+
+    assert result.exit_code == 0, result.output
+    assert 'Expired 1 holds.' in result.output
+    db.session.expire_all()
+    assert db.session.get(HoldModel, waiting_hold.id).status == HoldStatus.PENDING
+
+
+def test_relay_outbox_command_drains_the_outbox(app: Flask) -> None:
+    with patch.object(app.container, 'outbox_relay', create=True) as mock_relay:  # type: ignore[attr-defined]
+        mock_relay.relay.side_effect = [2, 2, 1]
+        runner = app.test_cli_runner()
+
+        result = runner.invoke(relay_outbox_command, ['--batch-size', '2', '--once'])
+
+    assert result.exit_code == 0, result.output
+    assert 'Relayed 5 outbox events.' in result.output
+    assert mock_relay.relay.call_count == 3
+
+
+def test_seed_command_writes_a_sqlite_file(tmp_path: Path) -> None:
+    database = tmp_path / 'seed.db'
+    config = type('SeedConfig', (Config,), {'SQLALCHEMY_DATABASE_URI': f'sqlite:///{database}'})
+    app = create_app(config)
+    runner = app.test_cli_runner()
+    args = ['--branches', '2', '--items', '20', '--copies-per-item', '2', '--patrons', '30', '--as-of', '2026-06-01']
+
+    result = runner.invoke(seed_command, args)
+
+    assert result.exit_code == 0, result.output
+    assert 'copies: 40' in result.output
+    with sqlite3.connect(database) as conn:
+        assert conn.execute('SELECT count(*) FROM copies').fetchone() == (40,)
+        assert conn.execute('SELECT count(*) FROM alembic_version').fetchone() == (1,)
+
+    result = runner.invoke(seed_command, args)
+
+    assert result.exit_code == 1
+    assert 'already holds data' in result.output
@@ -1,9 +1,11 @@
 'use client';
 
-import { useQuery, useMutation, useQueryClient } from '@tanstack/react-query';
+import { useMutation, useQueryClient } from '@tanstack/react-query';
 import { branchesApi } from '@/lib/api/organizations';
+import { formatCount, usePagedList } from '@/lib/pagination';
 import Link from 'next/link';
 import { Button } from '@/components/ui/button';
+import { LoadMore } from '@/components/load-more';
 import { Card, CardContent, CardHeader, CardTitle } from '@/components/ui/card';
 import { Table, TableBody, TableCell, TableHead, TableHeader, TableRow } from '@/components/ui/table';
 import { Plus, Pencil, Trash2, Mail, Phone, MapPin } from 'lucide-react';
@@ -11,10 +13,13 @@ import { Plus, Pencil, Trash2, Mail, Phone, MapPin } from 'lucide-react';
 export default function BranchesPage() {
   const queryClient = useQueryClient();
 
-  const { data: branches, isLoading } = useQuery({
-    queryKey: ['branches'],
-    queryFn: branchesApi.list,
-  });
+  const {
+    results: branches,
+    isLoading,
+    hasNextPage,
+    isFetchingNextPage,
+    fetchNextPage,
+  } = usePagedList(['branches', 'pages'], branchesApi.list);
 
   const deleteMutation = useMutation({
     mutationFn: branchesApi.delete,
@@ -54,7 +59,7 @@ export default function BranchesPage() {
 
       <Card>
         <CardHeader>
-          <CardTitle>All Branches ({branches?.count || 0})</CardTitle>
+          <CardTitle>Branches ({formatCount(branches.length, hasNextPage)})</CardTitle>
         </CardHeader>
         <CardContent>
           <Table>
@@ -68,7 +73,7 @@ export default function BranchesPage() {
               </TableRow>
             </TableHeader>
             <TableBody>
-              {branches?.results.map((branch) => (
+              {branches.map((branch) => (
                 <TableRow key={branch.id}>
                   <TableCell className="font-medium">{branch.name}</TableCell>
                   <TableCell>
@@ -122,11 +127,12 @@ export default function BranchesPage() {
               ))}
             </TableBody>
           </Table>
-          {!branches?.results.length && (
+          {!branches.length && (
             <div className="py-8 text-center text-gray-500">
               No branches found. Add your first branch to get started.
             </div>
           )}
+          <LoadMore hasNextPage={hasNextPage} isFetchingNextPage={isFetchingNextPage} fetchNextPage={fetchNextPage} />
         </CardContent>
       </Card>
     </div>
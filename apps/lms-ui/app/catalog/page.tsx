@@ -1,9 +1,11 @@
 'use client';
 
-import { useQuery, useMutation, useQueryClient } from '@tanstack/react-query';
+import { useMutation, useQueryClient } from '@tanstack/react-query';
 import { itemsApi } from '@/lib/api/catalogs';
+import { formatCount, usePagedList } from '@/lib/pagination';
 import Link from 'next/link';
 import { Button } from '@/components/ui/button';
+import { LoadMore } from '@/components/load-more';
 import { Card, CardContent, CardHeader, CardTitle } from '@/components/ui/card';
 import { Table, TableBody, TableCell, TableHead, TableHeader, TableRow } from '@/components/ui/table';
 import { Plus, Pencil, Trash2 } from 'lucide-react';
@@ -11,10 +13,13 @@ import { Plus, Pencil, Trash2 } from 'lucide-react';
 export default function CatalogPage() {
   const queryClient = useQueryClient();
 
-  const { data: items, isLoading } = useQuery({
-    queryKey: ['items'],
-    queryFn: itemsApi.list,
-  });
+  const {
+    results: items,
+    isLoading,
+    hasNextPage,
+    isFetchingNextPage,
+    fetchNextPage,
+  } = usePagedList(['items', 'pages'], itemsApi.list);
 
   const deleteMutation = useMutation({
     mutationFn: itemsApi.delete,
@@ -54,7 +59,7 @@ export default function CatalogPage() {
 
       <Card>
         <CardHeader>
-          <CardTitle>All Items ({items?.count || 0})</CardTitle>
+          <CardTitle>Items ({formatCount(items.length, hasNextPage)})</CardTitle>
         </CardHeader>
         <CardContent>
           <Table>
@@ -69,7 +74,7 @@ export default function CatalogPage() {
               </TableRow>
             </TableHeader>
             <TableBody>
-              {items?.results.map((item) => (
+              {items.map((item) => (
                 <TableRow key={item.id}>
                   <TableCell className="font-medium">{item.title}</TableCell>
                   <TableCell>{item.author || 'N/A'}</TableCell>
@@ -101,11 +106,12 @@ export default function CatalogPage() {
               ))}
             </TableBody>
           </Table>
-          {!items?.results.length && (
+          {!items.length && (
             <div className="py-8 text-center text-gray-500">
               No items found. Add your first item to get started.
             </div>
           )}
+          <LoadMore hasNextPage={hasNextPage} isFetchingNextPage={isFetchingNextPage} fetchNextPage={fetchNextPage} />
         </CardContent>
       </Card>
     </div>
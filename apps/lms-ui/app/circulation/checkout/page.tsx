@@ -8,6 +8,7 @@ import { patronsApi } from '@/lib/api/patrons';
 import { copiesApi } from '@/lib/api/catalogs';
 import { staffApi } from '@/lib/api/organizations';
 import { LoanCreateSchema, type LoanCreate } from '@/lib/schemas';
+import { listAll } from '@/lib/pagination';
 import { Button } from '@/components/ui/button';
 import { Card, CardContent, CardHeader, CardTitle } from '@/components/ui/card';
 import { Input } from '@/components/ui/input';
@@ -25,13 +26,13 @@ export default function CheckoutPage() {
   const [errors, setErrors] = useState<Record<string, string>>({});
 
   const { data: patrons } = useQuery({
-    queryKey: ['patrons'],
-    queryFn: patronsApi.list,
+    queryKey: ['patrons', 'all'],
+    queryFn: () => listAll(patronsApi.list),
   });
 
   const { data: staff } = useQuery({
-    queryKey: ['staff'],
-    queryFn: staffApi.list,
+    queryKey: ['staff', 'all'],
+    queryFn: () => listAll(staffApi.list),
   });
 
   const checkoutMutation = useMutation({
@@ -96,7 +97,7 @@ export default function CheckoutPage() {
                 required
               >
                 <option value="">Select a patron</option>
-                {patrons?.results.map((patron) => (
+                {patrons?.map((patron) => (
                   <option key={patron.id} value={patron.id}>
                     {patron.name} ({patron.email})
                   </option>
@@ -125,7 +126,7 @@ export default function CheckoutPage() {
                 required
               >
                 <option value="">Select staff member</option>
-                {staff?.results.map((member) => (
+                {staff?.map((member) => (
                   <option key={member.id} value={member.id}>
                     {member.name}
                   </option>
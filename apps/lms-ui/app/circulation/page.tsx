@@ -1,28 +1,24 @@
 'use client';
 
-import { useQuery } from '@tanstack/react-query';
 import { loansApi, holdsApi } from '@/lib/api/circulations';
+import { formatCount, usePagedList } from '@/lib/pagination';
 import { Card, CardContent, CardHeader, CardTitle } from '@/components/ui/card';
 import { Table, TableBody, TableCell, TableHead, TableHeader, TableRow } from '@/components/ui/table';
 import { Button } from '@/components/ui/button';
+import { LoadMore } from '@/components/load-more';
 import { ArrowLeftRight, BookMarked, Plus } from 'lucide-react';
 import { formatDate } from '@/lib/utils';
 import Link from 'next/link';
 
 export default function CirculationPage() {
-  const { data: loans, isLoading: loansLoading } = useQuery({
-    queryKey: ['loans'],
-    queryFn: loansApi.list,
-  });
+  const loans = usePagedList(['loans', 'pages'], loansApi.list);
+  const holds = usePagedList(['holds', 'pages'], holdsApi.list);
+  const loansLoading = loans.isLoading;
+  const holdsLoading = holds.isLoading;
 
-  const { data: holds, isLoading: holdsLoading } = useQuery({
-    queryKey: ['holds'],
-    queryFn: holdsApi.list,
-  });
-
-  const activeLoans = loans?.results.filter((loan) => !loan.return_date) || [];
-  const overdueLoans =
-    activeLoans.filter((loan) => new Date(loan.due_date) < new Date()) || [];
+  // Filtered over the pages loaded so far, so the figures are lower bounds while more pages remain.
+  const activeLoans = loans.results.filter((loan) => !loan.return_date);
+  const overdueLoans = activeLoans.filter((loan) => new Date(loan.due_date) < new Date());
 
   return (
     <div className="space-y-6">
@@ -44,7 +40,7 @@ export default function CirculationPage() {
           <CardContent className="flex items-center justify-between p-6">
             <div>
               <p className="text-sm font-medium text-gray-600">Active Loans</p>
-              <p className="mt-2 text-3xl font-bold text-gray-900">{activeLoans.length}</p>
+              <p className="mt-2 text-3xl font-bold text-gray-900">{formatCount(activeLoans.length, loans.hasNextPage)}</p>
             </div>
             <div className="rounded-lg bg-blue-50 p-3">
               <ArrowLeftRight className="h-6 w-6 text-blue-600" />
@@ -56,7 +52,7 @@ export default function CirculationPage() {
           <CardContent className="flex items-center justify-between p-6">
             <div>
               <p className="text-sm font-medium text-gray-600">Overdue</p>
-              <p className="mt-2 text-3xl font-bold text-red-600">{overdueLoans.length}</p>
+              <p className="mt-2 text-3xl font-bold text-red-600">{formatCount(overdueLoans.length, loans.hasNextPage)}</p>
             </div>
             <div className="rounded-lg bg-red-50 p-3">
               <ArrowLeftRight className="h-6 w-6 text-red-600" />
@@ -68,7 +64,7 @@ export default function CirculationPage() {
           <CardContent className="flex items-center justify-between p-6">
             <div>
               <p className="text-sm font-medium text-gray-600">Active Holds</p>
-              <p className="mt-2 text-3xl font-bold text-gray-900">{holds?.count || 0}</p>
+              <p className="mt-2 text-3xl font-bold text-gray-900">{formatCount(holds.results.length, holds.hasNextPage)}</p>
             </div>
             <div className="rounded-lg bg-purple-50 p-3">
               <BookMarked className="h-6 w-6 text-purple-600" />
@@ -134,6 +130,11 @@ export default function CirculationPage() {
           {!loansLoading && !activeLoans.length && (
             <div className="py-8 text-center text-gray-500">No active loans found.</div>
           )}
+          <LoadMore
+            hasNextPage={loans.hasNextPage}
+            isFetchingNextPage={loans.isFetchingNextPage}
+            fetchNextPage={loans.fetchNextPage}
+          />
         </CardContent>
       </Card>
 
@@ -157,7 +158,7 @@ export default function CirculationPage() {
                 </TableRow>
               </TableHeader>
               <TableBody>
-                {holds?.results.map((hold) => (
+                {holds.results.map((hold) => (
                   <TableRow key={hold.id}>
                     <TableCell className="font-medium">{hold.patron_id}</TableCell>
                     <TableCell>{hold.item_id}</TableCell>
@@ -178,9 +179,14 @@ export default function CirculationPage() {
               </TableBody>
             </Table>
           )}
-          {!holdsLoading && !holds?.results.length && (
+          {!holdsLoading && !holds.results.length && (
             <div className="py-8 text-center text-gray-500">No active holds found.</div>
           )}
+          <LoadMore
+            hasNextPage={holds.hasNextPage}
+            isFetchingNextPage={holds.isFetchingNextPage}
+            fetchNextPage={holds.fetchNextPage}
+          />
         </CardContent>
       </Card>
     </div>
@@ -1,59 +1,47 @@
 'use client';
 
-import { useQuery } from '@tanstack/react-query';
 import { patronsApi } from '@/lib/api/patrons';
 import { branchesApi } from '@/lib/api/organizations';
 import { loansApi } from '@/lib/api/circulations';
 import { itemsApi } from '@/lib/api/catalogs';
+import { formatCount, usePagedList } from '@/lib/pagination';
 import { Card, CardContent, CardHeader, CardTitle } from '@/components/ui/card';
 import { Users, BookOpen, ArrowLeftRight, Building2 } from 'lucide-react';
 
 export default function Home() {
-  const { data: patrons } = useQuery({
-    queryKey: ['patrons'],
-    queryFn: patronsApi.list,
-  });
+  const patrons = usePagedList(['patrons', 'pages'], patronsApi.list);
+  const branches = usePagedList(['branches', 'pages'], branchesApi.list);
+  const loans = usePagedList(['loans', 'pages'], loansApi.list);
+  const items = usePagedList(['items', 'pages'], itemsApi.list);
 
-  const { data: branches } = useQuery({
-    queryKey: ['branches'],
-    queryFn: branchesApi.list,
-  });
-
-  const { data: loans } = useQuery({
-    queryKey: ['loans'],
-    queryFn: loansApi.list,
-  });
-
-  const { data: items } = useQuery({
-    queryKey: ['items'],
-    queryFn: itemsApi.list,
-  });
+  // Only the first page of each list is loaded here, so the figures are lower bounds while more pages remain.
+  const activeLoans = loans.results.filter((l) => !l.return_date);
 
   const stats = [
     {
-      name: 'Total Patrons',
-      value: patrons?.count || 0,
+      name: 'Patrons',
+      value: formatCount(patrons.results.length, patrons.hasNextPage),
       icon: Users,
       color: 'text-blue-600',
       bgColor: 'bg-blue-50',
     },
     {
       name: 'Catalog Items',
-      value: items?.count || 0,
+      value: formatCount(items.results.length, items.hasNextPage),
       icon: BookOpen,
       color: 'text-green-600',
       bgColor: 'bg-green-50',
     },
     {
       name: 'Active Loans',
-      value: loans?.results.filter((l) => !l.return_date).length || 0,
+      value: formatCount(activeLoans.length, loans.hasNextPage),
       icon: ArrowLeftRight,
       color: 'text-purple-600',
       bgColor: 'bg-purple-50',
     },
     {
       name: 'Branches',
-      value: branches?.count || 0,
+      value: formatCount(branches.results.length, branches.hasNextPage),
       icon: Building2,
       color: 'text-orange-600',
       bgColor: 'bg-orange-50',
@@ -86,11 +74,11 @@ export default function Home() {
       <div className="grid gap-6 lg:grid-cols-2">
         <Card>
           <CardHeader>
-            <CardTitle>Recent Loans</CardTitle>
+            <CardTitle>Loans</CardTitle>
           </CardHeader>
           <CardContent>
             <div className="space-y-3">
-              {loans?.results.slice(0, 5).map((loan) => (
+              {loans.results.slice(0, 5).map((loan) => (
                 <div key={loan.id} className="flex items-center justify-between border-b pb-3 last:border-0">
                   <div>
                     <p className="font-medium text-gray-900">Copy ID: {loan.copy_id}</p>
@@ -110,7 +98,7 @@ export default function Home() {
                   </div>
                 </div>
               ))}
-              {!loans?.results.length && (
+              {!loans.results.length && (
                 <p className="text-center text-sm text-gray-500">No loans found</p>
               )}
             </div>
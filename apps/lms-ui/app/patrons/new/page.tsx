@@ -6,6 +6,7 @@ import { useMutation, useQuery, useQueryClient } from '@tanstack/react-query';
 import { patronsApi } from '@/lib/api/patrons';
 import { branchesApi } from '@/lib/api/organizations';
 import { PatronCreateSchema, type PatronCreate } from '@/lib/schemas';
+import { listAll } from '@/lib/pagination';
 import { Button } from '@/components/ui/button';
 import { Card, CardContent, CardHeader, CardTitle } from '@/components/ui/card';
 import { Input } from '@/components/ui/input';
@@ -23,8 +24,8 @@ export default function NewPatronPage() {
   const [errors, setErrors] = useState<Record<string, string>>({});
 
   const { data: branches } = useQuery({
-    queryKey: ['branches'],
-    queryFn: branchesApi.list,
+    queryKey: ['branches', 'all'],
+    queryFn: () => listAll(branchesApi.list),
   });
 
   const createMutation = useMutation({
@@ -106,7 +107,7 @@ export default function NewPatronPage() {
                 required
               >
                 <option value="">Select a branch</option>
-                {branches?.results.map((branch) => (
+                {branches?.map((branch) => (
                   <option key={branch.id} value={branch.id}>
                     {branch.name}
                   </option>
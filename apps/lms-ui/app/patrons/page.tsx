@@ -3,8 +3,10 @@
 import { useQuery, useMutation, useQueryClient } from '@tanstack/react-query';
 import { patronsApi } from '@/lib/api/patrons';
 import { branchesApi } from '@/lib/api/organizations';
+import { formatCount, listAll, usePagedList } from '@/lib/pagination';
 import Link from 'next/link';
 import { Button } from '@/components/ui/button';
+import { LoadMore } from '@/components/load-more';
 import { Card, CardContent, CardHeader, CardTitle } from '@/components/ui/card';
 import { Table, TableBody, TableCell, TableHead, TableHeader, TableRow } from '@/components/ui/table';
 import { Plus, Pencil, Trash2, Mail, Building2 } from 'lucide-react';
@@ -13,14 +15,17 @@ import { formatDate } from '@/lib/utils';
 export default function PatronsPage() {
   const queryClient = useQueryClient();
 
-  const { data: patrons, isLoading } = useQuery({
-    queryKey: ['patrons'],
-    queryFn: patronsApi.list,
-  });
+  const {
+    results: patrons,
+    isLoading,
+    hasNextPage,
+    isFetchingNextPage,
+    fetchNextPage,
+  } = usePagedList(['patrons', 'pages'], patronsApi.list);
 
   const { data: branches } = useQuery({
-    queryKey: ['branches'],
-    queryFn: branchesApi.list,
+    queryKey: ['branches', 'all'],
+    queryFn: () => listAll(branchesApi.list),
   });
 
   const deleteMutation = useMutation({
@@ -31,7 +36,7 @@ export default function PatronsPage() {
   });
 
   const getBranchName = (branchId: string) => {
-    return branches?.results.find((b) => b.id === branchId)?.name || branchId;
+    return branches?.find((b) => b.id === branchId)?.name || branchId;
   };
 
   const handleDelete = async (patronId: string) => {
@@ -65,7 +70,7 @@ export default function PatronsPage() {
 
       <Card>
         <CardHeader>
-          <CardTitle>All Patrons ({patrons?.count || 0})</CardTitle>
+          <CardTitle>Patrons ({formatCount(patrons.length, hasNextPage)})</CardTitle>
         </CardHeader>
         <CardContent>
           <Table>
@@ -80,7 +85,7 @@ export default function PatronsPage() {
               </TableRow>
             </TableHeader>
             <TableBody>
-              {patrons?.results.map((patron) => (
+              {patrons.map((patron) => (
                 <TableRow key={patron.id}>
                   <TableCell className="font-medium">{patron.name}</TableCell>
                   <TableCell>
@@ -120,11 +125,12 @@ export default function PatronsPage() {
               ))}
             </TableBody>
           </Table>
-          {!patrons?.results.length && (
+          {!patrons.length && (
             <div className="py-8 text-center text-gray-500">
               No patrons found. Add your first patron to get started.
             </div>
           )}
+          <LoadMore hasNextPage={hasNextPage} isFetchingNextPage={isFetchingNextPage} fetchNextPage={fetchNextPage} />
         </CardContent>
       </Card>
     </div>
@@ -5,6 +5,7 @@ import { useRouter, useParams } from 'next/navigation';
 import { useMutation, useQuery, useQueryClient } from '@tanstack/react-query';
 import { staffApi, branchesApi } from '@/lib/api/organizations';
 import { StaffUpdateSchema, type StaffUpdate } from '@/lib/schemas';
+import { listAll } from '@/lib/pagination';
 import { Button } from '@/components/ui/button';
 import { Card, CardContent, CardHeader, CardTitle } from '@/components/ui/card';
 import { Input } from '@/components/ui/input';
@@ -31,11 +32,11 @@ export default function EditStaffPage() {
   });
 
   const { data: branchesData } = useQuery({
-    queryKey: ['branches'],
-    queryFn: () => branchesApi.list(),
+    queryKey: ['branches', 'all'],
+    queryFn: () => listAll(branchesApi.list),
   });
 
-  const branches = branchesData?.results || [];
+  const branches = branchesData || [];
 
   useEffect(() => {
     if (staff) {
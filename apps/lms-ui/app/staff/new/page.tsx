@@ -5,6 +5,7 @@ import { useRouter } from 'next/navigation';
 import { useMutation, useQuery, useQueryClient } from '@tanstack/react-query';
 import { staffApi, branchesApi } from '@/lib/api/organizations';
 import { StaffCreateSchema, type StaffCreate } from '@/lib/schemas';
+import { listAll } from '@/lib/pagination';
 import { Button } from '@/components/ui/button';
 import { Card, CardContent, CardHeader, CardTitle } from '@/components/ui/card';
 import { Input } from '@/components/ui/input';
@@ -24,11 +25,11 @@ export default function NewStaffPage() {
   const [errors, setErrors] = useState<Record<string, string>>({});
 
   const { data: branchesData } = useQuery({
-    queryKey: ['branches'],
-    queryFn: () => branchesApi.list(),
+    queryKey: ['branches', 'all'],
+    queryFn: () => listAll(branchesApi.list),
   });
 
-  const branches = branchesData?.results || [];
+  const branches = branchesData || [];
 
   const createMutation = useMutation({
     mutationFn: (data: StaffCreate) => staffApi.create(data),
@@ -3,8 +3,10 @@
 import { useMutation, useQuery, useQueryClient } from '@tanstack/react-query';
 import { staffApi } from '@/lib/api/organizations';
 import { branchesApi } from '@/lib/api/organizations';
+import { formatCount, listAll, usePagedList } from '@/lib/pagination';
 import Link from 'next/link';
 import { Button } from '@/components/ui/button';
+import { LoadMore } from '@/components/load-more';
 import { Card, CardContent, CardHeader, CardTitle } from '@/components/ui/card';
 import { Table, TableBody, TableCell, TableHead, TableHeader, TableRow } from '@/components/ui/table';
 import { Plus, Mail, Building2, Pencil, Trash2 } from 'lucide-react';
@@ -12,18 +14,21 @@ import type { Staff, Branch } from '@/lib/schemas';
 
 export default function StaffPage() {
   const queryClient = useQueryClient();
-  const { data: staff, isLoading } = useQuery({
-    queryKey: ['staff'],
-    queryFn: staffApi.list,
-  });
+  const {
+    results: staff,
+    isLoading,
+    hasNextPage,
+    isFetchingNextPage,
+    fetchNextPage,
+  } = usePagedList(['staff', 'pages'], staffApi.list);
 
   const { data: branches } = useQuery({
-    queryKey: ['branches'],
-    queryFn: branchesApi.list,
+    queryKey: ['branches', 'all'],
+    queryFn: () => listAll(branchesApi.list),
   });
 
   const getBranchName = (branchId: string) => {
-    return branches?.results.find((b: Branch) => b.id === branchId)?.name || branchId;
+    return branches?.find((b: Branch) => b.id === branchId)?.name || branchId;
   };
 
   const deleteMutation = useMutation({
@@ -64,7 +69,7 @@ export default function StaffPage() {
 
       <Card>
         <CardHeader>
-          <CardTitle>All Staff ({staff?.count || 0})</CardTitle>
+          <CardTitle>Staff ({formatCount(staff.length, hasNextPage)})</CardTitle>
         </CardHeader>
         <CardContent>
           <Table>
@@ -78,7 +83,7 @@ export default function StaffPage() {
               </TableRow>
             </TableHeader>
             <TableBody>
-              {staff?.results.map((member: Staff) => (
+              {staff.map((member: Staff) => (
                 <TableRow key={member.id}>
                   <TableCell className="font-medium">{member.name}</TableCell>
                   <TableCell>
@@ -119,11 +124,12 @@ export default function StaffPage() {
               ))}
             </TableBody>
           </Table>
-          {!staff?.results.length && (
+          {!staff.length && (
             <div className="py-8 text-center text-gray-500">
               No staff members found.
             </div>
           )}
+          <LoadMore hasNextPage={hasNextPage} isFetchingNextPage={isFetchingNextPage} fetchNextPage={fetchNextPage} />
         </CardContent>
       </Card>
     </div>
@@ -0,0 +1,20 @@
+import { Button } from '@/components/ui/button';
+
+interface LoadMoreProps {
+  hasNextPage: boolean;
+  isFetchingNextPage: boolean;
+  fetchNextPage: () => unknown;
+}
+
+export function LoadMore({ hasNextPage, isFetchingNextPage, fetchNextPage }: LoadMoreProps) {
+  if (!hasNextPage) {
+    return null;
+  }
+  return (
+    <div className="mt-4 flex justify-center">
+      <Button variant="secondary" onClick={() => fetchNextPage()} disabled={isFetchingNextPage}>
+        {isFetchingNextPage ? 'Loading...' : 'Load more'}
+      </Button>
+    </div>
+  );
+}
@@ -1,11 +1,12 @@
 import JsonRpcClient from '../api-client';
 import type { Item, ItemCreate, ItemUpdate, Copy, Page } from '../schemas';
+import type { PageParams } from '../pagination';
 
 const jsonRpcClient = new JsonRpcClient('catalogs');
 
 export const itemsApi = {
-  list: async (): Promise<Page<Item>> => {
-    return jsonRpcClient.call<Page<Item>>('Items.list');
+  list: async (params: PageParams = {}): Promise<Page<Item>> => {
+    return jsonRpcClient.call<Page<Item>>('Items.list', params);
   },
 
   get: async (itemId: string): Promise<Item> => {
@@ -26,8 +27,8 @@ export const itemsApi = {
 };
 
 export const copiesApi = {
-  list: async (): Promise<Page<Copy>> => {
-    return jsonRpcClient.call<Page<Copy>>('Copies.list');
+  list: async (params: PageParams = {}): Promise<Page<Copy>> => {
+    return jsonRpcClient.call<Page<Copy>>('Copies.list', params);
   },
 
   get: async (copyId: string): Promise<Copy> => {
@@ -1,11 +1,12 @@
 import JsonRpcClient from '../api-client';
-import type { Loan, LoanCreate, Hold, Page } from '../schemas';
+import type { Loan, LoanCreate, Hold, HoldPosition, Page } from '../schemas';
+import type { PageParams } from '../pagination';
 
 const jsonRpcClient = new JsonRpcClient('circulations');
 
 export const loansApi = {
-  list: async (): Promise<Page<Loan>> => {
-    return jsonRpcClient.call<Page<Loan>>('Loans.list');
+  list: async (params: PageParams = {}): Promise<Page<Loan>> => {
+    return jsonRpcClient.call<Page<Loan>>('Loans.list', params);
   },
 
   get: async (loanId: string): Promise<Loan> => {
@@ -26,14 +27,18 @@ export const loansApi = {
 };
 
 export const holdsApi = {
-  list: async (): Promise<Page<Hold>> => {
-    return jsonRpcClient.call<Page<Hold>>('Holds.list');
+  list: async (params: PageParams = {}): Promise<Page<Hold>> => {
+    return jsonRpcClient.call<Page<Hold>>('Holds.list', params);
   },
 
   get: async (holdId: string): Promise<Hold> => {
     return jsonRpcClient.call<Hold>('Holds.get', { hold_id: holdId });
   },
 
+  position: async (holdId: string): Promise<HoldPosition> => {
+    return jsonRpcClient.call<HoldPosition>('Holds.position', { hold_id: holdId });
+  },
+
   place: async (patronId: string, itemId: string): Promise<Hold> => {
     return jsonRpcClient.call<Hold>('Holds.place', { patron_id: patronId, item_id: itemId });
   },
@@ -1,11 +1,12 @@
 import JsonRpcClient from '../api-client';
 import type { Branch, BranchCreate, BranchUpdate, Staff, StaffCreate, StaffUpdate, Page } from '../schemas';
+import type { PageParams } from '../pagination';
 
 const jsonRpcClient = new JsonRpcClient('organizations');
 
 export const branchesApi = {
-  list: async (): Promise<Page<Branch>> => {
-    return jsonRpcClient.call<Page<Branch>>('Branches.list');
+  list: async (params: PageParams = {}): Promise<Page<Branch>> => {
+    return jsonRpcClient.call<Page<Branch>>('Branches.list', params);
   },
 
   get: async (branchId: string): Promise<Branch> => {
@@ -26,8 +27,8 @@ export const branchesApi = {
 };
 
 export const staffApi = {
-  list: async (): Promise<Page<Staff>> => {
-    return jsonRpcClient.call<Page<Staff>>('Staff.list');
+  list: async (params: PageParams = {}): Promise<Page<Staff>> => {
+    return jsonRpcClient.call<Page<Staff>>('Staff.list', params);
   },
 
   get: async (staffId: string): Promise<Staff> => {
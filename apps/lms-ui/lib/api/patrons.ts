@@ -1,11 +1,12 @@
 import JsonRpcClient from '../api-client';
 import type { Patron, PatronCreate, PatronUpdate, Page } from '../schemas';
+import type { PageParams } from '../pagination';
 
 const jsonRpcClient = new JsonRpcClient('patrons');
 
 export const patronsApi = {
-  list: async (): Promise<Page<Patron>> => {
-    return jsonRpcClient.call<Page<Patron>>('Patrons.list');
+  list: async (params: PageParams = {}): Promise<Page<Patron>> => {
+    return jsonRpcClient.call<Page<Patron>>('Patrons.list', params);
   },
 
   get: async (patronId: string): Promise<Patron> => {
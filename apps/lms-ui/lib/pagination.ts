@@ -0,0 +1,37 @@
+import { useInfiniteQuery, type QueryKey } from '@tanstack/react-query';
+import type { Page } from './schemas';
+
+export type PageParams = {
+  limit?: number;
+  after?: string | null;
+};
+
+type ListFn<T> = (params?: PageParams) => Promise<Page<T>>;
+
+// List methods return one keyset page at a time; `count` is the size of that page, not a table total.
+export function usePagedList<T>(queryKey: QueryKey, list: ListFn<T>) {
+  const query = useInfiniteQuery({
+    queryKey,
+    queryFn: ({ pageParam }) => list({ after: pageParam }),
+    initialPageParam: null as string | null,
+    getNextPageParam: (lastPage) => lastPage.next_cursor ?? undefined,
+  });
+  return { ...query, results: query.data?.pages.flatMap((page) => page.results) ?? [] };
+}
+
+// Follows `next_cursor` to the last page; meant for short reference lists such as branches and staff.
+export async function listAll<T>(list: ListFn<T>): Promise<T[]> {
+  const results: T[] = [];
+  let after: string | null = null;
+  do {
+    const page: Page<T> = await list({ after });
+    results.push(...page.results);
+    after = page.next_cursor ?? null;
+  } while (after);
+  return results;
+}
+
+// A count over the pages loaded so far is only a lower bound while more pages remain.
+export function formatCount(count: number, hasMore: boolean | undefined): string {
+  return hasMore ? `${count}+` : `${count}`;
+}
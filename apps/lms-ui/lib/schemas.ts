@@ -5,6 +5,7 @@ export const PageSchema = <T extends z.ZodTypeAny>(itemSchema: T) =>
   z.object({
     results: z.array(itemSchema),
     count: z.number(),
+    next_cursor: z.string().nullish(),
   });
 
 // Patron schemas
@@ -132,6 +133,13 @@ export const HoldSchema = z.object({
   updated_at: z.string().optional(),
 });
 
+export const HoldPositionSchema = z.object({
+  hold_id: z.string(),
+  item_id: z.string(),
+  patron_id: z.string(),
+  position: z.number().int().min(1),
+});
+
 // Types
 export type Patron = z.infer<typeof PatronSchema>;
 export type PatronCreate = z.infer<typeof PatronCreateSchema>;
@@ -155,8 +163,10 @@ export type Loan = z.infer<typeof LoanSchema>;
 export type LoanCreate = z.infer<typeof LoanCreateSchema>;
 
 export type Hold = z.infer<typeof HoldSchema>;
+export type HoldPosition = z.infer<typeof HoldPositionSchema>;
 
 export type Page<T> = {
   results: T[];
   count: number;
+  next_cursor?: string | null;
 };